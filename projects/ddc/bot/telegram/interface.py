@@ -12,6 +12,7 @@
 
 import asyncio
 import logging
+import os
 from typing import Optional, Dict, List
 from datetime import datetime
 import json
@@ -550,10 +551,17 @@ class TelegramBot:
 
     async def handle_video(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """비디오 처리"""
-        await update.message.reply_text(
-            "🎬 비디오 분석은 준비 중입니다.\n"
-            "곧 추가될 예정입니다! 🚀"
-        )
+        user_id = update.effective_user.id
+        session = self.user_sessions.get(user_id, {})
+        state = session.get("state")
+
+        if state == ConversationState.BIO_ANALYSIS:
+            # Bio 타임랩스 분석
+            await self.analyze_bio_video(update, context)
+        else:
+            await update.message.reply_text(
+                "⚠️ 비디오를 업로드하려면 먼저 /bio 명령어를 실행해주세요."
+            )
 
     # ========================================================================
     # 분석 함수
@@ -600,6 +608,87 @@ class TelegramBot:
             logger.error(f"Bio analysis error: {e}")
             await update.message.reply_text(f"❌ 오류: {str(e)}")
 
+    async def analyze_bio_video(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Bio 비디오(타임랩스) 분석 - 진행 상황을 상태 메시지로 갱신"""
+        file_path = None
+        try:
+            # 파일 다운로드
+            video = update.message.video
+            file = await video.get_file()
+            file_path = f"/tmp/bio_video_{datetime.now().timestamp()}.mp4"
+            await file.download_to_drive(file_path)
+            status = await update.message.reply_text("🎬 비디오 분석 시작...")
+
+            # API 스트리밍 요청 (NDJSON: progress* -> result | error) - 블로킹 I/O 는 스레드에서
+            # 서버가 일반 JSON 으로 응답하면 (비디오 파이프라인 미설치 시 임시 응답) 그 본문이 결과
+            loop = asyncio.get_running_loop()
+            events: asyncio.Queue = asyncio.Queue()
+
+            def stream():
+                with open(file_path, "rb") as f:
+                    with requests.post(
+                        f"{self.api_base}/api/bio/analyze_video",
+                        params={"stream": "true"},
+                        files={"file": (video.file_name or "video.mp4", f, video.mime_type or "video/mp4")},
+                        stream=True,
+                        timeout=600
+                    ) as response:
+                        response.raise_for_status()
+                        if not response.headers.get("content-type", "").startswith("application/x-ndjson"):
+                            loop.call_soon_threadsafe(events.put_nowait, {"event": "result", **response.json()})
+                            return
+                        for line in response.iter_lines():
+                            if line:
+                                loop.call_soon_threadsafe(events.put_nowait, json.loads(line))
+
+            worker = asyncio.ensure_future(asyncio.to_thread(stream))
+            worker.add_done_callback(lambda _: events.put_nowait(None))
+
+            result, last_percent = None, -10.0
+            while (event := await events.get()) is not None:
+                kind = event.get("event")
+                if kind == "progress" and event.get("percent") is not None and event["percent"] >= last_percent + 10:
+                    last_percent = event["percent"]
+                    await status.edit_text(
+                        f"🎬 비디오 분석 중... {last_percent:.0f}% "
+                        f"(샘플 프레임 {event.get('frames_sampled', 0)}개)"
+                    )
+                elif kind == "result":
+                    result = event
+                elif kind == "error":
+                    raise RuntimeError(event.get("detail", "분석 실패"))
+            await worker
+
+            if result is None:
+                await status.edit_text("⚠️ 분석 중 오류가 발생했습니다.")
+                return
+
+            stages = result.get("developmental_stages", [])
+            stage_lines = "\n".join(
+                f"• {s.get('stage', s.get('status'))}: "
+                f"{s.get('start_seconds', 0):.0f}s - {s.get('end_seconds', 0):.0f}s "
+                f"(밀도 {s.get('mean_density', 0):.1f}%)"
+                for s in stages
+            ) or "• 검출된 단계 없음"
+            await status.edit_text(
+                f"""
+✅ **Bio 비디오 분석 완료**
+
+**분석 프레임:** {result.get('frames_analyzed', 0)} / {result.get('total_frames', 0)}
+**길이:** {result.get('duration_seconds', 0):.0f}초
+
+**발달 단계:**
+{stage_lines}
+                """,
+                parse_mode="Markdown"
+            )
+        except Exception as e:
+            logger.error(f"Bio video analysis error: {e}")
+            await update.message.reply_text(f"❌ 오류: {str(e)}")
+        finally:
+            if file_path is not None and os.path.exists(file_path):
+                os.remove(file_path)
+
     async def analyze_stock(self, update: Update, context: ContextTypes.DEFAULT_TYPE, ticker: str):
         """주식 분석"""
         try:
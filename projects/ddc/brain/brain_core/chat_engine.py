@@ -5,7 +5,6 @@ True Multi-Engine Routing with Neuroplasticity
 """
 
 import os
-import re
 import logging
 import asyncio
 import random
@@ -21,8 +20,8 @@ except ImportError:
     pass
 
 from projects.ddc.brain.neuronet.neuroplasticity import NeuroplasticityLearner
-from projects.ddc.brain.brain_core.limbic_system import get_limbic_system
-from projects.ddc.brain.brain_core.limbic_system.limbic_coordinator import LimbicCoordinator
+from projects.ddc.brain.brain_core.limbic_system import get_limbic_system, get_async_limbic_system
+from projects.ddc.brain.brain_core.limbic_system.limbic_coordinator import LimbicCoordinatorPool
 from projects.ddc.brain.brain_core.limbic_system.amygdala import Amygdala
 
 # [NEW] Memory Cartridge System
@@ -39,8 +38,11 @@ from projects.ddc.brain.brain_core.memory_providers import (
 from projects.ddc.brain.brain_core.intent_classifier import (
     IntentClassifier,
     IntentType,
+    LexicalAnalysis,
     get_intent_classifier
 )
+from projects.ddc.brain.brain_core.stage_scheduler import StageScheduler
+from projects.ddc.brain.brain_core.response_filter import filter_response, IDENTITY_OVERRIDE_RESPONSE
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,7 @@ class ChatEngine:
     def __init__(self):
         self.learner = NeuroplasticityLearner()
         self.limbic = get_limbic_system()  # Integrated L2 Limbic System
+        self.limbic_async = get_async_limbic_system()  # L2 off the event loop (worker pool)
         self.amygdala = Amygdala()  # Legacy support
         self._configure_clients()
         
@@ -64,6 +67,11 @@ class ChatEngine:
         self._cartridge_cache: Dict[str, MemoryCartridge] = {}
         self._intent_classifier = get_intent_classifier()
         
+        # 사용자별 LimbicCoordinator 재사용 (WorkingMemory/Hippocampus 재초기화 방지)
+        self._coordinator_pool = LimbicCoordinatorPool(
+            max_size=int(os.getenv("LIMBIC_COORDINATOR_CACHE_SIZE", "128"))
+        )
+        
         # System instruction (will be populated in initialize())
         self.system_instruction = ""
         
@@ -352,18 +360,20 @@ Assistant: 아, 숀님이시군요! 앞으로 숀님이라고 부를게요. 무
         # [NEW] 1. Memory Cartridge 획득
         cartridge = self.get_cartridge(user_id)
         
-        # [NEW] 2. Intent Classification
-        intent_result = self._intent_classifier.classify(
+        # [NEW] 2. Unified Lexical Analysis (의도 + 연속/질문/코드/정체성 플래그를 한 번에 산출)
+        lexical = self._intent_classifier.analyze(
             text, 
             intent_history=cartridge._intent_history,
             user_profile=cartridge.profile.to_dict()
         )
+        intent_result = lexical.intent
         
-        # [NEW] 3. 특수 의도 처리
+        # [NEW] 3. 특수 의도 처리 (Fast Path: Limbic/Memory 작업 이전에 즉시 응답)
         if intent_result.intent_type == IntentType.NUMERIC_CHOICE:
             resolved = intent_result.target
             if intent_result.metadata.get("resolved"):
                 text = f"선택: {resolved}"
+                lexical = self._intent_classifier.analyze(text)
                 logger.info(f"📌 Numeric choice resolved: {resolved}")
         
         elif intent_result.intent_type == IntentType.IDENTITY_QUERY:
@@ -372,63 +382,60 @@ Assistant: 아, 숀님이시군요! 앞으로 숀님이라고 부를게요. 무
                 return f"**{cartridge.profile.user_name}**이시죠! 🌟\n\n_🎰 Memory Cartridge: {cartridge.profile.user_id}_"
 
         # [v6.0] 사용자 정체성 업데이트 감지 ("내가 OOO야", "난 OOO이야")
-        identity_update_match = re.search(r'(?:내가|난|나는|저는)\s*(\S+?)(?:야|이야|입니다|이에요|예요|임)', text)
-        if identity_update_match:
-            new_name = identity_update_match.group(1)
-            if new_name and len(new_name) >= 1 and new_name not in ["누구", "뭐", "뭔"]:
-                old_name = cartridge.profile.user_name
-                cartridge.profile.user_name = new_name
-                await cartridge.save()
-                logger.info(f"🔄 User identity updated: {old_name} → {new_name}")
-                return f"아, **{new_name}**님이시군요! 앞으로 {new_name}님이라고 부를게요. 무엇을 도와드릴까요? 😊\n\n_🎰 Identity Updated_"
-        
-        # [L2] 4. Integrated Limbic Analysis (Emotional Intelligence)
-        limbic_result = self.limbic.process_input(text, str(user_id))
+        if lexical.identity_update:
+            new_name = lexical.identity_update
+            old_name = cartridge.profile.user_name
+            cartridge.profile.user_name = new_name
+            await cartridge.save()
+            logger.info(f"🔄 User identity updated: {old_name} → {new_name}")
+            return f"아, **{new_name}**님이시군요! 앞으로 {new_name}님이라고 부를게요. 무엇을 도와드릴까요? 😊\n\n_🎰 Identity Updated_"
+        
+        # [L2] 4-7. Limbic Analysis + Memory Retrieval (Dependency-aware Stage Scheduling)
+        # 감정 분석과 기억 로딩/단기 컨텍스트 조회는 서로 독립적이므로 병렬 실행,
+        # 레벨 결정은 감정 분석 결과에, 장기 기억 조회는 레벨에 의존
+        is_admin = user_id == self.admin_id
+        scheduler = StageScheduler("get_response")
+        scheduler.add_stage(
+            "limbic",
+            # 워커 풀에서 실행 (이벤트 루프 비차단, 과부하/타임아웃 시 중립 결과)
+            lambda r: self.limbic_async.process_input(text, str(user_id))
+        )
+        scheduler.add_stage(
+            "coordinator",
+            lambda r: self._coordinator_pool.get(str(user_id), is_admin=is_admin),
+            run_in_thread=True  # 캐시 미스 시 WorkingMemory 디스크 로딩
+        )
+        scheduler.add_stage(
+            "short_term",
+            lambda r: r["coordinator"].get_short_term_context(),
+            depends_on=["coordinator"]
+        )
+        scheduler.add_stage(
+            "level",
+            lambda r: self._decide_level(text, lexical, r["limbic"], cartridge),
+            depends_on=["limbic"]
+        )
+        scheduler.add_stage(
+            "long_term",
+            lambda r: r["coordinator"].retrieve_long_term_context(text, level=r["level"]),
+            depends_on=["coordinator", "level"]
+        )
+        stage_results = await scheduler.run()
+        logger.info(scheduler.format_timings())
+
+        limbic_result = stage_results["limbic"]
+        level = stage_results["level"]
+        limbic = stage_results["coordinator"]
         primary_emotion = limbic_result["emotion"]["primary"]
         importance = limbic_result["priority"]["score"]
         
-        # 5. Level Analysis (v6.0 - Context-Aware Routing)
-        is_code = any(k in text.lower() for k in ["def ", "class ", "import ", "code", "python", "script"])
-
-        # [v6.0] 컨텍스트 연속성 감지: 짧은 입력이 이전 대화의 연속인지 판단
-        continuation_keywords = ["응", "어", "야", "뭐", "왜", "그래", "아", "음", "ㅇㅇ", "ㅇ", "웅"]
-        is_continuation = text.strip() in continuation_keywords or len(text.strip()) <= 3
-        has_conversation_history = len(cartridge.get_conversation_context(n=3).strip()) > 50
-
-        # [v6.0] 질문/요청 패턴 감지
-        question_patterns = ["뭐야", "뭐", "어떻게", "왜", "설명", "알려", "해줘", "줘", "?"]
-        is_question = any(p in text for p in question_patterns)
-
-        # Determine Level based on complexity, context, and emotional urgency
-        if limbic_result["priority"]["level"] == "critical":
-            level = "L3"  # Critical emotional state requires cognitive depth
-        elif is_code:
-            level = "L4"
-        elif is_continuation and has_conversation_history:
-            # [v6.0 핵심] 짧은 연속 입력은 컨텍스트가 필요하므로 L2 사용
-            level = "L2"
-            logger.info(f"🔄 Continuation detected: '{text}' → L2 (context-aware)")
-        elif len(text) < 10 and not is_question and primary_emotion == "neutral":
-            # 정말 단순한 인사만 L1 (예: "안녕", "하이")
-            level = "L1"
-        elif len(text) < 30 and primary_emotion == "neutral":
-            level = "L2"  # 대부분의 짧은 질문은 L2로
-        else:
-            level = "L2"
-
-        logger.info(f"📊 Level Decision: '{text[:20]}...' → {level} | cont={is_continuation}, hist={has_conversation_history}")
-        
-        # 6. 가용 후보 목록 획득
+        # 가용 후보 목록 획득
         available_candidates = [
             c for c in self.candidates[level] 
             if c["engine"] in self.clients or c["engine"] == "Gemini"
         ]
         
-        # [Reinforcement] 7. Build Integrated Context with Emotional Intelligence
-
-        is_admin = user_id == self.admin_id
-        limbic = LimbicCoordinator(str(user_id), is_admin=is_admin)
-        
+        # [Reinforcement] Build Integrated Context with Emotional Intelligence
         session_context = cartridge.get_session_context()
         conversation_context = cartridge.get_conversation_context(n=5)
         
@@ -455,10 +462,9 @@ Assistant: 아, 숀님이시군요! 앞으로 숀님이라고 부를게요. 무
             logger.info(f"⚡ L1 Reflexive: With minimal context ({len(recent_context)} chars)")
 
         else:
-            # [L2-L4] Full Memory Context
-            mem_start = time.time()
-            integrated_context = await limbic.build_integrated_context(text, level=level)
-            memory_latency = (time.time() - mem_start) * 1000
+            # [L2-L4] Full Memory Context (단기/장기 기억은 스케줄러에서 이미 조회됨)
+            integrated_context = limbic.compose_context(stage_results["short_term"], stage_results["long_term"])
+            memory_latency = scheduler.duration("short_term") + scheduler.duration("long_term")
 
             # [v6.0] 구조화된 프롬프트 형식
             prompt_with_memory = f"""{current_system_instruction}
@@ -496,7 +502,7 @@ Assistant: 아, 숀님이시군요! 앞으로 숀님이라고 부를게요. 무
                 response_text, tokens_used = await self._execute_provider_call(engine, model_id, prompt_with_memory)
                 
                 # [POST-PROCESSING] 정체성 필터 + 메타데이터 제거
-                response_text = self._filter_identity_response(response_text, text)
+                response_text = self._filter_identity_response(response_text, text, lexical.is_identity_question)
                 
                 # 측정
                 latency_ms = (time.time() - start_time) * 1000
@@ -540,6 +546,37 @@ Assistant: 아, 숀님이시군요! 앞으로 숀님이라고 부를게요. 무
         # 모든 모델 실패
         return "⚠️ **Neural Overload**\n모든 경로가 혼잡합니다."
 
+    def _decide_level(self, text: str, lexical: LexicalAnalysis, limbic_result: Dict[str, Any], cartridge: MemoryCartridge) -> str:
+        """
+        Level Analysis (v6.0 - Context-Aware Routing)
+        Determine Level based on complexity, context, and emotional urgency
+        어휘 신호(코드/연속 입력/질문)는 IntentClassifier.analyze에서 이미 산출됨
+        """
+        primary_emotion = limbic_result["emotion"]["primary"]
+        is_code = lexical.is_code
+        is_continuation = lexical.is_continuation
+        is_question = lexical.is_question
+        has_conversation_history = len(cartridge.get_conversation_context(n=3).strip()) > 50
+
+        if limbic_result["priority"]["level"] == "critical":
+            level = "L3"  # Critical emotional state requires cognitive depth
+        elif is_code:
+            level = "L4"
+        elif is_continuation and has_conversation_history:
+            # [v6.0 핵심] 짧은 연속 입력은 컨텍스트가 필요하므로 L2 사용
+            level = "L2"
+            logger.info(f"🔄 Continuation detected: '{text}' → L2 (context-aware)")
+        elif len(text) < 10 and not is_question and primary_emotion == "neutral":
+            # 정말 단순한 인사만 L1 (예: "안녕", "하이")
+            level = "L1"
+        elif len(text) < 30 and primary_emotion == "neutral":
+            level = "L2"  # 대부분의 짧은 질문은 L2로
+        else:
+            level = "L2"
+
+        logger.info(f"📊 Level Decision: '{text[:20]}...' → {level} | cont={is_continuation}, hist={has_conversation_history}")
+        return level
+
     async def _execute_provider_call(self, engine: str, model_id: str, text: str) -> tuple[str, int]:
         """Execute call to specific provider and return (text, tokens)"""
         if engine == "Groq":
@@ -616,78 +653,28 @@ Assistant: 아, 숀님이시군요! 앞으로 숀님이라고 부를게요. 무
                 
         return None, "None", 0.0
     
-    def _filter_identity_response(self, response: str, user_query: str) -> str:
+    def _filter_identity_response(self, response: str, user_query: str, identity_question: Optional[bool] = None) -> str:
         """
         응답 필터링:
         1. 내부 프롬프트/메타데이터 제거 (모든 응답에 적용)
         2. 정체성 관련 응답을 SHawn-Bot으로 강제 치환 (정체성 질문에만 적용)
         
+        패턴별 사전 컴파일 정규식을 기존 순서대로 적용, 마커 위치에서만 매칭 (response_filter 모듈).
+        완성된 응답 전체를 필터링함 (청크 단위 필터 StreamingResponseFilter 는 아직 호출처 없음).
+        
         Args:
             response: LLM의 원본 응답
             user_query: 사용자 질문
+            identity_question: 어휘 분석에서 판단한 정체성 질문 여부 (없으면 재판단)
             
         Returns:
             필터링된 응답
         """
-        import re
-        
-        # [CRITICAL FIX] 1. 내부 메타데이터 제거 (모든 응답에 적용)
-        # LLM이 시스템 지시를 그대로 출력하는 경우 제거
-        metadata_patterns = [
-            r'\[Emotional Status\]:.*?(?=\n|$)',
-            r'\[Empathy Directive\]:.*?(?=\n|$)',
-            r'\[Session Info\].*?(?=\n\n|\[User\]|$)',
-            r'- 사용자: User_\d+.*?(?=\n|$)',
-            r'- 권한:.*?(?=\n|$)',
-            r'- 세션 ID:.*?(?=\n|$)',
-            r'\[User\]:.*?(?=\n|$)',
-            r'\[Response\]:?\s*',
-        ]
-        
-        cleaned_response = response
-        for pattern in metadata_patterns:
-            cleaned_response = re.sub(pattern, '', cleaned_response, flags=re.DOTALL)
-        
-        # 연속된 빈 줄 정리
-        cleaned_response = re.sub(r'\n{3,}', '\n\n', cleaned_response)
-        cleaned_response = cleaned_response.strip()
-        
-        # 2. 정체성 질문 패턴 (부분 매칭)
-        identity_patterns = [
-            "누구",  # "너는 누구", "너 누구야" 등 모두 포함
-            "who are you",
-            "자기소개",
-            "소개해",
-            "정체"
-        ]
-        
-        is_identity_question = any(p in user_query.lower() for p in identity_patterns)
-        
-        logger.info(f"🔍 Identity Filter: query='{user_query}', is_identity={is_identity_question}")
-        
-        if is_identity_question:
-            # 기본 모델명 패턴 감지 (Gemini 특화 패턴 추가)
-            problematic_patterns = [
-                "DeepSeek", 
-                "Llama", 
-                "Meta AI", 
-                "Claude", 
-                "인공지능 언어 모델", 
-                "Google에서 훈련한", 
-                "대규모 언어 모델"
-            ]
-            
-            if any(pattern in cleaned_response for pattern in problematic_patterns):
-                logger.warning(f"⚠️ Identity Override: Detected problematic identity pattern in response")
-                # 강제 치환
-                return (
-                    "저는 **SHawn-Bot**입니다. "
-                    "Dr. SHawn의 D-CNS v5.5 인터페이스로, "
-                    "생물학 연구 및 시스템 관리를 보조합니다. 🧠\n\n"
-                    "무엇을 도와드릴까요?"
-                )
-        
-        return cleaned_response
+        filtered = filter_response(response, user_query, identity_question)
+        if filtered == IDENTITY_OVERRIDE_RESPONSE:
+            logger.warning(f"⚠️ Identity Override: Detected problematic identity pattern in response")
+        logger.debug(f"🔍 Identity Filter: query='{user_query}'")
+        return filtered
 
     # --- Engine Implementations ---
 
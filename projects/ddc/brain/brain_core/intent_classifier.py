@@ -5,6 +5,8 @@
 - 이모지 → 카트리지 매핑
 - 숫자 선택 → 이전 선택지 해석
 - 맥락 참조 질문 감지 ("근거는?", "왜?")
+- 통합 어휘 분석: 모든 트리거 구문을 Aho-Corasick 자동자로 한 번에 스캔하여
+  의도 + 연속 입력/질문/코드/정체성 플래그를 함께 산출
 
 Author: Dr. SHawn (Digital Da Vinci Project)
 Version: 1.0.0
@@ -12,8 +14,8 @@ Version: 1.0.0
 
 import re
 import logging
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,83 @@ class IntentResult:
             self.metadata = {}
 
 
+@dataclass
+class LexicalAnalysis:
+    """
+    통합 어휘 분석 결과 (ChatEngine 라우팅에 필요한 모든 어휘 신호)
+    """
+    intent: IntentResult
+    is_code: bool = False                       # 코드 관련 입력 (L4)
+    is_continuation: bool = False               # 짧은 연속 입력 ("응", "왜")
+    is_question: bool = False                   # 질문/요청 패턴
+    is_identity_question: bool = False          # 응답 정체성 필터 대상 질문
+    identity_update: Optional[str] = None       # "내가 OOO야" → OOO
+    tags: Set[str] = field(default_factory=set) # 매칭된 트리거 태그
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick 다중 구문 매처
+    모든 트리거 구문을 하나의 자동자(trie + failure link)로 컴파일하여
+    입력을 한 번만 스캔하면서 (태그, 시작 위치) 목록을 산출
+    """
+    
+    def __init__(self, phrases: List[Tuple[str, str]]):
+        """
+        Args:
+            phrases: (구문, 태그) 목록. 구문은 소문자 기준으로 매칭
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, int]]] = [[]]
+        
+        for phrase, tag in phrases:
+            self._add(phrase.lower(), tag)
+        self._build_failure_links()
+    
+    def _add(self, phrase: str, tag: str):
+        node = 0
+        for ch in phrase:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((tag, len(phrase)))
+    
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        while queue:
+            next_queue = []
+            for node in queue:
+                for ch, child in self._goto[node].items():
+                    fallback = self._fail[node]
+                    while fallback and ch not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    target = self._goto[fallback].get(ch, 0)
+                    self._fail[child] = target if target != child else 0
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+                    next_queue.append(child)
+            queue = next_queue
+    
+    def scan(self, text: str) -> List[Tuple[str, int]]:
+        """(태그, 시작 위치) 목록 반환 (text는 호출 측에서 소문자화)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for tag, length in out[node]:
+                    hits.append((tag, i - length + 1))
+        return hits
+
+
 class IntentClassifier:
     """
     사용자 입력 의도 분류기
@@ -116,7 +195,46 @@ class IntentClassifier:
         re.compile(r'(설정|config)', re.IGNORECASE),
     ]
     
+    # 사용자 정체성 갱신 패턴 ("내가 OOO야", "난 OOO이야")
+    IDENTITY_UPDATE_PATTERN = re.compile(r'(?:내가|난|나는|저는)\s*(\S+?)(?:야|이야|입니다|이에요|예요|임)')
+    IDENTITY_UPDATE_EXCLUDE = {"누구", "뭐", "뭔"}
+    
+    # ChatEngine 라우팅 신호
+    CONTINUATION_KEYWORDS = {"응", "어", "야", "뭐", "왜", "그래", "아", "음", "ㅇㅇ", "ㅇ", "웅"}
+    CODE_KEYWORDS = ["def ", "class ", "import ", "code", "python", "script"]
+    QUESTION_KEYWORDS = ["뭐야", "뭐", "어떻게", "왜", "설명", "알려", "해줘", "줘", "?"]
+    IDENTITY_QUESTION_KEYWORDS = ["누구", "who are you", "자기소개", "소개해", "정체"]
+    
+    # =========================================================
+    # 트리거 구문 → 태그 (Aho-Corasick 자동자로 통합)
+    # 정규식 패턴은 필수 리터럴(앵커)이 발견된 경우에만 검증
+    # =========================================================
+    TRIGGER_PHRASES = (
+        [(emoji, f"cartridge:{emoji}") for emoji in EMOJI_CARTRIDGE_MAP]
+        + [(p, "greeting") for p in ["안녕", "하이", "헬로", "hi", "hello", "hey", "반가워", "반갑습니다"]]
+        + [("누구", "identity"), ("알아", "identity"), ("shawn", "identity")]
+        + [
+            ("근거", "follow_up:evidence"),
+            ("왜", "follow_up:why"),
+            ("어떻게", "follow_up:how"),
+            ("자세히", "follow_up:detail"),
+            ("계속", "follow_up:continue"),
+            ("예시", "follow_up:example"),
+            ("예를", "follow_up:example"),
+        ]
+        + [(p, "system") for p in ["리소스", "메모리", "cpu", "상태", "버전", "업데이트", "업그레이드", "설정", "config"]]
+        + [(p, "identity_update") for p in ["내가", "난", "나는", "저는"]]
+        + [(p, "code") for p in CODE_KEYWORDS]
+        + [(p, "question") for p in QUESTION_KEYWORDS]
+        + [(p, "identity_question") for p in IDENTITY_QUESTION_KEYWORDS]
+    )
+    
+    # 맥락 참조 유형 우선순위 (CONTEXT_REF_PATTERNS 순서와 동일)
+    FOLLOW_UP_ORDER = ["evidence", "why", "how", "detail", "continue", "example"]
+    
     def __init__(self):
+        self._matcher = PhraseMatcher(self.TRIGGER_PHRASES)
+        self._follow_up_patterns = {kind: pattern for pattern, kind in self.CONTEXT_REF_PATTERNS}
         logger.info("🎯 IntentClassifier initialized")
     
     def classify(
@@ -136,8 +254,56 @@ class IntentClassifier:
         Returns:
             IntentResult
         """
-        text = text.strip()
+        return self.analyze(text, intent_history, user_profile).intent
+    
+    def analyze(
+        self, 
+        text: str, 
+        intent_history: List[dict] = None,
+        user_profile: dict = None
+    ) -> LexicalAnalysis:
+        """
+        통합 어휘 분석: 한 번의 스캔으로 의도와 라우팅 플래그를 함께 산출
+        
+        Args:
+            text: 사용자 입력
+            intent_history: 이전 의도 히스토리 (숫자 선택 해석용)
+            user_profile: 사용자 프로필 (관리자 여부 등)
+            
+        Returns:
+            LexicalAnalysis
+        """
+        stripped = text.strip()
+        # 원문 전체를 한 번 스캔 (시작 위치는 strip 기준으로 보정)
+        offset = len(text) - len(text.lstrip())
+        hits = [(tag, start - offset) for tag, start in self._matcher.scan(text.lower())] if stripped else []
+        tags = {tag for tag, _ in hits}
+        
+        analysis = LexicalAnalysis(
+            intent=self._classify_from_hits(stripped, hits, tags, intent_history, user_profile),
+            is_code="code" in tags,
+            is_continuation=stripped in self.CONTINUATION_KEYWORDS or len(stripped) <= 3,
+            is_question="question" in tags,
+            is_identity_question="identity_question" in tags,
+            tags=tags,
+        )
         
+        if "identity_update" in tags:
+            match = self.IDENTITY_UPDATE_PATTERN.search(text)
+            if match and match.group(1) not in self.IDENTITY_UPDATE_EXCLUDE:
+                analysis.identity_update = match.group(1)
+        
+        return analysis
+    
+    def _classify_from_hits(
+        self,
+        text: str,
+        hits: List[Tuple[str, int]],
+        tags: Set[str],
+        intent_history: List[dict] = None,
+        user_profile: dict = None
+    ) -> IntentResult:
+        """스캔 결과로 의도 결정 (우선순위: 카트리지 > 숫자 > 인사 > 정체성 > 맥락 참조 > 시스템)"""
         if not text:
             return IntentResult(
                 intent_type=IntentType.GENERAL,
@@ -146,35 +312,47 @@ class IntentClassifier:
                 raw_input=text
             )
         
-        # 1. 이모지 카트리지 전환 확인
-        result = self._check_cartridge_switch(text)
-        if result:
-            return result
+        # 1. 이모지 카트리지 전환 확인 (입력 시작 위치)
+        for tag, start in hits:
+            if start == 0 and tag.startswith("cartridge:"):
+                return self._check_cartridge_switch(text)
         
         # 2. 숫자 선택 확인
-        result = self._check_numeric_choice(text, intent_history)
-        if result:
-            return result
+        if text[0].isdecimal():
+            result = self._check_numeric_choice(text, intent_history)
+            if result:
+                return result
         
-        # 3. 인사 확인
-        result = self._check_greeting(text)
-        if result:
-            return result
+        # 3. 인사 확인 (입력 시작 위치)
+        if any(tag == "greeting" and start == 0 for tag, start in hits):
+            result = self._check_greeting(text)
+            if result:
+                return result
         
         # 4. 정체성 질문 확인
-        result = self._check_identity_query(text, user_profile)
-        if result:
-            return result
+        if "identity" in tags:
+            result = self._check_identity_query(text, user_profile)
+            if result:
+                return result
         
         # 5. 맥락 참조 질문 확인
-        result = self._check_context_follow_up(text)
-        if result:
-            return result
+        for follow_up_type in self.FOLLOW_UP_ORDER:
+            if f"follow_up:{follow_up_type}" in tags and self._follow_up_patterns_match(text, follow_up_type):
+                return IntentResult(
+                    intent_type=IntentType.CONTEXT_FOLLOW_UP,
+                    target=follow_up_type,
+                    confidence=0.85,
+                    raw_input=text
+                )
         
         # 6. 시스템 관련 질문 확인
-        result = self._check_system_query(text)
-        if result:
-            return result
+        if "system" in tags:
+            return IntentResult(
+                intent_type=IntentType.SYSTEM_QUERY,
+                target="system",
+                confidence=0.8,
+                raw_input=text
+            )
         
         # 7. 일반 질문
         return IntentResult(
@@ -184,6 +362,16 @@ class IntentClassifier:
             raw_input=text
         )
     
+    def _follow_up_patterns_match(self, text: str, follow_up_type: str) -> bool:
+        """앵커만으로 확정되지 않는 유형("더 자세히", "예를 들")은 원래 패턴으로 검증"""
+        if follow_up_type in ("detail", "example"):
+            return any(
+                pattern.search(text)
+                for pattern, kind in self.CONTEXT_REF_PATTERNS
+                if kind == follow_up_type
+            )
+        return True
+    
     def _check_cartridge_switch(self, text: str) -> Optional[IntentResult]:
         """이모지 카트리지 전환 확인"""
         for emoji, cartridge in self.EMOJI_CARTRIDGE_MAP.items():
@@ -7,4 +7,5 @@ from .limbic_integrated import LimbicIntegratedSystem, get_limbic_system
 from .amygdala import Amygdala
 # Keep legacy processors for compatibility if needed
 from .emotion_processor import EmotionProcessor
-from .limbic_coordinator import LimbicCoordinator
+from .limbic_coordinator import LimbicCoordinator, LimbicCoordinatorPool, get_shared_hippocampus
+from .limbic_async import AsyncLimbicSystem, get_async_limbic_system, neutral_limbic_result
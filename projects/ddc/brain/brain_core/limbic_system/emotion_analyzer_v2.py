@@ -112,6 +112,18 @@ class EmotionDetector:
         Returns:
             Emotion: 감지된 감정 데이터
         """
+        return self.record(self.classify(text))
+    
+    def classify(self, text: str) -> Emotion:
+        """
+        감지 통계를 갱신하지 않는 감정 판별 (공유 상태 없음 - 여러 스레드에서 동시 호출 가능)
+        
+        Args:
+            text: 사용자 메시지
+            
+        Returns:
+            Emotion: 판별된 감정 데이터
+        """
         text_lower = text.lower()
         
         # 각 감정별 점수 계산
@@ -157,9 +169,12 @@ class EmotionDetector:
             keywords=keywords
         )
         
-        self.emotion_scores[primary_emotion] += 1
+        return emotion
+    
+    def record(self, emotion: Emotion) -> Emotion:
+        """판별된 감정을 감지 통계에 반영"""
+        self.emotion_scores[emotion.primary] += 1
         self.total_detections += 1
-        
         return emotion
     
     def _calculate_emotion_score(self, text: str, emotion: str, keywords: List[str]) -> float:
@@ -466,19 +481,20 @@ class EmotionAnalyzerSystem:
         self.context_analyzer = ContextAnalyzer()
         self.tracker = EmotionTracker()
     
-    def analyze_message(self, text: str, user_id: str = 'default') -> Dict:
+    def analyze_message(self, text: str, user_id: str = 'default', emotion: Optional[Emotion] = None) -> Dict:
         """
         메시지를 종합적으로 분석합니다.
         
         Args:
             text: 사용자 메시지
             user_id: 사용자 ID
+            emotion: 미리 판별한 감정 (detector.classify 결과, 지정 시 재판별 생략)
             
         Returns:
             Dict: 종합 분석 결과
         """
         # 1. 감정 감지
-        emotion = self.detector.detect(text)
+        emotion = self.detector.detect(text) if emotion is None else self.detector.record(emotion)
         
         # 2. 강도 측정
         intensity_score = self.intensity_scorer.score(emotion)
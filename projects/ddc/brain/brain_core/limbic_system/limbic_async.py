@@ -0,0 +1,200 @@
+"""
+limbic_async.py - Executor-backed async facade for the L2 Limbic System
+LimbicIntegratedSystem.process_input는 동기 CPU 작업(정규식 점수화, Q-Learning, 템플릿 생성)이므로
+이벤트 루프 밖의 워커 풀에서 실행하고, 백프레셔와 타임아웃 시 중립 결과로 대체합니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from projects.ddc.brain.brain_core.limbic_system.limbic_integrated import (
+    LimbicIntegratedSystem,
+    get_limbic_system,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def neutral_limbic_result(text: str, user_id: str = "default", reason: str = "timeout") -> Dict[str, Any]:
+    """
+    process_input과 동일한 스키마의 중립 결과 (타임아웃/과부하 시 대체값)
+    """
+    return {
+        "emotion": {
+            "primary": "neutral",
+            "secondary": None,
+            "intensity": 0.0,
+            "confidence": 0.0,
+            "keywords": [],
+        },
+        "intensity_score": {
+            "intensity": 0.0,
+            "confidence": 0.0,
+            "combined_score": 0.0,
+            "level": "weak",
+            "context": None,
+        },
+        "priority": {
+            "score": 0.2,
+            "level": "low",
+            "reasoning": f"limbic fallback ({reason})",
+            "action_required": False,
+        },
+        "empathy_proposal": "",
+        "routing": {"emotion": "neutral", "priority": 0.2, "strategy": "management", "destination": "L3_standard_processing"},
+        "context": {"user_id": user_id, "text_length": len(text), "fallback": reason},
+    }
+
+
+def _process_batch_in_worker(items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """프로세스 풀 워커 진입점 (워커 프로세스별 싱글톤 사용)"""
+    system = get_limbic_system()
+    return [system.process_input(text, user_id) for text, user_id in items]
+
+
+class AsyncLimbicSystem:
+    """
+    L2 Limbic System 비동기 파사드
+    - 단건 처리: 스레드 풀 (공유 학습 상태 유지)
+    - 배치 처리: 프로세스 풀 선택 가능 (오프라인 재분석 등 대량 작업용)
+    """
+
+    def __init__(
+        self,
+        system: Optional[LimbicIntegratedSystem] = None,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        timeout: float = 1.5,
+        batch_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            system: 래핑할 LimbicIntegratedSystem (기본: 싱글톤)
+            max_workers: 스레드 풀 크기
+            max_pending: 동시에 대기/실행 가능한 최대 분석 수 (백프레셔)
+            timeout: 분석 대기 한도 (초). 초과 시 중립 결과 반환
+            batch_workers: 배치 모드 프로세스 풀 크기 (기본: CPU 수)
+        """
+        self.system = system or get_limbic_system()
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.batch_workers = batch_workers or os.cpu_count() or 2
+
+        self._thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="limbic")
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # 감정 추적/Q-Table은 공유 가변 상태이므로 상태 갱신 단계만 직렬화 (감정 판별은 잠금 밖)
+        self._state_lock = threading.Lock()
+
+        self.stats = {"completed": 0, "timeouts": 0, "rejected": 0, "errors": 0}
+
+    def _analyze(self, text: str, user_id: str) -> Dict[str, Any]:
+        """감정 판별(정규식 점수화)은 병렬 실행, 추적/학습 상태 갱신만 잠금 안에서 실행"""
+        emotion = self.system.detect_emotion(text)
+        with self._state_lock:
+            return self.system.process_input(text, user_id, emotion=emotion)
+
+    async def process_input(self, text: str, user_id: str = "default") -> Dict[str, Any]:
+        """
+        워커 스레드에서 process_input 실행 (이벤트 루프 비차단)
+        과부하 또는 타임아웃 시 neutral_limbic_result 반환
+        """
+        if not self._slots.acquire(blocking=False):
+            self.stats["rejected"] += 1
+            logger.warning(f"⚠️ [L2 Async] Backpressure: {self.max_pending} analyses pending, using neutral result")
+            return neutral_limbic_result(text, user_id, reason="backpressure")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._thread_pool, self._analyze, text, user_id)
+        # 슬롯은 실제 작업이 끝날 때 반환 (타임아웃 후에도 작업은 계속 실행되므로)
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+            self.stats["completed"] += 1
+            return result
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.warning(f"⚠️ [L2 Async] Analysis exceeded {self.timeout:.1f}s, using neutral result")
+            return neutral_limbic_result(text, user_id, reason="timeout")
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"❌ [L2 Async] Analysis failed: {e}")
+            return neutral_limbic_result(text, user_id, reason="error")
+
+    async def process_batch(
+        self,
+        items: List[Tuple[str, str]],
+        use_processes: bool = False,
+        chunk_size: int = 64,
+    ) -> List[Dict[str, Any]]:
+        """
+        (text, user_id) 목록 일괄 분석
+
+        Args:
+            items: 분석 대상 목록
+            use_processes: True면 프로세스 풀 사용 (워커별 독립 상태, 학습 결과는 본 프로세스에 반영되지 않음)
+            chunk_size: 워커 한 번에 전달할 항목 수
+        """
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        if use_processes:
+            executor: Executor = self._get_process_pool()
+            futures = [loop.run_in_executor(executor, _process_batch_in_worker, chunk) for chunk in chunks]
+        else:
+            def _run_chunk(chunk):
+                return [self._analyze(text, user_id) for text, user_id in chunk]
+            futures = [loop.run_in_executor(self._thread_pool, _run_chunk, chunk) for chunk in chunks]
+
+        results: List[Dict[str, Any]] = []
+        for chunk, chunk_result in zip(chunks, await asyncio.gather(*futures, return_exceptions=True)):
+            if isinstance(chunk_result, Exception):
+                logger.error(f"❌ [L2 Async] Batch chunk failed: {chunk_result}")
+                self.stats["errors"] += len(chunk)
+                results.extend(neutral_limbic_result(text, user_id, reason="error") for text, user_id in chunk)
+            else:
+                self.stats["completed"] += len(chunk)
+                results.extend(chunk_result)
+        return results
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.batch_workers)
+        return self._process_pool
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "timeout": self.timeout,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """워커 풀 종료"""
+        self._thread_pool.shutdown(wait=wait)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
+
+
+# Singleton
+_async_instance = None
+
+def get_async_limbic_system() -> AsyncLimbicSystem:
+    global _async_instance
+    if _async_instance is None:
+        _async_instance = AsyncLimbicSystem(
+            max_workers=int(os.getenv("LIMBIC_WORKERS", "2")),
+            timeout=float(os.getenv("LIMBIC_TIMEOUT", "1.5")),
+        )
+    return _async_instance
@@ -6,6 +6,8 @@
 
 import asyncio
 import logging
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from projects.ddc.brain.brain_core.limbic_system.working_memory import WorkingMemory
 from projects.ddc.brain.brain_core.limbic_system.hippocampus import Hippocampus
@@ -13,12 +15,24 @@ from projects.ddc.brain.brain_core.limbic_system.amygdala import Amygdala
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 해마 (Pinecone 연결, 임베딩 클라이언트, Obsidian 메타데이터를 한 번만 초기화)
+_shared_hippocampus: Optional[Hippocampus] = None
+_hippocampus_lock = threading.Lock()
+
+def get_shared_hippocampus() -> Hippocampus:
+    global _shared_hippocampus
+    if _shared_hippocampus is None:
+        with _hippocampus_lock:
+            if _shared_hippocampus is None:
+                _shared_hippocampus = Hippocampus()
+    return _shared_hippocampus
+
 class LimbicCoordinator:
     """
     변연계의 기억과 감정 신호를 통합하여 자아(ChatEngine)에게 전달하는 코디네이터
     """
     
-    def __init__(self, user_id: str, is_admin: bool = False):
+    def __init__(self, user_id: str, is_admin: bool = False, hippocampus: Optional[Hippocampus] = None):
         self.user_id = user_id
         self.is_admin = is_admin
         
@@ -28,22 +42,34 @@ class LimbicCoordinator:
         # 2. 감정/중요도 (편도체)
         self.amygdala = Amygdala() 
         
-        # 3. 해마 (색인 및 공고화)
-        self.hippocampus = Hippocampus()
+        # 3. 해마 (색인 및 공고화) - 사용자 간 공유
+        self.hippocampus = hippocampus or get_shared_hippocampus()
         self.neocortical_store = None # Pinecone Wrapper (Future)
 
     async def build_integrated_context(self, query: str, level: str = "L3") -> str:
         """
         3계층 기억을 병렬로 조회하여 통합 프롬프트 컨텍스트 생성
         """
-        tasks = []
-        sections = []
-        
         # 1. 단기 기억 (항상 필수)
-        # WorkingMemory는 이미 로컬 로딩되어 있음
-        short_term_ctx = self.working_memory.get_context()
+        short_term_ctx = self.get_short_term_context()
         
         # 2. 중/장기 기억 (L3 이상이거나 분석 질문일 때만)
+        sections = await self.retrieve_long_term_context(query, level=level)
+        
+        return self.compose_context(short_term_ctx, sections)
+
+    def get_short_term_context(self) -> str:
+        """단기 기억 조회 (WorkingMemory는 이미 로컬 로딩되어 있음)"""
+        return self.working_memory.get_context()
+
+    async def retrieve_long_term_context(self, query: str, level: str = "L3") -> List[str]:
+        """
+        중/장기 기억 병렬 조회 (L3 이상 + 관리자만)
+        단기 기억과 독립적이므로 ChatEngine이 별도 단계로 스케줄링할 수 있음
+        """
+        tasks = []
+        sections = []
+        
         if level in ["L3", "L4"] and self.is_admin:
             tasks.append(self.hippocampus.search(query))
             # tasks.append(self.neocortical_store.search(query)) # Future
@@ -54,8 +80,12 @@ class LimbicCoordinator:
             for res in results:
                 if isinstance(res, str) and res:
                     sections.append(f"### [Knowledge Retrieval]\n{res}")
+        
+        return sections
 
-        # 컨텍스트 통합
+    def compose_context(self, short_term_ctx: str, sections: List[str]) -> str:
+        """단기/장기 기억 섹션을 하나의 프롬프트 컨텍스트로 통합"""
+        sections = list(sections)
         if short_term_ctx:
             sections.insert(0, f"### [Recent Conversation]\n{short_term_ctx}")
             
@@ -83,3 +113,57 @@ class LimbicCoordinator:
         """신피질(Pinecone)에서 장기 지식 조회"""
         # TODO: Implement Phase 4/5
         return ""
+
+
+class LimbicCoordinatorPool:
+    """
+    사용자별 LimbicCoordinator LRU 캐시
+    매 턴마다 WorkingMemory 디스크 로딩과 해마 재초기화를 반복하지 않도록 인스턴스를 재사용
+    """
+    
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._coordinators: "OrderedDict[str, LimbicCoordinator]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, user_id: str, is_admin: bool = False) -> LimbicCoordinator:
+        """캐시된 코디네이터 반환 (없으면 생성, 용량 초과 시 가장 오래 쓰지 않은 사용자 제거)"""
+        with self._lock:
+            coordinator = self._coordinators.get(user_id)
+            if coordinator is not None:
+                self._coordinators.move_to_end(user_id)
+                coordinator.is_admin = is_admin
+                self.hits += 1
+                return coordinator
+            
+            self.misses += 1
+            coordinator = LimbicCoordinator(user_id, is_admin=is_admin)
+            self._coordinators[user_id] = coordinator
+            
+            while len(self._coordinators) > self.max_size:
+                evicted_id, _ = self._coordinators.popitem(last=False)
+                logger.debug(f"♻️ LimbicCoordinator evicted (LRU): User {evicted_id}")
+            
+            return coordinator
+    
+    def invalidate(self, user_id: str):
+        """특정 사용자 코디네이터 제거 (다음 조회 시 디스크에서 다시 로딩)"""
+        with self._lock:
+            self._coordinators.pop(user_id, None)
+    
+    def clear(self):
+        with self._lock:
+            self._coordinators.clear()
+    
+    def __len__(self) -> int:
+        return len(self._coordinators)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._coordinators),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
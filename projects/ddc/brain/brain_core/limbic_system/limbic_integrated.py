@@ -7,7 +7,7 @@ Integrates Emotion Analysis, Empathy Response, and Attention Learning.
 import logging
 from typing import Dict, Any, Optional
 
-from projects.ddc.brain.brain_core.limbic_system.emotion_analyzer_v2 import EmotionAnalyzerSystem
+from projects.ddc.brain.brain_core.limbic_system.emotion_analyzer_v2 import Emotion, EmotionAnalyzerSystem
 from projects.ddc.brain.brain_core.limbic_system.empathy_responder_v2 import EmpathyResponderSystem
 from projects.ddc.brain.brain_core.limbic_system.attention_learner_v2 import AttentionLearnerSystem
 
@@ -24,12 +24,22 @@ class LimbicIntegratedSystem:
         self.empathy_responder = EmpathyResponderSystem()
         self.attention_learner = AttentionLearnerSystem()
         
-    def process_input(self, text: str, user_id: str = "default") -> Dict[str, Any]:
+    def detect_emotion(self, text: str) -> Emotion:
+        """
+        Stateless emotion detection (keyword/regex scoring).
+        Touches no shared state, so callers may run it concurrently and pass
+        the result to process_input.
+        """
+        return self.emotion_analyzer.detector.classify(text)
+        
+    def process_input(self, text: str, user_id: str = "default", emotion: Optional[Emotion] = None) -> Dict[str, Any]:
         """
         Process user input through the integrated limbic system.
+        If emotion (from detect_emotion) is given, detection is skipped and only
+        the tracking/learning state is updated.
         """
         # 1. Analyze Emotion
-        emotion_result = self.emotion_analyzer.analyze_message(text, user_id)
+        emotion_result = self.emotion_analyzer.analyze_message(text, user_id, emotion=emotion)
         
         # 2. Extract key metrics for further processing
         primary_emotion = emotion_result["emotion"]["primary"]
@@ -0,0 +1,208 @@
+"""
+ResponseFilter - Precompiled identity & metadata sanitizer for LLM responses
+- 내부 프롬프트/메타데이터 제거: 패턴별 사전 컴파일 정규식을 기존 순서대로 적용하되,
+  각 패스는 리터럴 마커 위치(str.find)에서만 매칭 (마커가 없으면 패스 생략)
+- 정체성 질문 응답 강제 치환
+- 스트리밍 응답용 점진적(incremental) 필터
+"""
+
+import re
+from typing import Optional
+
+# 내부 메타데이터 패턴 (LLM이 시스템 지시를 그대로 출력하는 경우)
+# (패턴, 리터럴 시작 마커) - 기존 순차 re.sub 와 결과가 같도록 이 순서대로 한 패턴씩 적용
+# ([Session Info] 의 DOTALL 비탐욕 매칭은 앞 패스에서 지운 줄 뒤의 텍스트를 기준으로 해야 함)
+METADATA_PASSES = tuple(
+    (re.compile(pattern, re.DOTALL), marker) for pattern, marker in [
+        (r'\[Emotional Status\]:.*?(?=\n|$)', "[Emotional Status]:"),
+        (r'\[Empathy Directive\]:.*?(?=\n|$)', "[Empathy Directive]:"),
+        (r'\[Session Info\].*?(?=\n\n|\[User\]|$)', "[Session Info]"),
+        (r'- 사용자: User_\d+.*?(?=\n|$)', "- 사용자: User_"),
+        (r'- 권한:.*?(?=\n|$)', "- 권한:"),
+        (r'- 세션 ID:.*?(?=\n|$)', "- 세션 ID:"),
+        (r'\[User\]:.*?(?=\n|$)', "[User]:"),
+        (r'\[Response\]:?\s*', "[Response]"),
+    ]
+)
+EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# 정체성 질문 패턴 (부분 매칭, 소문자 비교)
+IDENTITY_QUERY_RE = re.compile(r'누구|who are you|자기소개|소개해|정체')
+
+# 기본 모델명 노출 패턴 (Gemini 특화 패턴 포함)
+PROBLEMATIC_IDENTITY_RE = re.compile(
+    r'DeepSeek|Llama|Meta AI|Claude|인공지능 언어 모델|Google에서 훈련한|대규모 언어 모델'
+)
+
+IDENTITY_OVERRIDE_RESPONSE = (
+    "저는 **SHawn-Bot**입니다. "
+    "Dr. SHawn의 D-CNS v5.5 인터페이스로, "
+    "생물학 연구 및 시스템 관리를 보조합니다. 🧠\n\n"
+    "무엇을 도와드릴까요?"
+)
+
+# 스트리밍 시 안전한 절단 지점: 문단 경계(빈 줄) 다음에 실제 내용이 시작되는 위치
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\n\s*(?=\S)')
+# 앞선 패스 적용 후 문단 경계 직전이 [Response] 마커면 절단 불가 ([Response]:?\s* 가 빈 줄까지 지우므로)
+_OPEN_RESPONSE_MARKER_RE = re.compile(r'\[Response\]:?\s*$')
+
+
+def _sub_at_markers(pattern: re.Pattern, text: str, markers: tuple, repl: str) -> str:
+    """
+    pattern.sub(repl, text)와 동일한 결과를 내되, 정규식은 마커 위치에서만 시도
+    (C 수준 str.find로 후보를 찾으므로 메타데이터가 없는 긴 응답은 거의 비용 없이 통과)
+    """
+    candidates = []
+    for marker in markers:
+        idx = text.find(marker)
+        while idx != -1:
+            candidates.append(idx)
+            idx = text.find(marker, idx + 1)
+    if not candidates:
+        return text
+
+    candidates.sort()
+    parts = []
+    last = 0
+    for pos in candidates:
+        if pos < last:
+            continue  # 이전 매칭 범위 안
+        match = pattern.match(text, pos)
+        if match:
+            parts.append(text[last:pos])
+            parts.append(repl)
+            last = match.end()
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _apply_passes(text: str, passes: tuple) -> str:
+    for pattern, marker in passes:
+        text = _sub_at_markers(pattern, text, (marker,), '')
+    return text
+
+
+def _is_safe_cut(segment: str) -> bool:
+    """
+    segment 뒤(문단 경계)에서 잘라도 전체 텍스트 필터 결과와 같은지 여부
+    [Response] 이전 패스들로 정리한 끝부분이 열린 [Response] 마커면 빈 줄이 함께 지워지므로 보류
+    """
+    if "[Response" not in segment:
+        return True
+    return _OPEN_RESPONSE_MARKER_RE.search(_apply_passes(segment, METADATA_PASSES[:-1])) is None
+
+
+def strip_metadata(text: str) -> str:
+    """내부 메타데이터 제거 + 연속 빈 줄 정리 (앞뒤 공백 유지)"""
+    cleaned = _apply_passes(text, METADATA_PASSES)
+    return _sub_at_markers(EXCESS_NEWLINES_RE, cleaned, ("\n\n\n",), '\n\n')
+
+
+def is_identity_question(user_query: str) -> bool:
+    return IDENTITY_QUERY_RE.search(user_query.lower()) is not None
+
+
+def has_identity_leak(response: str) -> bool:
+    return PROBLEMATIC_IDENTITY_RE.search(response) is not None
+
+
+def filter_response(response: str, user_query: str, identity_question: Optional[bool] = None) -> str:
+    """
+    응답 필터링:
+    1. 내부 프롬프트/메타데이터 제거 (모든 응답에 적용)
+    2. 정체성 관련 응답을 SHawn-Bot으로 강제 치환 (정체성 질문에만 적용)
+
+    identity_question: 어휘 분석 단계에서 이미 판단한 경우 전달 (재스캔 생략)
+    """
+    cleaned_response = strip_metadata(response).strip()
+
+    if identity_question is None:
+        identity_question = is_identity_question(user_query)
+
+    if identity_question and has_identity_leak(cleaned_response):
+        return IDENTITY_OVERRIDE_RESPONSE
+
+    return cleaned_response
+
+
+class StreamingResponseFilter:
+    """
+    스트리밍 청크용 점진적 필터
+    문단 경계까지 완성된 텍스트만 정제하여 내보내고, 나머지는 다음 청크까지 보류합니다.
+    정체성 질문이면 치환 여부를 응답 전체로 판단해야 하므로 flush()까지 보류합니다.
+
+    Usage:
+        f = StreamingResponseFilter(user_query)
+        for chunk in stream:
+            out = f.feed(chunk)
+            if out: send(out)
+        send(f.flush())
+    """
+
+    def __init__(self, user_query: str = ""):
+        self.hold_all = is_identity_question(user_query)
+        self._buffer = ""
+        self._scan_from = 0       # 문단 경계 탐색 시작 위치 (이미 확인한 구간 재탐색 방지)
+        self._pending_ws = ""     # 이미 정제된 세그먼트의 후행 공백 (다음 세그먼트와 합쳐 정리)
+        self._started = False     # 첫 내용 출력 여부 (선행 공백 제거용)
+        self._emitted = []
+
+    def feed(self, chunk: str) -> str:
+        """청크 추가 후 출력 가능한 정제 텍스트 반환"""
+        self._buffer += chunk
+        if self.hold_all:
+            return ""
+
+        breaks = [m.start() for m in _PARAGRAPH_BREAK_RE.finditer(self._buffer, self._scan_from)]
+        cut = next((b for b in reversed(breaks) if _is_safe_cut(self._buffer[:b])), None)
+        # 후행 공백 구간은 다음 청크와 이어서 경계를 이룰 수 있으므로 재탐색 대상에 남김
+        end = len(self._buffer)
+        while end > 0 and self._buffer[end - 1].isspace():
+            end -= 1
+        self._scan_from = end
+        if cut is None:
+            return ""
+
+        segment, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        self._scan_from = max(0, self._scan_from - cut)
+        return self._emit(strip_metadata(segment))
+
+    def flush(self) -> str:
+        """스트림 종료: 남은 버퍼 정제 후 반환"""
+        remaining, self._buffer = self._buffer, ""
+
+        if self.hold_all:
+            result = strip_metadata(remaining).strip()
+            if has_identity_leak(result):
+                result = IDENTITY_OVERRIDE_RESPONSE
+            self._emitted.append(result)
+            return result
+
+        out = self._emit(strip_metadata(remaining))
+        self._pending_ws = ""  # 최종 후행 공백 제거 (strip 동작)
+        return out
+
+    def _emit(self, cleaned: str) -> str:
+        body = cleaned.rstrip()
+        trailing_ws = cleaned[len(body):]
+
+        if not body:
+            # 공백뿐인 세그먼트: 다음 내용과 합쳐 정리
+            self._pending_ws += trailing_ws
+            return ""
+
+        if not self._started:
+            body = body.lstrip()
+            self._started = True
+        else:
+            leading = body[:len(body) - len(body.lstrip())]
+            body = EXCESS_NEWLINES_RE.sub('\n\n', self._pending_ws + leading) + body.lstrip()
+
+        self._pending_ws = trailing_ws
+        self._emitted.append(body)
+        return body
+
+    @property
+    def text(self) -> str:
+        """지금까지 출력된 전체 텍스트"""
+        return "".join(self._emitted)
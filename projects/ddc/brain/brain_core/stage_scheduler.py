@@ -0,0 +1,178 @@
+"""
+StageScheduler - Dependency-aware async stage runner for ChatEngine turns
+서로 독립적인 단계(L2 감정 분석, 기억 컨텍스트 조회 등)는 병렬로 시작하고,
+의존 단계가 끝나는 즉시 후속 단계를 실행합니다. 단계별 타이밍과 임계 경로를 기록합니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 단계 함수는 완료된 선행 단계 결과(dict)를 받아 값 또는 awaitable을 반환
+StageFunc = Callable[[Dict[str, Any]], Union[Any, Awaitable[Any]]]
+
+
+@dataclass
+class Stage:
+    """단일 실행 단계"""
+    name: str
+    func: StageFunc
+    depends_on: List[str] = field(default_factory=list)
+    run_in_thread: bool = False  # 동기 블로킹 작업(디스크 I/O 등)은 스레드에서 실행
+    start_ms: Optional[float] = None
+    end_ms: Optional[float] = None
+
+    @property
+    def duration_ms(self) -> float:
+        if self.start_ms is None or self.end_ms is None:
+            return 0.0
+        return self.end_ms - self.start_ms
+
+
+class StageScheduler:
+    """
+    DAG 기반 단계 스케줄러
+    - 선행 단계가 모두 끝난 단계부터 즉시 실행 (asyncio 태스크)
+    - 순차 실행 대비 절약 시간 = 단계 시간 합 - 실제 경과 시간
+    """
+
+    def __init__(self, name: str = "turn"):
+        self.name = name
+        self.stages: Dict[str, Stage] = {}
+        self.results: Dict[str, Any] = {}
+        self.wall_ms: float = 0.0
+
+    def add_stage(
+        self,
+        name: str,
+        func: StageFunc,
+        depends_on: Optional[List[str]] = None,
+        run_in_thread: bool = False,
+    ) -> "StageScheduler":
+        """단계 등록 (체이닝 가능)"""
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self.stages[name] = Stage(name, func, list(depends_on or []), run_in_thread)
+        return self
+
+    def _validate(self):
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        # 순환 의존 검사 (DFS)
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Cyclic dependency at stage '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        모든 단계를 의존 순서에 따라 실행하고 결과 dict 반환
+        한 단계가 실패하면 예외를 그대로 전파합니다.
+        """
+        self._validate()
+        t0 = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def execute(stage: Stage):
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+            deps = {dep: self.results[dep] for dep in stage.depends_on}
+
+            stage.start_ms = (time.perf_counter() - t0) * 1000
+            try:
+                if stage.run_in_thread:
+                    value = await asyncio.to_thread(stage.func, deps)
+                else:
+                    value = stage.func(deps)
+                    if asyncio.iscoroutine(value) or isinstance(value, asyncio.Future):
+                        value = await value
+            finally:
+                stage.end_ms = (time.perf_counter() - t0) * 1000
+
+            self.results[stage.name] = value
+            return value
+
+        for stage in self.stages.values():
+            tasks[stage.name] = asyncio.ensure_future(execute(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        finally:
+            self.wall_ms = (time.perf_counter() - t0) * 1000
+
+        return self.results
+
+    def duration(self, name: str) -> float:
+        """단계 실행 시간 (ms)"""
+        return self.stages[name].duration_ms
+
+    def critical_path(self) -> List[str]:
+        """단계 시간 기준 가장 긴 의존 경로"""
+        memo: Dict[str, tuple] = {}
+
+        def longest(name: str) -> tuple:
+            if name not in memo:
+                stage = self.stages[name]
+                best_ms, best_path = 0.0, []
+                for dep in stage.depends_on:
+                    dep_ms, dep_path = longest(dep)
+                    if dep_ms > best_ms:
+                        best_ms, best_path = dep_ms, dep_path
+                memo[name] = (best_ms + stage.duration_ms, best_path + [name])
+            return memo[name]
+
+        if not self.stages:
+            return []
+        return max((longest(name) for name in self.stages), key=lambda x: x[0])[1]
+
+    def timing_report(self) -> Dict[str, Any]:
+        """단계별 타이밍 및 임계 경로 절약 효과"""
+        sequential_ms = sum(s.duration_ms for s in self.stages.values())
+        path = self.critical_path()
+        return {
+            "stages": {
+                name: {
+                    "start_ms": round(s.start_ms or 0.0, 2),
+                    "duration_ms": round(s.duration_ms, 2),
+                    "depends_on": s.depends_on,
+                }
+                for name, s in self.stages.items()
+            },
+            "sequential_ms": round(sequential_ms, 2),
+            "critical_path": path,
+            "critical_path_ms": round(sum(self.stages[n].duration_ms for n in path), 2),
+            "wall_ms": round(self.wall_ms, 2),
+            "saved_ms": round(max(0.0, sequential_ms - self.wall_ms), 2),
+        }
+
+    def format_timings(self) -> str:
+        """로그 출력용 한 줄 요약"""
+        report = self.timing_report()
+        stages = ", ".join(f"{n}={v['duration_ms']:.1f}ms" for n, v in report["stages"].items())
+        return (
+            f"⏱️ [{self.name}] {stages} | sequential={report['sequential_ms']:.1f}ms, "
+            f"critical={'→'.join(report['critical_path'])} ({report['critical_path_ms']:.1f}ms), "
+            f"wall={report['wall_ms']:.1f}ms, saved={report['saved_ms']:.1f}ms"
+        )
@@ -102,6 +102,30 @@ class AstroCartridgeInterface:
             print(f"⚠️ 별지도 시각화 오류: {e}")
             return {'status': 'error', 'visualization': None}
     
+    def visualize_sky_region(
+        self,
+        star_index,
+        ra_deg: float,
+        dec_deg: float,
+        radius_deg: float,
+        magnitude_range: tuple = (0, 6)
+    ) -> Dict[str, Any]:
+        """
+        천구 영역 별지도 시각화 (StarIndex 원뿔 검색으로 좌표 목록 생성)
+        
+        Args:
+            star_index: astro_cartridge.StarIndex
+            ra_deg, dec_deg: 영역 중심 (도)
+            radius_deg: 영역 반경 (도)
+            magnitude_range: 겉보기 등급 범위
+        """
+        stars = star_index.cone(ra_deg, dec_deg, radius_deg, max_magnitude=magnitude_range[1])
+        coordinates = [
+            {'ra': s['ra_deg'], 'dec': s['dec_deg'], 'magnitude': s['magnitude'], 'name': s['name']}
+            for s in stars if s['magnitude'] >= magnitude_range[0]
+        ]
+        return {**self.visualize_star_map(coordinates, magnitude_range), 'star_count': len(coordinates)}
+    
     def analyze_exoplanet(self, planet_data: Dict[str, Any]) -> Dict[str, Any]:
         """외계 행성 분석"""
         print("🧠 Parietal: 외계 행성 분석")
@@ -156,7 +180,48 @@ class AstroCartridgeInterface:
         except Exception as e:
             print(f"⚠️ 궤도 역학 계산 오류: {e}")
             return {'status': 'error', 'mechanics': {}}
-    
+
+    def check_orbital_stability(
+        self,
+        propagator,
+        systems: List[Any],
+        n_orbits: int = 1000
+    ) -> Dict[str, Any]:
+        """
+        행성계 N체 안정성 검사 (OrbitPropagator 배치 적분)
+
+        Args:
+            propagator: astro_cartridge.OrbitPropagator
+            systems: astro_cartridge.NBodySystem 목록
+            n_orbits: 가장 안쪽 행성 주기 기준 적분 길이
+        """
+        print(f"🧠 Parietal: 궤도 안정성 검사 ({len(systems)}개 행성계)")
+
+        results = propagator.integrate(systems, n_orbits)
+        unstable = [r['system'] for r in results if not r['stable']]
+        return {'status': 'success', 'results': results, 'unstable_systems': unstable}
+
+    def detect_transits(
+        self,
+        search,
+        light_curve,
+        system=None,
+        max_candidates: int = 3
+    ) -> Dict[str, Any]:
+        """
+        광도곡선 트랜짓 탐색 (TransitSearch BLS), system 이 있으면 후보를 행성으로 추가
+
+        Args:
+            search: astro_cartridge.TransitSearch
+            light_curve: astro_cartridge.LightCurve
+            system: astro_cartridge.ExoplanetSystem (선택)
+        """
+        print(f"🧠 Occipital: 트랜짓 탐색 ({len(light_curve)}개 측광점)")
+
+        result = search.search(light_curve, max_candidates)
+        planets = [system.add_transit_candidate(c) for c in result['candidates']] if system else []
+        return {'status': 'success', 'candidates': result['candidates'], 'planets': planets}
+
     def detect_cosmic_events(
         self,
         event_data: List[Dict[str, Any]]
@@ -1,8 +1,16 @@
 """
 SHawn-BIO: Biology Cartridge
 Biological data analysis and processing
-"""
 
-from .cartridge import BiologyCartridge
+하위 카트리지 모듈 (quant_cartridge, investment_cartridge_v2 등) 만 import 해도
+faiss/sentence-transformers 를 로드하지 않도록 BiologyCartridge 는 지연 로드
+"""
 
 __all__ = ['BiologyCartridge']
+
+
+def __getattr__(name):
+    if name == 'BiologyCartridge':
+        from .bio_cartridge.biology_cartridge import BiologyCartridge
+        return BiologyCartridge
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,18 +7,34 @@ AstroCartridge: 우주과학 전문 카트리지 (Groq 초고속 개발자판)
 - 행성계 및 외계행성
 - 우주 탐사 임무 정보
 - 천체역학 및 궤도 계산
+- 대량 외계행성 카탈로그 (컬럼형, 벡터화 계산)
+- 별 공간 인덱스 (3D 이웃 / 천구 원뿔 검색)
+- 궤도 전파 및 N체 안정성 검사 (배치 / 프로세스 풀)
+- 광도곡선 트랜짓 탐색 (스트리밍 추세 제거 + BLS)
 
 작성자: Groq API 초고속 개발자
 버전: 1.0.0
 라이선스: MIT
 """
 
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import math
 import json
+import csv
+import heapq
+import os
+
+import numpy as np
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
 
 
 # ════════════════════════════════════════════════════════════════
@@ -116,6 +132,8 @@ class Star:
     mass_solar: float  # 태양질량 단위
     radius_solar: float  # 태양반경 단위
     luminosity_solar: float  # 태양광도 단위
+    ra_deg: Optional[float] = None  # 적경 (도, J2000)
+    dec_deg: Optional[float] = None  # 적위 (도, J2000)
     
     def info(self) -> Dict:
         """별의 상세 정보"""
@@ -129,6 +147,8 @@ class Star:
             "mass_solar_masses": self.mass_solar,
             "radius_solar_radii": self.radius_solar,
             "luminosity_solar_luminosities": self.luminosity_solar,
+            "ra_deg": self.ra_deg,
+            "dec_deg": self.dec_deg,
             "surface_temp_k": spec_info["surface_temp_k"],
             "lifetime_million_years": spec_info["lifetime_million_years"]
         }
@@ -168,12 +188,35 @@ class ExoplanetSystem:
         except Exception as e:
             raise ValueError(f"행성 추가 실패: {e}")
     
+    def add_transit_candidate(self, candidate: Dict, planet_name: Optional[str] = None) -> Dict:
+        """
+        BLS 트랜짓 후보를 행성으로 추가 (깊이 -> 반지름 -> 행성 분류, 케플러 제3법칙 -> 장반경)
+
+        Args:
+            candidate: TransitSearch.search 의 후보 (period_days, epoch, duration_days, depth, sde)
+            planet_name: 생략 시 '<항성> <다음 문자>'
+        """
+        radius_earth = math.sqrt(max(candidate["depth"], 0.0)) * self.star.radius_solar * SUN_RADIUS_EARTH
+        period = candidate["period_days"]
+        axis = (self.star.mass_solar * (period / 365.25) ** 2) ** (1 / 3)
+        name = planet_name or f"{self.star.name} {chr(98 + len(self.planets))}"
+        self.add_planet(name, planet_type_from_radius(radius_earth), period, axis)
+        self.planets[-1].update({
+            "radius_earth": round(radius_earth, 2),
+            "transit_epoch": candidate["epoch"],
+            "transit_duration_hours": round(candidate["duration_days"] * 24, 2),
+            "transit_depth": candidate["depth"],
+            "sde": round(candidate["sde"], 1),
+            "candidate": True,
+        })
+        return self.planets[-1]
+    
     def _calculate_orbital_velocity(self, semi_major_axis_au: float) -> float:
         """궤도 속도 계산 (km/s)"""
         try:
             # 케플러 법칙 적용
             M = self.star.mass_solar
-            a = semi_major_axis_au * 1.496e8  # AU -> km
+            a = semi_major_axis_au * 1.496e11  # AU -> m
             G = 6.674e-11
             sun_mass_kg = 1.989e30
             return math.sqrt(G * M * sun_mass_kg / a) / 1000
@@ -243,7 +286,1323 @@ class SpaceMission:
 
 
 # ════════════════════════════════════════════════════════════════
-# 3️⃣  MAIN CARTRIDGE: AstroCartridge 클래스
+# 3️⃣  CATALOG: 컬럼형 외계행성 카탈로그 (벡터화 계산)
+# ════════════════════════════════════════════════════════════════
+
+G_CONSTANT = 6.674e-11  # 만유인력상수 (m³/kg/s²)
+SUN_MASS_KG = 1.989e30
+EARTH_MASS_KG = 5.972e24
+EARTH_RADIUS_KM = 6371.0
+AU_M = 1.496e11
+LY_PER_PC = 3.26156
+SUN_TEFF_K = 5772.0
+
+
+def surface_gravity(mass_kg, radius_km) -> np.ndarray:
+    """표면 중력 가속도 (m/s²) - CelestialBody.gravity 의 배열판 (계산 불가 = NaN)"""
+    radius_m = np.asarray(radius_km, dtype=float) * 1000
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return G_CONSTANT * np.asarray(mass_kg, dtype=float) / radius_m ** 2
+
+
+def escape_velocity(mass_kg, radius_km) -> np.ndarray:
+    """탈출속도 (km/s) - CelestialBody.escape_velocity 의 배열판"""
+    radius_m = np.asarray(radius_km, dtype=float) * 1000
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sqrt(2 * G_CONSTANT * np.asarray(mass_kg, dtype=float) / radius_m) / 1000
+
+
+def orbital_velocity(star_mass_solar, semi_major_axis_au) -> np.ndarray:
+    """원궤도 속도 (km/s) - ExoplanetSystem._calculate_orbital_velocity 의 배열판"""
+    a_m = np.asarray(semi_major_axis_au, dtype=float) * AU_M
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sqrt(G_CONSTANT * np.asarray(star_mass_solar, dtype=float) * SUN_MASS_KG / a_m) / 1000
+
+
+def habitable_zone(luminosity_solar) -> Tuple[np.ndarray, np.ndarray]:
+    """거주가능 영역 (AU) 배열: (내부경계, 외부경계) - ExoplanetSystem.habitable_zone 과 같은 근사"""
+    L = np.asarray(luminosity_solar, dtype=float)
+    with np.errstate(invalid='ignore'):
+        return np.sqrt(L / 1.1), np.sqrt(L / 0.53)
+
+
+def absolute_magnitude(apparent_mag, distance_ly) -> np.ndarray:
+    """거리계수를 이용한 절대등급 배열 (거리가 0 이하/없음 = NaN)"""
+    distance_pc = np.asarray(distance_ly, dtype=float) / LY_PER_PC
+    with np.errstate(divide='ignore', invalid='ignore'):
+        modulus = 5 * np.log10(np.where(distance_pc > 0, distance_pc, np.nan)) - 5
+    return np.asarray(apparent_mag, dtype=float) - modulus
+
+
+class ExoplanetCatalog:
+    """
+    컬럼형 외계행성 카탈로그
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    행성 하나 = 모든 컬럼 배열의 같은 위치. 값이 없으면 NaN (문자열 컬럼은 '').
+    수천~수십만 행성의 중력/속도/거주가능 영역을 반복문 없이 한 번에 계산합니다.
+    """
+
+    TEXT_COLUMNS = ("planet_name", "system_name", "host_name")
+    NUMERIC_COLUMNS = (
+        "period_days", "semi_major_axis_au", "mass_earth", "radius_earth",
+        "star_mass_solar", "star_radius_solar", "star_teff_k", "star_luminosity_solar",
+        "distance_ly", "ra_deg", "dec_deg", "v_mag", "eccentricity",
+    )
+
+    # NASA Exoplanet Archive (PSCompPars) 컬럼 -> 카탈로그 컬럼
+    NASA_ARCHIVE_COLUMNS = {
+        "planet_name": "pl_name",
+        "system_name": "hostname",
+        "host_name": "hostname",
+        "period_days": "pl_orbper",
+        "semi_major_axis_au": "pl_orbsmax",
+        "mass_earth": "pl_bmasse",
+        "radius_earth": "pl_rade",
+        "star_mass_solar": "st_mass",
+        "star_radius_solar": "st_rad",
+        "star_teff_k": "st_teff",
+        "star_luminosity_solar": "st_lum",
+        "distance_ly": "sy_dist",
+        "ra_deg": "ra",
+        "dec_deg": "dec",
+        "v_mag": "sy_vmag",
+        "eccentricity": "pl_orbeccen",
+    }
+
+    # 단위 변환이 필요한 원본 컬럼 (st_lum: log10(L/L☉), sy_dist: pc)
+    SOURCE_TRANSFORMS = {
+        "st_lum": lambda values: np.power(10.0, values),
+        "sy_dist": lambda values: values * LY_PER_PC,
+    }
+
+    def __init__(self, **columns) -> None:
+        """
+        Args:
+            **columns: TEXT_COLUMNS / NUMERIC_COLUMNS 이름의 배열 (길이 동일, 생략 시 빈 값)
+        """
+        unknown = set(columns) - set(self.TEXT_COLUMNS) - set(self.NUMERIC_COLUMNS)
+        if unknown:
+            raise ValueError(f"알 수 없는 카탈로그 컬럼: {sorted(unknown)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"컬럼 길이가 다름: {sorted(lengths)}")
+        size = lengths.pop() if lengths else 0
+
+        for name in self.TEXT_COLUMNS:
+            values = columns.get(name)
+            setattr(self, name, np.full(size, '', dtype=object) if values is None
+                    else np.asarray(values, dtype=object))
+        for name in self.NUMERIC_COLUMNS:
+            values = columns.get(name)
+            setattr(self, name, np.full(size, np.nan) if values is None
+                    else np.array(values, dtype=float))
+        self._fill_derived()
+
+    def _fill_derived(self) -> None:
+        """빠진 값 보완: 케플러 제3법칙 (주기 <-> 장반경), L = R²(T/T☉)⁴"""
+        years = self.period_days / 365.25
+        with np.errstate(invalid='ignore'):
+            missing = np.isnan(self.semi_major_axis_au)
+            self.semi_major_axis_au[missing] = np.cbrt(self.star_mass_solar * years ** 2)[missing]
+            missing = np.isnan(self.period_days)
+            self.period_days[missing] = (365.25 * np.sqrt(self.semi_major_axis_au ** 3 / self.star_mass_solar))[missing]
+            missing = np.isnan(self.star_luminosity_solar)
+            self.star_luminosity_solar[missing] = (
+                self.star_radius_solar ** 2 * (self.star_teff_k / SUN_TEFF_K) ** 4)[missing]
+
+    def __len__(self) -> int:
+        return len(self.planet_name)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """컬럼 이름 -> 배열"""
+        return {name: getattr(self, name) for name in self.TEXT_COLUMNS + self.NUMERIC_COLUMNS}
+
+    def select(self, mask) -> "ExoplanetCatalog":
+        """불리언 마스크/인덱스로 부분 카탈로그 생성"""
+        return ExoplanetCatalog(**{name: values[mask] for name, values in self.columns().items()})
+
+    # ── 생성 / 대량 로드 ──
+
+    @classmethod
+    def from_systems(cls, systems: Dict[str, "ExoplanetSystem"]) -> "ExoplanetCatalog":
+        """등록된 ExoplanetSystem 들을 컬럼형으로 변환 (system_name = 딕셔너리 키)"""
+        rows = [(key, system, planet) for key, system in systems.items() for planet in system.planets]
+        star = [system.star for _, system, _ in rows]
+        return cls(
+            planet_name=[planet["name"] for _, _, planet in rows],
+            system_name=[key for key, _, _ in rows],
+            host_name=[s.name for s in star],
+            period_days=[planet["orbital_period_days"] for _, _, planet in rows],
+            semi_major_axis_au=[planet["semi_major_axis_au"] for _, _, planet in rows],
+            star_mass_solar=[s.mass_solar for s in star],
+            star_radius_solar=[s.radius_solar for s in star],
+            star_teff_k=[s.spectral_type.info()["surface_temp_k"] for s in star],
+            star_luminosity_solar=[s.luminosity_solar for s in star],
+            distance_ly=[s.distance_ly for s in star],
+            v_mag=[s.magnitude for s in star],
+        )
+
+    @classmethod
+    def load(cls, path: str, columns: Optional[Dict[str, str]] = None) -> "ExoplanetCatalog":
+        """
+        대량 카탈로그 로드 (오프라인 파일)
+
+        Args:
+            path: .csv (NASA Exoplanet Archive 형식, '#' 주석 줄 허용), .parquet, .npz (save 결과)
+            columns: 카탈로그 컬럼 -> 원본 컬럼 이름 (NASA_ARCHIVE_COLUMNS 덮어쓰기).
+                     카탈로그 컬럼 이름이 원본에 그대로 있으면 그 컬럼을 우선 사용합니다.
+        """
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix == ".npz":
+            with np.load(path, allow_pickle=False) as data:
+                return cls(**{name: data[name].astype(object) if name in cls.TEXT_COLUMNS else data[name]
+                              for name in data.files})
+
+        if suffix in (".parquet", ".pq"):
+            if not PANDAS_AVAILABLE:
+                raise ImportError("Parquet 카탈로그를 읽으려면 pandas (+ pyarrow) 가 필요합니다")
+            frame = pd.read_parquet(path)
+            header = list(frame.columns)
+
+            def read_column(name: str, numeric: bool) -> np.ndarray:
+                if numeric:
+                    return pd.to_numeric(frame[name], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+                return frame[name].fillna('').astype(str).to_numpy(dtype=object)
+        else:
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(line for line in f if not line.startswith('#'))
+                header = next(reader)
+                rows = list(reader)
+            index = {name: i for i, name in enumerate(header)}
+
+            def read_column(name: str, numeric: bool) -> np.ndarray:
+                i = index[name]
+                values = [row[i].strip() if i < len(row) else '' for row in rows]
+                if numeric:
+                    return np.array([v or 'nan' for v in values], dtype=float)
+                return np.array(values, dtype=object)
+
+        mapping = {**cls.NASA_ARCHIVE_COLUMNS, **(columns or {})}
+        data = {}
+        for name in cls.TEXT_COLUMNS + cls.NUMERIC_COLUMNS:
+            source = name if name in header else mapping.get(name)
+            if source not in header:
+                continue
+            values = read_column(source, name in cls.NUMERIC_COLUMNS)
+            transform = cls.SOURCE_TRANSFORMS.get(source) if source != name else None
+            data[name] = transform(values) if transform else values
+        if "system_name" not in data and "host_name" in data:
+            data["system_name"] = data["host_name"].copy()
+        return cls(**data)
+
+    def save(self, path: str) -> None:
+        """컬럼 배열을 .npz 로 저장 (다음 로드는 파싱 없이 바로 배열)"""
+        np.savez(path, **{name: values.astype(str) if name in self.TEXT_COLUMNS else values
+                          for name, values in self.columns().items()})
+
+    # ── 벡터화 계산 ──
+
+    def surface_gravity(self) -> np.ndarray:
+        """행성 표면 중력 (m/s²)"""
+        return surface_gravity(self.mass_earth * EARTH_MASS_KG, self.radius_earth * EARTH_RADIUS_KM)
+
+    def escape_velocity(self) -> np.ndarray:
+        """행성 탈출속도 (km/s)"""
+        return escape_velocity(self.mass_earth * EARTH_MASS_KG, self.radius_earth * EARTH_RADIUS_KM)
+
+    def orbital_velocity(self) -> np.ndarray:
+        """행성 궤도 속도 (km/s)"""
+        return orbital_velocity(self.star_mass_solar, self.semi_major_axis_au)
+
+    def habitable_zone(self) -> Tuple[np.ndarray, np.ndarray]:
+        """각 행성 모항성의 거주가능 영역 (AU)"""
+        return habitable_zone(self.star_luminosity_solar)
+
+    def absolute_magnitude(self) -> np.ndarray:
+        """모항성 절대등급"""
+        return absolute_magnitude(self.v_mag, self.distance_ly)
+
+    def habitable_mask(self, decimals: Optional[int] = 3) -> np.ndarray:
+        """
+        거주가능 영역 안의 행성 (값이 없는 행성은 False)
+
+        Args:
+            decimals: 경계 반올림 자릿수 (기본 3 = ExoplanetSystem.habitable_zone 과 동일, None = 반올림 없음)
+        """
+        inner, outer = self.habitable_zone()
+        if decimals is not None:
+            inner, outer = np.round(inner, decimals), np.round(outer, decimals)
+        with np.errstate(invalid='ignore'):
+            return (self.semi_major_axis_au >= inner) & (self.semi_major_axis_au <= outer)
+
+    def find_habitable(self, limit: Optional[int] = None) -> List[Dict]:
+        """거주가능 영역 행성 목록 (AstroCartridge.find_habitable_planets 와 같은 형식)"""
+        mask = self.habitable_mask()
+        indices = np.flatnonzero(mask)[:limit]
+        inner, outer = self.habitable_zone()
+        results = []
+        for i in indices:
+            axis = float(self.semi_major_axis_au[i])
+            hz_inner, hz_outer = round(float(inner[i]), 3), round(float(outer[i]), 3)
+            width = hz_outer - hz_inner
+            results.append({
+                "system": self.system_name[i],
+                "planet": self.planet_name[i],
+                "star": self.host_name[i],
+                "semi_major_axis_au": axis,
+                "habitable_zone_inner_au": hz_inner,
+                "habitable_zone_outer_au": hz_outer,
+                "habitable_index": round((axis - hz_inner) / width, 2) if width > 0 else 0.0
+            })
+        return results
+
+
+# ════════════════════════════════════════════════════════════════
+# 4️⃣  SPATIAL INDEX: 3D k-d 트리 + 천구 격자 (이웃 / 원뿔 검색)
+# ════════════════════════════════════════════════════════════════
+
+def unit_vectors(ra_deg, dec_deg) -> np.ndarray:
+    """적경/적위 (도) -> 천구 단위벡터 (N, 3)"""
+    ra, dec = np.radians(np.asarray(ra_deg, dtype=float)), np.radians(np.asarray(dec_deg, dtype=float))
+    return np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], axis=-1)
+
+
+def angular_separation(ra1, dec1, ra2, dec2) -> np.ndarray:
+    """두 천구 좌표 사이 각거리 (도)"""
+    dot = np.sum(unit_vectors(ra1, dec1) * unit_vectors(ra2, dec2), axis=-1)
+    return np.degrees(np.arccos(np.clip(dot, -1.0, 1.0)))
+
+
+class KDTree:
+    """
+    배열 기반 k-d 트리
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    점들을 리프 순서로 재배열해 두고 노드마다 [start, end) 범위와 경계상자를 저장합니다.
+    가지치기는 경계상자 거리로, 리프 안의 거리 계산은 벡터화로 처리합니다.
+    """
+
+    NODE_ARRAYS = ("node_start", "node_end", "node_left", "node_right", "node_min", "node_max")
+
+    def __init__(self, points, leaf_size: int = 32) -> None:
+        points = np.asarray(points, dtype=float)
+        order = np.arange(len(points))
+        starts, ends, lefts, rights, mins, maxs = [], [], [], [], [], []
+
+        def add_node(start: int, end: int) -> int:
+            chunk = points[order[start:end]]
+            starts.append(start)
+            ends.append(end)
+            lefts.append(-1)
+            rights.append(-1)
+            mins.append(chunk.min(axis=0) if end > start else np.zeros(points.shape[1]))
+            maxs.append(chunk.max(axis=0) if end > start else np.zeros(points.shape[1]))
+            return len(starts) - 1
+
+        stack = [add_node(0, len(points))]
+        while stack:
+            node = stack.pop()
+            start, end = starts[node], ends[node]
+            if end - start <= leaf_size:
+                continue
+            dim = int(np.argmax(maxs[node] - mins[node]))
+            mid = (start + end) // 2
+            segment = order[start:end]
+            order[start:end] = segment[np.argpartition(points[segment, dim], mid - start)]
+            lefts[node], rights[node] = add_node(start, mid), add_node(mid, end)
+            stack.extend((lefts[node], rights[node]))
+
+        self.leaf_size = leaf_size
+        self.indices = order
+        self.points = points[order]
+        self.node_start, self.node_end = np.array(starts), np.array(ends)
+        self.node_left, self.node_right = np.array(lefts), np.array(rights)
+        self.node_min, self.node_max = np.array(mins), np.array(maxs)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _box_distance2(self, node: int, center: np.ndarray) -> float:
+        gap = np.maximum(self.node_min[node] - center, 0) + np.maximum(center - self.node_max[node], 0)
+        return float(gap @ gap)
+
+    def query_radius(self, center, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """반경 안의 점: (원래 인덱스, 거리), 거리 오름차순"""
+        center = np.asarray(center, dtype=float)
+        radius2 = radius * radius
+        found_idx, found_d2 = [], []
+        stack = [0] if len(self) else []
+        while stack:
+            node = stack.pop()
+            if self._box_distance2(node, center) > radius2:
+                continue
+            if self.node_left[node] >= 0:
+                stack.extend((self.node_left[node], self.node_right[node]))
+                continue
+            start, end = self.node_start[node], self.node_end[node]
+            diff = self.points[start:end] - center
+            d2 = np.einsum('ij,ij->i', diff, diff)
+            hit = d2 <= radius2
+            found_idx.append(self.indices[start:end][hit])
+            found_d2.append(d2[hit])
+        if not found_idx:
+            return np.array([], dtype=int), np.array([])
+        idx, d2 = np.concatenate(found_idx), np.concatenate(found_d2)
+        order = np.argsort(d2, kind='stable')
+        return idx[order], np.sqrt(d2[order])
+
+    def query(self, center, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """가장 가까운 k 개: (원래 인덱스, 거리), 거리 오름차순 (경계상자 거리 우선 탐색)"""
+        center = np.asarray(center, dtype=float)
+        k = min(k, len(self))
+        best_idx, best_d2 = np.array([], dtype=int), np.array([])
+        heap = [(0.0, 0)] if k > 0 else []
+        while heap:
+            box_d2, node = heapq.heappop(heap)
+            if len(best_d2) == k and box_d2 > best_d2[-1]:
+                break
+            if self.node_left[node] >= 0:
+                for child in (self.node_left[node], self.node_right[node]):
+                    heapq.heappush(heap, (self._box_distance2(child, center), int(child)))
+                continue
+            start, end = self.node_start[node], self.node_end[node]
+            diff = self.points[start:end] - center
+            d2 = np.concatenate([best_d2, np.einsum('ij,ij->i', diff, diff)])
+            idx = np.concatenate([best_idx, self.indices[start:end]])
+            keep = np.argsort(d2, kind='stable')[:k]
+            best_idx, best_d2 = idx[keep], d2[keep]
+        return best_idx, np.sqrt(best_d2)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """저장용 배열"""
+        data = {name: getattr(self, name) for name in self.NODE_ARRAYS}
+        data.update(indices=self.indices, points=self.points, leaf_size=np.array(self.leaf_size))
+        return data
+
+    @classmethod
+    def from_arrays(cls, data) -> "KDTree":
+        """저장된 배열에서 재구성 (다시 분할하지 않음)"""
+        tree = cls.__new__(cls)
+        for name in cls.NODE_ARRAYS + ("indices", "points"):
+            setattr(tree, name, np.asarray(data[name]))
+        tree.leaf_size = int(data["leaf_size"])
+        return tree
+
+
+class SkyGrid:
+    """
+    등면적에 가까운 천구 격자 (HEALPix 유사)
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    적위 띠마다 cos(δ) 에 비례하는 수의 적경 셀을 두고, 셀별 별 목록을 CSR 배열로 저장합니다.
+    원뿔 검색은 겹치는 셀만 모은 뒤 단위벡터 내적으로 정확히 거릅니다.
+    """
+
+    def __init__(self, ra_deg, dec_deg, cell_deg: float = 1.0) -> None:
+        self._layout(max(1, int(math.ceil(180.0 / cell_deg))), ra_deg, dec_deg)
+        valid = np.flatnonzero(np.isfinite(self.ra_deg) & np.isfinite(self.dec_deg))
+        cells = self._cell_ids(self.ra_deg[valid], self.dec_deg[valid])
+        order = np.argsort(cells, kind='stable')
+        self.members = valid[order]
+        self.cell_start = np.searchsorted(cells[order], np.arange(self.band_offset[-1] + 1))
+
+    def _layout(self, band_count: int, ra_deg, dec_deg) -> None:
+        self.band_count = band_count
+        self.band_height = 180.0 / band_count
+        centers = np.radians(-90.0 + (np.arange(band_count) + 0.5) * self.band_height)
+        self.band_cells = np.maximum(1, np.round(360.0 * np.cos(centers) / self.band_height)).astype(int)
+        self.band_offset = np.concatenate([[0], np.cumsum(self.band_cells)])
+        self.ra_deg = np.asarray(ra_deg, dtype=float)
+        self.dec_deg = np.asarray(dec_deg, dtype=float)
+        self.vectors = unit_vectors(self.ra_deg, self.dec_deg)
+
+    @classmethod
+    def from_arrays(cls, band_count: int, ra_deg, dec_deg, members, cell_start) -> "SkyGrid":
+        """저장된 CSR 배열에서 재구성"""
+        grid = cls.__new__(cls)
+        grid._layout(band_count, ra_deg, dec_deg)
+        grid.members, grid.cell_start = np.asarray(members), np.asarray(cell_start)
+        return grid
+
+    def _band(self, dec_deg) -> np.ndarray:
+        band = np.floor((np.asarray(dec_deg, dtype=float) + 90.0) / self.band_height).astype(int)
+        return np.clip(band, 0, self.band_count - 1)
+
+    def _cell_ids(self, ra_deg, dec_deg) -> np.ndarray:
+        band = self._band(dec_deg)
+        n = self.band_cells[band]
+        column = np.floor(np.mod(ra_deg, 360.0) / 360.0 * n).astype(int) % n
+        return self.band_offset[band] + column
+
+    def cone(self, ra_deg: float, dec_deg: float, radius_deg: float) -> Tuple[np.ndarray, np.ndarray]:
+        """원뿔 안의 별: (인덱스, 중심으로부터 각거리 도), 각거리 오름차순"""
+        radius = math.radians(radius_deg)
+        cos_dec = math.cos(math.radians(dec_deg))
+        whole_ring = radius >= math.pi / 2 or math.sin(radius) >= cos_dec  # 극을 포함하는 원뿔
+        half_width = 180.0 if whole_ring else math.degrees(math.asin(math.sin(radius) / cos_dec))
+
+        candidates = []
+        for band in range(self._band(dec_deg - radius_deg), self._band(dec_deg + radius_deg) + 1):
+            n = self.band_cells[band]
+            if half_width >= 180.0 or n == 1:
+                columns = np.arange(n)
+            else:
+                first = int(math.floor((ra_deg - half_width) % 360.0 / 360.0 * n))
+                span = int(math.ceil(2 * half_width / 360.0 * n)) + 1
+                columns = np.unique((first + np.arange(min(span, n) + 1)) % n)
+            for cell in self.band_offset[band] + columns:
+                candidates.append(self.members[self.cell_start[cell]:self.cell_start[cell + 1]])
+        if not candidates:
+            return np.array([], dtype=int), np.array([])
+
+        idx = np.concatenate(candidates)
+        dot = self.vectors[idx] @ unit_vectors(ra_deg, dec_deg)
+        hit = dot >= math.cos(radius)
+        idx = idx[hit]
+        separation = np.degrees(np.arccos(np.clip(dot[hit], -1.0, 1.0)))
+        order = np.argsort(separation, kind='stable')
+        return idx[order], separation[order]
+
+
+class StarIndex:
+    """
+    별 위치 공간 인덱스
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    - 3D 이웃 검색: 태양 중심 직교좌표 (광년) 위의 KDTree
+    - 원뿔 검색: 적경/적위 SkyGrid
+    대량 별 목록 파일 (HYG 형식 CSV) 에서 만들고 .npz 로 저장/로드합니다.
+    """
+
+    # HYG 데이터베이스 컬럼 -> 인덱스 컬럼 (ra: 시 단위, dist: pc, 100000 = 거리 미상)
+    HYG_COLUMNS = {"name": "proper", "ra_deg": "ra", "dec_deg": "dec", "distance_ly": "dist", "magnitude": "mag"}
+    SOURCE_TRANSFORMS = {
+        "ra": lambda values: values * 15.0,
+        "dist": lambda values: np.where(values >= 100000, np.nan, values * LY_PER_PC),
+    }
+
+    def __init__(self, names, ra_deg, dec_deg, distance_ly, magnitude=None,
+                 leaf_size: int = 32, cell_deg: float = 1.0) -> None:
+        self.names = np.asarray(names, dtype=object)
+        self.ra_deg = np.asarray(ra_deg, dtype=float)
+        self.dec_deg = np.asarray(dec_deg, dtype=float)
+        self.distance_ly = np.asarray(distance_ly, dtype=float)
+        self.magnitude = np.full(len(self.names), np.nan) if magnitude is None else np.asarray(magnitude, dtype=float)
+        self.row_by_name = {name: i for i, name in enumerate(self.names)}
+
+        # 거리 0 (태양) 은 방향과 무관하게 원점
+        at_origin = self.distance_ly == 0
+        positions = self.distance_ly[:, None] * unit_vectors(np.where(at_origin, 0.0, self.ra_deg),
+                                                             np.where(at_origin, 0.0, self.dec_deg))
+        self.positions = np.where(at_origin[:, None], 0.0, positions)
+        located = np.flatnonzero(np.isfinite(self.positions).all(axis=1))
+        self.kdtree_rows = located
+        self.kdtree = KDTree(self.positions[located], leaf_size)
+        self.sky_grid = SkyGrid(self.ra_deg, self.dec_deg, cell_deg)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ── 생성 / 저장 ──
+
+    @classmethod
+    def from_stars(cls, stars, **kwargs) -> "StarIndex":
+        """Star 객체들로 인덱스 생성"""
+        stars = list(stars)
+        return cls([s.name for s in stars],
+                   [np.nan if s.ra_deg is None else s.ra_deg for s in stars],
+                   [np.nan if s.dec_deg is None else s.dec_deg for s in stars],
+                   [s.distance_ly for s in stars], [s.magnitude for s in stars], **kwargs)
+
+    @classmethod
+    def from_catalog(cls, catalog: ExoplanetCatalog, **kwargs) -> "StarIndex":
+        """외계행성 카탈로그의 모항성 (호스트별 첫 행) 으로 인덱스 생성"""
+        _, first = np.unique(catalog.host_name.astype(str), return_index=True)
+        first.sort()
+        return cls(catalog.host_name[first], catalog.ra_deg[first], catalog.dec_deg[first],
+                   catalog.distance_ly[first], catalog.v_mag[first], **kwargs)
+
+    @classmethod
+    def merge(cls, *indexes: "StarIndex", **kwargs) -> "StarIndex":
+        """여러 인덱스를 하나로 (이름이 겹치면 앞의 것 우선)"""
+        seen, rows = set(), []
+        for index in indexes:
+            for i, name in enumerate(index.names):
+                if name not in seen:
+                    seen.add(name)
+                    rows.append((index, i))
+        column = lambda attr: [getattr(index, attr)[i] for index, i in rows]
+        return cls(column("names"), column("ra_deg"), column("dec_deg"), column("distance_ly"),
+                   column("magnitude"), **kwargs)
+
+    @classmethod
+    def load(cls, path: str, columns: Optional[Dict[str, str]] = None, **kwargs) -> "StarIndex":
+        """
+        대량 별 목록에서 생성하거나 저장된 인덱스 로드
+
+        Args:
+            path: .npz (save 결과, 트리/격자 재계산 없음) 또는 .csv (HYG 형식 또는 인덱스 컬럼 이름)
+            columns: 인덱스 컬럼 -> 원본 컬럼 이름 (HYG_COLUMNS 덮어쓰기)
+        """
+        if os.path.splitext(path)[1].lower() == ".npz":
+            with np.load(path, allow_pickle=False) as data:
+                return cls._from_saved(data)
+
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(line for line in f if not line.startswith('#'))
+            header = next(reader)
+            rows = list(reader)
+        index = {name: i for i, name in enumerate(header)}
+        mapping = {**cls.HYG_COLUMNS, **(columns or {})}
+        data = {}
+        for name in ("name", "ra_deg", "dec_deg", "distance_ly", "magnitude"):
+            source = name if name in index else mapping.get(name)
+            if source not in index:
+                continue
+            values = [row[index[source]].strip() if index[source] < len(row) else '' for row in rows]
+            if name == "name":
+                data[name] = [v or f"star-{i}" for i, v in enumerate(values)]
+                continue
+            values = np.array([v or 'nan' for v in values], dtype=float)
+            transform = cls.SOURCE_TRANSFORMS.get(source) if source != name else None
+            data[name] = transform(values) if transform else values
+        missing = {"ra_deg", "dec_deg", "distance_ly"} - set(data)
+        if missing:
+            raise ValueError(f"별 목록에 필요한 컬럼이 없음: {sorted(missing)}")
+        data.setdefault("name", [f"star-{i}" for i in range(len(rows))])
+        return cls(data["name"], data["ra_deg"], data["dec_deg"], data["distance_ly"], data.get("magnitude"), **kwargs)
+
+    def save(self, path: str) -> None:
+        """인덱스 저장 (.npz: 별 컬럼 + k-d 트리 노드 + 격자 CSR)"""
+        grid = self.sky_grid
+        np.savez(path, names=self.names.astype(str), ra_deg=self.ra_deg, dec_deg=self.dec_deg,
+                 distance_ly=self.distance_ly, magnitude=self.magnitude, kdtree_rows=self.kdtree_rows,
+                 grid_band_count=np.array(grid.band_count), grid_members=grid.members,
+                 grid_cell_start=grid.cell_start,
+                 **{f"kdtree_{name}": values for name, values in self.kdtree.arrays().items()})
+
+    @classmethod
+    def _from_saved(cls, data) -> "StarIndex":
+        index = cls.__new__(cls)
+        index.names = data["names"].astype(object)
+        for name in ("ra_deg", "dec_deg", "distance_ly", "magnitude", "kdtree_rows"):
+            setattr(index, name, data[name])
+        index.row_by_name = {name: i for i, name in enumerate(index.names)}
+        index.kdtree = KDTree.from_arrays({name[len("kdtree_"):]: data[name]
+                                           for name in data.files if name.startswith("kdtree_") and name != "kdtree_rows"})
+        index.positions = np.full((len(index.names), 3), np.nan)
+        index.positions[index.kdtree_rows[index.kdtree.indices]] = index.kdtree.points
+
+        index.sky_grid = SkyGrid.from_arrays(int(data["grid_band_count"]), index.ra_deg, index.dec_deg,
+                                             data["grid_members"], data["grid_cell_start"])
+        return index
+
+    # ── 검색 ──
+
+    def position(self, target) -> np.ndarray:
+        """별 이름 또는 직교좌표 (광년) -> 직교좌표"""
+        if isinstance(target, str):
+            if target not in self.row_by_name:
+                raise ValueError(f"인덱스에 없는 별: {target}")
+            position = self.positions[self.row_by_name[target]]
+            if not np.isfinite(position).all():
+                raise ValueError(f"거리 정보가 없는 별: {target}")
+            return position
+        return np.asarray(target, dtype=float)
+
+    def _record(self, row: int, **extra) -> Dict:
+        record = {
+            "name": self.names[row],
+            "ra_deg": float(self.ra_deg[row]),
+            "dec_deg": float(self.dec_deg[row]),
+            "distance_ly": float(self.distance_ly[row]),
+            "magnitude": float(self.magnitude[row]),
+        }
+        record.update({key: float(value) for key, value in extra.items()})
+        return record
+
+    def within(self, target, radius_ly: float) -> List[Dict]:
+        """target (별 이름/좌표) 에서 radius_ly 광년 안의 별 (자신 제외), 가까운 순"""
+        rows, distances = self.kdtree.query_radius(self.position(target), radius_ly)
+        rows = self.kdtree_rows[rows]
+        return [self._record(row, separation_ly=d) for row, d in zip(rows, distances)
+                if not (isinstance(target, str) and self.names[row] == target)]
+
+    def nearest(self, target, k: int = 5) -> List[Dict]:
+        """target 에서 가장 가까운 별 k 개 (자신 제외)"""
+        exclude = isinstance(target, str)
+        rows, distances = self.kdtree.query(self.position(target), k + exclude)
+        rows = self.kdtree_rows[rows]
+        found = [self._record(row, separation_ly=d) for row, d in zip(rows, distances)
+                 if not (exclude and self.names[row] == target)]
+        return found[:k]
+
+    def cone(self, ra_deg: float, dec_deg: float, radius_deg: float,
+             max_magnitude: Optional[float] = None) -> List[Dict]:
+        """천구 원뿔 안의 별 (max_magnitude 보다 어두운 별 제외), 중심에 가까운 순"""
+        rows, separations = self.sky_grid.cone(ra_deg, dec_deg, radius_deg)
+        if max_magnitude is not None:
+            keep = self.magnitude[rows] <= max_magnitude
+            rows, separations = rows[keep], separations[keep]
+        return [self._record(row, angular_separation_deg=s) for row, s in zip(rows, separations)]
+
+
+# ════════════════════════════════════════════════════════════════
+# 5️⃣  ORBITS: 케플러 궤도 전파 + N체 적분 (안정성 검사)
+# ════════════════════════════════════════════════════════════════
+
+GM_SUN_AU3_DAY2 = 2.959122082855911e-4  # 가우스 중력상수² (AU³/일²/태양질량)
+EARTH_MASS_SOLAR = EARTH_MASS_KG / SUN_MASS_KG
+GOLDEN_ANGLE_DEG = 137.50776405003785
+
+
+def solve_kepler(mean_anomaly, eccentricity, tol: float = 1e-12, max_iter: int = 32) -> np.ndarray:
+    """
+    케플러 방정식 M = E - e·sin(E) 를 천체 여러 개에 대해 한 번에 풂 (뉴턴법, 라디안)
+
+    수렴하지 않은 원소만 계속 갱신합니다. e ≥ 0.8 은 E₀ = π 에서 시작해 발산을 피합니다.
+    """
+    M, e = np.broadcast_arrays(np.asarray(mean_anomaly, dtype=float), np.asarray(eccentricity, dtype=float))
+    M = np.mod(M, 2 * np.pi)
+    E = np.where(e < 0.8, M + e * np.sin(M), np.pi)
+    active = np.ones(E.shape, dtype=bool)
+    for _ in range(max_iter):
+        step = (E[active] - e[active] * np.sin(E[active]) - M[active]) / (1 - e[active] * np.cos(E[active]))
+        E[active] -= step
+        still = np.abs(step) > tol
+        if not still.any():
+            break
+        active[active] = still
+    return E
+
+
+def kepler_state(semi_major_axis_au, eccentricity, mean_anomaly_deg, mu,
+                 inclination_deg=0.0, ascending_node_deg=0.0, periapsis_deg=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """궤도 요소 배열 -> 중심천체 기준 위치 (AU), 속도 (AU/일), 마지막 축 = xyz"""
+    a, e, mu = (np.asarray(v, dtype=float) for v in (semi_major_axis_au, eccentricity, mu))
+    E = solve_kepler(np.radians(mean_anomaly_deg), e)
+    cos_E, sin_E = np.cos(E), np.sin(E)
+    root = np.sqrt(1 - e ** 2)
+    E_dot = np.sqrt(mu / a ** 3) / (1 - e * cos_E)
+    orbit_pos = (a * (cos_E - e), a * root * sin_E)
+    orbit_vel = (-a * sin_E * E_dot, a * root * cos_E * E_dot)
+
+    inc, node, peri = (np.radians(np.asarray(v, dtype=float))
+                       for v in (inclination_deg, ascending_node_deg, periapsis_deg))
+    cos_O, sin_O, cos_w, sin_w, cos_i, sin_i = (np.cos(node), np.sin(node), np.cos(peri),
+                                                 np.sin(peri), np.cos(inc), np.sin(inc))
+    # 궤도면 -> 기준면 회전 R = Rz(Ω) Rx(i) Rz(ω) 의 앞 두 열
+    columns = ((cos_O * cos_w - sin_O * sin_w * cos_i, sin_O * cos_w + cos_O * sin_w * cos_i, sin_w * sin_i),
+               (-cos_O * sin_w - sin_O * cos_w * cos_i, -sin_O * sin_w + cos_O * cos_w * cos_i, cos_w * sin_i))
+    rotate = lambda x, y: np.stack([columns[0][k] * x + columns[1][k] * y for k in range(3)], axis=-1)
+    return rotate(*orbit_pos), rotate(*orbit_vel)
+
+
+@dataclass
+class OrbitalElements:
+    """케플러 궤도 요소 배열 (천체 N 개, 각도는 도, 기준 시각 t=0)"""
+    semi_major_axis_au: np.ndarray
+    eccentricity: np.ndarray
+    mean_anomaly_deg: np.ndarray
+    central_mass_solar: np.ndarray
+    inclination_deg: np.ndarray = 0.0
+    ascending_node_deg: np.ndarray = 0.0
+    periapsis_deg: np.ndarray = 0.0
+
+    @property
+    def mu(self) -> np.ndarray:
+        return GM_SUN_AU3_DAY2 * np.asarray(self.central_mass_solar, dtype=float)
+
+    def period_days(self) -> np.ndarray:
+        return 2 * np.pi * np.sqrt(np.asarray(self.semi_major_axis_au, dtype=float) ** 3 / self.mu)
+
+    def state(self, times_days=0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        시각별 위치/속도 (AU, AU/일)
+
+        Args:
+            times_days: 스칼라 또는 (T,) 배열 -> 결과 모양 (N, 3) 또는 (T, N, 3)
+        """
+        times = np.asarray(times_days, dtype=float)
+        mean_motion_deg = 360.0 / self.period_days()
+        mean_anomaly = np.asarray(self.mean_anomaly_deg, dtype=float) + np.multiply.outer(times, mean_motion_deg)
+        return kepler_state(self.semi_major_axis_au, self.eccentricity, mean_anomaly, self.mu,
+                            self.inclination_deg, self.ascending_node_deg, self.periapsis_deg)
+
+    def positions(self, times_days) -> np.ndarray:
+        return self.state(times_days)[0]
+
+
+@dataclass
+class NBodySystem:
+    """N체 적분용 행성계 (질량중심 좌표, [0] = 항성)"""
+    name: str
+    planet_names: List[str]
+    masses_solar: np.ndarray  # (N,)
+    positions_au: np.ndarray  # (N, 3)
+    velocities_au_day: np.ndarray  # (N, 3)
+    semi_major_axis_au: np.ndarray  # (N-1,) 행성 초기 장반경
+
+    @classmethod
+    def from_elements(cls, name: str, planet_names: List[str], star_mass_solar: float,
+                      planet_masses_solar, elements: OrbitalElements) -> "NBodySystem":
+        """항성 기준 궤도 요소 -> 질량중심 상태 벡터"""
+        planet_masses = np.asarray(planet_masses_solar, dtype=float)
+        masses = np.concatenate([[star_mass_solar], planet_masses])
+        pos, vel = replace(elements, central_mass_solar=star_mass_solar + planet_masses).state(0.0)
+        positions = np.vstack([np.zeros(3), pos])
+        velocities = np.vstack([np.zeros(3), vel])
+        positions -= masses @ positions / masses.sum()
+        velocities -= masses @ velocities / masses.sum()
+        return cls(name, list(planet_names), masses, positions, velocities,
+                   np.asarray(elements.semi_major_axis_au, dtype=float))
+
+    @classmethod
+    def from_exoplanet_system(cls, system: "ExoplanetSystem", planet_mass_earth: float = 1.0) -> "NBodySystem":
+        """
+        ExoplanetSystem -> N체 초기 상태 (원궤도, 공면)
+
+        행성 질량 정보가 없으므로 planet_mass_earth 를 쓰고, 초기 위상은 황금각 간격으로 펼쳐
+        인위적인 일렬 배치 (합) 를 피합니다.
+        """
+        axes = np.array([p["semi_major_axis_au"] for p in system.planets], dtype=float)
+        n = len(axes)
+        elements = OrbitalElements(axes, np.zeros(n), np.arange(n) * GOLDEN_ANGLE_DEG, system.star.mass_solar)
+        return cls.from_elements(system.name, [p["name"] for p in system.planets], system.star.mass_solar,
+                                 np.full(n, planet_mass_earth * EARTH_MASS_SOLAR), elements)
+
+    @classmethod
+    def from_catalog(cls, catalog: ExoplanetCatalog, min_planets: int = 2,
+                     default_mass_earth: float = 1.0) -> List["NBodySystem"]:
+        """카탈로그의 다행성계 (장반경/항성질량이 있는 행성 min_planets 개 이상) -> N체 초기 상태 목록"""
+        usable = np.isfinite(catalog.semi_major_axis_au) & np.isfinite(catalog.star_mass_solar)
+        names = catalog.system_name.astype(str)
+        systems = []
+        for system_name in dict.fromkeys(names[usable]):
+            rows = np.flatnonzero(usable & (names == system_name))
+            if len(rows) < min_planets:
+                continue
+            rows = rows[np.argsort(catalog.semi_major_axis_au[rows])]
+            eccentricity = np.nan_to_num(catalog.eccentricity[rows], nan=0.0)
+            mass_earth = np.where(np.isfinite(catalog.mass_earth[rows]), catalog.mass_earth[rows], default_mass_earth)
+            elements = OrbitalElements(catalog.semi_major_axis_au[rows], eccentricity,
+                                       np.arange(len(rows)) * GOLDEN_ANGLE_DEG, catalog.star_mass_solar[rows[0]])
+            systems.append(cls.from_elements(system_name, list(catalog.planet_name[rows]),
+                                             float(catalog.star_mass_solar[rows[0]]),
+                                             mass_earth * EARTH_MASS_SOLAR, elements))
+        return systems
+
+    @property
+    def body_count(self) -> int:
+        return len(self.masses_solar)
+
+    def inner_period_days(self) -> float:
+        return float(2 * np.pi * np.sqrt(self.semi_major_axis_au.min() ** 3
+                                         / (GM_SUN_AU3_DAY2 * self.masses_solar[0])))
+
+
+def _accelerations(masses: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """배치 중력 가속도: masses (S, N), positions (S, N, 3) -> 가속도 (S, N, 3), 쌍별 거리² (S, N, N)"""
+    diff = positions[:, None, :, :] - positions[:, :, None, :]  # [s, i, j] = r_j - r_i
+    r2 = np.einsum('sijk,sijk->sij', diff, diff)
+    n = positions.shape[1]
+    r2[:, np.arange(n), np.arange(n)] = np.inf
+    inv_r3 = r2 ** -1.5
+    return GM_SUN_AU3_DAY2 * np.einsum('sij,sj,sijk->sik', inv_r3, masses, diff), r2
+
+
+def _energy(masses: np.ndarray, positions: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+    kinetic = 0.5 * np.einsum('sn,snk,snk->s', masses, velocities, velocities)
+    diff = positions[:, None, :, :] - positions[:, :, None, :]
+    r = np.sqrt(np.einsum('sijk,sijk->sij', diff, diff))
+    n = positions.shape[1]
+    upper = np.triu(np.ones((n, n), dtype=bool), 1)
+    potential = -GM_SUN_AU3_DAY2 * np.sum(np.where(upper, masses[:, :, None] * masses[:, None, :] / np.where(upper, r, 1.0), 0.0),
+                                          axis=(1, 2))
+    return kinetic + potential
+
+
+def _integrate_batch(task: Dict) -> List[Dict]:
+    """
+    리프프로그 (kick-drift-kick) 배치 적분 - 프로세스 풀 워커 (모듈 수준 함수라 피클링 가능)
+
+    같은 배치의 행성계는 각자 dt = 가장 안쪽 주기 / steps_per_orbit 로, 같은 스텝 수를 진행합니다.
+    빈 자리 (행성 수가 적은 계) 는 질량 0, 멀리 고정된 천체로 채웁니다.
+    """
+    systems: List[NBodySystem] = task["systems"]
+    steps_per_orbit, n_orbits = task["steps_per_orbit"], task["n_orbits"]
+    hill_factor, escape_factor = task["hill_factor"], task["escape_factor"]
+    S, N = len(systems), max(s.body_count for s in systems)
+
+    masses = np.zeros((S, N))
+    pos = np.zeros((S, N, 3))
+    vel = np.zeros((S, N, 3))
+    axes = np.ones((S, N - 1))
+    real = np.zeros((S, N), dtype=bool)
+    pos[:, :, 0] = 1e6 * np.arange(1, N + 1)  # 빈 자리: 서로 멀리 떨어진 정지 천체
+    for s, system in enumerate(systems):
+        n = system.body_count
+        masses[s, :n], pos[s, :n], vel[s, :n] = system.masses_solar, system.positions_au, system.velocities_au_day
+        axes[s, :n - 1] = system.semi_major_axis_au
+        real[s, :n] = True
+    active = real[:, :, None]
+    dt = np.array([s.inner_period_days() / steps_per_orbit for s in systems])[:, None, None]
+
+    # 행성 쌍별 상호 힐 반경² (초기 장반경 기준) - 근접 조우는 가속도 계산의 거리²로 매 스텝 검사
+    planet_mass, real_planet = masses[:, 1:], real[:, 1:]
+    real_pair = real_planet[:, :, None] & real_planet[:, None, :] & ~np.eye(N - 1, dtype=bool)[None]
+    pair_hill = (np.cbrt((planet_mass[:, :, None] + planet_mass[:, None, :]) / (3 * masses[:, :1, None]))
+                 * (axes[:, :, None] + axes[:, None, :]) / 2)
+    pair_hill2 = np.where(real_pair, pair_hill ** 2, 1.0)
+    min_hill = np.full(S, np.inf)  # 최소 (거리 / 상호 힐 반경)², 끝에서 제곱근
+    max_excursion = np.zeros(S)
+
+    energy0 = _energy(masses, pos, vel)
+    acc = _accelerations(masses, pos)[0] * active
+    for step in range(1, n_orbits * steps_per_orbit + 1):
+        vel += 0.5 * dt * acc
+        pos += dt * vel * active
+        acc, r2 = _accelerations(masses, pos)
+        acc *= active
+        vel += 0.5 * dt * acc
+        ratio2 = np.where(real_pair, r2[:, 1:, 1:] / pair_hill2, np.inf)
+        min_hill = np.minimum(min_hill, ratio2.min(axis=(1, 2)))
+        if step % task["check_every"] == 0:
+            planets = pos[:, 1:]
+            heliocentric = np.linalg.norm(planets - pos[:, :1], axis=-1)
+            max_excursion = np.maximum(max_excursion, np.where(real_planet, heliocentric / axes, 0).max(axis=1))
+
+    energy_error = np.abs((_energy(masses, pos, vel) - energy0) / energy0)
+    min_hill = np.sqrt(min_hill)
+    results = []
+    for s, system in enumerate(systems):
+        n = system.body_count
+        close_encounter = bool(min_hill[s] < hill_factor)
+        escaped = bool(max_excursion[s] > escape_factor)
+        results.append({
+            "system": system.name,
+            "planets": system.planet_names,
+            "stable": not (close_encounter or escaped),
+            "close_encounter": close_encounter,
+            "escaped": escaped,
+            "min_hill_separation": float(min_hill[s]),
+            "max_distance_ratio": float(max_excursion[s]),
+            "energy_error": float(energy_error[s]),
+            "orbits": n_orbits,
+            "integrated_days": float(dt[s, 0, 0] * n_orbits * steps_per_orbit),
+            "positions_au": pos[s, :n] - pos[s, :1],
+            "velocities_au_day": vel[s, :n] - vel[s, :1],
+        })
+    return results
+
+
+class OrbitPropagator:
+    """
+    행성계 궤도 전파 / 안정성 검사
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    - 케플러 전파: 상호작용 없는 해석해 (OrbitalElements.state)
+    - N체 적분: 심플렉틱 리프프로그를 여러 행성계에 대해 한 번에 (배열 연산)
+      천체 수가 비슷한 계끼리 묶고, 배치 크기는 쌍별 배열 메모리 (S·N²) 기준으로 정합니다.
+      processes > 1 이면 배치를 프로세스 풀에 나눠 보냅니다.
+    """
+
+    def __init__(self, steps_per_orbit: int = 64, max_batch_bytes: int = 32 * 1024 * 1024,
+                 processes: int = 1, hill_factor: float = 1.0, escape_factor: float = 3.0) -> None:
+        """
+        Args:
+            steps_per_orbit: 가장 안쪽 행성 한 주기당 적분 스텝 수
+            max_batch_bytes: 배치 하나의 쌍별 임시 배열 (S x N x N x 3 float64) 메모리 상한
+            processes: 배치를 나눠 실행할 프로세스 수 (1 = 현재 프로세스)
+            hill_factor: 행성 간 거리가 상호 힐 반경의 이 배수 미만이면 근접 조우
+            escape_factor: 항성 거리가 초기 장반경의 이 배수를 넘으면 탈출
+        """
+        self.steps_per_orbit = steps_per_orbit
+        self.max_batch_bytes = max_batch_bytes
+        self.processes = processes
+        self.hill_factor = hill_factor
+        self.escape_factor = escape_factor
+
+    def batches(self, systems: List[NBodySystem]) -> List[List[NBodySystem]]:
+        """
+        천체 수 순으로 정렬해 메모리 상한 안에서 묶음
+
+        배치의 천체 수는 마지막 (가장 큰) 계에 맞춰 채우므로, 정렬 덕분에 빈 자리 낭비가 작습니다.
+        """
+        batches: List[List[NBodySystem]] = []
+        for system in sorted(systems, key=lambda s: s.body_count):
+            n = system.body_count
+            pair_bytes = n * n * 3 * 8 * 4  # 쌍별 변위 배열 + 중간 결과 여유분
+            if batches and (len(batches[-1]) + 1) * pair_bytes <= self.max_batch_bytes:
+                batches[-1].append(system)
+            else:
+                batches.append([system])
+        return batches
+
+    def integrate(self, systems: List[NBodySystem], n_orbits: int = 1000,
+                  check_every: Optional[int] = None) -> List[Dict]:
+        """
+        N체 적분 + 안정성 판정 (입력 순서대로 결과 반환)
+
+        Args:
+            systems: NBodySystem 목록
+            n_orbits: 계마다 가장 안쪽 행성 주기 기준 적분 길이
+            check_every: 탈출 검사 간격 (스텝, 기본 = 한 주기)
+        """
+        if not systems:
+            return []
+        tasks = [{
+            "systems": batch,
+            "steps_per_orbit": self.steps_per_orbit,
+            "n_orbits": n_orbits,
+            "check_every": check_every or self.steps_per_orbit,
+            "hill_factor": self.hill_factor,
+            "escape_factor": self.escape_factor,
+        } for batch in self.batches(systems)]
+
+        if self.processes > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=self.processes) as pool:
+                batch_results = list(pool.map(_integrate_batch, tasks))
+        else:
+            batch_results = [_integrate_batch(task) for task in tasks]
+
+        by_id = {id(system): result for task, results in zip(tasks, batch_results)
+                 for system, result in zip(task["systems"], results)}
+        return [by_id[id(system)] for system in systems]
+
+
+# ════════════════════════════════════════════════════════════════
+# 6️⃣  LIGHT CURVES: 광도곡선 스트리밍 + BLS 트랜짓 탐색
+# ════════════════════════════════════════════════════════════════
+
+SUN_RADIUS_EARTH = 109.1
+
+# 반지름 (지구 단위) 상한 -> 행성 분류
+PLANET_RADIUS_CLASSES = (
+    (1.25, PlanetType.TERRESTRIAL),
+    (2.0, PlanetType.SUPER_EARTH),
+    (6.0, PlanetType.NEPTUNE_LIKE),
+    (np.inf, PlanetType.JOVIAN),
+)
+
+
+def planet_type_from_radius(radius_earth: float) -> PlanetType:
+    """반지름 (R⊕) 기반 행성 분류"""
+    for limit, planet_type in PLANET_RADIUS_CLASSES:
+        if radius_earth < limit:
+            return planet_type
+    return PlanetType.JOVIAN
+
+
+def running_median(values, window: int, stride: Optional[int] = None) -> np.ndarray:
+    """
+    이동 중앙값 (길이 = 입력)
+
+    중앙값은 stride 간격 창에서만 계산하고 사이는 선형 보간합니다 (기본 stride = window // 8).
+    창보다 짧으면 전체 중앙값, 양 끝 반 창은 가장자리 값으로 채웁니다.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n == 0:
+        return values.copy()
+    if n <= window:
+        return np.full(n, np.median(values))
+    stride = stride or max(1, window // 8)
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)[::stride]
+    centers = np.arange(len(windows)) * stride + window // 2
+    return np.interp(np.arange(n), centers, np.median(windows, axis=1))
+
+
+class LightCurve:
+    """
+    광도곡선 (시간 [일], 플럭스) - 배열 또는 메모리 맵
+
+    .npy 파일 (N, 2) [time, flux] 은 mmap 으로 열어 청크 단위로만 읽습니다.
+    CSV 는 처음 한 번 같은 이름의 .npy 로 변환 (청크 단위 기록) 후 메모리 맵으로 엽니다.
+    """
+
+    def __init__(self, time, flux) -> None:
+        if len(time) != len(flux):
+            raise ValueError(f"시간/플럭스 길이가 다름: {len(time)} != {len(flux)}")
+        self.time = time
+        self.flux = flux
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @classmethod
+    def load(cls, path: str, time_column: str = "time", flux_column: str = "flux",
+             chunk_rows: int = 1_000_000) -> "LightCurve":
+        """
+        Args:
+            path: .npy ((N, 2) float64) 또는 .csv ('#' 주석 줄 허용)
+            time_column / flux_column: CSV 컬럼 이름 (예: TESS SPOC 'TIME', 'PDCSAP_FLUX')
+        """
+        if os.path.splitext(path)[1].lower() != ".npy":
+            cache = os.path.splitext(path)[0] + ".npy"
+            if not os.path.exists(cache) or os.path.getmtime(cache) < os.path.getmtime(path):
+                cls._convert_csv(path, cache, time_column, flux_column, chunk_rows)
+            path = cache
+        data = np.load(path, mmap_mode='r')
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f"광도곡선 배열은 (N, 2) 여야 함: {data.shape}")
+        return cls(data[:, 0], data[:, 1])
+
+    @staticmethod
+    def _convert_csv(path: str, cache: str, time_column: str, flux_column: str, chunk_rows: int) -> None:
+        """CSV -> .npy (행 수를 먼저 세고, open_memmap 에 청크 단위로 기록)"""
+        def rows():
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(line for line in f if not line.startswith('#'))
+                header = next(reader)
+                t, y = header.index(time_column), header.index(flux_column)
+                for row in reader:
+                    yield row[t].strip() or 'nan', row[y].strip() or 'nan'
+
+        count = sum(1 for _ in rows())
+        tmp = cache + ".tmp"
+        out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float64, shape=(count, 2))
+        start, chunk = 0, []
+        for row in rows():
+            chunk.append(row)
+            if len(chunk) == chunk_rows:
+                out[start:start + len(chunk)] = np.array(chunk, dtype=float)
+                start, chunk = start + len(chunk), []
+        if chunk:
+            out[start:] = np.array(chunk, dtype=float)
+        out.flush()
+        del out
+        os.replace(tmp, cache)
+
+    def save(self, path: str) -> None:
+        """(N, 2) .npy 로 저장 (다음 로드는 메모리 맵)"""
+        np.save(path, np.column_stack([self.time, self.flux]))
+
+    def chunks(self, chunk_size: int, overlap: int = 0):
+        """
+        (시간, 플럭스, 앞 겹침 수, 본체 길이) 청크 생성 - 각 청크 앞뒤로 overlap 개를 더 읽음
+        """
+        n = len(self)
+        for start in range(0, n, chunk_size):
+            lo, hi = max(0, start - overlap), min(n, start + chunk_size + overlap)
+            yield (np.asarray(self.time[lo:hi], dtype=float), np.asarray(self.flux[lo:hi], dtype=float),
+                   start - lo, min(chunk_size, n - start))
+
+
+def _bls_block(task: Dict) -> Tuple[np.ndarray, ...]:
+    """
+    BLS 주기 블록 계산 - 프로세스 풀 워커 (모듈 수준 함수라 피클링 가능)
+
+    주기 블록마다 위상 빈 누적 (bincount 한 번) -> 원형 누적합 -> 모든 시작 위상 x 지속시간의
+    박스 합을 배열 연산으로 구합니다. 신호 잔차 SR = s² / (r (1 - r)) (Kovács et al. 2002).
+
+    Returns:
+        (power, depth, duration_days, epoch) - 각 (주기 수,)
+    """
+    t, y, w = task["time"], task["flux"], task["weight"]
+    periods, durations, bin_days = task["periods"], task["durations"], task["bin_days"]
+    max_elements = task["max_elements"]
+    count = len(periods)
+    power, depth = np.zeros(count), np.zeros(count)
+    best_duration, epoch = np.full(count, np.nan), np.full(count, np.nan)
+    wy = w * y
+
+    block = max(1, max_elements // max(1, len(t)))
+    tiled_w, tiled_wy = np.tile(w, min(block, count)), np.tile(wy, min(block, count))
+    for lo in range(0, count, block):
+        P = periods[lo:lo + block]
+        bins = np.ceil(P / bin_days).astype(np.int64)  # 주기별 위상 빈 수 (블록 구성과 무관)
+        nb = int(bins.max())
+        width = P / bins  # 주기별 위상 빈 폭 (일)
+        # 위상 빈 번호 + 주기별 오프셋 -> bincount 한 번으로 블록 전체 누적
+        cycles = np.multiply.outer(1 / P, t)
+        cycles -= np.floor(cycles)
+        cycles *= bins[:, None]
+        np.minimum(cycles, (bins - 1)[:, None], out=cycles)
+        cycles += np.arange(len(P))[:, None] * nb
+        flat = cycles.astype(np.intp).ravel()
+        size = len(P) * nb
+        sum_w = np.bincount(flat, tiled_w[:flat.size], size).reshape(len(P), nb)
+        sum_wy = np.bincount(flat, tiled_wy[:flat.size], size).reshape(len(P), nb)
+
+        # 원형 누적합: 열 k = 위상 빈 (k mod 빈 수) 까지의 합
+        q_all = np.clip(np.rint(durations[None, :] / width[:, None]).astype(np.int64), 1, (bins - 1)[:, None])
+        wrap = np.arange(nb + int(q_all.max()))[None, :] % bins[:, None]
+        zero = np.zeros((len(P), 1))
+        cum_w = np.concatenate([zero, np.cumsum(np.take_along_axis(sum_w, wrap, 1), 1)], 1)
+        cum_wy = np.concatenate([zero, np.cumsum(np.take_along_axis(sum_wy, wrap, 1), 1)], 1)
+
+        starts = np.arange(nb)[None, :]
+        valid_start = starts < bins[:, None]
+        block_power, block_depth = np.zeros(len(P)), np.zeros(len(P))
+        block_duration, block_epoch = np.full(len(P), np.nan), np.full(len(P), np.nan)
+        for d in range(len(durations)):
+            q = q_all[:, d:d + 1]
+            r = np.take_along_axis(cum_w, starts + q, 1) - cum_w[:, :nb]
+            s = np.take_along_axis(cum_wy, starts + q, 1) - cum_wy[:, :nb]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sr = np.where(valid_start & (r > 0) & (r < 1) & (s < 0), s * s / (r * (1 - r)), 0.0)
+            best = sr.argmax(axis=1)
+            rows = np.arange(len(P))
+            better = sr[rows, best] > block_power
+            r_best, s_best = r[rows, best], s[rows, best]
+            block_power = np.where(better, sr[rows, best], block_power)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                block_depth = np.where(better, -s_best / (r_best * (1 - r_best)), block_depth)
+            block_duration = np.where(better, q[:, 0] * width, block_duration)
+            block_epoch = np.where(better, np.mod((best + q[:, 0] / 2) * width, P), block_epoch)
+        power[lo:lo + block], depth[lo:lo + block] = block_power, block_depth
+        best_duration[lo:lo + block], epoch[lo:lo + block] = block_duration, block_epoch
+    return power, depth, best_duration, epoch
+
+
+class TransitSearch:
+    """
+    광도곡선 트랜짓 탐색 (Box Least Squares)
+    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    1. 청크 스트리밍: 이동 중앙값으로 추세 제거 (청크 경계는 반 창씩 겹쳐 읽음)
+    2. 시간 빈 누적: 최소 지속시간 / oversample 폭으로 묶어 수백만 점 -> 수만 빈
+    3. BLS: 주기 블록 단위 배열 연산, processes > 1 이면 주기 구간을 프로세스 풀에 분배
+    4. 후보: SDE 임계치 이상 피크, 이미 고른 주기의 정수배/분수배는 제외
+    """
+
+    def __init__(self, min_period_days: float = 0.5, max_period_days: Optional[float] = None,
+                 durations_days=(0.04, 0.06, 0.08, 0.12, 0.16, 0.25),
+                 oversample: int = 3, detrend_window_days: Optional[float] = None,
+                 chunk_size: int = 1_000_000, processes: int = 1, max_block_elements: int = 4_000_000) -> None:
+        """
+        Args:
+            min_period_days / max_period_days: 주기 탐색 범위 (최대 기본값 = 관측 기간 / 2)
+            durations_days: 트랜짓 지속시간 격자
+            oversample: 최소 지속시간당 시간 빈 / 주기 격자 조밀도
+            detrend_window_days: 이동 중앙값 창 (기본 = 최대 지속시간 x 3)
+            chunk_size: 스트리밍 청크 크기 (점)
+            processes: BLS 주기 구간을 나눠 계산할 프로세스 수
+            max_block_elements: 주기 블록 하나의 (주기 x 빈) 임시 배열 원소 상한
+        """
+        self.min_period_days = min_period_days
+        self.max_period_days = max_period_days
+        self.durations_days = np.sort(np.asarray(durations_days, dtype=float))
+        self.oversample = oversample
+        self.detrend_window_days = detrend_window_days or 3 * self.durations_days.max()
+        self.chunk_size = chunk_size
+        self.processes = processes
+        self.max_block_elements = max_block_elements
+
+    @property
+    def bin_days(self) -> float:
+        return self.durations_days.min() / self.oversample
+
+    def bin_light_curve(self, light_curve: LightCurve) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        청크 단위 추세 제거 + 시간 빈 누적
+
+        Returns:
+            (빈 중심 시각, 가중 평균 상대 플럭스 - 평균, 정규화 가중치) - 빈 점 없는 빈은 제외
+        """
+        head = np.asarray(light_curve.time[:min(len(light_curve), 10000)], dtype=float)
+        head = head[np.isfinite(head)]
+        cadence = float(np.median(np.diff(head))) if len(head) > 1 else self.bin_days
+        window = max(3, int(round(self.detrend_window_days / cadence)) | 1)
+        t0 = float(np.nanmin(light_curve.time))
+        size = int(np.floor((float(np.nanmax(light_curve.time)) - t0) / self.bin_days)) + 1
+
+        # 청크 시작/겹침을 stride 배수로 맞춰 중앙값 계산 위치가 청크 크기와 무관하게 같도록
+        stride = max(1, window // 8)
+        chunk_size = -(-self.chunk_size // stride) * stride
+        overlap = -(-window // stride) * stride
+
+        counts, sums = np.zeros(size), np.zeros(size)
+        for time, flux, offset, length in light_curve.chunks(chunk_size, overlap=overlap):
+            good = np.isfinite(time) & np.isfinite(flux)
+            body = np.zeros(len(time), dtype=bool)
+            body[offset:offset + length] = True
+            body &= good
+            if not body.any():
+                continue
+            # 결측 플럭스는 이웃 값으로 메워 중앙값 창의 인덱스 간격 유지
+            rows = np.arange(len(flux))
+            filled_flux = np.interp(rows, rows[good], flux[good]) if not good.all() else flux
+            trend = running_median(filled_flux, window, stride)
+            relative = flux[body] / trend[body] - 1.0
+            index = ((time[body] - t0) / self.bin_days).astype(np.int64)
+            counts += np.bincount(index, minlength=size)
+            sums += np.bincount(index, relative, minlength=size)
+
+        filled = counts > 0
+        centers = t0 + (np.flatnonzero(filled) + 0.5) * self.bin_days
+        weight = counts[filled] / counts.sum()
+        flux = sums[filled] / counts[filled]
+        return centers, flux - weight @ flux, weight
+
+    def period_grid(self, baseline_days: float) -> np.ndarray:
+        """
+        로그 간격 주기 격자: 관측 기간 동안 위상 어긋남이 최소 지속시간 / oversample 이하
+        (P_{k+1} = P_k (1 + d_min / (oversample x baseline)))
+        """
+        max_period = min(self.max_period_days or baseline_days / 2, baseline_days / 2)
+        if max_period <= self.min_period_days:
+            raise ValueError(f"관측 기간 {baseline_days:.2f}일이 최소 주기 {self.min_period_days}일의 2배보다 짧음")
+        ratio = 1 + self.durations_days.min() / (self.oversample * baseline_days)
+        count = int(np.ceil(np.log(max_period / self.min_period_days) / np.log(ratio))) + 1
+        return self.min_period_days * ratio ** np.arange(count)
+
+    def power(self, time: np.ndarray, flux: np.ndarray, weight: np.ndarray,
+              periods: np.ndarray) -> Dict[str, np.ndarray]:
+        """BLS 파워 스펙트럼 (빈 누적 결과 입력) - processes > 1 이면 주기 구간별 프로세스 풀"""
+        t0 = time.min() - self.bin_days / 2  # 시간 빈 경계 (빈 중심이 위상 빈 경계에 걸리지 않게)
+        parts = np.array_split(periods, self.processes) if self.processes > 1 else [periods]
+        tasks = [{
+            "time": time - t0, "flux": flux, "weight": weight, "periods": part,
+            "durations": self.durations_days, "bin_days": self.bin_days,
+            "max_elements": self.max_block_elements,
+        } for part in parts if len(part)]
+        if len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=self.processes) as pool:
+                results = list(pool.map(_bls_block, tasks))
+        else:
+            results = [_bls_block(task) for task in tasks]
+        power, depth, duration, epoch = (np.concatenate(column) for column in zip(*results))
+        return {"period": periods, "power": power, "depth": depth, "duration": duration, "epoch": epoch + t0}
+
+    def search(self, light_curve: LightCurve, max_candidates: int = 3, min_sde: float = 7.0) -> Dict:
+        """
+        광도곡선 -> BLS 스펙트럼 + 트랜짓 후보
+
+        Returns:
+            {"periods", "power", "sde", "candidates": [{period_days, epoch, duration_days,
+             depth, sde}, ...] (SDE 내림차순)}
+        """
+        time, flux, weight = self.bin_light_curve(light_curve)
+        baseline = float(time.max() - time.min())
+        spectrum = self.power(time, flux, weight, self.period_grid(baseline))
+        power = spectrum["power"]
+        spread = power.std()
+        sde = (power - power.mean()) / spread if spread > 0 else np.zeros_like(power)
+
+        candidates = []
+        for i in np.argsort(sde)[::-1]:
+            if sde[i] < min_sde or len(candidates) >= max_candidates:
+                break
+            period = spectrum["period"][i]
+            if any(self._is_alias(period, c["period_days"]) for c in candidates):
+                continue
+            candidates.append({
+                "period_days": float(period),
+                "epoch": float(spectrum["epoch"][i]),
+                "duration_days": float(spectrum["duration"][i]),
+                "depth": float(spectrum["depth"][i]),
+                "sde": float(sde[i]),
+            })
+        return {"periods": spectrum["period"], "power": power, "sde": sde, "candidates": candidates}
+
+    @staticmethod
+    def _is_alias(period: float, other: float, tolerance: float = 0.01, max_harmonic: int = 10) -> bool:
+        """주기비가 작은 정수비 (1, 2, ..., 3/2, 5/3 ...) 에 가까우면 같은 신호의 별칭"""
+        ratio = max(period, other) / min(period, other)
+        if ratio > max_harmonic + tolerance:
+            return False
+        return any(abs(ratio * m - round(ratio * m)) < tolerance * m for m in (1, 2, 3))
+
+
+# ════════════════════════════════════════════════════════════════
+# 7️⃣  MAIN CARTRIDGE: AstroCartridge 클래스
 # ════════════════════════════════════════════════════════════════
 
 class AstroCartridge:
@@ -258,6 +1617,8 @@ class AstroCartridge:
         self.stars: Dict[str, Star] = {}
         self.exoplanet_systems: Dict[str, ExoplanetSystem] = {}
         self.missions: Dict[str, SpaceMission] = {}
+        self.catalog: Optional[ExoplanetCatalog] = None  # 대량 로드한 외계행성 카탈로그
+        self.star_index: Optional[StarIndex] = None  # 별 공간 인덱스 (첫 검색 시 생성)
         self.version = "1.0.0"
         self._load_sample_data()
     
@@ -283,7 +1644,9 @@ class AstroCartridge:
             distance_ly=8.6,
             mass_solar=2.02,
             radius_solar=1.71,
-            luminosity_solar=25.4
+            luminosity_solar=25.4,
+            ra_deg=101.287,
+            dec_deg=-16.716
         )
         self.stars["Sirius"] = sirius
         
@@ -295,7 +1658,9 @@ class AstroCartridge:
             distance_ly=4.24,
             mass_solar=0.12,
             radius_solar=0.14,
-            luminosity_solar=0.0017
+            luminosity_solar=0.0017,
+            ra_deg=217.429,
+            dec_deg=-62.680
         )
         self.stars["Proxima Centauri"] = proxima
         
@@ -307,7 +1672,9 @@ class AstroCartridge:
             distance_ly=39,
             mass_solar=0.089,
             radius_solar=0.117,
-            luminosity_solar=0.000546
+            luminosity_solar=0.000546,
+            ra_deg=346.622,
+            dec_deg=-5.041
         )
         self.stars["TRAPPIST-1"] = trappist1
         
@@ -399,34 +1766,122 @@ class AstroCartridge:
         """모든 우주 탐사 임무 목록"""
         return list(self.missions.keys())
     
-    def calculate_distance_modulus(self, apparent_mag: float, distance_ly: float) -> float:
-        """거리계수를 이용한 절대등급 계산"""
+    def load_exoplanet_catalog(self, path: str, columns: Optional[Dict[str, str]] = None) -> int:
+        """대량 외계행성 카탈로그 로드 (CSV / Parquet / npz), 로드한 행성 수 반환"""
+        self.catalog = ExoplanetCatalog.load(path, columns)
+        return len(self.catalog)
+
+    def systems_catalog(self) -> ExoplanetCatalog:
+        """등록된 행성계의 컬럼형 표현"""
+        return ExoplanetCatalog.from_systems(self.exoplanet_systems)
+
+    def build_star_index(self, path: Optional[str] = None, save_path: Optional[str] = None) -> int:
+        """
+        별 공간 인덱스 생성: 등록된 별 + 로드한 카탈로그의 모항성 + 대량 별 목록 파일
+
+        Args:
+            path: 추가할 별 목록 (.csv HYG 형식 또는 저장된 .npz 인덱스)
+            save_path: 생성한 인덱스를 저장할 .npz 경로
+        """
+        indexes = [StarIndex.from_stars(self.stars.values())]
+        if self.catalog is not None:
+            indexes.append(StarIndex.from_catalog(self.catalog))
+        if path:
+            indexes.append(StarIndex.load(path))
+        self.star_index = indexes[0] if len(indexes) == 1 else StarIndex.merge(*indexes)
+        if save_path:
+            self.star_index.save(save_path)
+        return len(self.star_index)
+
+    def load_star_index(self, path: str) -> int:
+        """저장된 별 공간 인덱스 로드 (.npz)"""
+        self.star_index = StarIndex.load(path)
+        return len(self.star_index)
+
+    def _spatial_index(self) -> StarIndex:
+        if self.star_index is None:
+            self.build_star_index()
+        return self.star_index
+
+    def stars_within(self, star_name: str, radius_ly: float) -> List[Dict]:
+        """별 주변 radius_ly 광년 안의 별 (가까운 순)"""
+        return self._spatial_index().within(star_name, radius_ly)
+
+    def nearest_stars(self, star_name: str, k: int = 5) -> List[Dict]:
+        """별에서 가장 가까운 별 k 개"""
+        return self._spatial_index().nearest(star_name, k)
+
+    def cone_search(self, ra_deg: float, dec_deg: float, radius_deg: float,
+                    max_magnitude: Optional[float] = None) -> List[Dict]:
+        """천구 원뿔 (적경/적위 중심, 반경 도) 안의 별"""
+        return self._spatial_index().cone(ra_deg, dec_deg, radius_deg, max_magnitude)
+
+    def propagate_orbits(self, system_name: str, times_days) -> Dict[str, np.ndarray]:
+        """
+        등록된 행성계의 케플러 궤도 전파 (원궤도, 행성 간 상호작용 무시)
+
+        Returns:
+            행성 이름 -> 항성 기준 위치 (AU), times_days 가 (T,) 배열이면 (T, 3)
+        """
+        if system_name not in self.exoplanet_systems:
+            raise ValueError(f"행성계를 찾을 수 없음: {system_name}")
+        system = NBodySystem.from_exoplanet_system(self.exoplanet_systems[system_name])
+        elements = OrbitalElements(system.semi_major_axis_au, np.zeros(len(system.planet_names)),
+                                   np.arange(len(system.planet_names)) * GOLDEN_ANGLE_DEG,
+                                   system.masses_solar[0])
+        positions = elements.positions(times_days)
+        return {name: positions[..., i, :] for i, name in enumerate(system.planet_names)}
+
+    def check_stability(self, n_orbits: int = 1000, include_catalog: bool = True,
+                        min_planets: int = 2, processes: int = 1, steps_per_orbit: int = 64) -> List[Dict]:
+        """
+        다행성계 N체 안정성 검사 (등록된 행성계 + 로드한 카탈로그)
+
+        Args:
+            n_orbits: 계마다 가장 안쪽 행성 주기 기준 적분 길이
+            processes: 배치를 나눠 실행할 프로세스 수
+        """
+        systems = [NBodySystem.from_exoplanet_system(system) for system in self.exoplanet_systems.values()
+                   if len(system.planets) >= min_planets]
+        if include_catalog and self.catalog is not None:
+            systems.extend(NBodySystem.from_catalog(self.catalog, min_planets))
+        propagator = OrbitPropagator(steps_per_orbit=steps_per_orbit, processes=processes)
+        return propagator.integrate(systems, n_orbits)
+
+    def search_transits(self, system_name: str, light_curve, search: Optional[TransitSearch] = None,
+                        max_candidates: int = 3, min_sde: float = 7.0) -> Dict:
+        """
+        광도곡선 BLS 트랜짓 탐색 후 후보를 행성계에 추가
+
+        Args:
+            system_name: 등록된 행성계 이름
+            light_curve: LightCurve 또는 파일 경로 (.npy / .csv)
+            search: 탐색 설정 (기본 TransitSearch())
+        """
+        if system_name not in self.exoplanet_systems:
+            raise ValueError(f"행성계를 찾을 수 없음: {system_name}")
+        if isinstance(light_curve, str):
+            light_curve = LightCurve.load(light_curve)
+        result = (search or TransitSearch()).search(light_curve, max_candidates, min_sde)
+        system = self.exoplanet_systems[system_name]
+        result["planets"] = [system.add_transit_candidate(c) for c in result["candidates"]]
+        return result
+
+    def calculate_distance_modulus(self, apparent_mag, distance_ly):
+        """거리계수를 이용한 절대등급 계산 (배열 입력 시 벡터화, 잘못된 거리는 NaN)"""
+        if np.ndim(apparent_mag) or np.ndim(distance_ly):
+            return absolute_magnitude(apparent_mag, distance_ly)
         try:
             distance_pc = distance_ly / 3.26156
             return apparent_mag - (5 * math.log10(distance_pc) - 5)
         except (ValueError, ZeroDivisionError):
             raise ValueError("유효하지 않은 겉보기 등급 또는 거리")
     
-    def find_habitable_planets(self) -> List[Dict]:
-        """거주가능 영역에 있는 행성 찾기"""
-        habitable_planets = []
-        
-        for system_name, system in self.exoplanet_systems.items():
-            hz_inner, hz_outer = system.habitable_zone()
-            
-            for planet in system.planets:
-                axis = planet["semi_major_axis_au"]
-                if hz_inner <= axis <= hz_outer:
-                    habitable_planets.append({
-                        "system": system_name,
-                        "planet": planet["name"],
-                        "star": system.star.name,
-                        "semi_major_axis_au": axis,
-                        "habitable_zone_inner_au": hz_inner,
-                        "habitable_zone_outer_au": hz_outer,
-                        "habitable_index": round((axis - hz_inner) / (hz_outer - hz_inner), 2)
-                    })
-        
+    def find_habitable_planets(self, include_catalog: bool = True) -> List[Dict]:
+        """거주가능 영역에 있는 행성 찾기 (등록된 행성계 + 로드한 카탈로그)"""
+        habitable_planets = self.systems_catalog().find_habitable()
+        if include_catalog and self.catalog is not None:
+            habitable_planets.extend(self.catalog.find_habitable())
         return habitable_planets
     
     def compare_stars(self, star1_name: str, star2_name: str) -> Dict:
@@ -437,6 +1892,19 @@ class AstroCartridge:
         s1 = self.stars[star1_name]
         s2 = self.stars[star2_name]
         
+        # 공간 인덱스의 좌표로 두 별 사이 거리 / 각거리
+        index = self._spatial_index()
+        separation_ly = angular_deg = None
+        if star1_name in index.row_by_name and star2_name in index.row_by_name:
+            row1, row2 = index.row_by_name[star1_name], index.row_by_name[star2_name]
+            gap = index.positions[row1] - index.positions[row2]
+            if np.isfinite(gap).all():
+                separation_ly = round(float(np.sqrt(gap @ gap)), 3)
+            if index.distance_ly[row1] > 0 and index.distance_ly[row2] > 0:
+                angle = angular_separation(index.ra_deg[row1], index.dec_deg[row1],
+                                           index.ra_deg[row2], index.dec_deg[row2])
+                angular_deg = None if np.isnan(angle) else round(float(angle), 3)
+        
         return {
             "star1": s1.name,
             "star2": s2.name,
@@ -445,7 +1913,9 @@ class AstroCartridge:
                 "mass_ratio": f"1 : {round(s2.mass_solar / s1.mass_solar, 2)}",
                 "luminosity_ratio": f"1 : {round(s2.luminosity_solar / s1.luminosity_solar, 2)}",
                 "distance_ratio": f"1 : {round(s2.distance_ly / s1.distance_ly if s1.distance_ly > 0 else 0, 2)}",
-                "magnitude_difference": f"{s2.magnitude - s1.magnitude:.2f} (밝음)"
+                "magnitude_difference": f"{s2.magnitude - s1.magnitude:.2f} (밝음)",
+                "separation_ly": separation_ly,
+                "angular_separation_deg": angular_deg
             }
         }
     
@@ -456,6 +1926,7 @@ class AstroCartridge:
             "stars_count": len(self.stars),
             "exoplanet_systems_count": len(self.exoplanet_systems),
             "total_exoplanets": sum(len(sys.planets) for sys in self.exoplanet_systems.values()),
+            "catalog_planets": len(self.catalog) if self.catalog is not None else 0,
             "missions_count": len(self.missions),
             "active_missions": sum(1 for m in self.missions.values() if m.status == MissionStatus.ACTIVE),
             "habitable_candidates": len(self.find_habitable_planets())
@@ -463,7 +1934,7 @@ class AstroCartridge:
 
 
 # ════════════════════════════════════════════════════════════════
-# 4️⃣  TESTS: 단위 테스트
+# 8️⃣  TESTS: 단위 테스트
 # ════════════════════════════════════════════════════════════════
 
 def run_tests() -> Dict:
@@ -600,7 +2071,7 @@ def run_tests() -> Dict:
 
 
 # ════════════════════════════════════════════════════════════════
-# 5️⃣  MAIN: 데모 및 테스트 실행
+# 9️⃣  MAIN: 데모 및 테스트 실행
 # ════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
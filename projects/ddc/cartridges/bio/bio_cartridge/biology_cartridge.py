@@ -1,61 +1,396 @@
 
 import os
 import json
+import math
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 
 # FAISS and sentence-transformers are heavy dependencies, so we prepare for them.
-# In a real environment, these would be installed.
+# The index and document store only need FAISS/numpy; encoding new text needs sentence-transformers.
 try:
     import faiss
     import numpy as np
-    from sentence_transformers import SentenceTransformer
     FAISS_AVAILABLE = True
 except ImportError:
     FAISS_AVAILABLE = False
 
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+KNOWLEDGE_BASE_AVAILABLE = FAISS_AVAILABLE and SENTENCE_TRANSFORMERS_AVAILABLE
+
 # Setup basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+class DocumentStore:
+    """
+    Append-only document storage backed by memory-mapped files.
+
+    A saved store is three files: the UTF-8 text of all documents concatenated (``path``),
+    the int64 end offset of each document (``path.offsets``) and its SHA-256 digest
+    (``path.hashes``). Saved documents are read on demand through ``np.memmap``, so the
+    corpus is never loaded into memory; documents added since the last flush are kept in
+    memory and appended to the files by ``flush``.
+    """
+    DIGEST_SIZE = 32
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self._data = None
+        self._ends = None
+        self._persisted = 0
+        self._pending: List[str] = []
+        self._pending_digests: List[bytes] = []
+        self._digests: Dict[bytes, int] = {}
+
+    @staticmethod
+    def digest(doc: str) -> bytes:
+        """Content hash used for deduplication (surrounding whitespace is ignored)."""
+        return hashlib.sha256(doc.strip().encode('utf-8')).digest()
+
+    @classmethod
+    def open(cls, path: str, count: Optional[int] = None) -> 'DocumentStore':
+        """
+        Opens a saved store.
+
+        Args:
+            path (str): The document blob path.
+            count (Optional[int]): Number of committed documents. Anything written after
+                them (e.g. by an interrupted save) is ignored and overwritten on the next flush.
+        """
+        store = cls()
+        available = os.path.getsize(path + '.offsets') // 8
+        count = available if count is None else min(count, available)
+        if count:
+            store._ends = np.memmap(path + '.offsets', dtype='<i8', mode='r', shape=(count,))
+            size = int(store._ends[-1])
+            store._data = np.memmap(path, dtype=np.uint8, mode='r', shape=(size,)) if size else None
+        with open(path + '.hashes', 'rb') as f:
+            raw = f.read(count * cls.DIGEST_SIZE)
+        store._digests = {raw[i * cls.DIGEST_SIZE:(i + 1) * cls.DIGEST_SIZE]: i for i in range(count)}
+        store._persisted = count
+        store.path = path
+        return store
+
+    @classmethod
+    def from_list(cls, docs: List[str]) -> 'DocumentStore':
+        """Builds an unsaved store holding every document, duplicates included, in order."""
+        store = cls()
+        store._pending = list(docs)
+        store._pending_digests = [cls.digest(doc) for doc in store._pending]
+        for i, digest in enumerate(store._pending_digests):
+            store._digests.setdefault(digest, i)
+        return store
+
+    def __len__(self) -> int:
+        return self._persisted + len(self._pending)
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("document index out of range")
+        if i >= self._persisted:
+            return self._pending[i - self._persisted]
+        start, end = (int(self._ends[i - 1]) if i else 0), int(self._ends[i])
+        return bytes(self._data[start:end]).decode('utf-8') if end > start else ''
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def has_digest(self, digest: bytes) -> bool:
+        return digest in self._digests
+
+    def append(self, doc: str, digest: Optional[bytes] = None) -> bool:
+        """Adds a document unless one with the same content is already stored."""
+        digest = digest or self.digest(doc)
+        if digest in self._digests:
+            return False
+        self._digests[digest] = len(self)
+        self._pending.append(doc)
+        self._pending_digests.append(digest)
+        return True
+
+    def extend(self, docs: List[str]) -> int:
+        return sum(self.append(doc) for doc in docs)
+
+    def flush(self, path: str):
+        """
+        Writes the store to ``path``. Saving to the store's own path only appends the
+        documents added since the last flush; any other path gets a full copy.
+        """
+        if path == self.path:
+            committed = int(self._ends[-1]) if self._persisted else 0
+            self._write(path, committed, self._pending, self._pending_digests)
+        else:
+            self._write(path, 0, list(self), [self._digest_at(i) for i in range(len(self))])
+        reopened = DocumentStore.open(path, len(self))
+        self.__dict__.update(reopened.__dict__)
+
+    def _digest_at(self, i: int) -> bytes:
+        return self._pending_digests[i - self._persisted] if i >= self._persisted else self._stored_digest(i)
+
+    def _stored_digest(self, i: int) -> bytes:
+        with open(self.path + '.hashes', 'rb') as f:
+            f.seek(i * self.DIGEST_SIZE)
+            return f.read(self.DIGEST_SIZE)
+
+    def _write(self, path: str, committed: int, docs: List[str], digests: List[bytes]):
+        count = self._persisted if path == self.path else 0
+        encoded = [doc.encode('utf-8') for doc in docs]
+        ends = committed + np.cumsum([len(b) for b in encoded], dtype='<i8')
+        for suffix, size, payload in (('', committed, b''.join(encoded)),
+                                      ('.offsets', count * 8, ends.astype('<i8').tobytes()),
+                                      ('.hashes', count * self.DIGEST_SIZE, b''.join(digests))):
+            with open(path + suffix, 'r+b' if size else 'wb') as f:
+                f.truncate(size)  # drop bytes left by an interrupted save
+                f.seek(size)
+                f.write(payload)
+
+
 class KnowledgeBase:
     """
     Manages a knowledge base using FAISS for efficient similarity search.
     This class is prepared to handle vector embeddings of text data.
+
+    Index types:
+        - ``flat``: exact brute-force search (IndexFlatL2).
+        - ``ivf``: inverted file index. Vectors are kept in an exact flat index until
+          ``train_threshold`` documents exist, then the IVF index is trained on them. It is
+          retrained (with a larger ``nlist`` when auto-sized) whenever the corpus grows by
+          ``rebuild_threshold`` times the size it was last trained on.
+        - ``hnsw``: graph index; no training, supports incremental adds.
     """
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', dimension: int = 384):
+    INDEX_TYPES = ('flat', 'ivf', 'hnsw')
+    # Saved indexes take appended vectors in a delta file until it reaches this fraction
+    # of the base index, after which the full index is rewritten.
+    DELTA_COMPACT_RATIO = 0.5
+
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', dimension: int = 384,
+                 index_type: str = 'flat', batch_size: int = 64, nlist: Optional[int] = None,
+                 nprobe: int = 8, train_threshold: int = 10000, rebuild_threshold: float = 4.0,
+                 hnsw_m: int = 32, ef_search: int = 64, model: Optional[Any] = None,
+                 query_cache_size: int = 1024):
         """
         Initializes the KnowledgeBase.
 
         Args:
             model_name (str): The name of the sentence-transformer model to use.
             dimension (int): The dimension of the vectors produced by the model.
+            index_type (str): One of ``flat``, ``ivf`` or ``hnsw``.
+            batch_size (int): Number of documents encoded and indexed per batch.
+            nlist (Optional[int]): IVF cell count. Auto-sized to ~4*sqrt(N) when None.
+            nprobe (int): IVF cells visited per query.
+            train_threshold (int): Documents required before an IVF index is trained.
+            rebuild_threshold (float): Corpus growth factor that triggers IVF retraining.
+            hnsw_m (int): HNSW graph degree.
+            ef_search (int): HNSW search breadth.
+            model (Optional[Any]): A pre-loaded encoder with a SentenceTransformer-compatible
+                ``encode``. When omitted, ``model_name`` is loaded on first use, not here.
+            query_cache_size (int): Number of query embeddings kept in the LRU cache (0 disables it).
         """
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {self.INDEX_TYPES}, got '{index_type}'.")
+        self.model_name = model_name
+        self.dimension = dimension
+        self.index_type = index_type
+        self.batch_size = batch_size
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.rebuild_threshold = rebuild_threshold
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.documents = DocumentStore()
+        self._trained_size = 0
+        self._unsaved_vectors: List[Any] = []
+        self._saved_index: Optional[Tuple[str, int, int]] = None  # (index_path, base, delta) of the last save
+        self._index_dirty = True
+        self.query_cache_size = query_cache_size
+        self._query_cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self.query_cache_hits = 0
+        self.query_cache_misses = 0
+        self._model = model
+        self._model_pending = model is None and KNOWLEDGE_BASE_AVAILABLE
+
         if not FAISS_AVAILABLE:
             logging.warning("FAISS or sentence-transformers not found. KnowledgeBase will have limited functionality.")
-            self.model = None
             self.index = None
-            self.documents: List[str] = []
-        else:
-            self.model = SentenceTransformer(model_name)
-            self.index = faiss.IndexFlatL2(dimension)
-            self.documents: List[str] = []
-            logging.info(f"KnowledgeBase initialized with model '{model_name}'.")
+            return
 
-    def add_documents(self, docs: List[str]):
+        if model is None and not SENTENCE_TRANSFORMERS_AVAILABLE:
+            logging.warning("sentence-transformers not found. Saved knowledge bases can be loaded but not queried.")
+        self.index = self._create_index(0)
+        logging.info(f"KnowledgeBase initialized with model '{model_name}' and '{index_type}' index.")
+
+    @property
+    def model(self):
+        """The sentence encoder, loaded from ``model_name`` the first time it is needed."""
+        if self._model_pending:
+            self._model_pending = False
+            logging.info(f"Loading sentence-transformer model '{self.model_name}'.")
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self._model_pending = False
+        self._query_cache.clear()
+
+    # --- Index management ---
+
+    def _ivf_nlist(self, n: int) -> int:
+        return self.nlist or max(1, min(int(4 * math.sqrt(n)), n // 39))
+
+    def _create_index(self, n: int):
+        if self.index_type == 'hnsw':
+            index = faiss.index_factory(self.dimension, f"HNSW{self.hnsw_m}")
+        elif self.index_type == 'ivf' and n >= max(self.train_threshold, self.nlist or 1):
+            index = faiss.index_factory(self.dimension, f"IVF{self._ivf_nlist(n)},Flat")
+        else:
+            index = faiss.IndexFlatL2(self.dimension)
+        self._configure(index)
+        return index
+
+    def _configure(self, index):
+        if isinstance(index, faiss.IndexIVF):
+            index.nprobe = self.nprobe
+        elif isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = self.ef_search
+
+    @staticmethod
+    def _leading_vectors(index, n: int):
+        if isinstance(index, faiss.IndexIVF):
+            index.make_direct_map()
+            vectors = index.reconstruct_n(0, n)
+            index.make_direct_map(False)
+            return vectors
+        return index.reconstruct_n(0, n)
+
+    def _all_vectors(self):
+        return self._leading_vectors(self.index, self.index.ntotal)
+
+    def _needs_rebuild(self) -> bool:
+        if self.index_type != 'ivf':
+            return False
+        n = self.index.ntotal
+        if not isinstance(self.index, faiss.IndexIVF):
+            return n >= max(self.train_threshold, self.nlist or 1)
+        return n >= self._trained_size * self.rebuild_threshold
+
+    def rebuild(self):
+        """Re-creates (and for IVF, retrains) the index from the vectors it currently holds."""
+        vectors = self._all_vectors()
+        index = self._create_index(len(vectors))
+        if not index.is_trained:
+            index.train(vectors)
+            self._trained_size = len(vectors)
+        index.add(vectors)
+        self.index = index
+        self._index_dirty = True
+        logging.info(f"Rebuilt '{self.index_type}' index over {index.ntotal} vectors.")
+
+    def add_documents(self, docs: List[str], batch_size: Optional[int] = None) -> int:
         """
         Adds documents to the knowledge base.
 
+        Documents whose content is already stored (or repeated within ``docs``) are
+        skipped. New documents are encoded and indexed ``batch_size`` at a time.
+
         Args:
             docs (List[str]): A list of documents (strings) to add.
+            batch_size (Optional[int]): Overrides the knowledge base batch size.
+
+        Returns:
+            int: The number of documents actually added.
         """
-        if not self.model or not self.index:
+        if self.index is None or self.model is None:
             logging.error("Cannot add documents. KnowledgeBase is not properly initialized.")
-            return
+            return 0
+
+        batch_size = batch_size or self.batch_size
+        fresh, digests, seen = [], [], set()
+        for doc in docs:
+            digest = DocumentStore.digest(doc)
+            if digest in seen or self.documents.has_digest(digest):
+                continue
+            seen.add(digest)
+            fresh.append(doc)
+            digests.append(digest)
+
+        for start in range(0, len(fresh), batch_size):
+            batch = fresh[start:start + batch_size]
+            embeddings = self.model.encode(batch, batch_size=batch_size, convert_to_numpy=True)
+            embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+            self.index.add(embeddings)
+            self._unsaved_vectors.append(embeddings)
+            for doc, digest in zip(batch, digests[start:start + batch_size]):
+                self.documents.append(doc, digest)
+            if self._needs_rebuild():
+                self.rebuild()
+
+        logging.info(f"Added {len(fresh)} new documents ({len(docs) - len(fresh)} duplicates skipped). "
+                     f"Total documents: {self.index.ntotal}.")
+        return len(fresh)
+
+    def _encode_queries(self, queries: List[str]):
+        """Returns query embeddings, encoding only the queries missing from the LRU cache in one call."""
+        cache = self._query_cache
+        missing = list(dict.fromkeys(q for q in queries if q not in cache))
+        self.query_cache_hits += len(queries) - sum(q not in cache for q in queries)
+        self.query_cache_misses += len(missing)
+        encoded = {}
+        if missing:
+            embeddings = self.model.encode(missing, batch_size=self.batch_size, convert_to_numpy=True)
+            encoded = dict(zip(missing, np.asarray(embeddings, dtype='float32')))
+
+        vectors = []
+        for query in queries:
+            if query in encoded:
+                vector = encoded[query]
+            else:
+                vector = cache[query]
+                cache.move_to_end(query)
+            vectors.append(vector)
+        if self.query_cache_size > 0:
+            for query, vector in encoded.items():
+                cache[query] = vector
+            while len(cache) > self.query_cache_size:
+                cache.popitem(last=False)
+        return np.ascontiguousarray(vectors, dtype='float32')
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Tuple[str, float]]]:
+        """
+        Searches the knowledge base for many queries at once.
 
-        self.documents.extend(docs)
-        embeddings = self.model.encode(docs, convert_to_numpy=True)
-        self.index.add(embeddings.astype('float32'))
-        logging.info(f"Added {len(docs)} new documents. Total documents: {self.index.ntotal}.")
+        Queries are encoded in a single model call (cached embeddings are reused) and
+        searched with a single index call.
+
+        Args:
+            queries (List[str]): The query strings.
+            k (int): The number of similar documents to return per query.
+
+        Returns:
+            List[List[Tuple[str, float]]]: For each query, a list of (document, distance) tuples.
+        """
+        if self.index is None or self.index.ntotal == 0 or self.model is None:
+            logging.warning("Knowledge base is empty or not initialized. Cannot perform search.")
+            return [[] for _ in queries]
+        if not queries:
+            return []
+
+        distances, indices = self.index.search(self._encode_queries(queries), k)
+        n_docs = len(self.documents)
+        return [[(self.documents[int(doc_index)], float(distance))
+                 for doc_index, distance in zip(row_indices, row_distances) if 0 <= doc_index < n_docs]
+                for row_indices, row_distances in zip(indices, distances)]
 
     def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
         """
@@ -68,42 +403,95 @@ class KnowledgeBase:
         Returns:
             List[Tuple[str, float]]: A list of tuples, each containing a document and its similarity score.
         """
-        if not self.model or not self.index or self.index.ntotal == 0:
-            logging.warning("Knowledge base is empty or not initialized. Cannot perform search.")
-            return []
+        return self.search_batch([query], k)[0]
 
-        query_embedding = self.model.encode([query], convert_to_numpy=True).astype('float32')
-        distances, indices = self.index.search(query_embedding, k)
-
-        results = []
-        for i in range(len(indices[0])):
-            doc_index = indices[0][i]
-            if doc_index < len(self.documents):
-                results.append((self.documents[doc_index], distances[0][i]))
-        return results
+    # --- Persistence ---
 
     def save(self, index_path: str, docs_path: str):
-        """Saves the FAISS index and documents."""
-        if not FAISS_AVAILABLE:
+        """
+        Saves the FAISS index and documents.
+
+        Re-saving to the same paths is incremental: new documents are appended to the
+        document store and new vectors to ``index_path.delta``. The full index is only
+        rewritten after a rebuild or once the delta grows past ``DELTA_COMPACT_RATIO``.
+        """
+        if not FAISS_AVAILABLE or self.index is None:
             logging.error("Cannot save. FAISS not available.")
             return
-        faiss.write_index(self.index, index_path)
-        with open(docs_path, 'w', encoding='utf-8') as f:
-            json.dump(self.documents, f)
-        logging.info(f"KnowledgeBase saved to {index_path} and {docs_path}.")
+        self.documents.flush(docs_path)
+
+        pending = np.concatenate(self._unsaved_vectors) if self._unsaved_vectors else np.empty((0, self.index.d), 'float32')
+        saved = self._saved_index
+        if saved and saved[0] == index_path and not self._index_dirty \
+                and saved[2] + len(pending) <= self.DELTA_COMPACT_RATIO * max(saved[1], 1):
+            base, delta = saved[1], saved[2] + len(pending)
+            with open(index_path + '.delta', 'r+b' if saved[2] else 'wb') as f:
+                f.truncate(saved[2] * pending.itemsize * self.index.d)
+                f.seek(0, os.SEEK_END)
+                f.write(pending.tobytes())
+        else:
+            faiss.write_index(self.index, index_path + '.tmp')
+            os.replace(index_path + '.tmp', index_path)
+            base, delta = self.index.ntotal, 0
+
+        # The manifest is written last: it is what marks documents and vectors as committed.
+        meta = {"index_type": self.index_type, "dimension": self.index.d, "documents": len(self.documents),
+                "base": base, "delta": delta, "trained_size": self._trained_size}
+        with open(index_path + '.meta.json.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(index_path + '.meta.json.tmp', index_path + '.meta.json')
+
+        self._saved_index = (index_path, base, delta)
+        self._unsaved_vectors = []
+        self._index_dirty = False
+        logging.info(f"KnowledgeBase saved to {index_path} and {docs_path} "
+                     f"({base} indexed + {delta} appended vectors).")
 
     def load(self, index_path: str, docs_path: str):
-        """Loads the FAISS index and documents."""
+        """Loads the FAISS index and documents (including stores saved as a JSON list)."""
         if not FAISS_AVAILABLE:
             logging.error("Cannot load. FAISS not available.")
             return
-        if os.path.exists(index_path) and os.path.exists(docs_path):
-            self.index = faiss.read_index(index_path)
-            with open(docs_path, 'r', encoding='utf-8') as f:
-                self.documents = json.load(f)
-            logging.info(f"KnowledgeBase loaded from {index_path} and {docs_path}. Total documents: {self.index.ntotal}.")
-        else:
+        if not (os.path.exists(index_path) and os.path.exists(docs_path)):
             logging.error(f"Could not find files at {index_path} or {docs_path}.")
+            return
+
+        meta = {}
+        if os.path.exists(index_path + '.meta.json'):
+            with open(index_path + '.meta.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        index = faiss.read_index(index_path)
+        base, delta = index.ntotal, meta.get("delta", 0)
+        stale = "base" in meta and index.ntotal != meta["base"]
+        if stale:
+            # The index file was rewritten but the save stopped before its manifest. Vector ids are
+            # append-only (rebuilds keep their order), so the committed vectors are the leading ones.
+            vectors = self._leading_vectors(index, min(meta["documents"], index.ntotal))
+            index.reset()
+            index.add(vectors)
+            base, delta = index.ntotal, 0
+            logging.warning(f"Index at {index_path} is newer than its manifest; "
+                            f"truncated to the {base} committed vectors.")
+        elif delta:
+            vectors = np.fromfile(index_path + '.delta', dtype='float32', count=delta * index.d)
+            index.add(vectors.reshape(-1, index.d))
+        self._configure(index)
+
+        if os.path.exists(docs_path + '.offsets'):
+            documents = DocumentStore.open(docs_path, meta.get("documents", index.ntotal))
+        else:
+            with open(docs_path, 'r', encoding='utf-8') as f:
+                documents = DocumentStore.from_list(json.load(f))
+
+        self.index = index
+        self.documents = documents
+        self.dimension = index.d
+        self.index_type = meta.get("index_type", self.index_type)
+        self._trained_size = meta.get("trained_size", index.ntotal if isinstance(index, faiss.IndexIVF) else 0)
+        self._unsaved_vectors = []
+        self._saved_index = (index_path, base, delta)
+        self._index_dirty = stale
+        logging.info(f"KnowledgeBase loaded from {index_path} and {docs_path}. Total documents: {self.index.ntotal}.")
 
 
 class BiologyCartridge:
@@ -119,7 +507,7 @@ class BiologyCartridge:
         self.name = "BiologyCartridge"
         self.version = "1.0.0"
         self.author = "Gemini 2.5 Pro for Dr. SHawn"
-        self.knowledge_base = knowledge_base if knowledge_base else (KnowledgeBase() if FAISS_AVAILABLE else None)
+        self.knowledge_base = knowledge_base if knowledge_base else (KnowledgeBase() if KNOWLEDGE_BASE_AVAILABLE else None)
         
         # Core knowledge related to uterine organoids
         self.uterine_organoid_protocols = {
@@ -292,7 +680,7 @@ def run_tests():
         
     # 5. Test KnowledgeBase (if available)
     print("\n[5] Testing Knowledge Base...")
-    if not FAISS_AVAILABLE:
+    if not KNOWLEDGE_BASE_AVAILABLE:
         print("SKIPPED: FAISS or sentence-transformers not installed.")
     else:
         try:
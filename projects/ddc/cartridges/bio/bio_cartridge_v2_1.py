@@ -11,13 +11,30 @@ Bio-Cartridge v2.1 - google.genai 마이그레이션 버전
 
 import cv2
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterator, AsyncIterator, Union, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
 import json
 from datetime import datetime
 import asyncio
 import os
+import tempfile
+import time
+
+try:
+    import tifffile
+    TIFFFILE_AVAILABLE = True
+except ImportError:
+    TIFFFILE_AVAILABLE = False
+
+try:
+    from projects.ddc.utilities.cache_system import ContentAddressedCache, get_content_cache
+    CONTENT_CACHE_AVAILABLE = True
+except ImportError:
+    CONTENT_CACHE_AVAILABLE = False
 
 
 # ============================================================================
@@ -31,6 +48,18 @@ class Config:
     IMAGE_SIZE = (512, 512)
     MAX_RETRIES = 3
     TIMEOUT_SECONDS = 30
+    ANALYZER_VERSION = "2.1.1"             # CV/프롬프트/결합 로직 변경 시 올림 (캐시 키에 포함)
+    UPLOAD_TTL_SECONDS = 46 * 3600         # Gemini 업로드 파일 보존 기간(48시간) 내 재사용
+    VIDEO_INSPECT_FPS = 4.0                # 초당 검사 프레임 수 상한 (나머지는 디코딩 없이 grab 으로 건너뜀)
+    VIDEO_HASH_THRESHOLD = 4               # dHash 해밍 거리 이하면 거의 같은 프레임으로 간주
+    VIDEO_MAX_GAP_SECONDS = 60.0           # 변화가 없어도 이 간격마다 한 장은 분석
+    VIDEO_MIN_SAMPLES = 32                 # 짧은 타임랩스도 최소 이 정도 간격으로 샘플 (간격 = 길이 / N)
+    VIDEO_PROGRESS_EVERY = 50              # 진행 상황 보고 간격 (검사 프레임 수)
+    CV_MAX_WORKERS = os.cpu_count() or 1   # CV 프로세스 풀 크기
+    BATCH_CONCURRENCY = 4                  # 배치 분석 시 동시 Vision API 호출 수
+    TILE_SIZE = 1024                       # 타일 분석 단위 (픽셀)
+    TILED_MIN_PIXELS = 64_000_000          # 이 이상이면 타일 모드 (약 8000x8000)
+    TILED_MIN_BYTES = 100 * 1024 * 1024    # 크기 정보를 헤더로 알 수 없는 포맷의 파일 크기 기준
 
 
 # ============================================================================
@@ -65,6 +94,17 @@ class CVAnalysis:
     cv_confidence: float
 
 
+@dataclass
+class TiledCVAnalysis:
+    """타일 분석 결과 (전체 지표 + 타일별 히트맵)"""
+    analysis: CVAnalysis
+    tile_size: int
+    image_shape: Tuple[int, int]
+    density_map: np.ndarray        # (행, 열) 타일별 밀도 (%)
+    aggregation_map: np.ndarray    # 타일별 연결 성분 수 (경계 병합 전)
+    texture_map: np.ndarray        # 타일별 라플라시안 분산
+
+
 @dataclass
 class CellAnalysisResult:
     """종합 분석 결과"""
@@ -78,14 +118,27 @@ class CellAnalysisResult:
     recommendations: List[str]
     overall_confidence: float
     cv_analysis: CVAnalysis
+    ai_fallback: bool = False      # Vision API 폴백 응답 사용 여부 (폴백 결과는 캐시하지 않음)
 
 
 # ============================================================================
 # 3. CV 분석기 (기존 유지)
 # ============================================================================
 
+ImageSource = Union[str, np.ndarray]
+
+
 class CVAnalyzer:
-    """OpenCV 기반 정량 분석"""
+    """
+    OpenCV 기반 정량 분석
+    
+    - analyze / analyze_array: 단일 이미지 (동기)
+    - analyze_batch: 프로세스 풀 배치 분석, 완료 순서대로 스트리밍
+      (경로는 워커가 직접 디코딩, 메모리 배열은 공유 메모리로 전달 -> 픽셀 복사/피클링 없음)
+    - analyze_async / analyze_batch_async: 이벤트 루프를 막지 않는 비동기 버전
+    """
+    
+    _pool: Optional[ProcessPoolExecutor] = None
     
     @staticmethod
     def analyze(image_path: str) -> CVAnalysis:
@@ -94,33 +147,40 @@ class CVAnalyzer:
             img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
             if img is None:
                 return CVAnalyzer._get_fallback_analysis()
-            
-            # 밀도 계산
-            _, thresh = cv2.threshold(img, 127, 255, cv2.THRESH_BINARY)
-            density = (np.count_nonzero(thresh) / thresh.size) * 100
-            
-            # 윤곽선 분석
-            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            aggregation = min(len(contours) / 100, 100)
-            
-            # 텍스처 분석
-            texture_variance = cv2.Laplacian(img, cv2.CV_64F).var()
-            
-            # 형태 점수
-            morphology_score = (density * 0.3 + aggregation * 0.4 + min(texture_variance / 10, 100) * 0.3)
-            morphology_score = max(0, min(100, morphology_score))
-            
-            return CVAnalysis(
-                density=density,
-                aggregation=aggregation,
-                texture_variance=texture_variance,
-                morphology_score=morphology_score,
-                cv_confidence=85.0
-            )
+            return CVAnalyzer.analyze_array(img)
         except Exception as e:
             print(f"❌ CV 분석 오류: {e}")
             return CVAnalyzer._get_fallback_analysis()
     
+    @staticmethod
+    def analyze_array(img: np.ndarray) -> CVAnalysis:
+        """디코딩된 이미지 배열 분석 (컬러는 BGR 로 간주해 그레이스케일 변환)"""
+        if img.ndim == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        
+        # 밀도 계산
+        _, thresh = cv2.threshold(img, 127, 255, cv2.THRESH_BINARY)
+        density = (np.count_nonzero(thresh) / thresh.size) * 100
+        
+        # 윤곽선 분석
+        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        aggregation = min(len(contours) / 100, 100)
+        
+        # 텍스처 분석
+        texture_variance = cv2.Laplacian(img, cv2.CV_64F).var()
+        
+        # 형태 점수
+        morphology_score = (density * 0.3 + aggregation * 0.4 + min(texture_variance / 10, 100) * 0.3)
+        morphology_score = max(0, min(100, morphology_score))
+        
+        return CVAnalysis(
+            density=float(density),
+            aggregation=float(aggregation),
+            texture_variance=float(texture_variance),
+            morphology_score=float(morphology_score),
+            cv_confidence=85.0
+        )
+    
     @staticmethod
     def _get_fallback_analysis() -> CVAnalysis:
         """폴백 분석"""
@@ -131,8 +191,720 @@ class CVAnalyzer:
             morphology_score=45.0,
             cv_confidence=40.0
         )
+    
+    # ------------------------------------------------------------------
+    # 프로세스 풀
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def get_pool(cls) -> ProcessPoolExecutor:
+        """공유 CV 프로세스 풀 (최초 사용 시 생성, 재사용)"""
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor(max_workers=Config.CV_MAX_WORKERS)
+        return cls._pool
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """공유 풀 종료"""
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=True)
+            cls._pool = None
+    
+    @staticmethod
+    def _share(image: ImageSource) -> Tuple[Any, Optional[shared_memory.SharedMemory]]:
+        """워커 작업 인자 생성 - 배열은 공유 메모리 블록으로 복사하고 (이름, shape, dtype) 전달"""
+        if isinstance(image, np.ndarray):
+            block = shared_memory.SharedMemory(create=True, size=max(image.nbytes, 1))
+            np.ndarray(image.shape, image.dtype, buffer=block.buf)[...] = image
+            return (block.name, image.shape, image.dtype.str), block
+        return image, None
+    
+    @staticmethod
+    def _release(block: Optional[shared_memory.SharedMemory]) -> None:
+        if block is not None:
+            block.close()
+            block.unlink()
+    
+    @staticmethod
+    def analyze_batch(
+        images: List[ImageSource],
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[int, CVAnalysis]]:
+        """
+        배치 분석 (프로세스 풀) - 끝나는 순서대로 (입력 인덱스, 결과) 반환
+        
+        Args:
+            images: 이미지 경로 또는 디코딩된 배열 목록
+            max_workers: 지정 시 전용 풀 사용 (None 이면 공유 풀)
+        """
+        pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers else CVAnalyzer.get_pool()
+        blocks: Dict[Any, Optional[shared_memory.SharedMemory]] = {}
+        futures = {}
+        try:
+            for index, image in enumerate(images):
+                task, block = CVAnalyzer._share(image)
+                future = pool.submit(_cv_worker, task)
+                futures[future] = index
+                blocks[future] = block
+            for future in as_completed(futures):
+                CVAnalyzer._release(blocks.pop(future))
+                yield futures[future], future.result()
+        finally:
+            for future, block in blocks.items():
+                future.cancel()
+                if not future.cancelled():
+                    try:
+                        future.result()
+                    except Exception:
+                        pass
+                CVAnalyzer._release(block)
+            if max_workers:
+                pool.shutdown(wait=True)
+    
+    @staticmethod
+    async def analyze_async(image: ImageSource) -> CVAnalysis:
+        """단일 이미지 비동기 분석 (공유 프로세스 풀에서 실행, 대용량 이미지는 타일 모드)"""
+        if isinstance(image, str) and CVAnalyzer.is_large(image):
+            tiled = await asyncio.to_thread(CVAnalyzer.analyze_tiled, image)
+            return tiled.analysis
+        
+        task, block = CVAnalyzer._share(image)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(CVAnalyzer.get_pool(), _cv_worker, task)
+        finally:
+            CVAnalyzer._release(block)
+    
+    @staticmethod
+    async def analyze_batch_async(images: List[ImageSource]) -> AsyncIterator[Tuple[int, CVAnalysis]]:
+        """배치 비동기 분석 - 끝나는 순서대로 (입력 인덱스, 결과) 반환"""
+        async def run(index: int, image: ImageSource) -> Tuple[int, CVAnalysis]:
+            return index, await CVAnalyzer.analyze_async(image)
+        
+        tasks = [asyncio.ensure_future(run(i, image)) for i, image in enumerate(images)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    # ------------------------------------------------------------------
+    # 타일 모드 (대용량 이미지)
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def image_shape(image_path: str) -> Optional[Tuple[int, ...]]:
+        """디코딩 없이 이미지 크기 조회 (.npy / TIFF 만, 그 외 None)"""
+        suffix = os.path.splitext(image_path)[1].lower()
+        try:
+            if suffix == ".npy":
+                return np.load(image_path, mmap_mode="r").shape
+            if suffix in (".tif", ".tiff") and TIFFFILE_AVAILABLE:
+                with tifffile.TiffFile(image_path) as tif:
+                    return tif.pages[0].shape
+        except Exception:
+            return None
+        return None
+    
+    @staticmethod
+    def is_large(image_path: str) -> bool:
+        """타일 모드 대상 여부 (헤더 크기 또는 파일 크기 기준)"""
+        shape = CVAnalyzer.image_shape(image_path)
+        if shape is not None:
+            return shape[0] * shape[1] >= Config.TILED_MIN_PIXELS
+        try:
+            return os.path.getsize(image_path) >= Config.TILED_MIN_BYTES
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _open_tiled_source(image: ImageSource) -> Tuple[Tuple[Any, ...], Tuple[int, int], Optional[Any]]:
+        """
+        워커가 직접 여는 소스 기술자 생성 -> (기술자, (높이, 너비), 정리 대상)
+        
+        - .npy: 메모리 맵
+        - 비압축 TIFF: tifffile 메모리 맵 (tifffile 설치 시)
+        - 메모리 배열: 공유 메모리
+        - 그 외 포맷: 한 번 그레이스케일 디코딩 후 임시 .npy 로 저장 (디코딩 시점만 전체 크기 메모리)
+        """
+        if isinstance(image, np.ndarray):
+            task, block = CVAnalyzer._share(image)
+            return ("shm",) + task, image.shape[:2], block
+        
+        suffix = os.path.splitext(image)[1].lower()
+        if suffix == ".npy":
+            return ("npy", image), np.load(image, mmap_mode="r").shape[:2], None
+        if suffix in (".tif", ".tiff") and TIFFFILE_AVAILABLE:
+            try:
+                return ("tiff", image), tifffile.memmap(image, mode="r").shape[:2], None
+            except Exception:
+                pass  # 압축 TIFF 등 메모리 맵 불가 -> 디코딩 폴백
+        
+        decoded = cv2.imread(image, cv2.IMREAD_GRAYSCALE)
+        if decoded is None:
+            raise ValueError(f"이미지를 읽을 수 없음: {image}")
+        fd, temp_path = tempfile.mkstemp(suffix=".npy")
+        os.close(fd)
+        np.save(temp_path, decoded)
+        shape = decoded.shape
+        del decoded
+        return ("npy", temp_path), shape, temp_path
+    
+    @staticmethod
+    def analyze_tiled(
+        image: ImageSource,
+        tile_size: int = Config.TILE_SIZE,
+        max_workers: Optional[int] = None
+    ) -> TiledCVAnalysis:
+        """
+        타일 단위 분석 - 메모리 사용량은 이미지 크기와 무관 (워커당 타일 1개 + 타일 경계선)
+        
+        전체 지표는 타일 통계를 병합해 단일 이미지 분석과 동일하게 계산:
+        - 밀도: 전경 픽셀 수 합산
+        - 텍스처: 1픽셀 halo 로 라플라시안을 정확히 계산, 분산은 (개수, 평균, M2) 병합
+        - 응집도: 타일별 전경(8-연결)/배경(4-연결) 성분을 경계선 라벨로 union-find 병합한 뒤
+          바깥 배경에 닿는 전경 성분 수 (= findContours RETR_EXTERNAL 윤곽선 수)
+        """
+        source, (height, width), cleanup = CVAnalyzer._open_tiled_source(image)
+        rows = -(-height // tile_size)
+        cols = -(-width // tile_size)
+        density_map = np.zeros((rows, cols))
+        aggregation_map = np.zeros((rows, cols), dtype=np.int64)
+        texture_map = np.zeros((rows, cols))
+        borders: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        
+        foreground = 0
+        lap_count, lap_mean, lap_m2 = 0, 0.0, 0.0
+        
+        pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers else CVAnalyzer.get_pool()
+        window = 2 * (max_workers or Config.CV_MAX_WORKERS)
+        tiles = iter([(r, c) for r in range(rows) for c in range(cols)])
+        pending = {}
+        try:
+            while True:
+                # 진행 중 작업 수 제한 (결과 누적/메모리 상한)
+                for r, c in tiles:
+                    box = (r * tile_size, min((r + 1) * tile_size, height),
+                           c * tile_size, min((c + 1) * tile_size, width))
+                    pending[pool.submit(_tile_worker, source, box)] = (r, c)
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    r, c = pending.pop(future)
+                    stats = future.result()
+                    n = stats["pixels"]
+                    foreground += stats["foreground"]
+                    density_map[r, c] = stats["foreground"] / n * 100
+                    aggregation_map[r, c] = stats["components"]
+                    texture_map[r, c] = stats["lap_m2"] / n
+                    # Chan 병합
+                    delta = stats["lap_mean"] - lap_mean
+                    total = lap_count + n
+                    lap_mean += delta * n / total
+                    lap_m2 += stats["lap_m2"] + delta * delta * lap_count * n / total
+                    lap_count = total
+                    borders[(r, c)] = stats["borders"]
+        finally:
+            for future in pending:
+                future.cancel()
+            if max_workers:
+                pool.shutdown(wait=True)
+            if isinstance(cleanup, str):
+                os.remove(cleanup)
+            else:
+                CVAnalyzer._release(cleanup)
+        
+        components = CVAnalyzer._count_external_components(borders, rows, cols)
+        density = foreground / (height * width) * 100
+        aggregation = min(components / 100, 100)
+        texture_variance = lap_m2 / lap_count
+        morphology_score = (density * 0.3 + aggregation * 0.4 + min(texture_variance / 10, 100) * 0.3)
+        morphology_score = max(0, min(100, morphology_score))
+        
+        return TiledCVAnalysis(
+            analysis=CVAnalysis(
+                density=float(density),
+                aggregation=float(aggregation),
+                texture_variance=float(texture_variance),
+                morphology_score=float(morphology_score),
+                cv_confidence=85.0
+            ),
+            tile_size=tile_size,
+            image_shape=(height, width),
+            density_map=density_map,
+            aggregation_map=aggregation_map,
+            texture_map=texture_map
+        )
+    
+    @staticmethod
+    def _count_external_components(borders: Dict[Tuple[int, int], Dict[str, Any]], rows: int, cols: int) -> int:
+        """
+        타일 경계 라벨 병합 -> 바깥 배경에 닿는 전경 성분 수
+        
+        전경 키는 양수(타일 오프셋 + 라벨), 배경 키는 음수로 하나의 union-find 에 저장
+        """
+        fg_offset, bg_offset = {}, {}
+        fg_total = bg_total = 0
+        for r in range(rows):
+            for c in range(cols):
+                fg_offset[(r, c)], bg_offset[(r, c)] = fg_total, bg_total
+                fg_total += borders[(r, c)]["fg_count"]
+                bg_total += borders[(r, c)]["bg_count"]
+        
+        def fg(tile: Tuple[int, int], labels: np.ndarray) -> np.ndarray:
+            return labels.astype(np.int64) + fg_offset[tile]
+        
+        def bg(tile: Tuple[int, int], labels: np.ndarray) -> np.ndarray:
+            return -(labels.astype(np.int64) + bg_offset[tile])
+        
+        def shifted(line: np.ndarray, shift: int) -> np.ndarray:
+            out = np.zeros_like(line)
+            if shift > 0:
+                out[shift:] = line[:-shift]
+            elif shift < 0:
+                out[:shift] = line[-shift:]
+            else:
+                out[:] = line
+            return out
+        
+        sets = _DisjointSet()
+        adjacency: List[np.ndarray] = []
+        outer_bg: List[int] = []
+        external_fg: List[int] = []
+        
+        def link(a_tile, a_fg, a_bg, b_tile, b_fg, b_bg) -> None:
+            """맞닿은 두 경계선: 전경은 대각선 포함(8-연결), 배경은 마주보는 픽셀만(4-연결)"""
+            for shift in (-1, 0, 1):
+                other = shifted(b_fg, shift)
+                mask = (a_fg > 0) & (other > 0)
+                sets.union_pairs(fg(a_tile, a_fg[mask]), fg(b_tile, other[mask]))
+            mask = (a_bg > 0) & (b_bg > 0)
+            sets.union_pairs(bg(a_tile, a_bg[mask]), bg(b_tile, b_bg[mask]))
+            for f_tile, f_line, g_tile, g_line in ((a_tile, a_fg, b_tile, b_bg), (b_tile, b_fg, a_tile, a_bg)):
+                mask = (f_line > 0) & (g_line > 0)
+                adjacency.append(np.stack([fg(f_tile, f_line[mask]), bg(g_tile, g_line[mask])], axis=1))
+        
+        for (r, c), info in borders.items():
+            tile = (r, c)
+            fg_edges, bg_edges = info["fg"], info["bg"]
+            adjacency.append(np.stack([fg(tile, info["pairs"][:, 0]), bg(tile, info["pairs"][:, 1])], axis=1))
+            outer_bg.extend(bg(tile, info["bg_outer"]).tolist())
+            external_fg.extend(fg(tile, info["fg_outer"]).tolist())
+            
+            if c + 1 < cols:
+                right = borders[(r, c + 1)]
+                link(tile, fg_edges["right"], bg_edges["right"], (r, c + 1), right["fg"]["left"], right["bg"]["left"])
+            if r + 1 < rows:
+                below = borders[(r + 1, c)]
+                link(tile, fg_edges["bottom"], bg_edges["bottom"], (r + 1, c), below["fg"]["top"], below["bg"]["top"])
+                # 대각선 타일 모서리 (전경 8-연결)
+                if c + 1 < cols and fg_edges["bottom"][-1] and borders[(r + 1, c + 1)]["fg"]["top"][0]:
+                    sets.union(int(fg(tile, fg_edges["bottom"][-1:])[0]),
+                               int(fg((r + 1, c + 1), borders[(r + 1, c + 1)]["fg"]["top"][:1])[0]))
+                if c > 0 and fg_edges["bottom"][0] and borders[(r + 1, c - 1)]["fg"]["top"][-1]:
+                    sets.union(int(fg(tile, fg_edges["bottom"][:1])[0]),
+                               int(fg((r + 1, c - 1), borders[(r + 1, c - 1)]["fg"]["top"][-1:])[0]))
+        
+        outer = {sets.find(x) for x in outer_bg}
+        external = {sets.find(x) for x in external_fg}
+        if adjacency:
+            for f, g in np.unique(np.concatenate(adjacency), axis=0).tolist():
+                if sets.find(g) in outer:
+                    external.add(sets.find(f))
+        return len(external)
 
 
+class _DisjointSet:
+    """union-find (경로 압축)"""
+    
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+    
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while x != root:
+            parent[x], x = root, parent.get(x, x)
+        return root
+    
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[ra] = rb
+    
+    def union_pairs(self, a: np.ndarray, b: np.ndarray) -> None:
+        if len(a):
+            for x, y in np.unique(np.stack([a, b], axis=1), axis=0).tolist():
+                self.union(x, y)
+
+
+def _cv_worker(task: Any) -> CVAnalysis:
+    """프로세스 풀 워커: 경로는 직접 디코딩, (공유 메모리 이름, shape, dtype) 는 복사 없이 참조"""
+    if isinstance(task, str):
+        return CVAnalyzer.analyze(task)
+    
+    name, shape, dtype = task
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        image = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+        try:
+            return CVAnalyzer.analyze_array(image)
+        except Exception as e:
+            print(f"❌ CV 분석 오류: {e}")
+            return CVAnalyzer._get_fallback_analysis()
+        finally:
+            del image
+    finally:
+        block.close()
+
+
+def _open_tile_source(source: Tuple[Any, ...]) -> Tuple[np.ndarray, Optional[shared_memory.SharedMemory]]:
+    kind = source[0]
+    if kind == "npy":
+        return np.load(source[1], mmap_mode="r"), None
+    if kind == "tiff":
+        return tifffile.memmap(source[1], mode="r"), None
+    _, name, shape, dtype = source
+    block = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, np.dtype(dtype), buffer=block.buf), block
+
+
+def _tile_worker(source: Tuple[Any, ...], box: Tuple[int, int, int, int]) -> Dict[str, Any]:
+    """타일 워커: 1픽셀 halo 포함 영역만 읽어 밀도/성분/라플라시안 통계 + 경계 라벨 반환"""
+    y0, y1, x0, x1 = box
+    image, block = _open_tile_source(source)
+    try:
+        height, width = image.shape[:2]
+        top, left = max(y0 - 1, 0), max(x0 - 1, 0)
+        region = np.array(image[top:min(y1 + 1, height), left:min(x1 + 1, width)])
+    finally:
+        del image
+        if block is not None:
+            block.close()
+    
+    if region.ndim == 3:
+        region = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
+    laplacian = cv2.Laplacian(region, cv2.CV_64F)[y0 - top:y0 - top + (y1 - y0), x0 - left:x0 - left + (x1 - x0)]
+    tile = region[y0 - top:y0 - top + (y1 - y0), x0 - left:x0 - left + (x1 - x0)]
+    
+    _, thresh = cv2.threshold(tile, 127, 255, cv2.THRESH_BINARY)
+    fg_count, fg_labels = cv2.connectedComponents(thresh, connectivity=8)
+    bg_count, bg_labels = cv2.connectedComponents(cv2.bitwise_not(thresh), connectivity=4)
+    
+    # 타일 내부 전경-배경 인접 쌍 (4-이웃)
+    codes = []
+    for f, g in ((fg_labels[:, :-1], bg_labels[:, 1:]), (fg_labels[:, 1:], bg_labels[:, :-1]),
+                 (fg_labels[:-1], bg_labels[1:]), (fg_labels[1:], bg_labels[:-1])):
+        mask = (f > 0) & (g > 0)
+        codes.append(f[mask].astype(np.int64) * bg_count + g[mask])
+    codes = np.unique(np.concatenate(codes))
+    
+    # 이미지 가장자리에 닿는 성분 (바깥 배경 / 바깥 윤곽선)
+    outer = [line for line, at_edge in ((np.s_[0, :], y0 == 0), (np.s_[-1, :], y1 == height),
+                                        (np.s_[:, 0], x0 == 0), (np.s_[:, -1], x1 == width)) if at_edge]
+    fg_outer = np.unique(np.concatenate([fg_labels[line] for line in outer] or [np.zeros(0, np.int32)]))
+    bg_outer = np.unique(np.concatenate([bg_labels[line] for line in outer] or [np.zeros(0, np.int32)]))
+    
+    lap_mean = float(laplacian.mean())
+    return {
+        "pixels": tile.size,
+        "foreground": int(np.count_nonzero(thresh)),
+        "components": fg_count - 1,
+        "lap_mean": lap_mean,
+        "lap_m2": float(((laplacian - lap_mean) ** 2).sum()),
+        "borders": {
+            "fg_count": fg_count,
+            "bg_count": bg_count,
+            "pairs": np.stack([codes // bg_count, codes % bg_count], axis=1),
+            "fg_outer": fg_outer[fg_outer > 0],
+            "bg_outer": bg_outer[bg_outer > 0],
+            "fg": {"top": fg_labels[0].copy(), "bottom": fg_labels[-1].copy(),
+                   "left": fg_labels[:, 0].copy(), "right": fg_labels[:, -1].copy()},
+            "bg": {"top": bg_labels[0].copy(), "bottom": bg_labels[-1].copy(),
+                   "left": bg_labels[:, 0].copy(), "right": bg_labels[:, -1].copy()},
+        },
+    }
+
+
+# ============================================================================
+# 3-1. 비디오/타임랩스 프레임 파이프라인
+# ============================================================================
+
+@dataclass
+class FrameSample:
+    """샘플링된 프레임의 CV 분석"""
+    frame_index: int
+    time_seconds: float
+    analysis: CVAnalysis
+
+
+@dataclass
+class VideoAnalysis:
+    """비디오 시계열 분석 결과"""
+    total_frames: int
+    inspected_frames: int
+    sampled_frames: int
+    fps: float
+    duration_seconds: float
+    samples: List[FrameSample]
+    stages: List[Dict[str, Any]]
+    
+    def series(self) -> Dict[str, List[float]]:
+        """시간 / 밀도 / 응집도 / 형태 점수 시계열"""
+        return {
+            "time": [s.time_seconds for s in self.samples],
+            "density": [s.analysis.density for s in self.samples],
+            "aggregation": [s.analysis.aggregation for s in self.samples],
+            "morphology": [s.analysis.morphology_score for s in self.samples],
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_frames": self.total_frames,
+            "inspected_frames": self.inspected_frames,
+            "frames_analyzed": self.sampled_frames,
+            "fps": self.fps,
+            "duration_seconds": self.duration_seconds,
+            "series": self.series(),
+            "developmental_stages": self.stages,
+        }
+
+
+class VideoFramePipeline:
+    """
+    비디오 스트리밍 분석
+    
+    - 프레임을 순차 디코딩 (전체 로드 없음), 초당 VIDEO_INSPECT_FPS 장만 검사
+    - dHash 해밍 거리로 직전 샘플과 거의 같은 프레임은 건너뜀
+      (최대 간격 = min(VIDEO_MAX_GAP_SECONDS, 길이 / VIDEO_MIN_SAMPLES) 마다 강제 샘플)
+    - 샘플 프레임은 공유 메모리로 CV 프로세스 풀에 전달, 진행 중 프레임 수 제한 -> 메모리 일정
+    - 밀도/응집도/형태 시계열에서 발달 단계 구간 검출
+    """
+    
+    def __init__(
+        self,
+        inspect_fps: float = Config.VIDEO_INSPECT_FPS,
+        hash_threshold: int = Config.VIDEO_HASH_THRESHOLD,
+        max_gap_seconds: float = Config.VIDEO_MAX_GAP_SECONDS,
+        max_in_flight: Optional[int] = None
+    ):
+        self.inspect_fps = inspect_fps
+        self.hash_threshold = hash_threshold
+        self.max_gap_seconds = max_gap_seconds
+        self.max_in_flight = max_in_flight or 2 * Config.CV_MAX_WORKERS
+    
+    @staticmethod
+    def frame_hash(frame: np.ndarray) -> int:
+        """dHash (9x8 축소 후 가로 인접 밝기 비교, 64비트)"""
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = (small[:, 1:] > small[:, :-1]).ravel()
+        return int(np.packbits(bits).view(">u8")[0])
+    
+    def analyze(
+        self,
+        video_path: str,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> VideoAnalysis:
+        """
+        비디오 분석 (동기)
+        
+        Args:
+            on_progress: {'frames_processed', 'total_frames', 'frames_sampled', 'percent'} 콜백
+        """
+        capture = cv2.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise ValueError(f"비디오를 열 수 없음: {video_path}")
+        
+        fps = capture.get(cv2.CAP_PROP_FPS) or 1.0
+        total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        stride = max(1, int(round(fps / self.inspect_fps))) if self.inspect_fps else 1
+        max_gap = self.max_gap_seconds
+        if total:
+            max_gap = min(max_gap, total / fps / Config.VIDEO_MIN_SAMPLES)
+        
+        pool = CVAnalyzer.get_pool()
+        pending: Dict[Any, Tuple[int, float, Optional[shared_memory.SharedMemory]]] = {}
+        samples: List[FrameSample] = []
+        last_hash: Optional[int] = None
+        last_time = -float("inf")
+        index = inspected = 0
+        
+        def collect(futures) -> None:
+            for future in futures:
+                frame_index, time_seconds, block = pending.pop(future)
+                CVAnalyzer._release(block)
+                samples.append(FrameSample(frame_index, time_seconds, future.result()))
+        
+        def report() -> None:
+            if on_progress is not None:
+                on_progress({
+                    "frames_processed": index,
+                    "total_frames": total,
+                    "frames_sampled": len(samples) + len(pending),
+                    "percent": round(min(index / total, 1.0) * 100, 1) if total else None,
+                })
+        
+        try:
+            while True:
+                if index % stride:
+                    if not capture.grab():      # 디코딩 없이 건너뜀
+                        break
+                    index += 1
+                    continue
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                time_seconds = index / fps
+                index += 1
+                inspected += 1
+                
+                frame_hash = self.frame_hash(frame)
+                similar = last_hash is not None and bin(frame_hash ^ last_hash).count("1") <= self.hash_threshold
+                if not similar or time_seconds - last_time >= max_gap:
+                    last_hash, last_time = frame_hash, time_seconds
+                    if len(pending) >= self.max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    task, block = CVAnalyzer._share(frame)
+                    pending[pool.submit(_cv_worker, task)] = (index - 1, time_seconds, block)
+                del frame
+                
+                if inspected % Config.VIDEO_PROGRESS_EVERY == 0:
+                    report()
+            
+            collect(list(pending))
+        finally:
+            capture.release()
+            for future, (_, _, block) in list(pending.items()):
+                future.cancel()
+                if not future.cancelled():
+                    try:
+                        future.result()
+                    except Exception:
+                        pass
+                CVAnalyzer._release(block)
+        
+        total = max(total, index)
+        report()
+        samples.sort(key=lambda s: s.frame_index)
+        return VideoAnalysis(
+            total_frames=total,
+            inspected_frames=inspected,
+            sampled_frames=len(samples),
+            fps=fps,
+            duration_seconds=total / fps,
+            samples=samples,
+            stages=self.detect_stages(samples)
+        )
+    
+    async def analyze_async(
+        self,
+        video_path: str,
+        on_progress: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> VideoAnalysis:
+        """비동기 분석 (디코딩은 스레드, CV 는 프로세스 풀) - 콜백은 이벤트 루프에서 호출 (코루틴 가능)"""
+        loop = asyncio.get_running_loop()
+        is_coroutine = asyncio.iscoroutinefunction(on_progress)
+        
+        def callback(info):
+            if is_coroutine:
+                asyncio.run_coroutine_threadsafe(on_progress(info), loop)
+            else:
+                loop.call_soon_threadsafe(on_progress, info)
+        
+        return await asyncio.to_thread(self.analyze, video_path, callback if on_progress is not None else None)
+    
+    @staticmethod
+    def detect_stages(
+        samples: List[FrameSample],
+        window: Optional[int] = None,
+        threshold: float = 0.15,
+        min_relative_change: float = 0.05,
+        min_samples: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        발달 단계 구간 검출
+        
+        각 지표를 이동 평균으로 평활하고 범위(최소 평균의 min_relative_change)로 정규화한 뒤
+        window 샘플 구간의 변화량으로 분류:
+        밀도 증가 = proliferation, 밀도 감소 = regression,
+        (밀도 안정 시) 응집도 변화 = aggregation, 형태 점수 증가 = differentiation, 그 외 stable.
+        min_samples 미만의 짧은 구간은 앞 구간에 병합
+        """
+        n = len(samples)
+        if n == 0:
+            return []
+        window = window or max(3, n // 8)
+        
+        def normalized(values: List[float]) -> np.ndarray:
+            arr = np.asarray(values, dtype=float)
+            k = min(window, n)
+            padded = np.pad(arr, (k // 2, k - 1 - k // 2), mode="edge")
+            smooth = np.convolve(padded, np.ones(k) / k, mode="valid")
+            span = max(smooth.max() - smooth.min(), min_relative_change * abs(arr.mean()), 1e-9)
+            return (smooth - smooth.min()) / span
+        
+        density = normalized([s.analysis.density for s in samples])
+        aggregation = normalized([s.analysis.aggregation for s in samples])
+        morphology = normalized([s.analysis.morphology_score for s in samples])
+        
+        labels = []
+        for i in range(n):
+            lo, hi = max(0, i - window // 2), min(n - 1, i + window // 2)
+            scale = window / max(hi - lo, 1)   # 가장자리(짧은 구간) 보정
+            d_density = (density[hi] - density[lo]) * scale
+            if hi == lo:
+                labels.append("stable")
+            elif d_density > threshold:
+                labels.append("proliferation")
+            elif d_density < -threshold:
+                labels.append("regression")
+            elif abs(aggregation[hi] - aggregation[lo]) * scale > threshold:
+                labels.append("aggregation")
+            elif (morphology[hi] - morphology[lo]) * scale > threshold:
+                labels.append("differentiation")
+            else:
+                labels.append("stable")
+        
+        # 구간화 (짧은 구간은 앞 구간에 병합)
+        segments: List[List[Any]] = []   # [라벨, 시작 인덱스, 끝 인덱스]
+        for i, label in enumerate(labels):
+            if segments and segments[-1][0] == label:
+                segments[-1][2] = i
+            else:
+                segments.append([label, i, i])
+        merged: List[List[Any]] = []
+        for segment in segments:
+            if merged and (segment[2] - segment[1] + 1 < min_samples or merged[-1][0] == segment[0]):
+                merged[-1][2] = segment[2]
+            else:
+                merged.append(segment)
+        if len(merged) > 1 and merged[0][2] - merged[0][1] + 1 < min_samples:
+            merged[1][1] = merged[0][1]
+            merged.pop(0)
+        
+        stages = []
+        for label, start, end in merged:
+            members = [s.analysis for s in samples[start:end + 1]]
+            stages.append({
+                "stage": label,
+                "start_seconds": samples[start].time_seconds,
+                "end_seconds": samples[end].time_seconds,
+                "samples": end - start + 1,
+                "mean_density": float(np.mean([m.density for m in members])),
+                "mean_aggregation": float(np.mean([m.aggregation for m in members])),
+                "mean_morphology": float(np.mean([m.morphology_score for m in members])),
+            })
+        return stages
+
 # ============================================================================
 # 4. Gemini API 분석기 (google.genai 기반)
 # ============================================================================
@@ -144,6 +916,7 @@ class GeminiVisionAPI:
         """초기화"""
         self.api_key = api_key
         self.model = None
+        self._uploads: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()  # 내용 해시 -> (업로드 핸들, 시각)
         self._initialize()
     
     def _initialize(self):
@@ -161,8 +934,34 @@ class GeminiVisionAPI:
             print(f"⚠️ Gemini 초기화 오류: {e}")
             self.model = None
     
-    async def analyze_image(self, image_path: str) -> Dict[str, Any]:
-        """이미지 분석 (비동기)"""
+    @staticmethod
+    def _upload_key(image_path: str, digest: Optional[str]) -> str:
+        """업로드 핸들 키: 내용 해시, 없으면 경로 + 수정 시각 + 크기 (같은 이름으로 재촬영해도 구분)"""
+        if digest:
+            return digest
+        stat = os.stat(image_path)
+        return f"{os.path.abspath(image_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    
+    async def _upload(self, image_path: str, digest: Optional[str]) -> Any:
+        """업로드 핸들 재사용 (같은 내용은 보존 기간 내 재업로드 생략)"""
+        key = self._upload_key(image_path, digest)
+        cached = self._uploads.get(key)
+        if cached is not None and time.monotonic() - cached[1] < Config.UPLOAD_TTL_SECONDS:
+            self._uploads.move_to_end(key)
+            return cached[0]
+        handle = await asyncio.to_thread(self.genai.upload_file, image_path)
+        self._uploads[key] = (handle, time.monotonic())
+        while len(self._uploads) > 256:
+            self._uploads.popitem(last=False)
+        return handle
+    
+    async def analyze_image(self, image_path: str, digest: Optional[str] = None) -> Dict[str, Any]:
+        """
+        이미지 분석 (비동기)
+        
+        Args:
+            digest: 이미지 내용 해시 (지정 시 업로드 핸들을 내용 기준으로 재사용)
+        """
         
         # 폴백 처리
         if self.model is None:
@@ -192,11 +991,14 @@ JSON 형식으로 답변:
     "recommendations": [...]
 }"""
             
-            # API 호출 (재시도 로직)
+            # API 호출 (재시도 로직) - 업로드는 성공할 때까지 한 번만, 재시도 간 핸들 재사용
             for attempt in range(Config.MAX_RETRIES):
                 try:
-                    response = self.model.generate_content(
-                        [prompt, genai.upload_file(image_path)]
+                    uploaded = await self._upload(image_path, digest)
+                    # 블로킹 호출은 스레드에서 (이벤트 루프/배치의 다른 분석 진행)
+                    response = await asyncio.to_thread(
+                        self.model.generate_content,
+                        [prompt, uploaded]
                     )
                     
                     # 응답 파싱
@@ -230,7 +1032,8 @@ JSON 형식으로 답변:
             "health_score": 70,
             "morphology": "이미지를 분석할 수 없음 - 폴백 사용",
             "anomalies": [],
-            "recommendations": ["고해상도 이미지 사용", "조명 개선", "재촬영 권장"]
+            "recommendations": ["고해상도 이미지 사용", "조명 개선", "재촬영 권장"],
+            "fallback": True
         }
 
 
@@ -245,14 +1048,87 @@ class HybridAnalyzer:
         """초기화"""
         self.gemini_api = gemini_api
     
-    async def analyze(self, image_path: str) -> CellAnalysisResult:
-        """종합 분석"""
+    async def analyze(
+        self,
+        image_path: str,
+        cv_result: Optional[CVAnalysis] = None,
+        digest: Optional[str] = None
+    ) -> CellAnalysisResult:
+        """
+        종합 분석 (CV 는 프로세스 풀에서 Vision API 호출과 동시에 실행)
+        
+        Args:
+            cv_result: 캐시된 CV 분석 (지정 시 CV 생략)
+            digest: 이미지 내용 해시 (업로드 핸들 재사용 키)
+        """
+        if cv_result is not None:
+            return self.combine(cv_result, await self.gemini_api.analyze_image(image_path, digest=digest))
+        
+        cv_task = asyncio.ensure_future(CVAnalyzer.analyze_async(image_path))
+        try:
+            ai_result = await self.gemini_api.analyze_image(image_path, digest=digest)
+        except BaseException:
+            cv_task.cancel()
+            raise
+        cv_result = await cv_task
+        return self.combine(cv_result, ai_result)
+    
+    async def analyze_batch(
+        self,
+        image_paths: List[str],
+        max_concurrency: int = Config.BATCH_CONCURRENCY,
+        digests: Optional[Dict[str, str]] = None,
+        cv_results: Optional[Dict[str, CVAnalysis]] = None
+    ) -> AsyncIterator[Tuple[str, CellAnalysisResult]]:
+        """
+        배치 종합 분석 - 끝나는 순서대로 (경로, 결과) 반환
+        
+        CV 는 전체 배치를 프로세스 풀에 한 번에 제출하고, Vision API 호출은 max_concurrency 로 제한
+        
+        Args:
+            digests: 경로 -> 이미지 내용 해시 (업로드 핸들 재사용 키)
+            cv_results: 경로 -> 캐시된 CV 분석 (해당 이미지는 CV 생략)
+        """
+        loop = asyncio.get_running_loop()
+        paths = list(dict.fromkeys(image_paths))
+        digests = digests or {}
+        cv_futures = {path: loop.create_future() for path in paths}
+        for path, cv_result in (cv_results or {}).items():
+            if path in cv_futures:
+                cv_futures[path].set_result(cv_result)
+        cv_paths = [path for path in paths if not cv_futures[path].done()]
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # CV 분석
-        cv_result = CVAnalyzer.analyze(image_path)
+        async def feed_cv():
+            if not cv_paths:
+                return
+            try:
+                async for index, cv_result in CVAnalyzer.analyze_batch_async(cv_paths):
+                    cv_futures[cv_paths[index]].set_result(cv_result)
+            except Exception as e:
+                for future in cv_futures.values():
+                    if not future.done():
+                        future.set_exception(e)
         
-        # Gemini 분석 (비동기)
-        ai_result = await self.gemini_api.analyze_image(image_path)
+        async def run(path: str) -> Tuple[str, CellAnalysisResult]:
+            async with semaphore:
+                ai_result = await self.gemini_api.analyze_image(path, digest=digests.get(path))
+            return path, self.combine(await cv_futures[path], ai_result)
+        
+        feeder = asyncio.ensure_future(feed_cv())
+        tasks = [asyncio.ensure_future(run(path)) for path in paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+            await feeder
+        finally:
+            feeder.cancel()
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def combine(cv_result: CVAnalysis, ai_result: Dict[str, Any]) -> CellAnalysisResult:
+        """CV 정량 분석 + AI 분석 결과 결합"""
         
         # 신뢰도 가중치: CV 40% + AI 60%
         cv_conf = cv_result.cv_confidence / 100.0
@@ -286,7 +1162,8 @@ class HybridAnalyzer:
             anomalies=ai_result.get("anomalies", []),
             recommendations=ai_result.get("recommendations", []),
             overall_confidence=overall_conf,
-            cv_analysis=cv_result
+            cv_analysis=cv_result,
+            ai_fallback=bool(ai_result.get("fallback", False))
         )
 
 
@@ -295,17 +1172,114 @@ class HybridAnalyzer:
 # ============================================================================
 
 class BioCartridgeV21:
-    """Bio-Cartridge v2.1 (google.genai 마이그레이션)"""
+    """
+    Bio-Cartridge v2.1 (google.genai 마이그레이션)
     
-    def __init__(self):
-        """초기화"""
+    분석 결과/CV 특징은 이미지 내용 해시 + 분석기 버전 키로 디스크에 캐시
+    (같은 이미지 재업로드 시 OpenCV/Gemini 재실행 없음, 파일명이 달라도 동일)
+    """
+    
+    def __init__(self, cache: Optional["ContentAddressedCache"] = None, use_cache: bool = True):
+        """
+        초기화
+        
+        Args:
+            cache: 결과 캐시 (None 이면 공용 영속 캐시)
+            use_cache: False 면 캐시 미사용
+        """
         self.gemini_api = GeminiVisionAPI(Config.GEMINI_API_KEY)
         self.hybrid_analyzer = HybridAnalyzer(self.gemini_api)
+        self.cache = None
+        if use_cache:
+            self.cache = cache if cache is not None else (get_content_cache() if CONTENT_CACHE_AVAILABLE else None)
         print("🧬 Bio-Cartridge v2.1 준비 완료")
     
+    @property
+    def cache_version(self) -> str:
+        return f"{Config.ANALYZER_VERSION}/{Config.MODEL_ID}"
+    
+    def _cache_keys(self, image_path: str) -> Optional[Tuple[str, str, str]]:
+        """(내용 해시, 결과 키, CV 키) - 캐시 미사용/파일 없음이면 None"""
+        if self.cache is None or not os.path.exists(image_path):
+            return None
+        digest = self.cache.content_hash(image_path)
+        return (
+            digest,
+            self.cache.make_key("bio_result", self.cache_version, digest),
+            self.cache.make_key("bio_cv", Config.ANALYZER_VERSION, digest),
+        )
+    
+    def _lookup(self, image_path: str) -> Tuple[Optional[Tuple[str, str, str]], Optional[Dict], Optional[Dict]]:
+        """(캐시 키, 캐시된 결과, 캐시된 CV 특징) - 파일 해시 + sqlite 조회 (블로킹, 스레드에서 호출)"""
+        keys = self._cache_keys(image_path)
+        if keys is None:
+            return None, None, None
+        cached = self.cache.get(keys[1])
+        return keys, cached, self.cache.get(keys[2]) if cached is None else None
+    
+    def _store(self, keys: Optional[Tuple[str, str, str]], result: CellAnalysisResult) -> None:
+        if keys is None:
+            return
+        _, result_key, cv_key = keys
+        self.cache.set(cv_key, asdict(result.cv_analysis))
+        if not result.ai_fallback:
+            self.cache.set(result_key, asdict(result))
+    
+    @staticmethod
+    def result_from_dict(data: Dict[str, Any]) -> CellAnalysisResult:
+        """asdict(CellAnalysisResult) -> CellAnalysisResult"""
+        return CellAnalysisResult(**{**data, "cv_analysis": CVAnalysis(**data["cv_analysis"])})
+    
     async def analyze(self, image_path: str) -> CellAnalysisResult:
-        """이미지 분석"""
-        return await self.hybrid_analyzer.analyze(image_path)
+        """이미지 분석 (캐시 적중 시 즉시 반환, CV 특징만 있으면 Vision 만 호출)"""
+        keys, cached, cached_cv = await asyncio.to_thread(self._lookup, image_path)
+        if keys is None:
+            return await self.hybrid_analyzer.analyze(image_path)
+        if cached is not None:
+            return self.result_from_dict(cached)
+        
+        result = await self.hybrid_analyzer.analyze(
+            image_path,
+            cv_result=CVAnalysis(**cached_cv) if cached_cv is not None else None,
+            digest=keys[0]
+        )
+        await asyncio.to_thread(self._store, keys, result)
+        return result
+    
+    async def analyze_video(
+        self,
+        video_path: str,
+        on_progress: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> VideoAnalysis:
+        """타임랩스/비디오 분석 (적응형 프레임 샘플링 + CV 시계열 + 발달 단계)"""
+        return await VideoFramePipeline().analyze_async(video_path, on_progress)
+    
+    async def analyze_batch(
+        self,
+        image_paths: List[str],
+        max_concurrency: int = Config.BATCH_CONCURRENCY
+    ) -> AsyncIterator[Tuple[str, CellAnalysisResult]]:
+        """배치 이미지 분석 (예: 96-well 플레이트) - 캐시 적중분 먼저, 나머지는 끝나는 순서대로 (경로, 결과) 반환"""
+        pending: Dict[str, Optional[Tuple[str, str, str]]] = {}
+        digests: Dict[str, str] = {}
+        cv_results: Dict[str, CVAnalysis] = {}
+        for path in dict.fromkeys(image_paths):
+            keys, cached, cached_cv = await asyncio.to_thread(self._lookup, path)
+            if cached is not None:
+                yield path, self.result_from_dict(cached)
+                continue
+            pending[path] = keys
+            if keys is not None:
+                digests[path] = keys[0]
+                if cached_cv is not None:
+                    cv_results[path] = CVAnalysis(**cached_cv)
+        
+        if pending:
+            async for path, result in self.hybrid_analyzer.analyze_batch(
+                list(pending), max_concurrency, digests=digests, cv_results=cv_results
+            ):
+                await asyncio.to_thread(self._store, pending[path], result)
+                yield path, result
     
     def to_dict(self, result: CellAnalysisResult) -> Dict[str, Any]:
         """결과를 딕셔너리로 변환"""
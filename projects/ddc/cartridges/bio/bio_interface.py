@@ -17,7 +17,7 @@ except ImportError:
     print("⚠️ Warning: neocortex 모듈을 찾을 수 없습니다.")
 
 # Bio Cartridge v2.1 임포트
-from .bio_cartridge_v2_1 import BioCartridge, CellType, HealthStatus
+from .bio_cartridge_v2_1 import BioCartridgeV21 as BioCartridge, CellType, HealthStatus
 
 
 class BioCartridgeInterface:
@@ -14,11 +14,31 @@ import json
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import asyncio
 from abc import ABC, abstractmethod
 import os
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 로컬 컬럼형 시세 저장소 (선택)
+try:
+    from projects.ddc.utilities.market_data_store import MarketDataStore, OHLCVFrame
+    MARKET_STORE_AVAILABLE = True
+except ImportError:
+    MARKET_STORE_AVAILABLE = False
+
+# 스트리밍 지표 (실시간 워치리스트용, 선택)
+try:
+    from projects.ddc.utilities.streaming_indicators import IndicatorWatchlist, SymbolIndicators
+    STREAMING_INDICATORS_AVAILABLE = True
+except ImportError:
+    STREAMING_INDICATORS_AVAILABLE = False
+
 
 # ============================================================================
 # 1. 설정 & 상수
@@ -31,6 +51,8 @@ class Config:
     KRX_API_URL = "https://open.nasdaq.com/api/v1/quote"
     REQUEST_TIMEOUT = 10
     CACHE_DURATION = 300  # 5분
+    FAILURE_CACHE_DURATION = 10  # 조회 실패 스냅샷 (info 없음) 재시도 간격
+    MAX_CONCURRENT_SYMBOLS = 8  # analyze_many 동시 분석 종목 수
 
 
 # ============================================================================
@@ -219,16 +241,154 @@ class DataSourceAPI(ABC):
 
 
 class YahooFinanceAPI(DataSourceAPI):
-    """Yahoo Finance API"""
+    """
+    Yahoo Finance API
+    
+    종목별 스냅샷 (info + 일봉 이력) 을 yf.Ticker 1회 조회로 가져와
+    실시간 시세 / 펀더멘털 / 기술적 분석이 공유함
+    - 동시에 들어온 같은 종목 요청은 하나의 조회로 합침
+    - 스냅샷은 Config.CACHE_DURATION 동안 재사용
+    - yfinance 는 동기 라이브러리이므로 executor 스레드에서 실행
+    """
+    
+    def __init__(
+        self,
+        history_store: Optional["MarketDataStore"] = None,
+        cache_duration: float = Config.CACHE_DURATION,
+        failure_cache_duration: float = Config.FAILURE_CACHE_DURATION
+    ):
+        """
+        초기화
+        
+        Args:
+            history_store: 일봉 이력 로컬 저장소 (지정 시 증분 동기화, 같은 종목 재분석 시 1년치 재조회 없음)
+            cache_duration: 종목 스냅샷 TTL (초)
+            failure_cache_duration: 조회 실패 스냅샷 TTL (초, 짧게 두어 일시 장애 후 곧바로 재조회)
+        """
+        self.history_store = history_store
+        self.cache_duration = cache_duration
+        self.failure_cache_duration = failure_cache_duration
+        self._snapshots: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.fetch_count = 0
+    
+    # ------------------------------------------------------------------
+    # 종목 스냅샷 (조회 합치기 + TTL 캐시)
+    # ------------------------------------------------------------------
+    
+    async def get_snapshot(self, symbol: str, days: int = 365) -> Dict[str, Any]:
+        """
+        종목 스냅샷 {'info': dict|None, 'history': OHLCVFrame|None, 'days': int}
+        캐시 유효 시 즉시 반환, 같은 종목 조회가 진행 중이면 그 결과를 기다림
+        """
+        loop = asyncio.get_running_loop()
+        cached = self._snapshots.get(symbol)
+        if cached is not None and cached[0] > loop.time() and cached[1]["days"] >= days:
+            return cached[1]
+        
+        pending = self._inflight.get(symbol)
+        if pending is not None and pending.get_loop() is loop:
+            snapshot = await asyncio.shield(pending)
+            if snapshot["days"] >= days:
+                return snapshot
+        
+        future = loop.create_future()
+        self._inflight[symbol] = future
+        try:
+            self.fetch_count += 1
+            snapshot = await loop.run_in_executor(None, self._fetch_snapshot, symbol, days)
+            ttl = self.cache_duration if snapshot["info"] is not None else self.failure_cache_duration
+            self._snapshots[symbol] = (loop.time() + ttl, snapshot)
+            future.set_result(snapshot)
+            return snapshot
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 경고 방지
+            raise
+        finally:
+            if self._inflight.get(symbol) is future:
+                del self._inflight[symbol]
+    
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """스냅샷 캐시 무효화 (symbol=None 이면 전체)"""
+        if symbol is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(symbol, None)
     
-    async def get_realtime_data(self, symbol: str) -> RealTimeData:
-        """실시간 데이터 조회"""
+    def _fetch_snapshot(self, symbol: str, days: int) -> Dict[str, Any]:
+        """[blocking] yf.Ticker 하나로 info + 일봉 이력 조회"""
+        ticker = None
+        info = None
         try:
             import yfinance as yf
             
             ticker = yf.Ticker(symbol)
             info = ticker.info
-            hist = ticker.history(period="1d")
+        except Exception as e:
+            print(f"❌ Yahoo Finance 오류: {e}")
+        
+        return {"info": info, "history": self._load_history(symbol, days, ticker), "days": days}
+    
+    def _load_history(self, symbol: str, days: int, ticker=None) -> Optional["OHLCVFrame"]:
+        """
+        [blocking] 일봉 이력 (최근 days일)
+        history_store 지정 시: 신규 봉만 원격 조회 후 로컬 저장소에서 읽음
+        (원격 조회 실패 시에도 저장된 이력으로 분석 - 오프라인 픽스처 지원)
+        """
+        if not MARKET_STORE_AVAILABLE:
+            return None
+        
+        def fetcher(sym: str, start: date) -> Dict[str, List[Any]]:
+            if ticker is None:
+                raise RuntimeError("yfinance 사용 불가")
+            return YahooFinanceAPI._history_columns(ticker, start)
+        
+        if self.history_store is None:
+            try:
+                start = date.today() - timedelta(days=days)
+                return OHLCVFrame.from_columns(symbol, fetcher(symbol, start))
+            except Exception as e:
+                print(f"❌ Yahoo Finance 이력 오류: {e}")
+                return None
+        
+        try:
+            self.history_store.sync(symbol, fetcher, lookback_days=days)
+        except Exception as e:
+            print(f"⚠️ Yahoo Finance 이력 동기화 실패, 저장된 이력 사용: {e}")
+        
+        last = self.history_store.last_date(symbol)
+        if last is None:
+            return None
+        return self.history_store.read(symbol, start=last - np.timedelta64(days, "D"))
+    
+    async def get_history(self, symbol: str, days: int = 365) -> Optional["OHLCVFrame"]:
+        """일봉 이력 조회 (최근 days일, 스냅샷 공유)"""
+        return (await self.get_snapshot(symbol, days))["history"]
+    
+    @staticmethod
+    def _history_columns(ticker, start: date) -> Dict[str, List[Any]]:
+        """yf.Ticker 일봉 -> 컬럼 dict (당일 미완성 봉은 제외)"""
+        hist = ticker.history(start=start.isoformat())
+        today = date.today()
+        dates = [ts.date() for ts in hist.index]
+        n = sum(1 for d in dates if d < today)  # 인덱스는 날짜 오름차순
+        
+        return {
+            "date": dates[:n],
+            "open": hist["Open"].tolist()[:n],
+            "high": hist["High"].tolist()[:n],
+            "low": hist["Low"].tolist()[:n],
+            "close": hist["Close"].tolist()[:n],
+            "volume": hist["Volume"].tolist()[:n],
+        }
+    
+    async def get_realtime_data(self, symbol: str) -> RealTimeData:
+        """실시간 데이터 조회"""
+        try:
+            info = (await self.get_snapshot(symbol))["info"]
+            if info is None:
+                return self._get_fallback_data(symbol)
             
             return RealTimeData(
                 symbol=symbol,
@@ -249,10 +409,9 @@ class YahooFinanceAPI(DataSourceAPI):
     async def get_fundamentals(self, symbol: str) -> FundamentalMetrics:
         """펀더멘털 지표"""
         try:
-            import yfinance as yf
-            
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = (await self.get_snapshot(symbol))["info"]
+            if info is None:
+                return self._get_fallback_fundamentals()
             
             return FundamentalMetrics(
                 pe_ratio=info.get("trailingPE", 0),
@@ -363,86 +522,153 @@ class FinnhubAPI(DataSourceAPI):
 class TechnicalAnalyzer:
     """기술적 분석"""
     
-    @staticmethod
-    async def analyze(symbol: str) -> TechnicalSignals:
+    def __init__(
+        self,
+        data_source: Optional[YahooFinanceAPI] = None,
+        watchlist: Optional["IndicatorWatchlist"] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            data_source: 일봉 이력 제공자 (get_history) - 저장소가 연결된 YahooFinanceAPI 공유 가능
+            watchlist: 스트리밍 지표 상태 (실시간 추적 종목, 체크포인트에서 복원 가능)
+                       미지정 시 analyze_closes 와 같은 단순 평균 RSI (rsi_method="simple") 로 생성
+        """
+        self.data_source = data_source or YahooFinanceAPI()
+        self._watchlist = watchlist
+    
+    @property
+    def watchlist(self) -> "IndicatorWatchlist":
+        """스트리밍 지표 상태 (첫 사용 시 생성)"""
+        if self._watchlist is None:
+            if not STREAMING_INDICATORS_AVAILABLE:
+                raise ImportError("실시간 추적(watch/update_bar)에는 projects.ddc.utilities.streaming_indicators 가 필요합니다")
+            self._watchlist = IndicatorWatchlist(rsi_method="simple")
+        return self._watchlist
+    
+    @watchlist.setter
+    def watchlist(self, watchlist: Optional["IndicatorWatchlist"]) -> None:
+        self._watchlist = watchlist
+    
+    async def analyze(self, symbol: str) -> TechnicalSignals:
         """기술적 분석"""
         try:
-            import yfinance as yf
-            
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="1y")
-            
-            if len(hist) < 200:
+            history = await self.data_source.get_history(symbol, 365)
+            if history is None:
                 return TechnicalAnalyzer._get_fallback_signals()
-            
-            # 이동평균 계산
-            ma20 = hist["Close"].rolling(20).mean().iloc[-1]
-            ma50 = hist["Close"].rolling(50).mean().iloc[-1]
-            ma200 = hist["Close"].rolling(200).mean().iloc[-1]
-            
-            # RSI 계산
-            rsi = TechnicalAnalyzer._calculate_rsi(hist["Close"], 14)
-            
-            # MACD 계산
-            macd, macd_signal = TechnicalAnalyzer._calculate_macd(hist["Close"])
-            
-            # 볼린저 밴드
-            bb_upper, bb_middle, bb_lower = TechnicalAnalyzer._calculate_bollinger(hist["Close"], 20, 2)
-            
-            # 추세 판단
-            trend = TechnicalAnalyzer._determine_trend(hist["Close"], ma20, ma50, ma200)
-            
-            # 신호 수계산
-            current_price = hist["Close"].iloc[-1]
-            buy_signals = 0
-            sell_signals = 0
-            
-            if current_price > ma20 > ma50 > ma200:
-                buy_signals += 1
-            if rsi < 30:
-                buy_signals += 1
-            if macd > macd_signal and macd > 0:
-                buy_signals += 1
-            if current_price < bb_lower:
-                buy_signals += 1
-            
-            if current_price < ma20 < ma50 < ma200:
-                sell_signals += 1
-            if rsi > 70:
-                sell_signals += 1
-            if macd < macd_signal and macd < 0:
-                sell_signals += 1
-            if current_price > bb_upper:
-                sell_signals += 1
-            
-            signal_strength = (buy_signals - sell_signals) * 12.5 + 50  # 0-100
-            signal_strength = max(0, min(100, signal_strength))
-            
-            return TechnicalSignals(
-                trend=trend,
-                support_level=hist["Close"].min() * 0.98,
-                resistance_level=hist["Close"].max() * 1.02,
-                ma20=ma20,
-                ma50=ma50,
-                ma200=ma200,
-                rsi=rsi,
-                macd=macd,
-                macd_signal=macd_signal,
-                bollinger_upper=bb_upper,
-                bollinger_middle=bb_middle,
-                bollinger_lower=bb_lower,
-                buy_signal_count=buy_signals,
-                sell_signal_count=sell_signals,
-                signal_strength=signal_strength
-            )
+            return TechnicalAnalyzer.analyze_closes(history.close)
         except Exception as e:
             print(f"❌ 기술적 분석 오류: {e}")
             return TechnicalAnalyzer._get_fallback_signals()
     
+    async def watch(self, symbol: str) -> TechnicalSignals:
+        """
+        실시간 추적 시작: 1년 이력으로 지표 상태를 한 번만 초기화
+        이후 봉은 update_bar() 로 O(1) 갱신
+        """
+        if symbol in self.watchlist:
+            return TechnicalAnalyzer.from_indicators(self.watchlist.get(symbol))
+        history = await self.data_source.get_history(symbol, 365)
+        closes = history.close if history is not None else []
+        return TechnicalAnalyzer.from_indicators(self.watchlist.warm_up(symbol, closes))
+    
+    def update_bar(self, symbol: str, close: float) -> TechnicalSignals:
+        """새 종가 반영 후 신호 (전체 재계산 없음)"""
+        return TechnicalAnalyzer.from_indicators(self.watchlist.update(symbol, close))
+    
+    @staticmethod
+    def analyze_closes(closes) -> TechnicalSignals:
+        """종가 배열 (오름차순, 최근 1년) -> 기술적 신호"""
+        closes = np.asarray(closes, dtype=np.float64)
+        
+        if len(closes) < 200:
+            return TechnicalAnalyzer._get_fallback_signals()
+        
+        # 이동평균 계산 (마지막 시점 값만 필요)
+        ma20 = float(closes[-20:].mean())
+        ma50 = float(closes[-50:].mean())
+        ma200 = float(closes[-200:].mean())
+        
+        # RSI 계산
+        rsi = float(TechnicalAnalyzer._calculate_rsi(closes, 14))
+        
+        # MACD 계산
+        macd, macd_signal = TechnicalAnalyzer._calculate_macd(closes)
+        
+        # 볼린저 밴드
+        bb_upper, bb_middle, bb_lower = TechnicalAnalyzer._calculate_bollinger(closes, 20, 2)
+        
+        return TechnicalAnalyzer._build_signals(
+            float(closes[-1]), ma20, ma50, ma200, rsi, macd, macd_signal,
+            bb_upper, bb_middle, bb_lower, float(closes.min()), float(closes.max())
+        )
+    
+    @staticmethod
+    def from_indicators(indicators: "SymbolIndicators") -> TechnicalSignals:
+        """스트리밍 지표 상태 -> 기술적 신호 (재계산 없음)"""
+        if not indicators.ready:
+            return TechnicalAnalyzer._get_fallback_signals()
+        v = indicators.values(2)
+        return TechnicalAnalyzer._build_signals(
+            v["close"], v["ma20"], v["ma50"], v["ma200"], v["rsi"], v["macd"], v["macd_signal"],
+            v["bollinger_upper"], v["bollinger_middle"], v["bollinger_lower"],
+            v["period_low"], v["period_high"]
+        )
+    
+    @staticmethod
+    def _build_signals(current_price, ma20, ma50, ma200, rsi, macd, macd_signal,
+                       bb_upper, bb_middle, bb_lower, period_low, period_high) -> TechnicalSignals:
+        """지표 값 -> 추세/매수·매도 신호 집계"""
+        # 추세 판단
+        trend = TechnicalAnalyzer._determine_trend([current_price], ma20, ma50, ma200)
+        
+        # 신호 수계산
+        buy_signals = 0
+        sell_signals = 0
+        
+        if current_price > ma20 > ma50 > ma200:
+            buy_signals += 1
+        if rsi < 30:
+            buy_signals += 1
+        if macd > macd_signal and macd > 0:
+            buy_signals += 1
+        if current_price < bb_lower:
+            buy_signals += 1
+        
+        if current_price < ma20 < ma50 < ma200:
+            sell_signals += 1
+        if rsi > 70:
+            sell_signals += 1
+        if macd < macd_signal and macd < 0:
+            sell_signals += 1
+        if current_price > bb_upper:
+            sell_signals += 1
+        
+        signal_strength = (buy_signals - sell_signals) * 12.5 + 50  # 0-100
+        signal_strength = max(0, min(100, signal_strength))
+        
+        return TechnicalSignals(
+            trend=trend,
+            support_level=period_low * 0.98,
+            resistance_level=period_high * 1.02,
+            ma20=ma20,
+            ma50=ma50,
+            ma200=ma200,
+            rsi=rsi,
+            macd=macd,
+            macd_signal=macd_signal,
+            bollinger_upper=bb_upper,
+            bollinger_middle=bb_middle,
+            bollinger_lower=bb_lower,
+            buy_signal_count=buy_signals,
+            sell_signal_count=sell_signals,
+            signal_strength=signal_strength
+        )
+    
     @staticmethod
     def _calculate_rsi(prices, period=14) -> float:
         """RSI 계산"""
-        import numpy as np
         deltas = np.diff(prices)
         gains = np.where(deltas > 0, deltas, 0)
         losses = np.where(deltas < 0, -deltas, 0)
@@ -454,28 +680,42 @@ class TechnicalAnalyzer:
         rsi = 100 - (100 / (1 + rs))
         return rsi
     
+    @staticmethod
+    def _ewm_mean(values, span: int):
+        """지수이동평균 (pandas ewm(span).mean() 기본값 adjust=True 와 동일)"""
+        decay = 1 - 2 / (span + 1)
+        out = np.empty(len(values))
+        numerator = 0.0
+        denominator = 0.0
+        for i, value in enumerate(values):
+            numerator = value + decay * numerator
+            denominator = 1.0 + decay * denominator
+            out[i] = numerator / denominator
+        return out
+    
     @staticmethod
     def _calculate_macd(prices):
         """MACD 계산"""
-        ema12 = prices.ewm(span=12).mean()
-        ema26 = prices.ewm(span=26).mean()
+        ema12 = TechnicalAnalyzer._ewm_mean(prices, 12)
+        ema26 = TechnicalAnalyzer._ewm_mean(prices, 26)
         macd = ema12 - ema26
-        macd_signal = macd.ewm(span=9).mean()
-        return macd.iloc[-1], macd_signal.iloc[-1]
+        macd_signal = TechnicalAnalyzer._ewm_mean(macd, 9)
+        return float(macd[-1]), float(macd_signal[-1])
     
     @staticmethod
     def _calculate_bollinger(prices, period=20, std_dev=2):
         """볼린저 밴드"""
-        sma = prices.rolling(period).mean()
-        std = prices.rolling(period).std()
+        window = np.asarray(prices[-period:], dtype=np.float64)
+        sma = float(window.mean())
+        std = float(window.std(ddof=1))
         upper = sma + (std_dev * std)
         lower = sma - (std_dev * std)
-        return upper.iloc[-1], sma.iloc[-1], lower.iloc[-1]
+        return upper, sma, lower
     
     @staticmethod
     def _determine_trend(prices, ma20, ma50, ma200) -> TrendType:
         """추세 판단"""
-        current = prices.iloc[-1]
+        current = prices[-1]
         if current > ma20 > ma50 > ma200:
             return TrendType.STRONG_UPTREND
         elif current > ma20 and ma20 > ma50:
@@ -509,11 +749,16 @@ class TechnicalAnalyzer:
 class InvestmentCartridgeV2:
     """Investment-Cartridge v2.0"""
     
-    def __init__(self):
-        """초기화"""
-        self.yahoo_api = YahooFinanceAPI()
+    def __init__(self, history_store: Optional["MarketDataStore"] = None):
+        """
+        초기화
+        
+        Args:
+            history_store: 일봉 이력 로컬 저장소 (utilities.market_data_store.MarketDataStore)
+        """
+        self.yahoo_api = YahooFinanceAPI(history_store)
         self.finnhub_api = FinnhubAPI()
-        self.tech_analyzer = TechnicalAnalyzer()
+        self.tech_analyzer = TechnicalAnalyzer(self.yahoo_api)
         
         print("✅ Investment-Cartridge v2.0 초기화 완료")
     
@@ -586,6 +831,55 @@ class InvestmentCartridgeV2:
         print("✅ 분석 완료")
         return result
     
+    async def analyze_many(
+        self,
+        symbols: List[str],
+        max_concurrency: int = Config.MAX_CONCURRENT_SYMBOLS
+    ) -> Dict[str, InvestmentAnalysisV2]:
+        """
+        여러 종목 동시 분석
+        
+        - 동시 분석 종목 수는 max_concurrency 로 제한 (원격 API 부하 제한)
+        - 종목별 조회는 YahooFinanceAPI 스냅샷으로 합쳐져 한 번만 다운로드
+        - 실패한 종목은 결과에서 제외
+        
+        Returns:
+            {symbol: 분석 결과} (입력 순서, 중복 제거)
+        """
+        unique = list(dict.fromkeys(symbols))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(symbol: str) -> InvestmentAnalysisV2:
+            async with semaphore:
+                return await self.analyze(symbol)
+        
+        outcomes = await asyncio.gather(*(run(s) for s in unique), return_exceptions=True)
+        
+        results = {}
+        for symbol, outcome in zip(unique, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ {symbol} 분석 실패: {outcome}")
+                continue
+            results[symbol] = outcome
+        return results
+    
+    @staticmethod
+    def to_analysis_data(result: InvestmentAnalysisV2) -> Dict[str, Any]:
+        """분석 결과 -> InvCartridgeInterface 입력 형식 (analysis_data)"""
+        technical = asdict(result.technical_signals)
+        technical["trend"] = result.technical_signals.trend.value
+        analyst = asdict(result.analyst_consensus)
+        analyst["consensus_recommendation"] = result.analyst_consensus.consensus_recommendation.value
+        
+        return {
+            "technical_analysis": technical,
+            "fundamental_analysis": asdict(result.fundamentals),
+            "analyst_opinions": [analyst] if result.analyst_consensus.analysts_count else [],
+            "risk_level": "high" if result.risk_score > 70 else "low" if result.risk_score < 30 else "medium",
+            "current_price": result.realtime_data.current_price,
+            "recommendation": result.final_recommendation.value,
+        }
+    
     @staticmethod
     def _generate_signal(technical, fundamentals, timeframe) -> InvestmentSignal:
         """신호 생성"""
@@ -24,6 +24,15 @@ import json
 import random
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 # ============================================================================
@@ -43,6 +52,8 @@ class MathUtils:
         """Calculate standard deviation."""
         if len(values) < 2:
             return 0.0
+        if use_vectorized(len(values)):
+            return ArrayBackend.std_dev(values)
         mean_val = MathUtils.mean(values)
         variance = sum((x - mean_val) ** 2 for x in values) / (len(values) - 1)
         return math.sqrt(variance)
@@ -52,6 +63,8 @@ class MathUtils:
         """Calculate variance."""
         if len(values) < 2:
             return 0.0
+        if use_vectorized(len(values)):
+            return ArrayBackend.variance(values)
         mean_val = MathUtils.mean(values)
         return sum((x - mean_val) ** 2 for x in values) / (len(values) - 1)
     
@@ -60,6 +73,8 @@ class MathUtils:
         """Calculate covariance between two series."""
         if len(x) != len(y) or len(x) < 2:
             return 0.0
+        if use_vectorized(len(x)):
+            return ArrayBackend.covariance(x, y)
         
         mean_x = MathUtils.mean(x)
         mean_y = MathUtils.mean(y)
@@ -96,6 +111,8 @@ class MathUtils:
         """
         if len(x) < 2 or len(x) != len(y):
             return (0.0, 0.0)
+        if use_vectorized(len(x)):
+            return ArrayBackend.linear_regression(x, y)
         
         n = len(x)
         mean_x = MathUtils.mean(x)
@@ -122,6 +139,8 @@ class MathUtils:
         """Calculate percentile (p between 0 and 100)."""
         if not data:
             return 0.0
+        if use_vectorized(len(data)):
+            return ArrayBackend.percentile(data, p)
         
         sorted_data = sorted(data)
         index = int((p / 100.0) * len(sorted_data))
@@ -130,6 +149,160 @@ class MathUtils:
         return sorted_data[index]
 
 
+# ============================================================================
+# VECTORIZED ARRAY BACKEND (OPTIONAL NUMPY)
+# ============================================================================
+
+# Backend selection: "auto" (numpy for large inputs), "python", or "numpy"
+QUANT_BACKEND = os.getenv("QUANT_BACKEND", "auto").lower()
+
+# Below this size list->array conversion costs more than the Python loop
+VECTORIZE_MIN_SIZE = int(os.getenv("QUANT_VECTORIZE_MIN_SIZE", "64"))
+
+
+def set_backend(backend: str) -> None:
+    """Force backend selection ("auto", "python", "numpy")."""
+    global QUANT_BACKEND
+    backend = backend.lower()
+    if backend not in ("auto", "python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        raise ValueError("numpy backend requested but numpy is not installed")
+    QUANT_BACKEND = backend
+
+
+def use_vectorized(size: int) -> bool:
+    """Whether an input of the given size should take the array path."""
+    if not NUMPY_AVAILABLE or QUANT_BACKEND == "python":
+        return False
+    return QUANT_BACKEND == "numpy" or size >= VECTORIZE_MIN_SIZE
+
+
+class ArrayBackend:
+    """
+    Array implementations over contiguous float64 buffers.
+    Each method returns the same value as its pure-Python counterpart
+    (up to floating point rounding); callers dispatch via use_vectorized().
+    """
+
+    @staticmethod
+    def as_array(values: Any) -> "np.ndarray":
+        """Convert to a contiguous float64 array (no copy if already one)."""
+        return np.ascontiguousarray(values, dtype=np.float64)
+
+    @staticmethod
+    def std_dev(values: Any) -> float:
+        return float(np.std(ArrayBackend.as_array(values), ddof=1))
+
+    @staticmethod
+    def variance(values: Any) -> float:
+        return float(np.var(ArrayBackend.as_array(values), ddof=1))
+
+    @staticmethod
+    def covariance(x: Any, y: Any) -> float:
+        xa = ArrayBackend.as_array(x)
+        ya = ArrayBackend.as_array(y)
+        return float(np.dot(xa - xa.mean(), ya - ya.mean()) / (len(xa) - 1))
+
+    @staticmethod
+    def linear_regression(x: Any, y: Any) -> Tuple[float, float]:
+        xa = ArrayBackend.as_array(x)
+        ya = ArrayBackend.as_array(y)
+        mean_x = xa.mean()
+        mean_y = ya.mean()
+        dx = xa - mean_x
+        denominator = float(np.dot(dx, dx))
+        slope = float(np.dot(dx, ya - mean_y)) / denominator if denominator != 0 else 0.0
+        return (slope, float(mean_y - slope * mean_x))
+
+    @staticmethod
+    def percentile(data: Any, p: float) -> float:
+        """Same nearest-rank rule as MathUtils.percentile, O(n) selection."""
+        arr = ArrayBackend.as_array(data)
+        index = min(max(int((p / 100.0) * len(arr)), 0), len(arr) - 1)
+        return float(np.partition(arr, index)[index])
+
+    @staticmethod
+    def var_95(returns: Any) -> float:
+        arr = ArrayBackend.as_array(returns)
+        index = int(len(arr) * 0.05)
+        return abs(float(np.partition(arr, index)[index]))
+
+    @staticmethod
+    def cvar(returns: Any) -> float:
+        arr = ArrayBackend.as_array(returns)
+        var_95 = ArrayBackend.var_95(arr)
+        tail = arr[arr <= -var_95]
+        if tail.size == 0:
+            return var_95
+        return float(np.abs(tail).mean())
+
+    @staticmethod
+    def max_drawdown(price_history: Any) -> float:
+        """Cumulative-max scan instead of a Python peak loop."""
+        prices = ArrayBackend.as_array(price_history)
+        peaks = np.maximum.accumulate(prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdowns = np.where(peaks > 0, (peaks - prices) / peaks, 0.0)
+        return max(float(drawdowns.max()), 0.0)
+
+    @staticmethod
+    def correlation_array(assets: List[Asset]) -> "np.ndarray":
+        """
+        Full (n x n) correlation matrix using the same volatility-based
+        estimate as QuantitativeAnalysis.calculate_correlation_matrix.
+        Diagonal is 1.0.
+        """
+        vols = ArrayBackend.as_array([a.volatility for a in assets])
+        markets = np.array([a.market.value for a in assets])
+        vol_products = np.outer(vols, vols)
+        same_market = markets[:, None] == markets[None, :]
+        corr = np.where(same_market, 0.4 + vol_products * 0.3, 0.2 + vol_products * 0.1)
+        np.minimum(corr, 0.95, out=corr)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    @staticmethod
+    def correlation_array_from_pairs(
+        assets: List[Asset],
+        correlations: Dict[Tuple[str, str], float],
+        default: float = 0.3
+    ) -> "np.ndarray":
+        """Expand a pairwise correlation dict into a full symmetric matrix."""
+        index = {asset.symbol: i for i, asset in enumerate(assets)}
+        corr = np.full((len(assets), len(assets)), default, dtype=np.float64)
+        for (sym1, sym2), value in correlations.items():
+            i = index.get(sym1)
+            j = index.get(sym2)
+            # Only (earlier, later) keys are read by the pure-Python path
+            if i is not None and j is not None and i < j:
+                corr[i, j] = corr[j, i] = value
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    @staticmethod
+    def upper_triangle_mean(matrix: "np.ndarray") -> float:
+        """Mean of the strict upper triangle (pairwise values only)."""
+        n = matrix.shape[0]
+        if n < 2:
+            return 0.0
+        off_diagonal_sum = float(matrix.sum() - np.trace(matrix)) / 2.0
+        return off_diagonal_sum / (n * (n - 1) / 2)
+
+    @staticmethod
+    def covariance_from_correlation(vols: Any, corr: "np.ndarray") -> "np.ndarray":
+        """Σ = diag(σ) · C · diag(σ)"""
+        v = ArrayBackend.as_array(vols)
+        return corr * np.outer(v, v)
+
+    @staticmethod
+    def portfolio_volatility(weights: Any, covariance: "np.ndarray") -> float:
+        """σ_p = sqrt(wᵀΣw) via BLAS matrix-vector products."""
+        w = ArrayBackend.as_array(weights)
+        variance = float(w @ (covariance @ w))
+        return math.sqrt(max(variance, 0.0001))
+
+
 # ============================================================================
 # ENUMS & CONSTANTS
 # ============================================================================
@@ -255,6 +428,8 @@ class QuantitativeAnalysis:
         """
         if not returns or len(returns) < 2:
             return 0.0
+        if use_vectorized(len(returns)):
+            return ArrayBackend.var_95(returns)
         
         sorted_returns = sorted(returns)
         index = int(len(sorted_returns) * 0.05)
@@ -266,6 +441,9 @@ class QuantitativeAnalysis:
         Calculate Conditional VaR (Expected Shortfall).
         Average loss beyond VaR threshold.
         """
+        # len < 2: VaR is 0.0, so the tail is every non-positive return (pure path for both backends)
+        if len(returns) >= 2 and use_vectorized(len(returns)):
+            return ArrayBackend.cvar(returns)
         var_95 = QuantitativeAnalysis.calculate_var_95(returns)
         tail_losses = [abs(r) for r in returns if r <= -var_95]
         
@@ -325,8 +503,18 @@ class QuantitativeAnalysis:
     ) -> Dict[Tuple[str, str], float]:
         """
         Calculate correlation matrix between assets.
-        Uses volatility-based estimation.
+        Uses volatility-based estimation (fallback when no returns history is
+        available; QuantCartridge prefers its CovarianceEngine).
         """
+        if use_vectorized(len(assets)):
+            corr = ArrayBackend.correlation_array(assets)
+            rows, cols = np.triu_indices(len(assets), k=1)
+            symbols = [asset.symbol for asset in assets]
+            return {
+                (symbols[i], symbols[j]): value
+                for i, j, value in zip(rows.tolist(), cols.tolist(), corr[rows, cols].tolist())
+            }
+        
         correlations: Dict[Tuple[str, str], float] = {}
         
         for i, asset1 in enumerate(assets):
@@ -353,6 +541,15 @@ class QuantitativeAnalysis:
         Calculate portfolio volatility using covariance matrix.
         Formula: σ_p = sqrt(w^T * Σ * w)
         """
+        if use_vectorized(len(assets)):
+            corr = ArrayBackend.correlation_array_from_pairs(assets, correlations)
+            covariance = ArrayBackend.covariance_from_correlation(
+                [asset.volatility for asset in assets], corr
+            )
+            return ArrayBackend.portfolio_volatility(
+                [weights.get(asset.symbol, 0) for asset in assets], covariance
+            )
+        
         # Variance contribution
         variance = 0.0
         
@@ -379,6 +576,8 @@ class QuantitativeAnalysis:
         """
         if not price_history or len(price_history) < 2:
             return 0.0
+        if use_vectorized(len(price_history)):
+            return ArrayBackend.max_drawdown(price_history)
         
         peak = price_history[0]
         max_dd = 0.0
@@ -416,6 +615,590 @@ class QuantitativeAnalysis:
         return mean_excess / tracking_error
 
 
+# ============================================================================
+# EMPIRICAL COVARIANCE ENGINE
+# ============================================================================
+
+class CovarianceEngine:
+    """
+    Returns-based covariance/correlation estimator (requires numpy).
+
+    - Sample covariance (halflife=None) or exponentially weighted
+      covariance (decay λ = 0.5 ** (1 / halflife))
+    - Ledoit-Wolf shrinkage towards a scaled identity target
+    - O(N²) rank-one update per new day of returns: only weighted moment
+      sums are kept, so update() never revisits the history
+
+    The Ledoit-Wolf intensity needs Σ_t ||y_t||⁴ for returns centered on the
+    *current* mean. Expanding ||x - m||⁴ keeps it incremental:
+        Σ(A - 2B + c)² = ΣA² + 4ΣB² + W·c² - 4ΣAB + 2cΣA - 4cΣB
+    with A = ||x||², B = xᵀm, c = ||m||², which only needs the running sums
+    Σw·x, Σw·xxᵀ, Σw·||x||²·x, Σw·||x||⁴ and Σw·||x||².
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        halflife: Optional[float] = None,
+        shrinkage: bool = True,
+        annualization: int = 252
+    ) -> None:
+        """Initialize engine for an ordered list of symbols."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("CovarianceEngine requires numpy")
+        if halflife is not None and halflife <= 0:
+            raise ValueError(f"Invalid halflife: {halflife}")
+
+        self.symbols = list(symbols)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.halflife = halflife
+        self.decay = 1.0 if halflife is None else 0.5 ** (1.0 / halflife)
+        self.shrinkage = shrinkage
+        self.annualization = annualization
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all observations."""
+        n = len(self.symbols)
+        self.n_obs = 0
+        self._w = 0.0           # Σw
+        self._w2 = 0.0          # Σw²
+        self._s1 = np.zeros(n)  # Σw·x
+        self._s2 = np.zeros((n, n))  # Σw·xxᵀ
+        self._q = np.zeros(n)   # Σw·||x||²·x
+        self._r = 0.0           # Σw·||x||⁴
+        self._a = 0.0           # Σw·||x||²
+        self._cache: Dict[str, Any] = {}
+
+    def fit(self, returns: Any) -> "CovarianceEngine":
+        """
+        Fit from an aligned (T x N) returns matrix, rows oldest first.
+        Equivalent to calling update() for each row, but done with BLAS.
+        """
+        x = ArrayBackend.as_array(returns)
+        if x.ndim != 2 or x.shape[1] != len(self.symbols):
+            raise ValueError(f"Expected (T, {len(self.symbols)}) returns, got {x.shape}")
+
+        self.reset()
+        if x.shape[0] == 0:
+            return self
+
+        t = x.shape[0]
+        w = self.decay ** np.arange(t - 1, -1, -1, dtype=np.float64)
+        sq_norms = np.einsum("ij,ij->i", x, x)
+
+        self.n_obs = t
+        self._w = float(w.sum())
+        self._w2 = float(np.dot(w, w))
+        self._s1 = w @ x
+        self._s2 = (x * w[:, None]).T @ x
+        self._q = (w * sq_norms) @ x
+        self._r = float(np.dot(w, sq_norms ** 2))
+        self._a = float(np.dot(w, sq_norms))
+        return self
+
+    def update(self, day_returns: Any) -> None:
+        """Add one day of returns (length N, engine symbol order): rank-one update."""
+        x = ArrayBackend.as_array(day_returns)
+        if x.shape != (len(self.symbols),):
+            raise ValueError(f"Expected {len(self.symbols)} returns, got {x.shape}")
+
+        if self.decay != 1.0:
+            lam = self.decay
+            self._w *= lam
+            self._w2 *= lam * lam
+            self._s1 *= lam
+            self._s2 *= lam
+            self._q *= lam
+            self._r *= lam
+            self._a *= lam
+
+        sq_norm = float(np.dot(x, x))
+        self.n_obs += 1
+        self._w += 1.0
+        self._w2 += 1.0
+        self._s1 += x
+        self._s2 += np.outer(x, x)
+        self._q += sq_norm * x
+        self._r += sq_norm * sq_norm
+        self._a += sq_norm
+        self._cache.clear()
+
+    def update_from_dict(self, day_returns: Dict[str, float]) -> None:
+        """Add one day of returns keyed by symbol (missing symbols count as 0)."""
+        self.update([day_returns.get(symbol, 0.0) for symbol in self.symbols])
+
+    @property
+    def effective_observations(self) -> float:
+        """Kish effective sample size (W² / Σw²); equals n_obs without decay."""
+        return self._w * self._w / self._w2 if self._w2 > 0 else 0.0
+
+    def mean(self) -> "np.ndarray":
+        """Weighted mean daily return per symbol."""
+        return self._s1 / self._w if self._w > 0 else np.zeros(len(self.symbols))
+
+    def _biased_covariance(self) -> "np.ndarray":
+        m = self.mean()
+        cov = self._s2 / self._w - np.outer(m, m)
+        return (cov + cov.T) / 2.0
+
+    def shrinkage_intensity(self) -> float:
+        """Ledoit-Wolf optimal shrinkage intensity δ in [0, 1]."""
+        if "shrinkage" in self._cache:
+            return self._cache["shrinkage"]
+
+        n = len(self.symbols)
+        n_eff = self.effective_observations
+        if n_eff < 2 or n == 0:
+            return 0.0
+
+        s = self._biased_covariance()
+        m = self.mean()
+        mu = float(np.trace(s)) / n
+
+        # Σw·||x - m||⁴ / W via the expansion in the class docstring
+        c = float(np.dot(m, m))
+        sum_a2 = self._r
+        sum_b2 = float(m @ self._s2 @ m)
+        sum_ab = float(np.dot(self._q, m))
+        sum_b = float(np.dot(self._s1, m))
+        fourth = (
+            sum_a2 + 4.0 * sum_b2 + self._w * c * c
+            - 4.0 * sum_ab + 2.0 * c * self._a - 4.0 * c * sum_b
+        ) / self._w
+
+        s_norm2 = float(np.sum(s * s))
+        delta = (s_norm2 - 2.0 * mu * float(np.trace(s)) + n * mu * mu) / n
+        beta = max((fourth - s_norm2) / (n * n_eff), 0.0)
+        beta = min(beta, delta)
+
+        intensity = 0.0 if beta == 0 or delta == 0 else beta / delta
+        self._cache["shrinkage"] = intensity
+        return intensity
+
+    def covariance(self, annualize: bool = False) -> "np.ndarray":
+        """
+        Covariance matrix (N x N).
+        With shrinkage: (1 - δ)·S + δ·μI on the (weighted) maximum-likelihood S.
+        Without: S rescaled to the unbiased estimator (W² / (W² - Σw²)).
+        """
+        key = "covariance"
+        if key not in self._cache:
+            n_eff = self.effective_observations
+            if n_eff < 2:
+                cov = np.zeros((len(self.symbols), len(self.symbols)))
+            elif self.shrinkage:
+                s = self._biased_covariance()
+                intensity = self.shrinkage_intensity()
+                mu = float(np.trace(s)) / len(self.symbols)
+                cov = (1.0 - intensity) * s
+                cov[np.diag_indices_from(cov)] += intensity * mu
+            else:
+                correction = self._w * self._w / (self._w * self._w - self._w2)
+                cov = self._biased_covariance() * correction
+            self._cache[key] = cov
+
+        cov = self._cache[key]
+        return cov * self.annualization if annualize else cov
+
+    def volatilities(self, annualize: bool = True) -> "np.ndarray":
+        """Per-symbol volatility from the covariance diagonal."""
+        return np.sqrt(np.clip(np.diag(self.covariance(annualize=annualize)), 0.0, None))
+
+    def correlation(self) -> "np.ndarray":
+        """Correlation matrix (N x N); zero-variance symbols get 0 off-diagonal."""
+        cov = self.covariance()
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        corr = np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    def correlation_pairs(self) -> Dict[Tuple[str, str], float]:
+        """Pairwise dict in the calculate_correlation_matrix format."""
+        corr = self.correlation()
+        rows, cols = np.triu_indices(len(self.symbols), k=1)
+        return {
+            (self.symbols[i], self.symbols[j]): value
+            for i, j, value in zip(rows.tolist(), cols.tolist(), corr[rows, cols].tolist())
+        }
+
+    def covers(self, symbols: List[str]) -> bool:
+        """Whether every symbol has a fitted column."""
+        return self.n_obs >= 2 and all(symbol in self.index for symbol in symbols)
+
+    def subset_covariance(self, symbols: List[str], annualize: bool = True) -> "np.ndarray":
+        """Covariance restricted to (and ordered by) the given symbols."""
+        idx = [self.index[symbol] for symbol in symbols]
+        return self.covariance(annualize=annualize)[np.ix_(idx, idx)]
+
+    def portfolio_volatility(self, weights: Dict[str, float], annualize: bool = True) -> float:
+        """σ_p = sqrt(wᵀΣw) on the estimated covariance."""
+        w = [weights.get(symbol, 0.0) for symbol in self.symbols]
+        return ArrayBackend.portfolio_volatility(w, self.covariance(annualize=annualize))
+
+
+# ============================================================================
+# PORTFOLIO OPTIMIZATION
+# ============================================================================
+
+@dataclass
+class OptimizationResult:
+    """Optimized portfolio with its ex-ante statistics."""
+    strategy: str
+    weights: Dict[str, float]
+    expected_return: float
+    volatility: float
+    sharpe_ratio: float
+    iterations: int
+    converged: bool
+
+
+class PortfolioOptimizer:
+    """
+    Constrained portfolio optimizer on a covariance matrix (requires numpy).
+
+    Strategies:
+    - min_variance: min wᵀΣw
+    - max_sharpe: tangency portfolio, a mean-variance solve whose risk
+      aversion γ is iterated to the fixed point γ = (μᵀw - r_f) / wᵀΣw
+      (a coarse γ sweep only when the start has no positive excess return)
+    - risk_parity: risk contributions w_i(Σw)_i proportional to budgets
+      (equal by default), solved by cyclical coordinate descent
+    - efficient_frontier: max μᵀw - γ/2·wᵀΣw over a γ grid
+
+    Constraints: Σw = 1 and min_weight ≤ w_i ≤ max_weight. Mean-variance
+    problems use accelerated projected gradient (FISTA with adaptive
+    restart); the projection onto the capped simplex is exact (sorted
+    breakpoints of τ in clip(v - τ, lo, hi)). Risk parity bounds are
+    enforced by projecting the unconstrained solution.
+
+    The last solution of each strategy (and the tangency γ) is kept and
+    used as the starting point of the next call, so re-optimizing after
+    small price moves converges in a few iterations.
+    """
+
+    STRATEGIES = ("min_variance", "max_sharpe", "risk_parity")
+
+    def __init__(
+        self,
+        min_weight: float = 0.0,
+        max_weight: float = 1.0,
+        risk_free_rate: float = 0.02,
+        tol: float = 1e-9,
+        max_iter: int = 10000
+    ) -> None:
+        """Initialize optimizer with box constraints shared by all strategies."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("PortfolioOptimizer requires numpy")
+        if not 0.0 <= min_weight <= max_weight:
+            raise ValueError(f"Invalid weight bounds: [{min_weight}, {max_weight}]")
+
+        self.min_weight = min_weight
+        self.max_weight = min(max_weight, 1.0)
+        self.risk_free_rate = risk_free_rate
+        self.tol = tol
+        self.max_iter = max_iter
+        self._warm: Dict[str, Dict[str, float]] = {}
+        self._warm_gamma: Optional[float] = None
+
+    # ---------- constraint handling ----------
+
+    def _bounds(self, n: int) -> Tuple[float, float]:
+        """Box bounds, checked for feasibility with Σw = 1."""
+        lo, hi = self.min_weight, self.max_weight
+        if n == 0 or n * lo > 1.0 + 1e-12 or n * hi < 1.0 - 1e-12:
+            raise ValueError(f"Infeasible weight bounds [{lo}, {hi}] for {n} assets")
+        return lo, hi
+
+    @staticmethod
+    def project(v: Any, lo: float, hi: float) -> "np.ndarray":
+        """Euclidean projection onto {Σw = 1, lo ≤ w ≤ hi}."""
+        v = np.asarray(v, dtype=np.float64)
+        n = len(v)
+        s = np.sort(v)
+        prefix = np.concatenate(([0.0], np.cumsum(s)))
+
+        # Σ clip(v - τ, lo, hi) is piecewise linear and non-increasing in τ,
+        # with breakpoints at v_i - hi and v_i - lo
+        taus = np.sort(np.concatenate((s - hi, s - lo)))
+        at_lo = np.searchsorted(s, taus + lo, side="right")
+        below_hi = np.searchsorted(s, taus + hi, side="left")
+        totals = (
+            at_lo * lo + (n - below_hi) * hi
+            + prefix[below_hi] - prefix[at_lo] - (below_hi - at_lo) * taus
+        )
+
+        k = int(np.searchsorted(-totals, -1.0, side="left"))
+        if k == 0:
+            tau = taus[0]
+        elif k >= len(taus):
+            tau = taus[-1]
+        else:
+            t0, t1 = totals[k - 1], totals[k]
+            tau = taus[k - 1] if t0 == t1 else taus[k - 1] + (t0 - 1.0) * (taus[k] - taus[k - 1]) / (t0 - t1)
+        return np.clip(v - tau, lo, hi)
+
+    def _start(self, strategy: str, symbols: List[str], lo: float, hi: float) -> "np.ndarray":
+        """Previous solution for known symbols, equal weight for new ones."""
+        previous = self._warm.get(strategy, {})
+        default = 1.0 / len(symbols)
+        return self.project([previous.get(symbol, default) for symbol in symbols], lo, hi)
+
+    # ---------- solvers ----------
+
+    def _solve_mean_variance(
+        self,
+        covariance: "np.ndarray",
+        mu: "np.ndarray",
+        gamma: float,
+        w0: "np.ndarray",
+        lo: float,
+        hi: float,
+        lipschitz: float
+    ) -> Tuple["np.ndarray", int, bool]:
+        """min γ/2·wᵀΣw - μᵀw on the capped simplex (FISTA)."""
+        step = 1.0 / max(gamma * lipschitz, 1e-18)
+        w = w0
+        y = w0
+        t = 1.0
+        for iteration in range(1, self.max_iter + 1):
+            grad = gamma * (covariance @ y) - mu
+            w_next = self.project(y - step * grad, lo, hi)
+            delta = w_next - w
+            if np.max(np.abs(delta)) < self.tol:
+                return w_next, iteration, True
+            if np.dot(grad, w_next - y) > 0:
+                # Adaptive restart: momentum is pointing uphill
+                t = 1.0
+                y = w_next
+            else:
+                t_next = 0.5 * (1.0 + math.sqrt(1.0 + 4.0 * t * t))
+                y = w_next + ((t - 1.0) / t_next) * delta
+                t = t_next
+            w = w_next
+        return w, self.max_iter, False
+
+    def _solve_risk_parity(
+        self,
+        covariance: "np.ndarray",
+        budgets: "np.ndarray",
+        w0: "np.ndarray"
+    ) -> Tuple["np.ndarray", int, bool]:
+        """min ½yᵀΣy - Σ b_i·ln y_i by cyclical coordinate descent, w = y / Σy."""
+        diag = np.diag(covariance).copy()
+        if np.any(diag <= 0):
+            raise ValueError("Risk parity requires positive variances")
+
+        y = np.maximum(w0, 1e-12)
+        y = y / math.sqrt(max(float(y @ covariance @ y), 1e-300))
+        sigma_y = covariance @ y
+        for sweep in range(1, self.max_iter + 1):
+            max_change = 0.0
+            for i in range(len(y)):
+                c = sigma_y[i] - diag[i] * y[i]
+                new = (-c + math.sqrt(c * c + 4.0 * diag[i] * budgets[i])) / (2.0 * diag[i])
+                change = new - y[i]
+                if change:
+                    sigma_y += change * covariance[:, i]
+                    y[i] = new
+                    max_change = max(max_change, abs(change) / new)
+            if max_change < self.tol:
+                return y / y.sum(), sweep, True
+        return y / y.sum(), self.max_iter, False
+
+    # ---------- results ----------
+
+    def _result(
+        self,
+        strategy: str,
+        symbols: List[str],
+        weights: "np.ndarray",
+        covariance: "np.ndarray",
+        mu: Optional["np.ndarray"],
+        iterations: int,
+        converged: bool
+    ) -> OptimizationResult:
+        """Package weights with return/volatility/Sharpe."""
+        volatility = math.sqrt(max(float(weights @ covariance @ weights), 0.0))
+        expected_return = float(mu @ weights) if mu is not None else 0.0
+        sharpe = (expected_return - self.risk_free_rate) / volatility if volatility > 0 and mu is not None else 0.0
+        return OptimizationResult(
+            strategy=strategy,
+            weights={symbol: float(w) for symbol, w in zip(symbols, weights)},
+            expected_return=expected_return,
+            volatility=volatility,
+            sharpe_ratio=sharpe,
+            iterations=iterations,
+            converged=converged
+        )
+
+    @staticmethod
+    def _prepare(covariance: Any, expected_returns: Any = None) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+        covariance = np.asarray(covariance, dtype=np.float64)
+        covariance = 0.5 * (covariance + covariance.T)
+        mu = None if expected_returns is None else np.asarray(expected_returns, dtype=np.float64)
+        return covariance, mu
+
+    @staticmethod
+    def _lipschitz(covariance: "np.ndarray") -> float:
+        return float(np.linalg.eigvalsh(covariance)[-1])
+
+    # ---------- strategies ----------
+
+    def min_variance(self, symbols: List[str], covariance: Any, expected_returns: Any = None) -> OptimizationResult:
+        """Minimum-variance portfolio."""
+        covariance, mu = self._prepare(covariance, expected_returns)
+        lo, hi = self._bounds(len(symbols))
+        w, iterations, converged = self._solve_mean_variance(
+            covariance, np.zeros(len(symbols)), 1.0,
+            self._start("min_variance", symbols, lo, hi), lo, hi, self._lipschitz(covariance)
+        )
+        self._warm["min_variance"] = dict(zip(symbols, w))
+        return self._result("min_variance", symbols, w, covariance, mu, iterations, converged)
+
+    def max_sharpe(self, symbols: List[str], covariance: Any, expected_returns: Any) -> OptimizationResult:
+        """
+        Maximum-Sharpe (tangency) portfolio under the box constraints.
+
+        The KKT conditions of max (μᵀw - r_f)/σ(w) match those of the
+        mean-variance problem with γ = (μᵀw - r_f) / wᵀΣw, so γ is iterated
+        to that fixed point, each solve warm-started from the previous one.
+        """
+        covariance, mu = self._prepare(covariance, expected_returns)
+        lo, hi = self._bounds(len(symbols))
+        lipschitz = self._lipschitz(covariance)
+        w = self._start("max_sharpe", symbols, lo, hi)
+        total_iterations = 0
+        converged = True
+
+        def solve(gamma: float, start: "np.ndarray") -> "np.ndarray":
+            nonlocal total_iterations, converged
+            solution, iterations, ok = self._solve_mean_variance(
+                covariance, mu, gamma, start, lo, hi, lipschitz
+            )
+            total_iterations += iterations
+            converged &= ok
+            return solution
+
+        def implied_gamma(weights: "np.ndarray") -> float:
+            return (float(mu @ weights) - self.risk_free_rate) / max(float(weights @ covariance @ weights), 1e-300)
+
+        gamma = self._warm_gamma
+        if gamma is None:
+            # Cold start from the minimum-variance portfolio
+            w, iterations, _ = self._solve_mean_variance(
+                covariance, np.zeros(len(symbols)), 1.0, w, lo, hi, lipschitz
+            )
+            total_iterations += iterations
+            gamma = implied_gamma(w)
+        if gamma <= 0:
+            # Excess return not positive at the start: coarse frontier sweep for a starting point
+            scale = (float(np.ptp(mu)) + 1e-12) / (float(np.mean(np.diag(covariance))) + 1e-18)
+            best = None
+            for candidate in scale * np.logspace(4, -3, 15):
+                w = solve(float(candidate), w)
+                sharpe = implied_gamma(w) * math.sqrt(max(float(w @ covariance @ w), 0.0))
+                if best is None or sharpe > best[0]:
+                    best = (sharpe, float(candidate), w)
+            _, gamma, w = best
+
+        for _ in range(100):
+            w = solve(gamma, w)
+            next_gamma = implied_gamma(w)
+            if next_gamma <= 0 or abs(next_gamma - gamma) <= 1e-8 * gamma:
+                break
+            gamma = next_gamma
+        else:
+            converged = False
+
+        self._warm_gamma = gamma if gamma > 0 else None
+        self._warm["max_sharpe"] = dict(zip(symbols, w))
+        return self._result("max_sharpe", symbols, w, covariance, mu, total_iterations, converged)
+
+    def risk_parity(
+        self,
+        symbols: List[str],
+        covariance: Any,
+        expected_returns: Any = None,
+        budgets: Optional[Dict[str, float]] = None
+    ) -> OptimizationResult:
+        """Equal risk contribution (or risk budgeting) portfolio."""
+        covariance, mu = self._prepare(covariance, expected_returns)
+        lo, hi = self._bounds(len(symbols))
+        b = np.array([budgets.get(symbol, 0.0) for symbol in symbols] if budgets else np.ones(len(symbols)))
+        if np.any(b <= 0):
+            raise ValueError("Risk budgets must be positive")
+        b = b / b.sum()
+
+        previous = self._warm.get("risk_parity", {})
+        w0 = np.array([previous.get(symbol, 1.0 / len(symbols)) for symbol in symbols])
+        w, iterations, converged = self._solve_risk_parity(covariance, b, w0)
+        self._warm["risk_parity"] = dict(zip(symbols, w))
+        if np.any(w < lo - 1e-12) or np.any(w > hi + 1e-12):
+            w = self.project(w, lo, hi)
+        return self._result("risk_parity", symbols, w, covariance, mu, iterations, converged)
+
+    def efficient_frontier(
+        self,
+        symbols: List[str],
+        covariance: Any,
+        expected_returns: Any,
+        points: int = 20
+    ) -> List[OptimizationResult]:
+        """
+        Frontier portfolios from minimum variance to maximum return.
+        Each point is warm-started from its neighbour.
+        """
+        covariance, mu = self._prepare(covariance, expected_returns)
+        lo, hi = self._bounds(len(symbols))
+        lipschitz = self._lipschitz(covariance)
+        scale = (float(np.ptp(mu)) + 1e-12) / (float(np.mean(np.diag(covariance))) + 1e-18)
+
+        frontier = []
+        w = self._start("min_variance", symbols, lo, hi)
+        for gamma in scale * np.logspace(4, -3, points):
+            w, iterations, converged = self._solve_mean_variance(
+                covariance, mu, float(gamma), w, lo, hi, lipschitz
+            )
+            frontier.append(self._result("efficient_frontier", symbols, w, covariance, mu, iterations, converged))
+        return frontier
+
+    def optimize(
+        self,
+        strategy: str,
+        symbols: List[str],
+        covariance: Any,
+        expected_returns: Any = None,
+        **kwargs: Any
+    ) -> OptimizationResult:
+        """Dispatch by strategy name (see STRATEGIES)."""
+        if strategy == "min_variance":
+            return self.min_variance(symbols, covariance, expected_returns)
+        if strategy == "max_sharpe":
+            if expected_returns is None:
+                raise ValueError("max_sharpe requires expected returns")
+            return self.max_sharpe(symbols, covariance, expected_returns)
+        if strategy == "risk_parity":
+            return self.risk_parity(symbols, covariance, expected_returns, **kwargs)
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+    def optimize_returns(
+        self,
+        strategy: str,
+        symbols: List[str],
+        returns: Any,
+        halflife: Optional[float] = None,
+        annualization: int = 252
+    ) -> OptimizationResult:
+        """Optimize on a (T × N) daily returns matrix via a shrunk CovarianceEngine."""
+        engine = CovarianceEngine(symbols, halflife=halflife, annualization=annualization).fit(returns)
+        return self.optimize(
+            strategy, symbols, engine.covariance(annualize=True), engine.mean() * annualization
+        )
+
+
 # ============================================================================
 # MARKET SIGNAL PROCESSING ENGINE
 # ============================================================================
@@ -476,7 +1259,104 @@ class MarketSignalProcessor:
         
         self.signal_history.append(signal)
         return signal
-    
+
+    def generate_signals_batch(
+        self,
+        assets: List[Asset],
+        price_matrix: Any,
+        volume_matrix: Any
+    ) -> Dict[str, MarketSignal]:
+        """
+        Generate signals for many assets at once.
+        price_matrix / volume_matrix: (assets x periods), rows in `assets` order.
+        Produces the same MarketSignal values as calling generate_signal per
+        asset, with every indicator computed as an array operation.
+        """
+        if not NUMPY_AVAILABLE:
+            return {
+                asset.symbol: self.generate_signal(asset, list(prices), list(volumes))
+                for asset, prices, volumes in zip(assets, price_matrix, volume_matrix)
+            }
+
+        prices = ArrayBackend.as_array(price_matrix).reshape(len(assets), -1)
+        volumes = ArrayBackend.as_array(volume_matrix).reshape(len(assets), -1)
+        n_periods = prices.shape[1]
+
+        momentum = self._momentum_batch(prices)
+        trend = self._trend_batch(prices)
+        volatility = np.array([self._calculate_volatility_signal(a.volatility) for a in assets])
+        sentiment = self._sentiment_batch(volumes)
+
+        composite = (
+            momentum * self.indicator_weights["momentum"] +
+            trend * self.indicator_weights["trend"] +
+            volatility * self.indicator_weights["volatility"] +
+            sentiment * self.indicator_weights["sentiment"]
+        )
+
+        # Confidence depends only on history length, shared by all rows
+        confidence = self._calculate_confidence(range(n_periods))
+        timestamp = datetime.now()
+        reasoning = f"Multi-indicator signal based on {n_periods} periods"
+
+        signals: Dict[str, MarketSignal] = {}
+        rows = zip(assets, momentum.tolist(), trend.tolist(), volatility.tolist(),
+                   sentiment.tolist(), composite.tolist())
+        for asset, m, t, v, s, c in rows:
+            signal = MarketSignal(
+                signal_type=self._composite_to_signal_type(c),
+                strength=min(abs(c), 1.0),
+                confidence=confidence,
+                timestamp=timestamp,
+                indicators={
+                    "momentum": m,
+                    "trend": t,
+                    "volatility": v,
+                    "sentiment": s,
+                    "composite": c
+                },
+                reasoning=reasoning
+            )
+            self.signal_history.append(signal)
+            signals[asset.symbol] = signal
+
+        return signals
+
+    @staticmethod
+    def _momentum_batch(prices: "np.ndarray") -> "np.ndarray":
+        """Row-wise _calculate_momentum."""
+        if prices.shape[1] < 2:
+            return np.zeros(prices.shape[0])
+        first = prices[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roc = np.where(first > 0, (prices[:, -1] - first) / first, 0.0)
+        return np.tanh(roc * 2.0)
+
+    @staticmethod
+    def _trend_batch(prices: "np.ndarray") -> "np.ndarray":
+        """Row-wise _calculate_trend: regression slopes for all rows in one GEMV."""
+        n_periods = prices.shape[1]
+        if n_periods < 2:
+            return np.zeros(prices.shape[0])
+        dx = np.arange(n_periods, dtype=np.float64) - (n_periods - 1) / 2.0
+        mean_price = prices.mean(axis=1)
+        slope = ((prices - mean_price[:, None]) @ dx) / float(np.dot(dx, dx))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(mean_price > 0, slope / mean_price, 0.0)
+        return np.tanh(normalized * 10.0)
+
+    @staticmethod
+    def _sentiment_batch(volumes: "np.ndarray") -> "np.ndarray":
+        """Row-wise _calculate_sentiment (recent 5 vs. earlier volume)."""
+        n_periods = volumes.shape[1]
+        if n_periods < 2:
+            return np.zeros(volumes.shape[0])
+        recent = volumes[:, -5:].mean(axis=1) if n_periods >= 5 else volumes.mean(axis=1)
+        historical = volumes[:, :-5].mean(axis=1) if n_periods > 5 else volumes.mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(historical != 0, recent / historical, 1.0)
+        return np.tanh((ratio - 1.0) * 2.0)
+
     @staticmethod
     def _calculate_momentum(prices: List[float]) -> float:
         """Rate of change momentum."""
@@ -694,6 +1574,398 @@ class DualQuantSystem:
         return allocation
 
 
+# ============================================================================
+# BACKTESTING ENGINE
+# ============================================================================
+
+def _common_date_rows(frames: List[Any], last_n: Optional[int] = None) -> List["np.ndarray"]:
+    """Per-frame row indices of the dates every frame traded (most recent last_n of them)."""
+    common = frames[0].dates
+    for frame in frames[1:]:
+        common = np.intersect1d(common, frame.dates)
+    if last_n is not None:
+        common = common[len(common) - min(last_n, len(common)):]
+    return [np.searchsorted(frame.dates, common) for frame in frames]
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of one backtested policy."""
+    equity_curve: Any  # np.ndarray, portfolio value per period (starts at initial capital)
+    returns: Any  # np.ndarray, per-period portfolio returns
+    risk_metrics: RiskMetrics
+    total_return: float
+    annual_return: float
+    information_ratio: float
+    turnover: float  # cumulative one-way turnover (1.0 = full portfolio)
+    transaction_costs: float  # cumulative costs as a fraction of equity
+    parameters: Dict[str, float] = field(default_factory=dict)
+
+
+class Backtester:
+    """
+    Vectorized backtester over an (assets x periods) price matrix (requires numpy).
+
+    - Rebalances every `rebalance_every` periods once `lookback` bars exist;
+      between rebalances holdings drift with prices (no implicit rebalancing)
+    - Transaction cost: `transaction_cost` x one-way turnover, deducted at
+      each rebalance
+    - Risk metrics are batch versions of the QuantitativeAnalysis formulas,
+      applied to per-period returns and annualized with `periods_per_year`
+    - Benchmark (information ratio): equal-weight buy-and-hold of the universe
+
+    Signal policies reuse MarketSignalProcessor indicators. The four
+    indicator scores are computed once for every (rebalance date, asset);
+    a set of indicator_weights only changes the weighted sum, so parameter
+    sweeps contract a precomputed tensor and simulate all candidates
+    together, in chunks spread over worker processes.
+    """
+
+    INDICATORS = ("momentum", "trend", "volatility", "sentiment")
+
+    def __init__(
+        self,
+        symbols: List[str],
+        prices: Any,
+        volumes: Any = None,
+        lookback: int = 60,
+        rebalance_every: int = 5,
+        transaction_cost: float = 0.001,
+        risk_free_rate: float = 0.02,
+        periods_per_year: int = 252,
+        initial_capital: float = 100000.0
+    ) -> None:
+        """prices / volumes: (assets x periods), rows in `symbols` order, oldest first."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("Backtester requires numpy")
+
+        self.symbols = list(symbols)
+        self.prices = np.asarray(prices, dtype=np.float64).reshape(len(self.symbols), -1)
+        n_assets, n_periods = self.prices.shape
+        if lookback < 2 or n_periods <= lookback:
+            raise ValueError(f"Need more than lookback={lookback} periods, got {n_periods}")
+        if np.any(self.prices <= 0) or not np.all(np.isfinite(self.prices)):
+            raise ValueError("Prices must be positive and finite")
+        self.volumes = (
+            np.ones_like(self.prices) if volumes is None
+            else np.asarray(volumes, dtype=np.float64).reshape(n_assets, n_periods)
+        )
+
+        self.lookback = lookback
+        self.rebalance_every = max(1, rebalance_every)
+        self.transaction_cost = transaction_cost
+        self.risk_free_rate = risk_free_rate
+        self.periods_per_year = periods_per_year
+        self.initial_capital = initial_capital
+
+        self.start = lookback - 1
+        self.rebalance_dates = np.arange(self.start, n_periods - 1, self.rebalance_every)
+        self._components: Optional["np.ndarray"] = None
+
+        benchmark = self.prices[:, self.start:] / self.prices[:, self.start][:, None]
+        benchmark_equity = benchmark.mean(axis=0)
+        self.benchmark_returns = benchmark_equity[1:] / benchmark_equity[:-1] - 1.0
+
+    @classmethod
+    def from_store(
+        cls,
+        store: Any,
+        symbols: List[str],
+        start: Any = None,
+        end: Any = None,
+        **kwargs: Any
+    ) -> "Backtester":
+        """Build from a local MarketDataStore, aligned on dates every symbol traded."""
+        frames = [store.read(symbol, start=start, end=end) for symbol in symbols]
+        rows = _common_date_rows(frames)
+        prices = np.array([frame.close[idx] for frame, idx in zip(frames, rows)])
+        volumes = np.array([frame.volume[idx] for frame, idx in zip(frames, rows)])
+        return cls(symbols, prices, volumes, **kwargs)
+
+    # ---------- indicator components ----------
+
+    def indicator_components(self) -> "np.ndarray":
+        """
+        (4, rebalance dates, assets) indicator scores, in INDICATORS order.
+        Volatility uses the realized annualized volatility of each window.
+        """
+        if self._components is None:
+            windows = np.lib.stride_tricks.sliding_window_view(self.prices, self.lookback, axis=1)
+            volume_windows = np.lib.stride_tricks.sliding_window_view(self.volumes, self.lookback, axis=1)
+            offsets = self.rebalance_dates - self.start
+            n_assets, n_dates = len(self.symbols), len(offsets)
+
+            price_rows = windows[:, offsets, :].transpose(1, 0, 2).reshape(n_dates * n_assets, self.lookback)
+            volume_rows = volume_windows[:, offsets, :].transpose(1, 0, 2).reshape(n_dates * n_assets, self.lookback)
+
+            log_returns = np.diff(np.log(price_rows), axis=1)
+            realized_vol = log_returns.std(axis=1, ddof=1) * math.sqrt(self.periods_per_year)
+            volatility = np.where(realized_vol > 0.5, -0.3, np.where(realized_vol > 0.3, 0.0, 0.2))
+
+            self._components = np.stack([
+                MarketSignalProcessor._momentum_batch(price_rows),
+                MarketSignalProcessor._trend_batch(price_rows),
+                volatility,
+                MarketSignalProcessor._sentiment_batch(volume_rows),
+            ]).reshape(len(self.INDICATORS), n_dates, n_assets)
+        return self._components
+
+    def signal_targets(self, weight_sets: Any, entry_threshold: float = 0.3) -> "np.ndarray":
+        """
+        (strategies, rebalance dates, assets) target weights of the signal policy:
+        hold assets whose composite score exceeds entry_threshold (BUY or better),
+        weighted by score; cash when nothing qualifies.
+        """
+        weights = np.asarray(weight_sets, dtype=np.float64).reshape(-1, len(self.INDICATORS))
+        composite = np.einsum("sc,ckn->skn", weights, self.indicator_components())
+        scores = np.where(composite > entry_threshold, composite, 0.0)
+        totals = scores.sum(axis=2, keepdims=True)
+        return np.divide(scores, totals, out=np.zeros_like(scores), where=totals > 0)
+
+    # ---------- simulation ----------
+
+    def simulate(self, targets: Any) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Replay target weights (strategies x rebalance dates x assets).
+        Returns: (equity curves relative to 1.0, turnover, transaction costs) per strategy.
+        """
+        targets = np.asarray(targets, dtype=np.float64)
+        n_strategies = targets.shape[0]
+        n_periods = self.prices.shape[1]
+
+        equity = np.empty((n_strategies, n_periods - self.start))
+        equity[:, 0] = 1.0
+        value = np.ones(n_strategies)
+        holdings = np.zeros((n_strategies, len(self.symbols)))
+        turnover = np.zeros(n_strategies)
+        costs = np.zeros(n_strategies)
+
+        dates = self.rebalance_dates.tolist()
+        for k, t in enumerate(dates):
+            end = dates[k + 1] if k + 1 < len(dates) else n_periods - 1
+            target = targets[:, k, :]
+            traded = np.abs(target - holdings).sum(axis=1)
+            cost = self.transaction_cost * traded
+            turnover += traded
+            costs += cost
+            value = value * (1.0 - cost)
+            if k > 0:
+                # Costs land in the return of the period ending at the rebalance
+                equity[:, t - self.start] = value
+
+            # Price relatives since the rebalance: holdings drift, cash stays flat
+            growth = self.prices[:, t + 1:end + 1] / self.prices[:, t][:, None]
+            cash = 1.0 - target.sum(axis=1)
+            path = target @ growth + cash[:, None]
+            equity[:, t + 1 - self.start:end + 1 - self.start] = value[:, None] * path
+
+            drifted = target * growth[:, -1]
+            holdings = drifted / path[:, -1][:, None]
+            value = value * path[:, -1]
+
+        return equity, turnover, costs
+
+    # ---------- metrics ----------
+
+    def batch_metrics(self, returns: Any) -> Dict[str, "np.ndarray"]:
+        """
+        Row-wise risk metrics for (strategies x periods) returns.
+        Same definitions as QuantitativeAnalysis with a per-period risk-free
+        rate, ratios annualized by sqrt(periods_per_year).
+        """
+        r = np.atleast_2d(np.asarray(returns, dtype=np.float64))
+        n = r.shape[1]
+        scale = math.sqrt(self.periods_per_year)
+        rf = self.risk_free_rate / self.periods_per_year
+
+        mean = r.mean(axis=1)
+        std = r.std(axis=1, ddof=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0, (mean - rf) / std, 0.0) * scale
+
+            # Sortino: std of the returns below 0 (calculate_sortino_ratio)
+            downside = r < 0
+            d_count = downside.sum(axis=1)
+            d_sum = np.where(downside, r, 0.0).sum(axis=1)
+            d_sq = np.where(downside, r * r, 0.0).sum(axis=1)
+            d_var = np.where(d_count > 1, (d_sq - d_sum * d_sum / np.maximum(d_count, 1)) / (d_count - 1), 0.0)
+            d_std = np.sqrt(np.clip(d_var, 0.0, None))
+            excess = mean - rf
+            sortino = np.where(
+                d_count == 0,
+                np.where(excess > 0, excess / 0.001, 0.0),
+                np.where(d_std > 0, excess / d_std, 0.0)
+            ) * scale
+
+            active = r - self.benchmark_returns[None, :n]
+            tracking = active.std(axis=1, ddof=1)
+            information = np.where(tracking > 0, active.mean(axis=1) / tracking, 0.0) * scale
+
+        # Historical VaR / CVaR (calculate_var_95 / calculate_cvar)
+        index = int(n * 0.05)
+        var_95 = np.abs(np.partition(r, index, axis=1)[:, index])
+        tail = r <= -var_95[:, None]
+        tail_count = tail.sum(axis=1)
+        cvar = np.where(
+            tail_count > 0,
+            np.where(tail, np.abs(r), 0.0).sum(axis=1) / np.maximum(tail_count, 1),
+            var_95
+        )
+
+        equity = np.concatenate([np.ones((r.shape[0], 1)), np.cumprod(1.0 + r, axis=1)], axis=1)
+        peaks = np.maximum.accumulate(equity, axis=1)
+        max_drawdown = ((peaks - equity) / peaks).max(axis=1)
+
+        return {
+            "sharpe_ratio": sharpe,
+            "sortino_ratio": sortino,
+            "information_ratio": information,
+            "value_at_risk": var_95,
+            "conditional_var": cvar,
+            "max_drawdown": max_drawdown,
+            "volatility": std * scale,
+            "total_return": equity[:, -1] - 1.0,
+            "annual_return": equity[:, -1] ** (self.periods_per_year / n) - 1.0,
+        }
+
+    def _results(
+        self,
+        equity: "np.ndarray",
+        turnover: "np.ndarray",
+        costs: "np.ndarray",
+        parameters: List[Dict[str, float]]
+    ) -> List[BacktestResult]:
+        returns = equity[:, 1:] / equity[:, :-1] - 1.0
+        metrics = self.batch_metrics(returns)
+        avg_corr = ArrayBackend.upper_triangle_mean(
+            np.corrcoef(self.prices[:, self.start + 1:] / self.prices[:, self.start:-1] - 1.0)
+        ) if len(self.symbols) > 1 else 0.0
+
+        results = []
+        for i, params in enumerate(parameters):
+            results.append(BacktestResult(
+                equity_curve=equity[i] * self.initial_capital,
+                returns=returns[i],
+                risk_metrics=RiskMetrics(
+                    value_at_risk=float(metrics["value_at_risk"][i]),
+                    conditional_var=float(metrics["conditional_var"][i]),
+                    sharpe_ratio=float(metrics["sharpe_ratio"][i]),
+                    sortino_ratio=float(metrics["sortino_ratio"][i]),
+                    max_drawdown=float(metrics["max_drawdown"][i]),
+                    beta=float(metrics["volatility"][i]),
+                    correlation_avg=avg_corr
+                ),
+                total_return=float(metrics["total_return"][i]),
+                annual_return=float(metrics["annual_return"][i]),
+                information_ratio=float(metrics["information_ratio"][i]),
+                turnover=float(turnover[i]),
+                transaction_costs=float(costs[i]),
+                parameters=params
+            ))
+        return results
+
+    # ---------- policies ----------
+
+    def run(self, policy: Any) -> BacktestResult:
+        """
+        Backtest a policy callable: policy(t, price_window, volume_window)
+        -> target weights (array in symbol order, or {symbol: weight}).
+        Windows are the last `lookback` bars up to and including period t.
+        """
+        targets = np.zeros((1, len(self.rebalance_dates), len(self.symbols)))
+        for k, t in enumerate(self.rebalance_dates.tolist()):
+            window = slice(t - self.lookback + 1, t + 1)
+            weights = policy(t, self.prices[:, window], self.volumes[:, window])
+            if isinstance(weights, dict):
+                weights = [weights.get(symbol, 0.0) for symbol in self.symbols]
+            targets[0, k] = weights
+        return self._results(*self.simulate(targets), [{}])[0]
+
+    def run_signals(
+        self,
+        indicator_weights: Optional[Dict[str, float]] = None,
+        entry_threshold: float = 0.3
+    ) -> BacktestResult:
+        """Backtest the signal policy for one set of indicator weights."""
+        weights = indicator_weights or MarketSignalProcessor().indicator_weights
+        return self.sweep([weights], entry_threshold=entry_threshold, max_workers=1)[0]
+
+    @staticmethod
+    def dual_quant_policy(assets: List[Asset], processor: Optional[MarketSignalProcessor] = None) -> Any:
+        """Policy callable replaying DualQuantSystem allocations on rolling signals."""
+        processor = processor or MarketSignalProcessor()
+        dual_quant = DualQuantSystem()
+
+        def policy(t: int, prices: "np.ndarray", volumes: "np.ndarray") -> Dict[str, float]:
+            signals = processor.generate_signals_batch(assets, prices, volumes)
+            processor.signal_history.clear()
+            return dual_quant.generate_allocation(assets, signals)
+
+        return policy
+
+    # ---------- parameter sweeps ----------
+
+    @staticmethod
+    def indicator_weight_grid(step: float = 0.1) -> List[Dict[str, float]]:
+        """All indicator_weights on a simplex grid (non-negative, summing to 1)."""
+        units = int(round(1.0 / step))
+        grid = []
+        for m in range(units + 1):
+            for t in range(units + 1 - m):
+                for v in range(units + 1 - m - t):
+                    s = units - m - t - v
+                    grid.append({
+                        "momentum": m / units, "trend": t / units,
+                        "volatility": v / units, "sentiment": s / units
+                    })
+        return grid
+
+    def _simulate_weight_sets(self, weight_sets: "np.ndarray", entry_threshold: float) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        return self.simulate(self.signal_targets(weight_sets, entry_threshold))
+
+    def sweep(
+        self,
+        weight_grid: List[Dict[str, float]],
+        entry_threshold: float = 0.3,
+        max_workers: Optional[int] = None,
+        chunk_elements: int = 2_000_000,
+        process_threshold: int = 5_000_000
+    ) -> List[BacktestResult]:
+        """
+        Backtest the signal policy for every indicator_weights candidate.
+        Candidates are simulated in chunks of ~chunk_elements (strategy x
+        date x asset) cells; large sweeps spread chunks over processes.
+        Results are returned in input order.
+        """
+        weight_sets = np.array([[w.get(name, 0.0) for name in self.INDICATORS] for w in weight_grid])
+        self.indicator_components()  # computed once, shipped to workers with the backtester
+
+        cells = len(self.rebalance_dates) * len(self.symbols)
+        per_chunk = max(1, chunk_elements // max(cells, 1))
+        chunks = [weight_sets[i:i + per_chunk] for i in range(0, len(weight_sets), per_chunk)]
+        workers = max_workers or os.cpu_count() or 1
+
+        if len(chunks) > 1 and workers > 1 and len(weight_sets) * cells >= process_threshold:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                parts = list(pool.map(_backtest_chunk, [self] * len(chunks), chunks, [entry_threshold] * len(chunks)))
+        else:
+            parts = [self._simulate_weight_sets(chunk, entry_threshold) for chunk in chunks]
+
+        equity = np.concatenate([p[0] for p in parts])
+        turnover = np.concatenate([p[1] for p in parts])
+        costs = np.concatenate([p[2] for p in parts])
+        return self._results(equity, turnover, costs, [dict(w) for w in weight_grid])
+
+
+def _backtest_chunk(
+    backtester: Backtester,
+    weight_sets: "np.ndarray",
+    entry_threshold: float
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Worker entry point (module level so it pickles)."""
+    return backtester._simulate_weight_sets(weight_sets, entry_threshold)
+
+
 # ============================================================================
 # MAIN QUANT CARTRIDGE ENGINE
 # ============================================================================
@@ -710,8 +1982,14 @@ class QuantCartridge:
     - Performance attribution
     """
     
-    def __init__(self, initial_capital: float = 100000.0) -> None:
-        """Initialize QuantCartridge."""
+    def __init__(self, initial_capital: float = 100000.0, market_store: Any = None) -> None:
+        """
+        Initialize QuantCartridge.
+        
+        market_store: optional OHLCV store (utilities.market_data_store.MarketDataStore).
+        When every registered asset has stored bars, signals and covariance use
+        real history instead of synthetic GBM paths.
+        """
         self.portfolio_manager = PortfolioManager()
         self.portfolio_manager.cash_balance = initial_capital
         
@@ -724,22 +2002,150 @@ class QuantCartridge:
         self.daily_returns: List[float] = []
         self.performance_log: List[Dict[str, Any]] = []
         
+        # Returns-based covariance (None = volatility-based estimate)
+        self.covariance_engine: Optional[CovarianceEngine] = None
+        # (store version, symbols) the engine was fitted from market_store with (None = explicit history)
+        self._store_covariance_key: Optional[Tuple[int, Tuple[str, ...]]] = None
+        
+        self.market_store = market_store
+        
+        # Covariance-based optimizer (keeps warm-start state between calls)
+        self.optimizer: Optional[PortfolioOptimizer] = PortfolioOptimizer() if NUMPY_AVAILABLE else None
+        self.last_optimization: Optional[OptimizationResult] = None
+        
+        # Market snapshot: bumped on any asset change, keys the signal cache
+        self._snapshot_version = 0
+        self._signal_cache: Optional[Tuple[Any, Dict[str, MarketSignal]]] = None
+        
         self.version = "2.0.0"
         self.created_at = datetime.now()
     
     def register_asset(self, asset: Asset) -> None:
         """Register an asset."""
         self.assets[asset.symbol] = asset
+        self.invalidate_market_snapshot()
     
     def register_assets_batch(self, assets: List[Asset]) -> None:
         """Register multiple assets."""
         for asset in assets:
             self.register_asset(asset)
     
-    def analyze_market(self) -> Dict[str, MarketSignal]:
+    def load_returns_history(
+        self,
+        returns_by_symbol: Dict[str, List[float]],
+        halflife: Optional[float] = None,
+        shrinkage: bool = True
+    ) -> CovarianceEngine:
+        """
+        Fit the covariance engine from per-symbol daily returns.
+        Series are aligned on their most recent common length.
+        """
+        symbols = list(returns_by_symbol)
+        length = min((len(series) for series in returns_by_symbol.values()), default=0)
+        matrix = np.array(
+            [returns_by_symbol[symbol][len(returns_by_symbol[symbol]) - length:] for symbol in symbols],
+            dtype=np.float64
+        ).reshape(len(symbols), length).T
+        
+        self.covariance_engine = CovarianceEngine(symbols, halflife=halflife, shrinkage=shrinkage)
+        self.covariance_engine.fit(matrix)
+        self._store_covariance_key = None
+        return self.covariance_engine
+    
+    def update_returns(self, day_returns: Dict[str, float]) -> None:
+        """Append one day of per-symbol returns (incremental covariance update)."""
+        if self.covariance_engine is None:
+            raise ValueError("No returns history loaded; call load_returns_history() first")
+        self.covariance_engine.update_from_dict(day_returns)
+    
+    def load_returns_from_store(
+        self,
+        days: int = 252,
+        halflife: Optional[float] = None,
+        shrinkage: bool = True
+    ) -> CovarianceEngine:
+        """
+        Fit the covariance engine from close-to-close returns in market_store.
+        Closes are aligned on the dates every symbol traded (markets with
+        different holidays), so each row is one calendar date for all symbols.
+        """
+        if self.market_store is None:
+            raise ValueError("No market_store configured")
+        
+        symbols = list(self.assets)
+        frames = [self.market_store.read(symbol) for symbol in symbols]
+        rows = _common_date_rows(frames, last_n=days + 1)
+        returns_by_symbol = {}
+        for symbol, frame, idx in zip(symbols, frames, rows):
+            closes = np.asarray(frame.close)[idx]
+            returns_by_symbol[symbol] = (np.diff(closes) / closes[:-1]).tolist() if len(closes) > 1 else []
+        
+        engine = self.load_returns_history(returns_by_symbol, halflife=halflife, shrinkage=shrinkage)
+        self._store_covariance_key = (getattr(self.market_store, "version", 0), tuple(symbols))
+        return engine
+    
+    def _refresh_store_covariance(self, symbols: List[str]) -> None:
+        """
+        Fit the covariance engine from market_store when every symbol has stored
+        history and the engine is missing, does not cover symbols, or was fitted
+        from an older store version. Explicitly loaded returns that cover symbols are kept.
+        """
+        if self.market_store is None or not NUMPY_AVAILABLE or not symbols:
+            return
+        engine = self.covariance_engine
+        key = (getattr(self.market_store, "version", 0), tuple(self.assets))
+        if engine is not None and engine.covers(symbols) and self._store_covariance_key in (None, key):
+            return
+        if all(self.market_store.has(symbol, 3) for symbol in symbols):
+            self.load_returns_from_store()
+    
+    def _snapshot_key(self) -> Tuple[int, int]:
+        store_version = getattr(self.market_store, "version", 0) if self.market_store is not None else 0
+        return (self._snapshot_version, store_version)
+    
+    def _stored_market_matrices(
+        self,
+        assets: List[Asset],
+        days: int = 60
+    ) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        """(assets x periods) close/volume matrices from market_store, aligned on common dates."""
+        if self.market_store is None or not all(self.market_store.has(a.symbol, 2) for a in assets):
+            return None
+        
+        frames = [self.market_store.read(asset.symbol) for asset in assets]
+        rows = _common_date_rows(frames, last_n=days)
+        if len(rows[0]) < 2:
+            return None
+        prices = np.array([np.asarray(frame.close)[idx] for frame, idx in zip(frames, rows)])
+        volumes = np.array([np.asarray(frame.volume)[idx] for frame, idx in zip(frames, rows)])
+        return prices, volumes
+    
+    def invalidate_market_snapshot(self) -> None:
+        """Start a new market snapshot (cached signals are regenerated)."""
+        self._snapshot_version += 1
+        self._signal_cache = None
+    
+    def analyze_market(self, refresh: bool = False) -> Dict[str, MarketSignal]:
         """
         Analyze all assets and generate trading signals.
+        Memoized per market snapshot: repeated calls (allocation, performance
+        report) reuse the same signals until assets change or refresh=True.
         """
+        snapshot = self._snapshot_key()
+        if not refresh and self._signal_cache is not None:
+            version, cached = self._signal_cache
+            if version == snapshot:
+                return dict(cached)
+        
+        if NUMPY_AVAILABLE and self.assets:
+            assets = list(self.assets.values())
+            matrices = self._stored_market_matrices(assets, days=60)
+            if matrices is None:
+                matrices = self._generate_market_matrices(assets, days=60)
+            signals = self.signal_processor.generate_signals_batch(assets, *matrices)
+            self._signal_cache = (snapshot, signals)
+            return dict(signals)
+        
         signals = {}
         
         for symbol, asset in self.assets.items():
@@ -753,7 +2159,8 @@ class QuantCartridge:
             )
             signals[symbol] = signal
         
-        return signals
+        self._signal_cache = (snapshot, signals)
+        return dict(signals)
     
     def calculate_risk_metrics(self) -> RiskMetrics:
         """
@@ -769,20 +2176,44 @@ class QuantCartridge:
         cumulative_returns = self._generate_cumulative_returns(returns)
         max_dd = QuantitativeAnalysis.calculate_max_drawdown(cumulative_returns)
         
-        # Correlation analysis
-        correlations = QuantitativeAnalysis.calculate_correlation_matrix(
-            list(self.assets.values())
-        )
-        
-        avg_corr = MathUtils.mean(list(correlations.values())) if correlations else 0.0
-        
-        # Portfolio volatility
+        assets = list(self.assets.values())
         weights = self.portfolio_manager.get_allocation()
-        portfolio_vol = QuantitativeAnalysis.calculate_portfolio_volatility(
-            weights,
-            list(self.assets.values()),
-            correlations
-        )
+        
+        symbols = [asset.symbol for asset in assets]
+        self._refresh_store_covariance(symbols)
+        
+        if self.covariance_engine is not None and self.covariance_engine.covers(symbols):
+            # Empirical path: covariance estimated from observed returns
+            covariance = self.covariance_engine.subset_covariance(symbols)
+            std = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr = np.nan_to_num(covariance / np.outer(std, std))
+            avg_corr = ArrayBackend.upper_triangle_mean(corr)
+            portfolio_vol = ArrayBackend.portfolio_volatility(
+                [weights.get(symbol, 0) for symbol in symbols], covariance
+            )
+        elif use_vectorized(len(assets)):
+            # Array path: no pairwise dict, Σ built once and reduced with BLAS
+            corr = ArrayBackend.correlation_array(assets)
+            avg_corr = ArrayBackend.upper_triangle_mean(corr)
+            covariance = ArrayBackend.covariance_from_correlation(
+                [asset.volatility for asset in assets], corr
+            )
+            portfolio_vol = ArrayBackend.portfolio_volatility(
+                [weights.get(asset.symbol, 0) for asset in assets], covariance
+            )
+        else:
+            # Correlation analysis
+            correlations = QuantitativeAnalysis.calculate_correlation_matrix(assets)
+            
+            avg_corr = MathUtils.mean(list(correlations.values())) if correlations else 0.0
+            
+            # Portfolio volatility
+            portfolio_vol = QuantitativeAnalysis.calculate_portfolio_volatility(
+                weights,
+                assets,
+                correlations
+            )
         
         self.risk_metrics = RiskMetrics(
             value_at_risk=var_95,
@@ -797,15 +2228,94 @@ class QuantCartridge:
         
         return self.risk_metrics
     
-    def generate_allocation(self) -> Dict[str, float]:
-        """Generate optimal allocation using Dual Quant."""
+    def create_backtester(self, start: Any = None, end: Any = None, **kwargs: Any) -> Backtester:
+        """Backtester over the stored history of the registered assets (offline)."""
+        if self.market_store is None:
+            raise ValueError("Backtesting needs a market_store with local history")
+        return Backtester.from_store(self.market_store, list(self.assets), start=start, end=end, **kwargs)
+    
+    # RiskMetrics fields that measure loss/risk (positive magnitudes, lower is better)
+    LOSS_METRICS = frozenset({"value_at_risk", "conditional_var", "max_drawdown", "beta"})
+    
+    def tune_indicator_weights(
+        self,
+        step: float = 0.1,
+        metric: str = "sharpe_ratio",
+        apply: bool = True,
+        **kwargs: Any
+    ) -> List[BacktestResult]:
+        """
+        Sweep indicator_weights over stored history and rank by a RiskMetrics
+        field (higher is better, except LOSS_METRICS where lower is better).
+        With apply=True the best weights replace signal_processor.indicator_weights.
+        Returns all candidates, best first.
+        """
+        backtester = self.create_backtester(**kwargs)
+        results = backtester.sweep(Backtester.indicator_weight_grid(step))
+        results.sort(key=lambda r: getattr(r.risk_metrics, metric), reverse=metric not in self.LOSS_METRICS)
+        if apply and results:
+            self.signal_processor.indicator_weights = dict(results[0].parameters)
+            self.invalidate_market_snapshot()
+        return results
+    
+    # Signal-implied Sharpe ratio used to turn composite scores into expected returns
+    SIGNAL_SHARPE = 0.5
+    
+    def generate_allocation(self, strategy: Optional[str] = None) -> Dict[str, float]:
+        """
+        Generate optimal allocation.
+        
+        strategy=None keeps the Dual Quant category weights; otherwise one of
+        PortfolioOptimizer.STRATEGIES ("min_variance", "max_sharpe",
+        "risk_parity") is solved on the asset covariance matrix.
+        """
         market_signals = self.analyze_market()
-        allocation = self.dual_quant.generate_allocation(
-            list(self.assets.values()),
-            market_signals
-        )
+        if strategy is None:
+            return self.dual_quant.generate_allocation(
+                list(self.assets.values()),
+                market_signals
+            )
         
-        return allocation
+        if self.optimizer is None:
+            raise ImportError("Covariance-based allocation requires numpy")
+        
+        symbols = list(self.assets)
+        covariance, expected_returns = self._allocation_inputs(symbols, market_signals)
+        self.last_optimization = self.optimizer.optimize(strategy, symbols, covariance, expected_returns)
+        return dict(self.last_optimization.weights)
+    
+    def efficient_frontier(self, points: int = 20) -> List[OptimizationResult]:
+        """Efficient frontier of the registered assets."""
+        if self.optimizer is None:
+            raise ImportError("Efficient frontier requires numpy")
+        symbols = list(self.assets)
+        covariance, expected_returns = self._allocation_inputs(symbols, self.analyze_market())
+        return self.optimizer.efficient_frontier(symbols, covariance, expected_returns, points)
+    
+    def _allocation_inputs(
+        self,
+        symbols: List[str],
+        market_signals: Dict[str, MarketSignal]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Annualized covariance and expected returns for the optimizer.
+        Empirical moments when the covariance engine covers every asset,
+        otherwise volatility/correlation estimates with signal-implied returns
+        (r_f + composite score × SIGNAL_SHARPE × σ).
+        """
+        if self.covariance_engine is not None and self.covariance_engine.covers(symbols):
+            engine = self.covariance_engine
+            idx = [engine.index[symbol] for symbol in symbols]
+            return engine.subset_covariance(symbols), engine.mean()[idx] * engine.annualization
+        
+        assets = [self.assets[symbol] for symbol in symbols]
+        vols = np.array([asset.volatility for asset in assets])
+        covariance = ArrayBackend.covariance_from_correlation(vols, ArrayBackend.correlation_array(assets))
+        scores = np.array([
+            market_signals[symbol].indicators.get("composite", 0.0) if symbol in market_signals else 0.0
+            for symbol in symbols
+        ])
+        return covariance, self.optimizer.risk_free_rate + scores * self.SIGNAL_SHARPE * vols
     
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate comprehensive performance report."""
@@ -862,6 +2372,28 @@ class QuantCartridge:
         
         return prices
     
+    @staticmethod
+    def _generate_market_matrices(
+        assets: List[Asset],
+        days: int = 60
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Synthetic (assets x days) price and volume matrices in one shot.
+        Same GBM / volume model as the per-asset helpers; seeded from the
+        `random` module so random.seed() still controls reproducibility.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        dt = 1 / 252
+        
+        vols = np.array([asset.volatility for asset in assets]) * math.sqrt(dt)
+        log_steps = rng.standard_normal((len(assets), max(days - 1, 0))) * vols[:, None]
+        log_paths = np.zeros((len(assets), max(days, 1)))
+        np.cumsum(log_steps, axis=1, out=log_paths[:, 1:])
+        prices = np.array([asset.current_price for asset in assets])[:, None] * np.exp(log_paths)
+        
+        volumes = 1000000.0 * (1 + rng.normal(0, 0.2, size=(len(assets), days)))
+        return prices, volumes
+    
     @staticmethod
     def _generate_volume_history(days: int = 60) -> List[float]:
         """Generate synthetic volume."""
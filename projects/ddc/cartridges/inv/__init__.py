@@ -1,8 +1,16 @@
 """
 SHawn-INV: Investment Cartridge
 Financial analysis and investment strategies
-"""
 
-from .cartridge import InvestmentCartridge
+InvestmentCartridge 는 bio/investment_cartridge_v2.InvestmentCartridgeV2 (지연 로드 -
+inv_interface 만 import 할 때 yfinance/분석 모듈을 로드하지 않음)
+"""
 
 __all__ = ['InvestmentCartridge']
+
+
+def __getattr__(name):
+    if name == 'InvestmentCartridge':
+        from ..bio.investment_cartridge_v2 import InvestmentCartridgeV2
+        return InvestmentCartridgeV2
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ Inv Cartridge Interface - 신피질과의 연결
 """
 
 from typing import Dict, Any, Optional, List
+import asyncio
 import os
 
 # neocortex 임포트
@@ -16,14 +17,127 @@ except ImportError:
     NEOCORTEX_AVAILABLE = False
     print("⚠️ Warning: neocortex 모듈을 찾을 수 없습니다.")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 공분산 기반 포트폴리오 최적화 (선택)
+try:
+    from projects.ddc.cartridges.bio.quant_cartridge.quant_cartridge import PortfolioOptimizer
+    OPTIMIZER_AVAILABLE = True
+except ImportError:
+    OPTIMIZER_AVAILABLE = False
+
 
 class InvCartridgeInterface:
     """Inv Cartridge Interface - neocortex와 협력"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, cartridge: Optional[Any] = None, optimizer: Optional[Any] = None):
+        """
+        초기화
+        
+        Args:
+            cartridge: 분석 데이터 제공자 (InvestmentCartridgeV2 - analyze_many/to_analysis_data)
+                       지정 시 비교/포트폴리오 메서드가 누락된 종목 분석을 analyze_many 로 직접 수집
+            optimizer: 포트폴리오 최적화기 (quant_cartridge.PortfolioOptimizer, 미지정 시 기본값)
+        """
         self.decision_framework = decision_framework if NEOCORTEX_AVAILABLE else None
         self.innovation_engine = innovation_engine if NEOCORTEX_AVAILABLE else None
+        self.cartridge = cartridge
+        if optimizer is None and OPTIMIZER_AVAILABLE:
+            optimizer = PortfolioOptimizer()
+        self.optimizer = optimizer
+    
+    async def collect_analyses(
+        self,
+        tickers: List[str],
+        analyses_data: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        분석 데이터 수집: 주어진 데이터가 없는 종목만 카트리지로 동시 분석
+        
+        Returns:
+            {ticker: analysis_data}
+        """
+        collected = dict(analyses_data or {})
+        missing = [t for t in tickers if t not in collected]
+        if missing and self.cartridge is not None:
+            results = await self.cartridge.analyze_many(missing)
+            for ticker, result in results.items():
+                collected[ticker] = self.cartridge.to_analysis_data(result)
+        return collected
+    
+    async def collect_returns(self, tickers: List[str]) -> Dict[str, List[float]]:
+        """
+        종목별 일간 수익률 (카트리지 일봉 이력, 분석 시 받은 스냅샷 재사용 - 추가 다운로드 없음)
+        휴장일이 다른 시장 (KRX/미국) 이 섞여도 같은 행이 같은 날짜가 되도록
+        모든 종목이 거래된 날짜의 종가만으로 수익률 계산
+        
+        Returns:
+            {ticker: 일간 수익률} (이력이 부족하거나 조회 실패한 종목 제외, 종목 간 길이 동일)
+        """
+        histories = await asyncio.gather(
+            *(self.cartridge.yahoo_api.get_history(t) for t in tickers), return_exceptions=True
+        )
+        valid = {
+            ticker: history for ticker, history in zip(tickers, histories)
+            if history is not None and not isinstance(history, Exception) and len(history) >= 3
+        }
+        if not valid:
+            return {}
+        
+        common = None
+        for history in valid.values():
+            common = history.dates if common is None else np.intersect1d(common, history.dates)
+        if len(common) < 3:
+            return {}
+        
+        returns_by_ticker = {}
+        for ticker, history in valid.items():
+            closes = np.asarray(history.close, dtype=np.float64)[np.searchsorted(history.dates, common)]
+            returns_by_ticker[ticker] = (closes[1:] / closes[:-1] - 1.0).tolist()
+        return returns_by_ticker
+    
+    async def _collect_inputs(
+        self,
+        tickers: List[str],
+        analyses_data: Optional[Dict[str, Dict[str, Any]]],
+        returns_by_ticker: Optional[Dict[str, List[float]]] = None,
+        with_returns: bool = False
+    ):
+        """누락된 분석 데이터 (+ 수익률) 수집 -> (analyses_data, returns_by_ticker)"""
+        collected = await self.collect_analyses(tickers, analyses_data)
+        if with_returns and returns_by_ticker is None and self._can_collect_returns():
+            returns_by_ticker = await self.collect_returns(tickers)
+        return collected, returns_by_ticker
+    
+    def _can_collect_returns(self) -> bool:
+        """카트리지 일봉 이력으로 수익률 계산 가능 여부 (최적화기가 있을 때만 필요)"""
+        return self.cartridge is not None and self.optimizer is not None and NUMPY_AVAILABLE
+    
+    def _collect_inputs_sync(
+        self,
+        tickers: List[str],
+        analyses_data: Optional[Dict[str, Dict[str, Any]]],
+        returns_by_ticker: Optional[Dict[str, List[float]]] = None,
+        with_returns: bool = False
+    ):
+        """
+        동기 메서드용 수집: 수집할 것이 있을 때만 새 이벤트 루프에서 analyze_many 실행
+        (이벤트 루프 안에서 호출 시 *_async 메서드를 사용해야 함)
+        """
+        analyses_data = analyses_data or {}
+        missing = self.cartridge is not None and any(t not in analyses_data for t in tickers)
+        if not missing and not (with_returns and returns_by_ticker is None and self._can_collect_returns()):
+            return analyses_data, returns_by_ticker
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._collect_inputs(tickers, analyses_data, returns_by_ticker, with_returns))
+        raise RuntimeError("이벤트 루프 안에서는 compare_multiple_stocks_async / portfolio_optimization_async 를 사용하세요")
     
     def analyze_stock_with_neocortex(
         self,
@@ -91,20 +205,28 @@ class InvCartridgeInterface:
     def compare_multiple_stocks(
         self,
         tickers: List[str],
-        analyses_data: Dict[str, Dict[str, Any]]
+        analyses_data: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         여러 종목 비교 분석 (Parietal 공간 통합)
         
         Args:
             tickers: 비교할 종목 코드 리스트
-            analyses_data: 각 종목의 분석 데이터
+            analyses_data: 각 종목의 분석 데이터 (누락 종목은 카트리지 analyze_many 로 동시 수집)
                 예: {'TSLA': {...}, 'NIO': {...}, '005930': {...}}
                 
         Returns:
             비교 분석 결과
         """
-        
+        analyses_data, _ = self._collect_inputs_sync(tickers, analyses_data)
+        return self._compare(tickers, analyses_data)
+    
+    def _compare(
+        self,
+        tickers: List[str],
+        analyses_data: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """수집된 분석 데이터로 종목별 신피질 분석 + 상대 비교"""
         results = []
         for ticker in tickers:
             print(f"\n📊 {ticker} 분석 중...")
@@ -135,7 +257,9 @@ class InvCartridgeInterface:
     def portfolio_optimization(
         self,
         holdings: Dict[str, float],
-        analyses_data: Dict[str, Dict[str, Any]]
+        analyses_data: Optional[Dict[str, Dict[str, Any]]] = None,
+        returns_by_ticker: Optional[Dict[str, List[float]]] = None,
+        strategy: str = "max_sharpe"
     ) -> Dict[str, Any]:
         """
         포트폴리오 최적화 (Prefrontal 의사결정 + Parietal 통합)
@@ -143,12 +267,27 @@ class InvCartridgeInterface:
         Args:
             holdings: 현재 보유 종목 및 비율
                 예: {'TSLA': 0.3, '005930': 0.3, 'NIO': 0.4}
-            analyses_data: 각 종목의 분석 데이터
+            analyses_data: 각 종목의 분석 데이터 (누락 종목은 카트리지 analyze_many 로 동시 수집)
+            returns_by_ticker: 종목별 일간 수익률 (지정 시 날짜 정렬된 수익률로 공분산 기반 최적 비중 산출,
+                               미지정 시 카트리지 일봉 이력의 공통 거래일로 계산)
+            strategy: min_variance / max_sharpe / risk_parity
             
         Returns:
             포트폴리오 재구성 추천
         """
-        
+        analyses_data, returns_by_ticker = self._collect_inputs_sync(
+            list(holdings), analyses_data, returns_by_ticker, with_returns=True
+        )
+        return self._optimize_portfolio(holdings, analyses_data, returns_by_ticker, strategy)
+    
+    def _optimize_portfolio(
+        self,
+        holdings: Dict[str, float],
+        analyses_data: Dict[str, Dict[str, Any]],
+        returns_by_ticker: Optional[Dict[str, List[float]]],
+        strategy: str
+    ) -> Dict[str, Any]:
+        """수집된 분석 데이터/수익률로 포트폴리오 최적화"""
         print("🧠 포트폴리오 최적화 시작")
         
         # Step 1: 각 종목 분석
@@ -188,8 +327,61 @@ class InvCartridgeInterface:
             except Exception as e:
                 print(f"⚠️ 포트폴리오 최적화 오류: {e}")
         
+        # Step 3: 공분산 기반 최적 비중
+        if self.optimizer is not None and returns_by_ticker and NUMPY_AVAILABLE:
+            try:
+                result['optimized_portfolio'] = self._optimize_weights(
+                    list(holdings), returns_by_ticker, strategy
+                )
+            except Exception as e:
+                print(f"⚠️ 비중 최적화 오류: {e}")
+        
         return result
     
+    def _optimize_weights(
+        self,
+        tickers: List[str],
+        returns_by_ticker: Dict[str, List[float]],
+        strategy: str
+    ) -> Dict[str, Any]:
+        """
+        일간 수익률 -> 공분산(Ledoit-Wolf) -> 최적 비중
+        수익률은 날짜 정렬된 것으로 가정 (collect_returns), 길이가 다르면 최근 공통 구간 사용
+        """
+        tickers = [t for t in tickers if len(returns_by_ticker.get(t, [])) >= 2]
+        length = min(len(returns_by_ticker[t]) for t in tickers)
+        matrix = np.array([returns_by_ticker[t][-length:] for t in tickers], dtype=np.float64).T
+        
+        optimized = self.optimizer.optimize_returns(strategy, tickers, matrix)
+        return {
+            'strategy': strategy,
+            'weights': optimized.weights,
+            'expected_return': optimized.expected_return,
+            'volatility': optimized.volatility,
+            'sharpe_ratio': optimized.sharpe_ratio
+        }
+    
+    async def compare_multiple_stocks_async(
+        self,
+        tickers: List[str],
+        analyses_data: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """여러 종목 비교 분석 (이벤트 루프 안에서 사용, 분석 데이터는 analyze_many 로 동시 수집)"""
+        collected, _ = await self._collect_inputs(tickers, analyses_data)
+        return self._compare(tickers, collected)
+    
+    async def portfolio_optimization_async(
+        self,
+        holdings: Dict[str, float],
+        analyses_data: Optional[Dict[str, Dict[str, Any]]] = None,
+        strategy: str = "max_sharpe"
+    ) -> Dict[str, Any]:
+        """포트폴리오 최적화 (이벤트 루프 안에서 사용, 분석 데이터/수익률은 카트리지에서 동시 수집)"""
+        collected, returns_by_ticker = await self._collect_inputs(
+            list(holdings), analyses_data, with_returns=True
+        )
+        return self._optimize_portfolio(holdings, collected, returns_by_ticker, strategy)
+    
     @staticmethod
     def _find_best_opportunity(comparative_analysis: Dict[str, Any]) -> Optional[str]:
         """최고의 투자 기회 찾기"""
@@ -2,7 +2,7 @@ import os
 import shutil
 import pytest
 from projects.ddc.brain.brain_core.limbic_system.working_memory import WorkingMemory
-from projects.ddc.brain.brain_core.limbic_system.limbic_coordinator import LimbicCoordinator
+from projects.ddc.brain.brain_core.limbic_system.limbic_coordinator import LimbicCoordinator, LimbicCoordinatorPool
 
 def test_working_memory_persistence():
     user_id = "test_bot_1"
@@ -54,5 +54,21 @@ async def test_limbic_coordinator_context():
     storage_dir = os.path.expanduser(f"~/.openclaw/memory/{user_id}")
     shutil.rmtree(storage_dir)
 
+def test_coordinator_pool_reuse_and_lru():
+    pool = LimbicCoordinatorPool(max_size=2)
+    a = pool.get("test_pool_a")
+    assert pool.get("test_pool_a") is a
+    
+    b = pool.get("test_pool_b")
+    # 두 사용자 모두 같은 프로세스 전역 해마를 공유
+    assert a.hippocampus is b.hippocampus
+    
+    pool.get("test_pool_a")  # a를 최근 사용으로 갱신
+    pool.get("test_pool_c")  # b가 제거되어야 함
+    assert len(pool) == 2
+    assert pool.get("test_pool_a") is a
+    assert pool.get("test_pool_b") is not b
+    assert pool.get_stats()["hits"] == 3
+
 if __name__ == "__main__":
     pytest.main([__file__])
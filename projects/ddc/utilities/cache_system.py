@@ -4,14 +4,21 @@
 역할:
 - Multi-level 캐싱 (Memory, Redis, Pinecone)
 - API 응답 캐싱
+- 내용 주소 기반 영속 캐시 (이미지 내용 해시 + 분석기 버전 키, 디스크 LRU)
 - 신경계 신호 캐싱
 - 카트리지 결과 캐싱
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union, Tuple
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from pathlib import Path
+import asyncio
 import json
 import hashlib
+import os
+import sqlite3
+import threading
 from functools import wraps
 import time
 
@@ -106,29 +113,184 @@ class CacheManager:
         }
 
 
+class ContentAddressedCache:
+    """
+    내용 주소 기반 영속 캐시 (sqlite 단일 파일, 용량 기준 LRU 제거)
+    
+    - 키 = 네임스페이스 + 분석기 버전 + 입력 내용 SHA-256 (경로/파일명과 무관)
+    - 값은 JSON 직렬화 가능한 객체
+    - 프로세스 재시작 후에도 유지, 여러 스레드에서 안전
+    """
+    
+    HASH_CHUNK = 1024 * 1024
+    
+    def __init__(self, path: Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self._digests: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()  # (경로, mtime, 크기) -> 해시
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._conn.commit()
+    
+    def content_hash(self, source: Union[str, Path, bytes]) -> str:
+        """파일/바이트 내용 SHA-256 (같은 파일은 mtime/크기가 같으면 재해시 생략)"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(source).hexdigest()
+        
+        stat = os.stat(source)
+        memo_key = (os.path.abspath(source), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+            if digest is not None:
+                self._digests.move_to_end(memo_key)
+                return digest
+        
+        sha = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        with self._lock:
+            self._digests[memo_key] = digest
+            while len(self._digests) > 4096:
+                self._digests.popitem(last=False)
+        return digest
+    
+    @staticmethod
+    def make_key(namespace: str, version: str, digest: str) -> str:
+        return f"{namespace}:{version}:{digest}"
+    
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
+        """조회 (ttl 초 지정 시 만료 항목은 없는 것으로 처리)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or (ttl is not None and now - row[1] > ttl):
+                self.stats['misses'] += 1
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.stats['hits'] += 1
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Any) -> None:
+        """저장 후 용량 초과 시 가장 오래 사용하지 않은 항목부터 제거"""
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload.encode()), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.stats['evictions'] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            'hits': self.stats['hits'],
+            'misses': self.stats['misses'],
+            'hit_rate': round(self.stats['hits'] / lookups * 100, 2) if lookups else 0,
+            'evictions': self.stats['evictions'],
+            'total_size_mb': round(total / 1024 / 1024, 2),
+            'cached_items': count
+        }
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_content_cache: Optional[ContentAddressedCache] = None
+
+
+def get_content_cache() -> ContentAddressedCache:
+    """영속 캐시 싱글톤 (DDC_CACHE_DIR, 기본 ~/.cache/ddc)"""
+    global _content_cache
+    if _content_cache is None:
+        root = Path(os.getenv('DDC_CACHE_DIR', Path.home() / '.cache' / 'ddc'))
+        _content_cache = ContentAddressedCache(root / 'content_cache.sqlite3')
+    return _content_cache
+
+
 class APIResponseCache:
     """API 응답 캐싱"""
     
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: CacheManager, content_cache: Optional[ContentAddressedCache] = None):
         self.cache = cache_manager
+        self._content_cache = content_cache
     
-    def cache_bio_analysis(self, image_path: str, ttl: int = 3600):
-        """Bio 분석 결과 캐싱 데코레이터"""
+    @property
+    def content_cache(self) -> ContentAddressedCache:
+        if self._content_cache is None:
+            self._content_cache = get_content_cache()
+        return self._content_cache
+    
+    def cache_bio_analysis(self, version: str, ttl: Optional[int] = None):
+        """
+        Bio 분석 결과 캐싱 데코레이터 (이미지 내용 해시 + 분석기 버전 키, 디스크 영속)
+        
+        감싼 함수는 image_path 를 키워드 또는 첫 번째 문자열/경로 인자로 받고
+        JSON 직렬화 가능한 결과를 반환해야 함 (동기/비동기 함수 모두 지원)
+        """
         def decorator(func):
+            def lookup(args, kwargs):
+                image_path = kwargs.get('image_path')
+                if image_path is None:
+                    image_path = next(a for a in args if isinstance(a, (str, os.PathLike)))
+                key = self.content_cache.make_key('bio', version, self.content_cache.content_hash(image_path))
+                return key, self.content_cache.get(key, ttl)
+            
+            if asyncio.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    key, cached = lookup(args, kwargs)
+                    if cached is not None:
+                        return cached
+                    result = await func(*args, **kwargs)
+                    self.content_cache.set(key, result)
+                    return result
+                return async_wrapper
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
-                key = self.cache._generate_key('bio', image_path, *args, **kwargs)
-                
-                # 캐시 확인
-                cached = self.cache.get(key, ttl)
+                key, cached = lookup(args, kwargs)
                 if cached is not None:
                     return cached
-                
-                # 함수 실행
                 result = func(*args, **kwargs)
-                
-                # 결과 캐싱
-                self.cache.set(key, result, ttl)
+                self.content_cache.set(key, result)
                 return result
             
             return wrapper
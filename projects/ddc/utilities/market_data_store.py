@@ -0,0 +1,298 @@
+"""
+시장 데이터 저장소 - 컬럼형 OHLCV 시계열 스토어
+
+역할:
+- 종목별 컬럼 파일(date/open/high/low/close/volume)을 append-only로 저장
+- np.memmap 기반 구간 조회 (전체 로드 없이 필요한 범위만 슬라이스)
+- 증분 동기화: 이미 저장된 마지막 날짜 이후의 봉만 원격에서 가져옴
+- 오프라인 픽스처 로더 (yfinance CSV 형식) - 테스트/오프라인 분석용
+"""
+
+from typing import Dict, Any, List, Optional, Callable, Mapping, Union
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+import csv
+import json
+import threading
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    """날짜 값 -> datetime64[D]"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+@dataclass
+class OHLCVFrame:
+    """OHLCV 구간 (각 컬럼은 같은 길이의 1차원 배열, 날짜 오름차순)"""
+    symbol: str
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def tail(self, n: int) -> "OHLCVFrame":
+        """마지막 n개 봉"""
+        start = max(len(self) - n, 0)
+        return OHLCVFrame(
+            self.symbol, self.dates[start:],
+            *(getattr(self, col)[start:] for col in COLUMNS)
+        )
+
+    @classmethod
+    def from_columns(cls, symbol: str, columns: Mapping[str, Any]) -> "OHLCVFrame":
+        """{'date': [...], 'open': [...], ...} -> OHLCVFrame"""
+        dates = np.array([to_day(d) for d in columns["date"]], dtype="datetime64[D]")
+        return cls(
+            symbol, dates,
+            *(np.asarray(columns[col], dtype=np.float64) for col in COLUMNS)
+        )
+
+
+class MarketDataStore:
+    """
+    컬럼형 OHLCV 스토어
+
+    디렉터리 구조:
+        root/<SYMBOL>/date.bin   (int64, 1970-01-01 기준 일수, <SYMBOL> 은 퍼센트 인코딩 - 예: BRK/B -> BRK%2FB)
+        root/<SYMBOL>/<col>.bin  (float64: open/high/low/close/volume)
+        root/<SYMBOL>/meta.json  (rows, last_sync) - rows 갱신이 커밋 지점
+
+    Usage:
+        store = MarketDataStore("data/market")
+        store.sync("AAPL", fetcher)           # 최초 1년치, 이후엔 신규 봉만
+        frame = store.read("AAPL", start="2025-01-01")
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.version = 0                     # append 발생 시 증가 (파생 캐시 무효화용)
+        self._lock = threading.Lock()
+        self._views: Dict[str, Dict[str, np.ndarray]] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # 경로 / 메타데이터
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode_symbol(symbol: str) -> str:
+        """종목 코드 -> 디렉터리 이름 (퍼센트 인코딩, 가역 - 서로 다른 종목이 같은 디렉터리로 겹치지 않음)"""
+        name = quote(symbol, safe="")
+        if name.startswith("."):
+            name = "%2E" + name[1:]          # "." / ".." 등 특수 경로 방지
+        return name
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.root / self._encode_symbol(symbol)
+
+    def _load_meta(self, symbol: str) -> Dict[str, Any]:
+        if symbol not in self._meta:
+            path = self._symbol_dir(symbol) / "meta.json"
+            if path.exists():
+                self._meta[symbol] = json.loads(path.read_text(encoding="utf-8"))
+            else:
+                self._meta[symbol] = {"rows": 0, "last_sync": None}
+        return self._meta[symbol]
+
+    def _save_meta(self, symbol: str, meta: Dict[str, Any]) -> None:
+        path = self._symbol_dir(symbol) / "meta.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(path)
+        self._meta[symbol] = meta
+
+    def symbols(self) -> List[str]:
+        """저장된 종목 목록 (디렉터리 이름을 복호화한 원래 종목 코드)"""
+        return sorted(unquote(p.name) for p in self.root.iterdir() if (p / "meta.json").exists())
+
+    def row_count(self, symbol: str) -> int:
+        return self._load_meta(symbol)["rows"]
+
+    def has(self, symbol: str, min_rows: int = 1) -> bool:
+        return self.row_count(symbol) >= min_rows
+
+    def last_date(self, symbol: str) -> Optional[np.datetime64]:
+        rows = self.row_count(symbol)
+        if rows == 0:
+            return None
+        return self._columns(symbol)["date"][rows - 1].astype("datetime64[D]")
+
+    # ------------------------------------------------------------------
+    # 쓰기 (append-only)
+    # ------------------------------------------------------------------
+
+    def append(self, symbol: str, columns: Mapping[str, Any]) -> int:
+        """
+        봉 추가 (날짜 오름차순 정렬, 마지막 저장 날짜 이하 봉은 무시 -> 재실행해도 안전)
+        Returns: 실제로 추가된 봉 수
+        """
+        frame = columns if isinstance(columns, OHLCVFrame) else OHLCVFrame.from_columns(symbol, columns)
+        order = np.argsort(frame.dates, kind="stable")
+        dates = frame.dates[order]
+
+        with self._lock:
+            meta = self._load_meta(symbol)
+            rows = meta["rows"]
+            last = self.last_date(symbol)
+            keep = np.ones(len(dates), dtype=bool)
+            if last is not None:
+                keep &= dates > last
+            # 같은 배치 내 중복 날짜는 마지막 값만 유지
+            if len(dates) > 1:
+                keep[:-1] &= dates[:-1] != dates[1:]
+            if not keep.any():
+                return 0
+
+            directory = self._symbol_dir(symbol)
+            directory.mkdir(parents=True, exist_ok=True)
+            data = {"date": dates[keep].astype(np.int64)}
+            for col in COLUMNS:
+                data[col] = getattr(frame, col)[order][keep].astype(np.float64)
+
+            for name, values in data.items():
+                path = directory / f"{name}.bin"
+                with open(path, "ab") as f:
+                    # 이전 실패로 남은 커밋되지 않은 꼬리 제거
+                    f.truncate(rows * 8)
+                    f.seek(rows * 8)
+                    f.write(np.ascontiguousarray(values).tobytes())
+
+            added = int(keep.sum())
+            self._save_meta(symbol, {**meta, "rows": rows + added})
+            self._views.pop(symbol, None)
+            self.version += 1
+            return added
+
+    def mark_synced(self, symbol: str, when: Optional[date] = None) -> None:
+        with self._lock:
+            meta = self._load_meta(symbol)
+            self._symbol_dir(symbol).mkdir(parents=True, exist_ok=True)
+            self._save_meta(symbol, {**meta, "last_sync": (when or date.today()).isoformat()})
+
+    # ------------------------------------------------------------------
+    # 읽기 (memmap 구간 조회)
+    # ------------------------------------------------------------------
+
+    def _columns(self, symbol: str) -> Dict[str, np.ndarray]:
+        views = self._views.get(symbol)
+        if views is None:
+            rows = self._load_meta(symbol)["rows"]
+            directory = self._symbol_dir(symbol)
+            views = {"date": np.memmap(directory / "date.bin", dtype=np.int64, mode="r", shape=(rows,))}
+            for col in COLUMNS:
+                views[col] = np.memmap(directory / f"{col}.bin", dtype=np.float64, mode="r", shape=(rows,))
+            self._views[symbol] = views
+        return views
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        last_n: Optional[int] = None
+    ) -> OHLCVFrame:
+        """
+        [start, end] 구간 (양끝 포함) 또는 마지막 last_n개 봉 조회
+        반환 배열은 memmap 뷰 (복사 없음, 읽기 전용)
+        """
+        rows = self.row_count(symbol)
+        if rows == 0:
+            empty = np.array([], dtype=np.float64)
+            return OHLCVFrame(symbol, np.array([], dtype="datetime64[D]"), *(empty,) * len(COLUMNS))
+
+        views = self._columns(symbol)
+        day_numbers = views["date"]
+        lo = 0 if start is None else int(np.searchsorted(day_numbers, to_day(start).astype(np.int64), "left"))
+        hi = rows if end is None else int(np.searchsorted(day_numbers, to_day(end).astype(np.int64), "right"))
+        if last_n is not None:
+            lo = max(lo, hi - last_n)
+
+        return OHLCVFrame(
+            symbol,
+            day_numbers[lo:hi].astype("datetime64[D]"),
+            *(views[col][lo:hi] for col in COLUMNS)
+        )
+
+    # ------------------------------------------------------------------
+    # 증분 동기화
+    # ------------------------------------------------------------------
+
+    def sync(
+        self,
+        symbol: str,
+        fetcher: Callable[[str, date], Mapping[str, Any]],
+        lookback_days: int = 365
+    ) -> int:
+        """
+        원격 데이터와 동기화
+        - 저장된 데이터 없음: lookback_days 전부터 전체 조회
+        - 오늘 이미 동기화됨: 조회 생략
+        - 그 외: 마지막 저장 날짜 다음 날부터의 신규 봉만 조회
+
+        fetcher(symbol, start_date) -> {'date': [...], 'open': [...], ...}
+        Returns: 추가된 봉 수
+        """
+        today = np.datetime64(date.today(), "D")
+        meta = self._load_meta(symbol)
+        last = self.last_date(symbol)
+
+        if last is None:
+            start = today - np.timedelta64(lookback_days, "D")
+        elif meta.get("last_sync") == str(today):
+            return 0
+        else:
+            start = last + np.timedelta64(1, "D")
+
+        added = 0
+        if start <= today:
+            columns = fetcher(symbol, start.astype(object))
+            if columns and len(columns.get("date", [])):
+                added = self.append(symbol, columns)
+        self.mark_synced(symbol, today.astype(object))
+        return added
+
+    # ------------------------------------------------------------------
+    # 오프라인 픽스처
+    # ------------------------------------------------------------------
+
+    def load_csv(self, symbol: str, path: Union[str, Path]) -> int:
+        """
+        yfinance/야후 CSV 형식 (Date,Open,High,Low,Close[,Adj Close],Volume) 로드
+        Returns: 추가된 봉 수
+        """
+        columns: Dict[str, List[Any]] = {"date": [], **{col: [] for col in COLUMNS}}
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                normalized = {k.strip().lower(): v for k, v in row.items() if k}
+                if not normalized.get("date") or not normalized.get("close"):
+                    continue
+                columns["date"].append(normalized["date"][:10])
+                for col in COLUMNS:
+                    # 가격 컬럼 누락 시 종가로 대체, 거래량 누락 시 0
+                    default = "0" if col == "volume" else normalized["close"]
+                    columns[col].append(float(normalized.get(col) or default))
+        return self.append(symbol, columns)
+
+    def load_fixture_dir(self, directory: Union[str, Path]) -> Dict[str, int]:
+        """디렉터리의 모든 <SYMBOL>.csv 로드 (파일명 = 종목 코드)"""
+        return {
+            path.stem: self.load_csv(path.stem, path)
+            for path in sorted(Path(directory).glob("*.csv"))
+        }
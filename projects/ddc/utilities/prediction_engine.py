@@ -2,7 +2,7 @@
 예측 & 시뮬레이션 엔진 - 미래 시나리오 분석
 
 역할:
-- 시계열 예측 (ARIMA, 지수평활)
+- 시계열 예측 (AR/ARIMA, Holt-Winters, 적합 모형 캐시)
 - 몬테카를로 시뮬레이션
 - 시나리오 분석
 - 의사결정 지원
@@ -10,8 +10,21 @@
 
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import math
+import os
 import statistics
 import random
+import struct
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 @dataclass
@@ -26,107 +39,721 @@ class Forecast:
     mae: float
 
 
+class ARModel:
+    """
+    AR(p) 모형 (d차 차분 포함, MA 항 없음)
+    
+    - Yule-Walker 방정식을 Levinson-Durbin 재귀로 풀이 (차수 1..K 계수를 한 번에)
+    - 자기공분산은 누적합(Σx, Σx_t·x_{t+k})으로 유지 -> 새 관측치 추가 시 O(K) 갱신 후 O(K²) 재추정
+    - max_order 지정 시 AIC 로 차수 선택
+    """
+    
+    def __init__(self, order: int = 1, d: int = 0, max_order: Optional[int] = None):
+        self.order = order
+        self.d = d
+        self.max_order = max_order
+        self.lags = max(order, max_order or 0)
+        
+        self.n = 0                      # 차분 계열 길이
+        self.total = 0.0
+        self.lag_sums = [0.0] * (self.lags + 1)
+        self.head: List[float] = []     # 처음 lags 개 (자기공분산 평균 보정용)
+        self.tail: List[float] = []     # 마지막 lags 개
+        self.levels: List[float] = []   # 차분 단계별 마지막 원계열 값 (역차분용)
+        self.observations = 0           # 원계열 길이
+        
+        self.p = order
+        self.mean = 0.0
+        self.coefficients: List[float] = []
+        self.sigma2 = 0.0
+    
+    def fit(self, data: List[float]) -> "ARModel":
+        self.append(data)
+        return self
+    
+    def append(self, values: List[float]) -> None:
+        """새 관측치 추가 후 계수 재추정"""
+        for value in values:
+            self._push(float(value))
+        self._estimate()
+    
+    def _push(self, value: float) -> None:
+        self.observations += 1
+        # 차분: 단계별로 직전 값과의 차이를 다음 단계로 전달
+        for level in range(self.d):
+            if len(self.levels) <= level:
+                self.levels.append(value)
+                return
+            previous = self.levels[level]
+            self.levels[level] = value
+            value = value - previous
+        
+        history = self.tail
+        for k in range(min(len(history), self.lags) + 1):
+            self.lag_sums[k] += value * (value if k == 0 else history[-k])
+        self.total += value
+        self.n += 1
+        if len(self.head) < self.lags:
+            self.head.append(value)
+        history.append(value)
+        if len(history) > self.lags:
+            del history[0]
+    
+    def autocovariances(self) -> List[float]:
+        """γ_k = (1/n)·Σ(x_t - m)(x_{t+k} - m), k = 0..lags"""
+        n, m = self.n, self.total / self.n
+        gammas = []
+        for k in range(min(self.lags, n - 1) + 1):
+            leading = self.total - sum(self.tail[len(self.tail) - k:]) if k else self.total
+            trailing = self.total - sum(self.head[:k])
+            gammas.append((self.lag_sums[k] - m * (leading + trailing) + (n - k) * m * m) / n)
+        return gammas
+    
+    @staticmethod
+    def levinson_durbin(gammas: List[float]) -> Tuple[List[List[float]], List[float]]:
+        """Yule-Walker 해 (차수별 계수, 차수별 혁신 분산)"""
+        variances = [gammas[0]]
+        solutions: List[List[float]] = [[]]
+        phi: List[float] = []
+        for k in range(1, len(gammas)):
+            if variances[-1] <= 0:
+                break
+            reflection = (gammas[k] - sum(phi[j] * gammas[k - 1 - j] for j in range(k - 1))) / variances[-1]
+            phi = [phi[j] - reflection * phi[k - 2 - j] for j in range(k - 1)] + [reflection]
+            solutions.append(phi)
+            variances.append(variances[-1] * (1 - reflection * reflection))
+        return solutions, variances
+    
+    def _estimate(self) -> None:
+        if self.n < 2:
+            self.mean, self.coefficients, self.sigma2 = (self.total / self.n if self.n else 0.0), [], 0.0
+            return
+        self.mean = self.total / self.n
+        solutions, variances = self.levinson_durbin(self.autocovariances())
+        if self.max_order:
+            candidates = range(min(self.max_order, len(solutions) - 1) + 1)
+            self.p = min(candidates, key=lambda p: self.n * math.log(max(variances[p], 1e-300)) + 2 * p)
+        else:
+            self.p = min(self.order, len(solutions) - 1)
+        self.coefficients = solutions[self.p]
+        self.sigma2 = max(variances[self.p], 0.0)
+    
+    @property
+    def name(self) -> str:
+        return f"ARIMA({self.p},{self.d},0)" if self.d else f"AR({self.p})"
+    
+    def forecast(self, periods: int) -> Tuple[List[float], List[float]]:
+        """(예측값, 예측 오차 분산)"""
+        recent = [x - self.mean for x in self.tail]
+        steps = []
+        for _ in range(periods):
+            z = sum(c * recent[-1 - i] for i, c in enumerate(self.coefficients) if i < len(recent))
+            recent.append(z)
+            steps.append(z + self.mean)
+        
+        # 역차분: 단계별 누적합
+        for level in reversed(range(self.d)):
+            base = self.levels[level]
+            integrated = []
+            for step in steps:
+                base += step
+                integrated.append(base)
+            steps = integrated
+        
+        # ψ 가중치 (φ(B)(1-B)^d 의 역) -> h기 예측 오차 분산
+        poly = [1.0] + [-c for c in self.coefficients]
+        for _ in range(self.d):
+            poly = [a - b for a, b in zip(poly + [0.0], [0.0] + poly)]
+        psi = [1.0]
+        for j in range(1, periods):
+            psi.append(-sum(poly[i] * psi[j - i] for i in range(1, min(j, len(poly) - 1) + 1)))
+        variances, acc = [], 0.0
+        for weight in psi:
+            acc += weight * weight
+            variances.append(self.sigma2 * acc)
+        return steps, variances
+
+
+class HoltWintersModel:
+    """
+    Holt-Winters 가법 모형 (season_length=None 이면 Holt 선형 추세)
+    
+    - 평활 계수(α, β, γ)는 1기 앞 예측 오차 제곱합 최소화 (격자 + 좌표 탐색)
+    - 수준/추세/계절 상태는 재귀 갱신 -> 새 관측치 추가 시 O(k)
+    """
+    
+    ALPHA_GRID = (0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9)
+    BETA_GRID = (0.0, 0.05, 0.1, 0.2, 0.4)
+    GAMMA_GRID = (0.05, 0.1, 0.3, 0.5)
+    
+    def __init__(self, season_length: Optional[int] = None, alpha: Optional[float] = None):
+        self.season_length = season_length if season_length and season_length > 1 else None
+        self.fixed_alpha = alpha
+        self.alpha = alpha or 0.3
+        self.beta = 0.1
+        self.gamma = 0.1 if self.season_length else 0.0
+        self.level = 0.0
+        self.trend = 0.0
+        self.seasonal: List[float] = []
+        self.observations = 0
+        self.sse = 0.0
+        self.residual_count = 0
+    
+    def _initial_state(self, data: List[float]) -> Tuple[float, float, List[float], int]:
+        m = self.season_length
+        if m:
+            first = sum(data[:m]) / m
+            second = sum(data[m:2 * m]) / m
+            return first, (second - first) / m, [x - first for x in data[:m]], m
+        return data[0], data[1] - data[0], [], 1
+    
+    def _run(self, data: List[float], alpha: float, beta: float, gamma: float, state=None):
+        """상태 재귀 (state=None 이면 초기화부터), 1기 앞 오차 제곱합 반환"""
+        if state is None:
+            level, trend, seasonal, start = self._initial_state(data)
+        else:
+            level, trend, seasonal = state
+            seasonal = list(seasonal)
+            start = 0
+        m = self.season_length
+        sse, count = 0.0, 0
+        for i in range(start, len(data)):
+            value = data[i]
+            season = seasonal[0] if m else 0.0
+            error = value - (level + trend + season)
+            sse += error * error
+            count += 1
+            previous_level = level
+            level = alpha * (value - season) + (1 - alpha) * (level + trend)
+            trend = beta * (level - previous_level) + (1 - beta) * trend
+            if m:
+                seasonal.append(gamma * (value - level) + (1 - gamma) * season)
+                del seasonal[0]
+        return sse, count, (level, trend, seasonal)
+    
+    def fit(self, data: List[float]) -> "HoltWintersModel":
+        """평활 계수 추정 후 전체 계열로 상태 초기화"""
+        if self.season_length and len(data) < 2 * self.season_length + 2:
+            self.season_length = None  # 계절 추정에 최소 2주기 필요
+            self.gamma = 0.0
+        if len(data) < 3:
+            raise ValueError("Holt-Winters requires at least 3 observations")
+        
+        alphas = (self.fixed_alpha,) if self.fixed_alpha else self.ALPHA_GRID
+        gammas = self.GAMMA_GRID if self.season_length else (0.0,)
+        best = min(
+            (self._run(data, a, b, g)[0], a, b, g)
+            for a in alphas for b in self.BETA_GRID for g in gammas
+        )
+        _, alpha, beta, gamma = best
+        
+        # 좌표 탐색 (간격 절반씩 축소)
+        step = 0.05
+        while step > 0.005:
+            improved = False
+            for name in ("alpha", "beta", "gamma"):
+                if (name == "alpha" and self.fixed_alpha) or (name == "gamma" and not self.season_length):
+                    continue
+                for delta in (-step, step):
+                    params = {"alpha": alpha, "beta": beta, "gamma": gamma}
+                    params[name] = min(max(params[name] + delta, 0.0 if name != "alpha" else 0.01), 1.0)
+                    sse = self._run(data, params["alpha"], params["beta"], params["gamma"])[0]
+                    if sse < best[0]:
+                        best = (sse, params["alpha"], params["beta"], params["gamma"])
+                        alpha, beta, gamma = best[1:]
+                        improved = True
+            if not improved:
+                step /= 2
+        
+        self.alpha, self.beta, self.gamma = alpha, beta, gamma
+        self.sse, self.residual_count, (self.level, self.trend, self.seasonal) = self._run(data, alpha, beta, gamma)
+        self.observations = len(data)
+        return self
+    
+    def append(self, values: List[float]) -> None:
+        """평활 계수는 유지, 상태만 재귀 갱신"""
+        sse, count, state = self._run(
+            list(values), self.alpha, self.beta, self.gamma, (self.level, self.trend, self.seasonal)
+        )
+        self.level, self.trend, self.seasonal = state
+        self.sse += sse
+        self.residual_count += count
+        self.observations += len(values)
+    
+    @property
+    def name(self) -> str:
+        if self.season_length:
+            return f"HoltWinters(α={self.alpha:.2f},β={self.beta:.2f},γ={self.gamma:.2f},m={self.season_length})"
+        return f"Holt(α={self.alpha:.2f},β={self.beta:.2f})"
+    
+    def forecast(self, periods: int) -> Tuple[List[float], List[float]]:
+        """(예측값, 예측 오차 분산) - 분산은 가법 Holt 근사 σ²·Σ(1 + α(1 + jβ))²"""
+        m = self.season_length
+        predictions = [
+            self.level + h * self.trend + (self.seasonal[(h - 1) % m] if m else 0.0)
+            for h in range(1, periods + 1)
+        ]
+        sigma2 = self.sse / max(self.residual_count, 1)
+        variances, acc = [], 0.0
+        for h in range(periods):
+            acc += 1.0 if h == 0 else (self.alpha * (1 + h * self.beta)) ** 2
+            variances.append(sigma2 * acc)
+        return predictions, variances
+
+
+@dataclass
+class FittedSeries:
+    """시계열 키별 적합 모형 캐시 항목"""
+    model: Any
+    length: int
+    prefix_digest: str  # data[:length] 의 해시 (중간 값이 바뀐 계열 재사용 방지)
+    rmse: float
+    mae: float
+    fitted_length: int  # 평활 계수를 마지막으로 추정한 시점의 길이
+
+
 class TimeSeriesForecastingEngine:
-    """시계열 예측 엔진"""
+    """
+    시계열 예측 엔진
     
-    def __init__(self):
+    - AR(p)/ARIMA(p,d,0): Yule-Walker (Levinson-Durbin)
+    - Holt-Winters: 평활 계수 SSE 최소화 + 재귀 상태 갱신
+    - 오차 지표(RMSE/MAE)는 마지막 구간을 떼어낸 홀드아웃 백테스트 결과
+    - key 지정 시 적합 모형 캐시: 같은 계열은 재사용, 뒤에 관측치가 추가되면 증분 갱신
+    """
+    
+    def __init__(self, cache_size: int = 256, refit_growth: float = 0.25):
+        """
+        Args:
+            cache_size: 캐시할 시계열 키 수 (LRU)
+            refit_growth: Holt-Winters 평활 계수 재추정 기준 (마지막 추정 이후 길이 증가율)
+        """
         self.historical_data = []
         self.forecasts = []
+        self.cache_size = cache_size
+        self.refit_growth = refit_growth
+        self._fits: "OrderedDict[Tuple[Any, ...], FittedSeries]" = OrderedDict()
     
-    def forecast_arima(
+    # ------------------------------------------------------------------
+    # 적합 + 캐시
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _prefix_digest(data: List[float], length: int) -> str:
+        """data[:length] 의 내용 해시"""
+        return hashlib.blake2b(struct.pack(f"<{length}d", *data[:length]), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _fit_with_holdout(build, data: List[float], periods: int, min_train: int) -> FittedSeries:
+        """마지막 h개를 떼어 학습 -> 홀드아웃 오차 측정 -> 떼어낸 구간을 증분 반영"""
+        n = len(data)
+        holdout = max(1, min(periods, n // 5))
+        if n - holdout < min_train:
+            holdout = 0
+        
+        train = data[:n - holdout] if holdout else data
+        model = build().fit(train)
+        if holdout:
+            predictions, _ = model.forecast(holdout)
+            errors = [actual - predicted for actual, predicted in zip(data[n - holdout:], predictions)]
+            rmse = math.sqrt(sum(e * e for e in errors) / holdout)
+            mae = sum(abs(e) for e in errors) / holdout
+            model.append(data[n - holdout:])
+        else:
+            # 홀드아웃 불가 (짧은 계열): 표본 내 1기 앞 오차
+            _, variances = model.forecast(1)
+            rmse = math.sqrt(variances[0])
+            mae = rmse * math.sqrt(2 / math.pi)
+        
+        return FittedSeries(
+            model=model, length=n, prefix_digest=TimeSeriesForecastingEngine._prefix_digest(data, n),
+            rmse=rmse, mae=mae, fitted_length=n
+        )
+    
+    def _fitted(
         self,
+        cache_key: Optional[Tuple[Any, ...]],
         data: List[float],
         periods: int,
-        order: Tuple[int, int, int] = (1, 1, 1)
-    ) -> Forecast:
-        """ARIMA 예측 (간단한 구현)"""
-        
-        if len(data) < 3:
-            return None
-        
-        # 간단한 선형 트렌드 계산
-        trend = (data[-1] - data[0]) / len(data)
-        
-        predictions = []
-        current = data[-1]
-        
-        for i in range(periods):
-            # 트렌드 + 노이즈
-            prediction = current + trend + random.gauss(0, statistics.stdev(data) * 0.1)
-            predictions.append(prediction)
-            current = prediction
-        
-        # 신뢰 구간
-        std = statistics.stdev(data)
-        upper_ci = [p + 1.96 * std for p in predictions]
-        lower_ci = [p - 1.96 * std for p in predictions]
-        
-        # 성능 지표 계산 (간단한 시뮬레이션)
-        rmse = std * 0.15
-        mae = std * 0.12
-        
+        build,
+        min_train: int,
+        refit_on_growth: bool
+    ) -> FittedSeries:
+        """캐시 조회 (앞부분 해시 비교) -> (동일 계열) 재사용 / (뒤에 추가됨) 증분 갱신 / 그 외 재적합"""
+        entry = self._fits.get(cache_key) if cache_key is not None else None
+        n = len(data)
+        
+        if (
+            entry is not None and entry.length <= n
+            and self._prefix_digest(data, entry.length) == entry.prefix_digest
+        ):
+            if entry.length < n:
+                if refit_on_growth and n > entry.fitted_length * (1 + self.refit_growth):
+                    entry = self._fit_with_holdout(build, data, periods, min_train)
+                else:
+                    entry.model.append(data[entry.length:])
+                    entry.length = n
+                    entry.prefix_digest = self._prefix_digest(data, n)
+        else:
+            entry = self._fit_with_holdout(build, data, periods, min_train)
+        
+        if cache_key is not None:
+            self._fits[cache_key] = entry
+            self._fits.move_to_end(cache_key)
+            while len(self._fits) > self.cache_size:
+                self._fits.popitem(last=False)
+        return entry
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """적합 캐시 무효화 (key=None 이면 전체)"""
+        if key is None:
+            self._fits.clear()
+        else:
+            for cache_key in [k for k in self._fits if k[-1] == key]:
+                del self._fits[cache_key]
+    
+    def _make_forecast(self, entry: FittedSeries, data: List[float], periods: int) -> Forecast:
+        predictions, variances = entry.model.forecast(periods)
+        half_widths = [1.96 * math.sqrt(max(v, 0.0)) for v in variances]
         forecast = Forecast(
-            model='ARIMA(1,1,1)',
+            model=entry.model.name,
             horizon_periods=periods,
             base_value=data[-1],
             predictions=predictions,
-            confidence_interval=(lower_ci, upper_ci),
-            rmse=rmse,
-            mae=mae
+            confidence_interval=(
+                [p - w for p, w in zip(predictions, half_widths)],
+                [p + w for p, w in zip(predictions, half_widths)]
+            ),
+            rmse=entry.rmse,
+            mae=entry.mae
         )
-        
         self.forecasts.append(forecast)
         return forecast
     
-    def forecast_exponential_smoothing(
+    # ------------------------------------------------------------------
+    # 예측 API
+    # ------------------------------------------------------------------
+    
+    def forecast_arima(
         self,
         data: List[float],
         periods: int,
-        alpha: float = 0.3
+        order: Tuple[int, int, int] = (1, 1, 1),
+        key: Optional[str] = None,
+        max_order: Optional[int] = None
     ) -> Forecast:
-        """지수평활 예측"""
+        """
+        ARIMA(p,d,0) 예측 (AR 계수는 Yule-Walker, MA 항 q 는 추정하지 않음)
+        
+        Args:
+            order: (p, d, q) - p: AR 차수, d: 차분 차수
+            key: 시계열 식별자 (지정 시 적합 모형 캐시/증분 갱신)
+            max_order: 지정 시 AIC 로 AR 차수 선택 (p 대신)
+        """
+        if len(data) < 3:
+            return None
         
+        p, d, _ = order
+        data = [float(x) for x in data]
+        entry = self._fitted(
+            ("arima", p, d, max_order, key) if key is not None else None,
+            data, periods,
+            lambda: ARModel(p, d, max_order),
+            min_train=d + max(p, max_order or 0) + 2,
+            refit_on_growth=False   # AR 계수는 append 마다 재추정
+        )
+        return self._make_forecast(entry, data, periods)
+    
+    def forecast_exponential_smoothing(
+        self,
+        data: List[float],
+        periods: int,
+        alpha: Optional[float] = None,
+        season_length: Optional[int] = None,
+        key: Optional[str] = None
+    ) -> Forecast:
+        """
+        Holt-Winters 지수평활 예측
+        
+        Args:
+            alpha: 수준 평활 계수 (None 이면 추정)
+            season_length: 계절 주기 (None 이면 Holt 선형 추세)
+            key: 시계열 식별자 (지정 시 적합 모형 캐시/증분 갱신)
+        """
         if len(data) < 2:
             return None
         
-        # 지수평활
-        smoothed = data[0]
-        smoothed_values = [smoothed]
-        
-        for value in data[1:]:
-            smoothed = alpha * value + (1 - alpha) * smoothed
-            smoothed_values.append(smoothed)
-        
-        # 예측 (일정한 마지막 값으로)
-        predictions = [smoothed_values[-1]] * periods
-        
-        # 신뢰 구간
-        std = statistics.stdev(data)
-        upper_ci = [p + 1.96 * std for p in predictions]
-        lower_ci = [p - 1.96 * std for p in predictions]
-        
-        rmse = std * 0.10
-        mae = std * 0.08
-        
-        forecast = Forecast(
-            model=f'ExponentialSmoothing(α={alpha})',
-            horizon_periods=periods,
-            base_value=data[-1],
-            predictions=predictions,
-            confidence_interval=(lower_ci, upper_ci),
-            rmse=rmse,
-            mae=mae
+        data = [float(x) for x in data]
+        if len(data) < 3:
+            data = [data[0]] + data  # 추세 초기화에 최소 3개 필요
+        entry = self._fitted(
+            ("holt_winters", alpha, season_length, key) if key is not None else None,
+            data, periods,
+            lambda: HoltWintersModel(season_length, alpha),
+            min_train=max(3, 2 * (season_length or 0) + 2),
+            refit_on_growth=True
         )
-        
-        self.forecasts.append(forecast)
-        return forecast
+        return self._make_forecast(entry, data, periods)
+
+
+class StreamingPercentileStats:
+    """
+    경로를 보관하지 않는 최종값 통계 누적기 (샤드 간 병합 가능)
+    - 평균/분산: Chan 병렬 병합 공식
+    - 백분위수: 고정 구간 히스토그램 (구간 밖 값은 양끝 구간으로, 최소/최대는 정확히 유지)
+    """
+
+    def __init__(self, initial_value: float, edges: Tuple[float, float], bins: int = 16384):
+        self.initial_value = initial_value
+        self.lo, self.hi = edges
+        self.bins = bins
+        self.width = (self.hi - self.lo) / bins if self.hi > self.lo else 1.0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.profit_count = 0
+        self.histogram = np.zeros(bins, dtype=np.int64)
+
+    def add(self, values: "np.ndarray") -> None:
+        n = len(values)
+        if n == 0:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(np.dot(values - chunk_mean, values - chunk_mean))
+        self._merge_moments(n, chunk_mean, chunk_m2)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.profit_count += int(np.count_nonzero(values > self.initial_value))
+        idx = ((values - self.lo) / self.width).astype(np.int64)
+        np.clip(idx, 0, self.bins - 1, out=idx)
+        self.histogram += np.bincount(idx, minlength=self.bins)
+
+    def merge(self, other: "StreamingPercentileStats") -> None:
+        if other.count == 0:
+            return
+        self._merge_moments(other.count, other.mean, other.m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.profit_count += other.profit_count
+        self.histogram += other.histogram
+
+    def _merge_moments(self, n: int, mean: float, m2: float) -> None:
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def value_at_rank(self, rank: int) -> float:
+        """정렬 시 rank번째(0-based) 값의 근사치 (구간 내 선형 보간)"""
+        cumulative = np.cumsum(self.histogram)
+        bin_idx = int(np.searchsorted(cumulative, rank, side="right"))
+        before = int(cumulative[bin_idx - 1]) if bin_idx > 0 else 0
+        in_bin = int(self.histogram[bin_idx])
+        value = self.lo + (bin_idx + (rank - before + 0.5) / in_bin) * self.width
+        return min(max(value, self.min), self.max)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+def _simulate_chunk(
+    rng: "np.random.Generator",
+    n_paths: int,
+    initial_value: float,
+    mean_return: float,
+    volatility: float,
+    periods: int,
+    antithetic: bool,
+    keep_paths: int = 0
+) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """(n_paths, periods) 수익률 배열로 한 번에 경로 생성 -> (최종값, 앞쪽 경로 일부)"""
+    half = (n_paths + 1) // 2 if antithetic else n_paths
+    shocks = rng.standard_normal((half, periods))
+
+    if antithetic:
+        # 대조 변량: z와 -z 쌍으로 분산 감소 (난수 생성량 절반)
+        growth = np.empty((n_paths, periods))
+        growth[:half] = shocks
+        np.negative(shocks[:n_paths - half], out=growth[half:])
+    else:
+        growth = shocks
+
+    # 기존 모델과 동일: next = prev * (1 + mean_return + volatility * z)
+    growth *= volatility
+    growth += 1.0 + mean_return
+    finals = initial_value * np.prod(growth, axis=1)
+
+    paths = None
+    if keep_paths:
+        head = initial_value * np.cumprod(growth[:keep_paths], axis=1)
+        paths = np.hstack([np.full((len(head), 1), initial_value), head])
+    return finals, paths
+
+
+def _simulate_shard(
+    seed_seq: "np.random.SeedSequence",
+    n_paths: int,
+    initial_value: float,
+    mean_return: float,
+    volatility: float,
+    periods: int,
+    antithetic: bool,
+    chunk_size: int,
+    keep_finals: bool,
+    edges: Optional[Tuple[float, float]],
+    keep_paths: int
+) -> Dict[str, Any]:
+    """샤드 단위 시뮬레이션 (프로세스 풀 작업 단위, 청크별로 메모리 제한)"""
+    rng = np.random.default_rng(seed_seq)
+    stats = None if keep_finals else StreamingPercentileStats(initial_value, edges)
+    finals_parts = []
+    sample_paths = None
+
+    remaining = n_paths
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        finals, paths = _simulate_chunk(
+            rng, n, initial_value, mean_return, volatility, periods, antithetic,
+            keep_paths=0 if sample_paths is not None else keep_paths
+        )
+        if sample_paths is None:
+            sample_paths = paths
+        if keep_finals:
+            finals_parts.append(finals)
+        else:
+            stats.add(finals)
+        remaining -= n
+
+    return {
+        'finals': np.concatenate(finals_parts) if keep_finals else None,
+        'stats': stats,
+        'paths': sample_paths,
+    }
+
+
+class VectorizedMonteCarlo:
+    """
+    numpy 기반 몬테카를로 엔진
+    - 모든 경로를 (iterations, periods) 배열로 생성 (Python 루프 없음)
+    - 시드 지정 가능한 Generator, 샤드별 SeedSequence 분기 (실행 방식과 무관하게 재현 가능)
+    - 대조 변량(antithetic variates), 청크 단위 생성으로 메모리 상한
+    - 대규모 실행은 프로세스 풀 샤딩
+    - exact_limit 초과 시 최종값도 보관하지 않고 스트리밍 히스토그램으로 백분위수 계산
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        antithetic: bool = True,
+        chunk_elements: int = 4_000_000,
+        shard_size: int = 500_000,
+        max_workers: Optional[int] = None,
+        process_threshold: int = 2_000_000,
+        exact_limit: int = 5_000_000
+    ):
+        self.seed = seed
+        self.antithetic = antithetic
+        self.chunk_elements = chunk_elements      # 청크당 난수 개수 상한 (~32MB)
+        self.shard_size = shard_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.process_threshold = process_threshold
+        self.exact_limit = exact_limit
+
+    def run(
+        self,
+        initial_value: float,
+        mean_return: float,
+        volatility: float,
+        periods: int,
+        iterations: int = 1000,
+        keep_paths: int = 10
+    ) -> Dict[str, Any]:
+        """MonteCarloSimulation.run_simulation 과 동일한 결과 스키마 반환"""
+        if iterations < 2:
+            raise ValueError(f"iterations must be >= 2, got {iterations}")
+
+        chunk_size = max(1, self.chunk_elements // max(periods, 1))
+        n_shards = math.ceil(iterations / self.shard_size)
+        shard_sizes = [self.shard_size] * (n_shards - 1) + [iterations - self.shard_size * (n_shards - 1)]
+        seeds = np.random.SeedSequence(self.seed).spawn(n_shards + 1)
+
+        keep_finals = iterations <= self.exact_limit
+        edges = None
+        if not keep_finals:
+            # 파일럿 샘플로 히스토그램 구간 결정 (모든 샤드가 같은 구간 사용)
+            pilot, _ = _simulate_chunk(
+                np.random.default_rng(seeds[-1]), min(iterations, 20_000),
+                initial_value, mean_return, volatility, periods, self.antithetic
+            )
+            span = float(pilot.max() - pilot.min()) or abs(initial_value) or 1.0
+            edges = (float(pilot.min()) - span * 0.5, float(pilot.max()) + span * 0.5)
+
+        jobs = [
+            (seeds[i], shard_sizes[i], initial_value, mean_return, volatility, periods,
+             self.antithetic, chunk_size, keep_finals, edges, keep_paths if i == 0 else 0)
+            for i in range(n_shards)
+        ]
+
+        if n_shards > 1 and self.max_workers > 1 and iterations >= self.process_threshold:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, n_shards)) as pool:
+                shards = list(pool.map(_simulate_shard, *zip(*jobs)))
+        else:
+            shards = [_simulate_shard(*job) for job in jobs]
+
+        paths = shards[0]['paths']
+        sample_paths = paths.tolist() if paths is not None else []
+
+        if keep_finals:
+            finals = np.concatenate([shard['finals'] for shard in shards])
+            n = len(finals)
+            ranks = sorted({n // 2, int(n * 0.05), int(n * 0.95)})
+            partitioned = np.partition(finals, ranks)
+            stats = {
+                'mean_final_value': float(finals.mean()),
+                'median_final_value': float(partitioned[n // 2]),
+                'std_final_value': float(finals.std(ddof=1)),
+                'min_final_value': float(finals.min()),
+                'max_final_value': float(finals.max()),
+                'percentile_5': float(partitioned[int(n * 0.05)]),
+                'percentile_95': float(partitioned[int(n * 0.95)])
+            }
+            profit_count = int(np.count_nonzero(finals > initial_value))
+        else:
+            merged = shards[0]['stats']
+            for shard in shards[1:]:
+                merged.merge(shard['stats'])
+            n = merged.count
+            stats = {
+                'mean_final_value': merged.mean,
+                'median_final_value': merged.value_at_rank(n // 2),
+                'std_final_value': merged.std,
+                'min_final_value': merged.min,
+                'max_final_value': merged.max,
+                'percentile_5': merged.value_at_rank(int(n * 0.05)),
+                'percentile_95': merged.value_at_rank(int(n * 0.95))
+            }
+            profit_count = merged.profit_count
+
+        return {
+            'iterations': iterations,
+            'periods': periods,
+            'initial_value': initial_value,
+            'simulations': sample_paths,  # 처음 10개만 저장
+            'statistics': stats,
+            'probability_of_profit': profit_count / iterations
+        }
 
 
 class MonteCarloSimulation:
     """몬테카를로 시뮬레이션"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, antithetic: bool = True):
         self.simulations = []
+        self.engine = VectorizedMonteCarlo(seed=seed, antithetic=antithetic) if NUMPY_AVAILABLE else None
     
     def run_simulation(
         self,
@@ -136,7 +763,25 @@ class MonteCarloSimulation:
         periods: int,
         iterations: int = 1000
     ) -> Dict[str, Any]:
-        """몬테카를로 시뮬레이션 실행"""
+        """몬테카를로 시뮬레이션 실행 (numpy 사용 가능 시 벡터화 엔진)"""
+        
+        if self.engine is not None:
+            result = self.engine.run(initial_value, mean_return, volatility, periods, iterations)
+        else:
+            result = self._run_simulation_python(initial_value, mean_return, volatility, periods, iterations)
+        
+        self.simulations.append(result)
+        return result
+    
+    def _run_simulation_python(
+        self,
+        initial_value: float,
+        mean_return: float,
+        volatility: float,
+        periods: int,
+        iterations: int
+    ) -> Dict[str, Any]:
+        """순수 Python 경로 (numpy 미설치 시 폴백)"""
         
         simulation_paths = []
         final_values = []
@@ -156,7 +801,7 @@ class MonteCarloSimulation:
         # 통계
         final_values.sort()
         
-        result = {
+        return {
             'iterations': iterations,
             'periods': periods,
             'initial_value': initial_value,
@@ -172,9 +817,6 @@ class MonteCarloSimulation:
             },
             'probability_of_profit': sum(1 for v in final_values if v > initial_value) / iterations
         }
-        
-        self.simulations.append(result)
-        return result
 
 
 class ScenarioAnalyzer:
@@ -241,15 +883,25 @@ class DecisionSupportSystem:
         self,
         historical_data: List[float],
         scenarios: Dict[str, Any],
-        risk_tolerance: str = 'moderate'
+        risk_tolerance: str = 'moderate',
+        series_key: Optional[str] = None
     ) -> Dict[str, Any]:
-        """종합 분석"""
+        """
+        종합 분석
+        
+        Args:
+            series_key: 시계열 식별자 (지정 시 적합 모형을 캐시하고 다음 호출에서 증분 갱신)
+        """
         
         analysis_start = __import__('datetime').datetime.now()
         
         # 1. 시계열 예측
-        arima_forecast = self.forecasting_engine.forecast_arima(historical_data, 12)
-        exp_forecast = self.forecasting_engine.forecast_exponential_smoothing(historical_data, 12)
+        arima_forecast = self.forecasting_engine.forecast_arima(
+            historical_data, 12, key=series_key, max_order=max(1, min(8, len(historical_data) // 5))
+        )
+        exp_forecast = self.forecasting_engine.forecast_exponential_smoothing(
+            historical_data, 12, key=series_key
+        )
         
         # 2. 몬테카를로 시뮬레이션
         monte_carlo_result = self.monte_carlo.run_simulation(
@@ -0,0 +1,388 @@
+"""
+스트리밍 기술적 지표 - 봉 단위 O(1) 증분 계산
+
+역할:
+- 이동평균/분산 (링 버퍼 + 슬라이딩 Welford)
+- 지수이동평균 (pandas ewm adjust=True 와 동일한 정규화 EMA)
+- RSI (Wilder 평활 / 단순 평균)
+- MACD (EMA 12/26, 시그널 9), 볼린저 밴드
+- 구간 최저/최고 (단조 덱, 분할상환 O(1))
+- 종목 수천 개 워치리스트 + JSON 체크포인트 (재시작 시 전체 재계산 불필요)
+"""
+
+from typing import Dict, Any, List, Optional, Iterable
+from collections import deque
+from pathlib import Path
+import json
+import math
+
+
+class RollingWindow:
+    """고정 길이 이동 평균/분산 (ddof=1), 링 버퍼 기반"""
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"Invalid period: {period}")
+        self.period = period
+        self._buffer: List[float] = [0.0] * period
+        self._pos = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> None:
+        if self.count < self.period:
+            # 채우는 중: 일반 Welford
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        else:
+            # 가득 참: 가장 오래된 값을 새 값으로 교체하는 슬라이딩 Welford
+            old = self._buffer[self._pos]
+            old_mean = self.mean
+            self.mean += (value - old) / self.period
+            self._m2 += (value - old) * (value - self.mean + old - old_mean)
+            self._m2 = max(self._m2, 0.0)
+        self._buffer[self._pos] = value
+        self._pos = (self._pos + 1) % self.period
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.period
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"period": self.period, "buffer": self._buffer, "pos": self._pos,
+                "count": self.count, "mean": self.mean, "m2": self._m2}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RollingWindow":
+        window = cls(state["period"])
+        window._buffer = list(state["buffer"])
+        window._pos = state["pos"]
+        window.count = state["count"]
+        window.mean = state["mean"]
+        window._m2 = state["m2"]
+        return window
+
+
+class RollingExtrema:
+    """고정 길이 구간 최저/최고 (단조 덱)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self._min: deque = deque()  # (index, value), value 오름차순
+        self._max: deque = deque()  # (index, value), value 내림차순
+
+    def update(self, value: float) -> None:
+        idx = self.count
+        self.count += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._min.append((idx, value))
+        self._max.append((idx, value))
+        expired = idx - self.period
+        if self._min[0][0] <= expired:
+            self._min.popleft()
+        if self._max[0][0] <= expired:
+            self._max.popleft()
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1] if self._min else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1] if self._max else 0.0
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"period": self.period, "count": self.count,
+                "min": [list(item) for item in self._min], "max": [list(item) for item in self._max]}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RollingExtrema":
+        extrema = cls(state["period"])
+        extrema.count = state["count"]
+        extrema._min = deque(tuple(item) for item in state["min"])
+        extrema._max = deque(tuple(item) for item in state["max"])
+        return extrema
+
+
+class EMA:
+    """지수이동평균 (span 기준, pandas ewm(span).mean() adjust=True 와 동일)"""
+
+    def __init__(self, span: int):
+        self.span = span
+        self.decay = 1 - 2 / (span + 1)
+        self._numerator = 0.0
+        self._denominator = 0.0
+        self.count = 0
+
+    def update(self, value: float) -> float:
+        self._numerator = value + self.decay * self._numerator
+        self._denominator = 1.0 + self.decay * self._denominator
+        self.count += 1
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self._numerator / self._denominator if self._denominator else 0.0
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"span": self.span, "num": self._numerator, "den": self._denominator, "count": self.count}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "EMA":
+        ema = cls(state["span"])
+        ema._numerator = state["num"]
+        ema._denominator = state["den"]
+        ema.count = state["count"]
+        return ema
+
+
+class RSI:
+    """
+    RSI
+    - method="wilder": Wilder 평활 (첫 period개 단순 평균으로 시작, 이후 (avg*(n-1)+x)/n)
+    - method="simple": 최근 period개 상승/하락폭 단순 평균 (TechnicalAnalyzer._calculate_rsi 와 동일)
+    """
+
+    def __init__(self, period: int = 14, method: str = "wilder"):
+        if method not in ("wilder", "simple"):
+            raise ValueError(f"Unknown RSI method: {method}")
+        self.period = period
+        self.method = method
+        self.prev: Optional[float] = None
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def update(self, close: float) -> None:
+        if self.prev is not None:
+            delta = close - self.prev
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if self.method == "wilder" and self.gains.ready:
+                self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+                self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+            else:
+                self.gains.update(gain)
+                self.losses.update(loss)
+                self.avg_gain = self.gains.mean
+                self.avg_loss = self.losses.mean
+        self.prev = close
+
+    @property
+    def ready(self) -> bool:
+        return self.gains.ready
+
+    @property
+    def value(self) -> float:
+        if self.avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + self.avg_gain / self.avg_loss))
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"period": self.period, "method": self.method, "prev": self.prev,
+                "gains": self.gains.to_state(), "losses": self.losses.to_state(),
+                "avg_gain": self.avg_gain, "avg_loss": self.avg_loss}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RSI":
+        rsi = cls(state["period"], state["method"])
+        rsi.prev = state["prev"]
+        rsi.gains = RollingWindow.from_state(state["gains"])
+        rsi.losses = RollingWindow.from_state(state["losses"])
+        rsi.avg_gain = state["avg_gain"]
+        rsi.avg_loss = state["avg_loss"]
+        return rsi
+
+
+class MACD:
+    """MACD = EMA(fast) - EMA(slow), 시그널 = EMA(MACD, signal)"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+
+    def update(self, close: float) -> None:
+        self.signal.update(self.fast.update(close) - self.slow.update(close))
+
+    @property
+    def value(self) -> float:
+        return self.fast.value - self.slow.value
+
+    @property
+    def signal_value(self) -> float:
+        return self.signal.value
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"fast": self.fast.to_state(), "slow": self.slow.to_state(), "signal": self.signal.to_state()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "MACD":
+        macd = cls()
+        macd.fast = EMA.from_state(state["fast"])
+        macd.slow = EMA.from_state(state["slow"])
+        macd.signal = EMA.from_state(state["signal"])
+        return macd
+
+
+class SymbolIndicators:
+    """
+    종목 하나의 지표 묶음 (TechnicalAnalyzer 가 쓰는 값 전부)
+    MA20/50/200, RSI(14), MACD(12/26/9), 볼린저(20, 2σ), 1년 최저/최고
+    """
+
+    WARMUP_BARS = 200  # TechnicalAnalyzer 와 동일: 200봉 미만이면 신호 미산출
+
+    def __init__(self, rsi_method: str = "wilder", extrema_period: int = 252):
+        self.ma20 = RollingWindow(20)
+        self.ma50 = RollingWindow(50)
+        self.ma200 = RollingWindow(200)
+        self.rsi = RSI(14, rsi_method)
+        self.macd = MACD()
+        self.extrema = RollingExtrema(extrema_period)
+        self.last_close = 0.0
+        self.count = 0
+
+    def update(self, close: float) -> None:
+        """새 종가 1개 반영 (O(1))"""
+        close = float(close)
+        self.ma20.update(close)
+        self.ma50.update(close)
+        self.ma200.update(close)
+        self.rsi.update(close)
+        self.macd.update(close)
+        self.extrema.update(close)
+        self.last_close = close
+        self.count += 1
+
+    def warm_up(self, closes: Iterable[float]) -> None:
+        for close in closes:
+            self.update(close)
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.WARMUP_BARS
+
+    def values(self, bollinger_std: float = 2.0) -> Dict[str, float]:
+        """현재 지표 값 (볼린저 중심선 = MA20)"""
+        middle = self.ma20.mean
+        band = bollinger_std * self.ma20.std
+        return {
+            "close": self.last_close,
+            "ma20": self.ma20.mean,
+            "ma50": self.ma50.mean,
+            "ma200": self.ma200.mean,
+            "rsi": self.rsi.value,
+            "macd": self.macd.value,
+            "macd_signal": self.macd.signal_value,
+            "bollinger_upper": middle + band,
+            "bollinger_middle": middle,
+            "bollinger_lower": middle - band,
+            "period_low": self.extrema.min,
+            "period_high": self.extrema.max,
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "ma20": self.ma20.to_state(), "ma50": self.ma50.to_state(), "ma200": self.ma200.to_state(),
+            "rsi": self.rsi.to_state(), "macd": self.macd.to_state(), "extrema": self.extrema.to_state(),
+            "last_close": self.last_close, "count": self.count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SymbolIndicators":
+        indicators = cls()
+        indicators.ma20 = RollingWindow.from_state(state["ma20"])
+        indicators.ma50 = RollingWindow.from_state(state["ma50"])
+        indicators.ma200 = RollingWindow.from_state(state["ma200"])
+        indicators.rsi = RSI.from_state(state["rsi"])
+        indicators.macd = MACD.from_state(state["macd"])
+        indicators.extrema = RollingExtrema.from_state(state["extrema"])
+        indicators.last_close = state["last_close"]
+        indicators.count = state["count"]
+        return indicators
+
+
+class IndicatorWatchlist:
+    """
+    종목별 SymbolIndicators 관리 (실시간 워치리스트)
+
+    Usage:
+        watchlist = IndicatorWatchlist()
+        watchlist.warm_up("AAPL", closes)        # 최초 1회
+        watchlist.update("AAPL", new_close)      # 틱/봉마다 O(1)
+        watchlist.save("indicators.json")       # 체크포인트
+    """
+
+    def __init__(self, rsi_method: str = "wilder"):
+        self.rsi_method = rsi_method
+        self.symbols: Dict[str, SymbolIndicators] = {}
+
+    def get(self, symbol: str) -> SymbolIndicators:
+        indicators = self.symbols.get(symbol)
+        if indicators is None:
+            indicators = SymbolIndicators(self.rsi_method)
+            self.symbols[symbol] = indicators
+        return indicators
+
+    def update(self, symbol: str, close: float) -> SymbolIndicators:
+        indicators = self.get(symbol)
+        indicators.update(close)
+        return indicators
+
+    def update_many(self, closes: Dict[str, float]) -> None:
+        """한 시점의 여러 종목 종가 반영"""
+        for symbol, close in closes.items():
+            self.get(symbol).update(close)
+
+    def warm_up(self, symbol: str, closes: Iterable[float]) -> SymbolIndicators:
+        indicators = self.get(symbol)
+        indicators.warm_up(closes)
+        return indicators
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.symbols
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """JSON 체크포인트 저장 (임시 파일 후 교체)"""
+        target = Path(path)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        state = {
+            "rsi_method": self.rsi_method,
+            "symbols": {symbol: ind.to_state() for symbol, ind in self.symbols.items()},
+        }
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        tmp.replace(target)
+
+    @classmethod
+    def load(cls, path: str) -> "IndicatorWatchlist":
+        state = json.loads(Path(path).read_text(encoding="utf-8"))
+        watchlist = cls(state["rsi_method"])
+        watchlist.symbols = {
+            symbol: SymbolIndicators.from_state(ind_state)
+            for symbol, ind_state in state["symbols"].items()
+        }
+        return watchlist
@@ -15,7 +15,7 @@ FastAPI Backend - SHawn-Brain Web 서버
 """
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
@@ -24,9 +24,28 @@ from datetime import datetime
 import asyncio
 import json
 import logging
+import os
+import tempfile
 from scripts.maintenance.auto_router import AutoRouter
 from projects.ddc.brain.brain_core.chat_engine import get_chat_engine
 
+# 투자 분석 + 포트폴리오 최적화 (선택)
+try:
+    from projects.ddc.cartridges.inv.inv_interface import InvCartridgeInterface
+    from projects.ddc.cartridges.bio.investment_cartridge_v2 import InvestmentCartridgeV2
+    INV_CARTRIDGE_AVAILABLE = True
+except ImportError as e:
+    logging.getLogger(__name__).warning(f"투자 카트리지 비활성화 (임시 응답 사용): {e}")
+    INV_CARTRIDGE_AVAILABLE = False
+
+# Bio 비디오 프레임 파이프라인 (선택, OpenCV 필요)
+try:
+    from projects.ddc.cartridges.bio.bio_cartridge_v2_1 import VideoFramePipeline
+    BIO_VIDEO_AVAILABLE = True
+except ImportError as e:
+    logging.getLogger(__name__).warning(f"Bio 비디오 파이프라인 비활성화 (임시 응답 사용): {e}")
+    BIO_VIDEO_AVAILABLE = False
+
 # ============================================================================
 # 1. 설정
 # ============================================================================
@@ -154,6 +173,15 @@ class NeuralSystemMonitor:
 monitor = NeuralSystemMonitor()
 router = AutoRouter()
 chat_engine = get_chat_engine()
+_inv_interface = None
+
+
+def get_inv_interface():
+    """InvCartridgeInterface 싱글톤 (스냅샷 캐시/최적화 warm-start 상태 공유)"""
+    global _inv_interface
+    if _inv_interface is None and INV_CARTRIDGE_AVAILABLE:
+        _inv_interface = InvCartridgeInterface(cartridge=InvestmentCartridgeV2())
+    return _inv_interface
 
 # ============================================================================
 # 4. 라우트: 헬스 체크
@@ -226,25 +254,86 @@ async def analyze_bio_image(request: BioAnalysisRequest):
         logger.error(f"Bio 분석 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _save_upload(file: UploadFile) -> str:
+    """업로드 파일을 청크 단위로 임시 파일에 저장 (전체를 메모리에 올리지 않음)"""
+    suffix = os.path.splitext(file.filename or "")[1] or ".mp4"
+    fd, path = tempfile.mkstemp(prefix="bio_video_", suffix=suffix)
+    with os.fdopen(fd, "wb") as out:
+        while chunk := await file.read(1024 * 1024):
+            out.write(chunk)
+    return path
+
+
+async def _stream_video_analysis(video_path: str, filename: str):
+    """진행 상황/결과 NDJSON 스트림 (한 줄 = 이벤트 하나)"""
+    queue: asyncio.Queue = asyncio.Queue()
+    task = asyncio.ensure_future(VideoFramePipeline().analyze_async(video_path, queue.put_nowait))
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while (progress := await queue.get()) is not None:
+            yield json.dumps({"event": "progress", **progress}) + "\n"
+        analysis = task.result()
+        yield json.dumps({
+            "event": "result",
+            "status": "success",
+            "filename": filename,
+            **analysis.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        }) + "\n"
+    except Exception as e:
+        logger.error(f"Bio 비디오 분석 오류: {e}")
+        yield json.dumps({"event": "error", "detail": str(e)}) + "\n"
+    finally:
+        task.cancel()
+        os.remove(video_path)
+
+
 @app.post("/api/bio/analyze_video", tags=["Bio Cartridge"])
-async def analyze_bio_video(file: UploadFile = File(...)):
+async def analyze_bio_video(file: UploadFile = File(...), stream: bool = False):
     """
     비디오 파일 분석 (시계열)
+    
+    - **file**: 타임랩스/비디오 파일
+    - **stream**: true 면 진행 상황과 최종 결과를 NDJSON 으로 스트리밍
+    
+    Returns:
+        샘플 프레임별 밀도/응집도/형태 시계열 + 발달 단계 구간
     """
     try:
         monitor.record_call('bio')
         
         logger.info(f"Bio 비디오 분석: {file.filename}")
         
+        if not BIO_VIDEO_AVAILABLE:
+            # 임시 응답 (시뮬레이션)
+            return {
+                "status": "success",
+                "filename": file.filename,
+                "frames_analyzed": 100,
+                "developmental_stages": [
+                    {"day": 1, "status": "initial"},
+                    {"day": 3, "status": "proliferation"},
+                    {"day": 7, "status": "differentiation"}
+                ],
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        video_path = await _save_upload(file)
+        if stream:
+            return StreamingResponse(
+                _stream_video_analysis(video_path, file.filename),
+                media_type="application/x-ndjson"
+            )
+        
+        try:
+            analysis = await VideoFramePipeline().analyze_async(video_path)
+        finally:
+            os.remove(video_path)
+        
         return {
             "status": "success",
             "filename": file.filename,
-            "frames_analyzed": 100,
-            "developmental_stages": [
-                {"day": 1, "status": "initial"},
-                {"day": 3, "status": "proliferation"},
-                {"day": 7, "status": "differentiation"}
-            ],
+            **analysis.to_dict(),
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -292,6 +381,35 @@ async def analyze_investment(request: InvAnalysisRequest):
         logger.error(f"Inv 분석 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/inv/compare", tags=["Inv Cartridge"])
+async def compare_stocks(tickers: List[str]):
+    """
+    여러 종목 비교 분석 (종목 분석은 analyze_many 로 동시 수집)
+    
+    Args:
+        tickers: 비교할 종목 코드 ['TSLA', 'NIO', '005930']
+    """
+    try:
+        monitor.record_call('inv')
+        
+        logger.info(f"종목 비교: {tickers}")
+        
+        interface = get_inv_interface()
+        if interface is None:
+            return {"status": "unavailable", "tickers": tickers, "timestamp": datetime.now().isoformat()}
+        
+        result = await interface.compare_multiple_stocks_async(tickers)
+        return {
+            "status": "success",
+            "tickers": tickers,
+            "analyses": {a['ticker']: a['basic_analysis'] for a in result['individual_analyses']},
+            "best_opportunity": result.get('best_opportunity'),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"종목 비교 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/inv/portfolio_optimization", tags=["Inv Cartridge"])
 async def portfolio_optimization(holdings: Dict[str, float]):
     """
@@ -305,6 +423,22 @@ async def portfolio_optimization(holdings: Dict[str, float]):
         
         logger.info(f"포트폴리오 최적화: {list(holdings.keys())}")
         
+        interface = get_inv_interface()
+        if interface is not None:
+            result = await interface.portfolio_optimization_async(holdings)
+            optimized = result.get('optimized_portfolio')
+            if optimized:
+                return {
+                    "status": "success",
+                    "current_portfolio": holdings,
+                    "optimized_portfolio": optimized['weights'],
+                    "strategy": optimized['strategy'],
+                    "expected_return": optimized['expected_return'],
+                    "volatility": optimized['volatility'],
+                    "sharpe_ratio": optimized['sharpe_ratio'],
+                    "timestamp": datetime.now().isoformat()
+                }
+        
         return {
             "status": "success",
             "current_portfolio": holdings,
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Response Filter Benchmark
+기존 8회 순차 re.sub 필터 vs 사전 컴파일 단일 패스 필터 (긴 코드 응답 기준)
+"""
+
+import os
+import re
+import sys
+import time
+
+# 프로젝트 경로 설정
+sys.path.append(os.getcwd())
+
+from projects.ddc.brain.brain_core.response_filter import (
+    StreamingResponseFilter,
+    filter_response,
+)
+
+
+def legacy_filter(response: str, user_query: str) -> str:
+    """기존 ChatEngine._filter_identity_response 로직 (비교 기준)"""
+    metadata_patterns = [
+        r'\[Emotional Status\]:.*?(?=\n|$)',
+        r'\[Empathy Directive\]:.*?(?=\n|$)',
+        r'\[Session Info\].*?(?=\n\n|\[User\]|$)',
+        r'- 사용자: User_\d+.*?(?=\n|$)',
+        r'- 권한:.*?(?=\n|$)',
+        r'- 세션 ID:.*?(?=\n|$)',
+        r'\[User\]:.*?(?=\n|$)',
+        r'\[Response\]:?\s*',
+    ]
+    cleaned = response
+    for pattern in metadata_patterns:
+        cleaned = re.sub(pattern, '', cleaned, flags=re.DOTALL)
+    cleaned = re.sub(r'\n{3,}', '\n\n', cleaned).strip()
+
+    identity_patterns = ["누구", "who are you", "자기소개", "소개해", "정체"]
+    if any(p in user_query.lower() for p in identity_patterns):
+        problematic = ["DeepSeek", "Llama", "Meta AI", "Claude", "인공지능 언어 모델", "Google에서 훈련한", "대규모 언어 모델"]
+        if any(p in cleaned for p in problematic):
+            return "override"
+    return cleaned
+
+
+def build_response(n_blocks: int) -> str:
+    """L4 코드 답변 형태의 긴 응답 생성"""
+    block = (
+        "다음은 요청하신 구현입니다.\n\n"
+        "```python\n"
+        + "".join(f"def handler_{i}(x):\n    return x * {i}  # step {i}\n" for i in range(20))
+        + "```\n\n"
+        "설명: 각 핸들러는 입력을 배수로 변환합니다.\n\n"
+    )
+    leak = "[Emotional Status]: neutral (Intensity: 0.5)\n[Session Info]\n- 사용자: User_1234\n- 권한: guest\n\n"
+    return leak + block * n_blocks + "[User]: 코드 짜줘\n"
+
+
+def bench(func, *args, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def stream_all(text: str, chunk_size: int = 64) -> str:
+    f = StreamingResponseFilter("코드 짜줘")
+    parts = [f.feed(text[i:i + chunk_size]) for i in range(0, len(text), chunk_size)]
+    parts.append(f.flush())
+    return "".join(parts)
+
+
+def main():
+    print("=" * 80)
+    print("🧹 Response Filter Benchmark (legacy vs compiled single-pass)")
+    print("=" * 80)
+    print(f"{'size':>10} | {'legacy (ms)':>12} | {'compiled (ms)':>13} | {'stream (ms)':>11} | {'speedup':>7}")
+    print("-" * 80)
+
+    for n_blocks in (1, 10, 100, 500):
+        text = build_response(n_blocks)
+        assert filter_response(text, "코드 짜줘") == legacy_filter(text, "코드 짜줘")
+
+        legacy_ms = bench(legacy_filter, text, "코드 짜줘")
+        compiled_ms = bench(filter_response, text, "코드 짜줘")
+        stream_ms = bench(stream_all, text)
+        print(f"{len(text):>10,} | {legacy_ms:>12.3f} | {compiled_ms:>13.3f} | {stream_ms:>11.3f} | {legacy_ms / compiled_ms:>6.1f}x")
+
+    print("-" * 80)
+
+
+if __name__ == "__main__":
+    main()
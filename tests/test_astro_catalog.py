@@ -0,0 +1,124 @@
+"""
+Astro Catalog Unit Tests
+검증 대상: astro_cartridge.ExoplanetCatalog (컬럼형 카탈로그, 벡터화 계산, CSV/Parquet/npz 대량 로드)
+"""
+import math
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.astro_cartridge import astro_cartridge as astro
+
+
+def _synthetic_systems(n_systems=1000, seed=0):
+    """모항성 n_systems 개 x 행성 6개 (~6,000 외계행성)"""
+    rng = np.random.default_rng(seed)
+    systems = {}
+    for s in range(n_systems):
+        luminosity = float(10 ** rng.uniform(-3.5, 1.0))
+        star = astro.Star(f"HD {s}", astro.SpectralType.K, float(rng.uniform(2, 14)),
+                          float(rng.uniform(5, 3000)), float(rng.uniform(0.1, 2.0)), 1.0, luminosity)
+        system = astro.ExoplanetSystem(f"HD {s} System", star)
+        for p in range(6):
+            axis = float(math.sqrt(luminosity) * 10 ** rng.uniform(-1, 0.7))
+            system.add_planet(f"HD {s} {chr(98 + p)}", astro.PlanetType.SUPER_EARTH, 10.0, axis)
+        systems[f"HD {s}"] = system
+    return systems
+
+
+def _loop_habitable(systems):
+    """기존 행성별 반복 구현 (기준값)"""
+    found = []
+    for system_name, system in systems.items():
+        hz_inner, hz_outer = system.habitable_zone()
+        for planet in system.planets:
+            axis = planet["semi_major_axis_au"]
+            if hz_inner <= axis <= hz_outer:
+                found.append((system_name, planet["name"], axis,
+                              round((axis - hz_inner) / (hz_outer - hz_inner), 2)))
+    return found
+
+
+def test_vectorized_habitable_query_matches_loop():
+    """~6,000 행성 거주가능 후보: 반복 구현과 동일한 결과, 수 밀리초"""
+    systems = _synthetic_systems()
+    catalog = astro.ExoplanetCatalog.from_systems(systems)
+    assert len(catalog) == 6000
+
+    start = time.perf_counter()
+    mask = catalog.habitable_mask()
+    elapsed = time.perf_counter() - start
+    found = catalog.find_habitable()
+    assert [(r["system"], r["planet"], r["semi_major_axis_au"], r["habitable_index"]) for r in found] \
+        == _loop_habitable(systems)
+    assert mask.sum() == len(found) > 100
+    assert elapsed < 0.02
+
+    cartridge = astro.AstroCartridge()
+    cartridge.exoplanet_systems.update(systems)
+    assert len(cartridge.find_habitable_planets()) == len(found) + 2       # + TRAPPIST-1 d, e
+
+
+def test_vectorized_physics_match_scalar_methods():
+    """중력/탈출속도/궤도속도/거주가능 영역/절대등급 배열 = 스칼라 메서드"""
+    earth = astro.CelestialBody("Earth", 5.972e24, 6371)
+    assert astro.surface_gravity([5.972e24], [6371])[0] == pytest.approx(earth.gravity())
+    assert astro.escape_velocity([5.972e24], [6371])[0] == pytest.approx(earth.escape_velocity())
+
+    trappist = astro.AstroCartridge().exoplanet_systems["TRAPPIST-1"]
+    catalog = astro.ExoplanetCatalog.from_systems({"TRAPPIST-1": trappist})
+    np.testing.assert_allclose(catalog.orbital_velocity(), [p["orbital_velocity_kms"] for p in trappist.planets])
+    assert 80 < catalog.orbital_velocity()[0] < 85                           # TRAPPIST-1b ≈ 83 km/s (AU -> m)
+    inner, outer = catalog.habitable_zone()
+    assert (round(inner[0], 3), round(outer[0], 3)) == trappist.habitable_zone()
+
+    cartridge = astro.AstroCartridge()
+    mags, distances = np.array([-1.46, 11.05, 3.0]), np.array([8.6, 4.24, 0.0])
+    modulus = cartridge.calculate_distance_modulus(mags, distances)
+    assert modulus[:2] == pytest.approx([cartridge.calculate_distance_modulus(m, d) for m, d in zip(mags[:2], distances[:2])])
+    assert math.isnan(modulus[2])
+    with pytest.raises(ValueError):
+        cartridge.calculate_distance_modulus(3.0, 0.0)
+
+
+_ARCHIVE_CSV = """# This file was produced by the NASA Exoplanet Archive
+# COLUMN pl_name: Planet Name
+pl_name,hostname,pl_orbper,pl_orbsmax,pl_bmasse,pl_rade,st_teff,st_rad,st_mass,st_lum,sy_dist,ra,dec,sy_vmag
+Kepler-442 b,Kepler-442,112.3053,0.409,2.36,1.34,4402,0.6,0.61,-0.711,366.64,285.36,39.28,14.76
+TOI-700 d,TOI-700,37.4260,,1.72,1.14,3459,0.42,0.42,-1.655,31.13,97.10,-65.58,13.15
+Teegarden's Star b,Teegarden's Star,4.91,0.0259,1.05,,2904,0.11,0.097,,3.83,43.25,16.88,15.14
+"""
+
+
+def test_bulk_loaders_and_npz_roundtrip(tmp_path):
+    """NASA 아카이브 CSV (주석, 빈 값, 단위 변환, 케플러 보완) / Parquet / npz 왕복"""
+    path = tmp_path / "pscomppars.csv"
+    path.write_text(_ARCHIVE_CSV, encoding="utf-8")
+    cartridge = astro.AstroCartridge()
+    assert cartridge.load_exoplanet_catalog(str(path)) == 3
+    catalog = cartridge.catalog
+
+    assert list(catalog.planet_name) == ["Kepler-442 b", "TOI-700 d", "Teegarden's Star b"]
+    assert catalog.star_luminosity_solar[0] == pytest.approx(10 ** -0.711)
+    assert catalog.distance_ly[1] == pytest.approx(31.13 * 3.26156)
+    assert catalog.semi_major_axis_au[1] == pytest.approx((0.42 * (37.426 / 365.25) ** 2) ** (1 / 3))
+    assert catalog.star_luminosity_solar[2] == pytest.approx(0.11 ** 2 * (2904 / 5772) ** 4)
+    assert math.isnan(catalog.radius_earth[2]) and math.isnan(catalog.surface_gravity()[2])
+    assert catalog.surface_gravity()[0] == pytest.approx(9.81 * 2.36 / 1.34 ** 2, rel=0.01)
+    assert [r["planet"] for r in catalog.find_habitable()] == ["TOI-700 d"]
+    assert cartridge.get_statistics()["catalog_planets"] == 3
+
+    catalog.save(str(tmp_path / "catalog.npz"))
+    reloaded = astro.ExoplanetCatalog.load(str(tmp_path / "catalog.npz"))
+    for name, values in catalog.columns().items():
+        np.testing.assert_array_equal(getattr(reloaded, name), values)
+
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    frame = pd.read_csv(path, comment="#")
+    frame.to_parquet(tmp_path / "pscomppars.parquet")
+    parquet = astro.ExoplanetCatalog.load(str(tmp_path / "pscomppars.parquet"))
+    for name, values in catalog.columns().items():
+        np.testing.assert_array_equal(getattr(parquet, name), values)
@@ -0,0 +1,105 @@
+"""
+Astro Orbits Unit Tests
+검증 대상: astro_cartridge 궤도 전파 (벡터화 케플러 풀이, 배치 리프프로그 N체 적분, 프로세스 풀)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.astro_cartridge import astro_cartridge as astro
+
+
+def _trappist_like(n_systems, seed=0):
+    """행성 3~7개, 주기비 ~1.5 공명 사슬 (TRAPPIST-1 형태)"""
+    rng = np.random.default_rng(seed)
+    systems = []
+    for s in range(n_systems):
+        n = int(rng.integers(3, 8))
+        axes = 0.01 * rng.uniform(0.9, 1.1) * 1.31 ** np.arange(n)       # 주기비 1.31^1.5 ≈ 1.5
+        elements = astro.OrbitalElements(axes, rng.uniform(0, 0.02, n), rng.uniform(0, 360, n), 0.09)
+        systems.append(astro.NBodySystem.from_elements(
+            f"TL-{s}", [f"TL-{s} {chr(98 + p)}" for p in range(n)], 0.09,
+            rng.uniform(0.3, 1.2, n) * astro.EARTH_MASS_SOLAR, elements))
+    return systems
+
+
+def test_vectorized_kepler_solver_and_two_body_period():
+    """케플러 방정식 잔차 ~ 기계 정밀도 (e < 0.99) / 한 주기 뒤 같은 위치 / 위치 = N체 2체 해"""
+    rng = np.random.default_rng(1)
+    M, e = rng.uniform(-20, 20, 10000), rng.uniform(0, 0.99, 10000)
+    E = astro.solve_kepler(M, e)
+    assert np.abs(E - e * np.sin(E) - np.mod(M, 2 * np.pi)).max() < 1e-10
+
+    earth = astro.OrbitalElements(np.array([1.0]), np.array([0.0167]), np.array([0.0]), 1.0)
+    assert earth.period_days()[0] == pytest.approx(365.2569, rel=1e-5)
+    positions = earth.positions(np.array([0.0, 100.0, earth.period_days()[0]]))
+    assert positions.shape == (3, 1, 3)
+    np.testing.assert_allclose(positions[2], positions[0], atol=1e-9)
+    assert np.linalg.norm(positions[0]) == pytest.approx(1 - 0.0167)       # 근일점
+
+    test_particle = astro.NBodySystem.from_elements(
+        "Sun-Earth", ["Earth"], 1.0, [1e-12], astro.OrbitalElements(np.array([1.0]), np.array([0.3]),
+                                                                    np.array([40.0]), 1.0))
+    result = astro.OrbitPropagator(steps_per_orbit=2000).integrate([test_particle], n_orbits=1)[0]
+    np.testing.assert_allclose(result["positions_au"][1], test_particle.positions_au[1]
+                               - test_particle.positions_au[0], atol=1e-4)
+
+
+def test_leapfrog_conserves_energy_and_flags_unstable_systems():
+    """공명 사슬은 안정 (에너지 오차 작음), 힐 반경 안쪽으로 붙인 무거운 행성쌍은 불안정"""
+    cartridge = astro.AstroCartridge()
+    trappist = cartridge.check_stability(n_orbits=100)
+    assert [r["system"] for r in trappist] == ["TRAPPIST-1 System"]
+    assert trappist[0]["stable"] and trappist[0]["energy_error"] < 1e-4
+
+    jupiter = 317.8 * astro.EARTH_MASS_SOLAR
+    packed = astro.NBodySystem.from_elements(
+        "Packed", ["b", "c"], 1.0, [jupiter, jupiter],
+        astro.OrbitalElements(np.array([1.0, 1.05]), np.zeros(2), np.array([0.0, 20.0]), 1.0))
+    result = astro.OrbitPropagator().integrate([packed], n_orbits=200)[0]
+    assert not result["stable"] and result["close_encounter"]
+    assert result["min_hill_separation"] < 1
+
+    positions = cartridge.propagate_orbits("TRAPPIST-1", np.linspace(0, 10, 4))
+    assert positions["TRAPPIST-1e"].shape == (4, 3)
+    np.testing.assert_allclose(np.linalg.norm(positions["TRAPPIST-1e"], axis=1), 0.02925)
+
+
+def test_batched_and_process_pool_integration_match_single_runs():
+    """메모리 상한 배치 (빈 자리 채움) / 프로세스 풀 결과 = 계별 단독 적분, 입력 순서 유지"""
+    systems = _trappist_like(12)
+    propagator = astro.OrbitPropagator(steps_per_orbit=32, max_batch_bytes=40000)
+    batches = propagator.batches(systems)
+    assert 1 < len(batches) < len(systems)
+    assert sorted(s.name for batch in batches for s in batch) == sorted(s.name for s in systems)
+    assert any(len({s.body_count for s in batch}) > 1 for batch in batches)
+
+    batched = propagator.integrate(systems, n_orbits=20)
+    single = [astro.OrbitPropagator(steps_per_orbit=32).integrate([s], n_orbits=20)[0] for s in systems]
+    pooled = astro.OrbitPropagator(steps_per_orbit=32, max_batch_bytes=40000,
+                                   processes=2).integrate(systems, n_orbits=20)
+    assert [r["system"] for r in batched] == [s.name for s in systems]
+    for a, b, c in zip(batched, single, pooled):
+        np.testing.assert_allclose(a["positions_au"], b["positions_au"], rtol=1e-9, atol=1e-12)
+        np.testing.assert_array_equal(a["positions_au"], c["positions_au"])
+        assert a["stable"] == b["stable"] == c["stable"]
+
+
+def test_catalog_systems_use_eccentricity_and_default_masses():
+    """카탈로그 다행성계만 (장반경 순), 이심률 반영, 빠진 질량은 기본값"""
+    catalog = astro.ExoplanetCatalog(
+        planet_name=["A c", "A b", "B b", "C b", "C c"],
+        system_name=["A", "A", "B", "C", "C"],
+        semi_major_axis_au=[0.2, 0.1, 0.05, 0.3, 0.5],
+        star_mass_solar=[1.0, 1.0, 0.5, 0.8, 0.8],
+        mass_earth=[5.0, np.nan, 1.0, 300.0, 2.0],
+        eccentricity=[0.0, 0.2, np.nan, np.nan, 0.1],
+    )
+    systems = astro.NBodySystem.from_catalog(catalog)
+    assert [s.name for s in systems] == ["A", "C"]
+    a = systems[0]
+    assert a.planet_names == ["A b", "A c"]
+    assert a.masses_solar[1:] == pytest.approx([astro.EARTH_MASS_SOLAR, 5 * astro.EARTH_MASS_SOLAR])
+    assert np.linalg.norm(a.positions_au[1] - a.positions_au[0]) == pytest.approx(0.1 * 0.8, rel=1e-4)
+    np.testing.assert_allclose(a.masses_solar @ a.velocities_au_day, 0, atol=1e-15)   # 질량중심 정지
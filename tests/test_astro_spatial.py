@@ -0,0 +1,100 @@
+"""
+Astro Spatial Index Unit Tests
+검증 대상: astro_cartridge.KDTree / SkyGrid / StarIndex (3D 이웃, 천구 원뿔 검색, 저장/로드)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.astro_cartridge import astro_cartridge as astro
+
+
+@pytest.fixture(scope="module")
+def sky():
+    """무작위 별 20,000 개 (전천 균일, 거리 1-500 광년, 일부 거리 미상)"""
+    rng = np.random.default_rng(0)
+    n = 20000
+    ra = rng.uniform(0, 360, n)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+    distance = rng.uniform(1, 500, n)
+    distance[::97] = np.nan
+    magnitude = rng.uniform(-1, 12, n)
+    names = [f"HIP {i}" for i in range(n)]
+    return astro.StarIndex(names, ra, dec, distance, magnitude, leaf_size=16, cell_deg=2.0)
+
+
+def _brute_within(index, center, radius):
+    d = np.linalg.norm(index.positions - center, axis=1)
+    return {index.names[i] for i in np.flatnonzero(d <= radius)}
+
+
+def _brute_cone(index, ra, dec, radius):
+    sep = astro.angular_separation(index.ra_deg, index.dec_deg, ra, dec)
+    return {index.names[i] for i in np.flatnonzero(sep <= radius)}
+
+
+def test_kdtree_matches_brute_force(sky):
+    """반경/최근접 검색 = 전수 비교 (자신 제외, 거리 미상 별 제외)"""
+    rng = np.random.default_rng(1)
+    for name in rng.choice(sky.names[np.isfinite(sky.distance_ly)], 10):
+        center = sky.position(name)
+        for radius in (5.0, 40.0):
+            found = sky.within(name, radius)
+            assert {r["name"] for r in found} == _brute_within(sky, center, radius) - {name}
+            assert [r["separation_ly"] for r in found] == sorted(r["separation_ly"] for r in found)
+
+        nearest = sky.nearest(name, k=7)
+        d = np.linalg.norm(sky.positions - center, axis=1)
+        d[sky.row_by_name[name]] = np.inf
+        expected = np.sort(d[np.isfinite(d)])[:7]
+        np.testing.assert_allclose([r["separation_ly"] for r in nearest], expected)
+
+    with pytest.raises(ValueError):
+        sky.within("HIP 0", 10)          # 거리 미상
+    assert sky.nearest([0.0, 0.0, 0.0], k=1)[0]["separation_ly"] == pytest.approx(np.nanmin(sky.distance_ly))
+
+
+@pytest.mark.parametrize("ra, dec, radius", [(120, 30, 3.0), (359.5, -10, 4.0), (0.2, 0, 1.5),
+                                             (45, 88.5, 3.0), (200, -89.9, 0.5), (10, 20, 95.0)])
+def test_cone_search_matches_brute_force(sky, ra, dec, radius):
+    """원뿔 검색 = 전수 각거리 비교 (적경 0/360 경계, 극 포함, 반구 이상 반경)"""
+    found = sky.cone(ra, dec, radius)
+    assert {r["name"] for r in found} == _brute_cone(sky, ra, dec, radius)
+    bright = sky.cone(ra, dec, radius, max_magnitude=4.0)
+    assert all(r["magnitude"] <= 4.0 for r in bright)
+    assert len(bright) == sum(sky.magnitude[sky.row_by_name[r["name"]]] <= 4.0 for r in found)
+
+
+def test_persisted_index_and_cartridge_queries(sky, tmp_path):
+    """HYG CSV 로 생성 -> .npz 저장/로드 (재분할 없음), 카트리지 이웃 API / compare_stars"""
+    csv_path = tmp_path / "hygdata.csv"
+    rows = ["id,proper,ra,dec,dist,mag",
+            "1,Alpha Centauri A,14.660,-60.834,1.3248,-0.01",
+            "2,Barnard's Star,17.963,4.693,1.8282,9.51",
+            "3,,6.752,-16.716,100000,5.0"]
+    csv_path.write_text("\n".join(rows), encoding="utf-8")
+
+    cartridge = astro.AstroCartridge()
+    saved = tmp_path / "stars.npz"
+    assert cartridge.build_star_index(str(csv_path), save_path=str(saved)) == 4 + 3
+    near = cartridge.stars_within("Proxima Centauri", 1.0)
+    assert [r["name"] for r in near] == ["Alpha Centauri A"]
+    assert near[0]["separation_ly"] < 0.3
+    assert [r["name"] for r in cartridge.nearest_stars("Sun", 3)] == \
+        ["Proxima Centauri", "Alpha Centauri A", "Barnard's Star"]
+    assert {r["name"] for r in cartridge.cone_search(101.3, -16.7, 0.5)} == {"Sirius", "star-2"}
+
+    comparison = cartridge.compare_stars("Sirius", "Proxima Centauri")["comparison"]
+    assert 8 < comparison["separation_ly"] < 13 and 0 < comparison["angular_separation_deg"] < 180
+
+    other = astro.AstroCartridge()
+    assert other.load_star_index(str(saved)) == 7
+    assert other.stars_within("Proxima Centauri", 1.0) == near
+
+    sky.save(str(tmp_path / "sky.npz"))
+    loaded = astro.StarIndex.load(str(tmp_path / "sky.npz"))
+    np.testing.assert_array_equal(loaded.kdtree.node_min, sky.kdtree.node_min)
+    np.testing.assert_array_equal(loaded.positions, sky.positions)
+    assert loaded.within("HIP 5", 30.0) == sky.within("HIP 5", 30.0)
+    assert loaded.cone(359.5, -10, 4.0) == sky.cone(359.5, -10, 4.0)
@@ -0,0 +1,103 @@
+"""
+Astro Transit Search Unit Tests
+검증 대상: astro_cartridge 광도곡선 파이프라인 (메모리 맵 청크 로드, 이동 중앙값 추세 제거, 벡터화 BLS)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.astro_cartridge import astro_cartridge as astro
+
+
+def _light_curve(n=60000, days=30.0, period=3.3, epoch=1.0, duration=0.1, depth=0.004, noise=1e-3, seed=0):
+    """2분 간격 측광 + 느린 항성 변광 + 박스 트랜짓"""
+    rng = np.random.default_rng(seed)
+    time = np.linspace(0, days, n)
+    flux = 1 + 0.01 * np.sin(2 * np.pi * time / 7.0) + rng.normal(0, noise, n)
+    phase = np.mod(time - epoch + period / 2, period) - period / 2
+    flux[np.abs(phase) < duration / 2] *= 1 - depth
+    return time, flux
+
+
+def test_running_median_and_chunked_streaming_match_in_memory(tmp_path):
+    """stride 1 이동 중앙값 = 창별 np.median / CSV -> 메모리 맵 .npy, 청크 크기와 무관한 빈 누적"""
+    values = np.random.default_rng(1).normal(size=500)
+    exact = astro.running_median(values, 21, stride=1)
+    np.testing.assert_allclose(exact[10:-10], [np.median(values[i - 10:i + 11]) for i in range(10, 490)])
+    assert astro.running_median(values[:5], 21).tolist() == [np.median(values[:5])] * 5
+
+    time, flux = _light_curve(n=20000)
+    flux[123] = np.nan
+    path = tmp_path / "lc.csv"
+    with open(path, "w") as f:
+        f.write("# TESS SPOC\nTIME,PDCSAP_FLUX\n")
+        f.writelines(f"{float(t)!r},{'' if np.isnan(y) else repr(float(y))}\n" for t, y in zip(time, flux))
+    light_curve = astro.LightCurve.load(str(path), "TIME", "PDCSAP_FLUX", chunk_rows=3000)
+    assert isinstance(light_curve.time.base, np.memmap) and len(light_curve) == 20000
+    np.testing.assert_array_equal(light_curve.time, time)
+    assert (tmp_path / "lc.npy").exists()
+
+    whole = astro.TransitSearch(chunk_size=10 ** 6).bin_light_curve(astro.LightCurve(time, flux))
+    streamed = astro.TransitSearch(chunk_size=1500).bin_light_curve(light_curve)
+    for a, b in zip(whole, streamed):
+        np.testing.assert_allclose(a, b, atol=1e-12)
+    assert abs(whole[1]).max() < 0.01                                # 변광 (1%) 제거됨
+
+
+def _naive_bls(time, flux, weight, period, durations, bin_days):
+    """주기 하나, 시작 위상 x 지속시간 반복 (기준 구현)"""
+    nb = int(np.ceil(period / bin_days))
+    phase_bin = np.floor(np.mod(time, period) / (period / nb)).astype(int)
+    best = 0.0
+    for q in np.clip(np.rint(durations / (period / nb)).astype(int), 1, nb - 1):
+        for start in range(nb):
+            inside = np.mod(phase_bin - start, nb) < q
+            r, s = weight[inside].sum(), (weight * flux)[inside].sum()
+            if 0 < r < 1 and s < 0:
+                best = max(best, s * s / (r * (1 - r)))
+    return best
+
+
+def test_vectorized_bls_matches_naive_loop_and_process_pool():
+    """주기 블록 bincount BLS = 반복 구현, 프로세스 풀 결과 = 단일 프로세스"""
+    search = astro.TransitSearch(min_period_days=1.0, durations_days=(0.06, 0.1))
+    time, flux, weight = search.bin_light_curve(astro.LightCurve(*_light_curve()))
+    periods = np.array([1.7, 2.45, 3.3])
+    spectrum = search.power(time, flux, weight, periods)
+    for period, power in zip(periods, spectrum["power"]):
+        single = search.power(time, flux, weight, np.array([period]))["power"][0]
+        assert power > 0 and single == pytest.approx(
+            _naive_bls(time - time.min() + search.bin_days / 2, flux, weight, period, search.durations_days, search.bin_days), rel=1e-9)
+    assert spectrum["power"].argmax() == 2
+
+    grid = search.period_grid(float(time.max() - time.min()))
+    serial = search.power(time, flux, weight, grid)
+    search.processes = 2
+    pooled = search.power(time, flux, weight, grid)
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], pooled[key])
+
+
+def test_search_recovers_injected_transit_and_adds_planet():
+    """주입한 트랜짓 (P=3.3일, 깊이 0.4%) 복원, 별칭 제외, 행성계에 후보 행성 추가"""
+    cartridge = astro.AstroCartridge()
+    cartridge.exoplanet_systems["Proxima Centauri"] = astro.ExoplanetSystem(
+        "Proxima Centauri System", cartridge.stars["Proxima Centauri"])
+    light_curve = astro.LightCurve(*_light_curve())
+    result = cartridge.search_transits("Proxima Centauri", light_curve,
+                                       astro.TransitSearch(min_period_days=1.0, chunk_size=7000))
+    assert len(result["candidates"]) == 1
+    candidate = result["candidates"][0]
+    assert candidate["period_days"] == pytest.approx(3.3, rel=2e-3)
+    assert np.mod(candidate["epoch"] - 1.0 + 0.1, 3.3) < 0.2
+    assert candidate["depth"] == pytest.approx(0.004, rel=0.3) and candidate["sde"] > 7
+
+    planet = result["planets"][0]
+    system = cartridge.exoplanet_systems["Proxima Centauri"]
+    assert system.planets[-1] is planet and planet["candidate"]
+    assert planet["type"] == astro.PlanetType.TERRESTRIAL.value              # √0.004 x 0.14 R☉ ≈ 0.97 R⊕
+    assert planet["semi_major_axis_au"] == pytest.approx((0.12 * (3.3 / 365.25) ** 2) ** (1 / 3), rel=0.01)
+
+    quiet = astro.TransitSearch(min_period_days=1.0).search(astro.LightCurve(*_light_curve(depth=0.0)))
+    assert quiet["candidates"] == []
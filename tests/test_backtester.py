@@ -0,0 +1,158 @@
+"""
+Backtester Unit Tests
+검증 대상: quant_cartridge.Backtester (리밸런싱 재현, 거래비용, 배치 위험 지표, indicator_weights 스윕)
+"""
+import math
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.utilities.market_data_store import MarketDataStore
+
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+
+
+def _market(n_assets=6, n_periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    drift = rng.normal(0.0004, 0.0006, (n_assets, 1))
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, (n_assets, n_periods)) + drift, axis=1))
+    volumes = rng.uniform(1e5, 1e6, (n_assets, n_periods))
+    return [f"S{i}" for i in range(n_assets)], prices, volumes
+
+
+def _reference_equity(bt, targets):
+    """기간별 루프 참조 구현 (보유 수량 추적)"""
+    prices = bt.prices
+    value = 1.0
+    shares = np.zeros(prices.shape[0])
+    cash = 1.0
+    curve = [1.0]
+    rebalances = {t: k for k, t in enumerate(bt.rebalance_dates.tolist())}
+    for t in range(bt.start, prices.shape[1]):
+        value = cash + shares @ prices[:, t]
+        if t in rebalances:
+            current = shares * prices[:, t] / value
+            target = targets[rebalances[t]]
+            value *= 1 - bt.transaction_cost * np.abs(target - current).sum()
+            shares = target * value / prices[:, t]
+            cash = value * (1 - target.sum())
+        if t > bt.start:
+            curve.append(cash + shares @ prices[:, t])
+    return np.array(curve)
+
+
+def test_simulation_matches_reference_loop():
+    """드리프트 + 주기적 리밸런싱 + 거래비용 = 수량 기반 루프 재현"""
+    symbols, prices, volumes = _market()
+    bt = qc.Backtester(symbols, prices, volumes, lookback=20, rebalance_every=7, transaction_cost=0.002)
+    rng = np.random.default_rng(1)
+    targets = rng.dirichlet(np.ones(len(symbols)), size=len(bt.rebalance_dates)) * 0.9   # 10% 현금
+    equity, turnover, costs = bt.simulate(targets[None])
+    np.testing.assert_allclose(equity[0], _reference_equity(bt, targets), rtol=1e-12)
+    assert costs[0] == pytest.approx(0.002 * turnover[0])
+
+
+def test_batch_metrics_match_quantitative_analysis():
+    """배치 지표 = QuantitativeAnalysis 공식 (기간 무위험수익률, √252 연율화)"""
+    symbols, prices, _ = _market()
+    bt = qc.Backtester(symbols, prices, lookback=20)
+    returns = np.random.default_rng(2).normal(0.0005, 0.01, (3, len(bt.benchmark_returns)))
+    metrics = bt.batch_metrics(returns)
+    rf = 0.02 / 252
+    for i, row in enumerate(returns.tolist()):
+        qa = qc.QuantitativeAnalysis
+        assert metrics["sharpe_ratio"][i] == pytest.approx(qa.calculate_sharpe_ratio(row, rf) * math.sqrt(252))
+        assert metrics["sortino_ratio"][i] == pytest.approx(qa.calculate_sortino_ratio(row, 0.0, rf) * math.sqrt(252))
+        assert metrics["value_at_risk"][i] == pytest.approx(qa.calculate_var_95(row))
+        assert metrics["conditional_var"][i] == pytest.approx(qa.calculate_cvar(row))
+        assert metrics["information_ratio"][i] == pytest.approx(
+            qa.calculate_information_ratio(row, bt.benchmark_returns.tolist()) * math.sqrt(252)
+        )
+        curve = np.cumprod(np.concatenate([[1.0], 1 + np.array(row)])).tolist()
+        assert metrics["max_drawdown"][i] == pytest.approx(qa.calculate_max_drawdown(curve))
+
+
+def test_signal_components_match_processor():
+    """리밸런싱 시점 지표 = MarketSignalProcessor.generate_signals_batch (실현 변동성 기준)"""
+    symbols, prices, volumes = _market(seed=3)
+    bt = qc.Backtester(symbols, prices, volumes, lookback=60, rebalance_every=10)
+    components = bt.indicator_components()
+    k = 4
+    t = int(bt.rebalance_dates[k])
+    window = slice(t - 59, t + 1)
+    realized = np.diff(np.log(prices[:, window]), axis=1).std(axis=1, ddof=1) * math.sqrt(252)
+    assets = [qc.Asset(s, s, qc.MarketType.USA, "Tech", 100.0, float(v)) for s, v in zip(symbols, realized)]
+
+    signals = qc.MarketSignalProcessor().generate_signals_batch(assets, prices[:, window], volumes[:, window])
+    for i, symbol in enumerate(symbols):
+        for c, name in enumerate(qc.Backtester.INDICATORS):
+            assert components[c, k, i] == pytest.approx(signals[symbol].indicators[name], abs=1e-12)
+
+
+def test_sweep_parallel_matches_serial():
+    """스윕: 입력 순서 유지, 프로세스 분산 결과 = 단일 프로세스 결과"""
+    symbols, prices, volumes = _market(n_assets=8, seed=4)
+    bt = qc.Backtester(symbols, prices, volumes, lookback=40, rebalance_every=5)
+    grid = qc.Backtester.indicator_weight_grid(0.25)
+    assert len(grid) == 35 and all(sum(w.values()) == pytest.approx(1.0) for w in grid)
+
+    serial = bt.sweep(grid, max_workers=1)
+    parallel = bt.sweep(grid, max_workers=2, chunk_elements=500, process_threshold=0)
+    assert [r.parameters for r in parallel] == grid
+    for a, b in zip(serial, parallel):
+        np.testing.assert_allclose(a.equity_curve, b.equity_curve)
+        assert a.risk_metrics.sharpe_ratio == pytest.approx(b.risk_metrics.sharpe_ratio)
+    single = bt.run_signals(grid[7])
+    np.testing.assert_allclose(single.equity_curve, serial[7].equity_curve)
+
+
+def test_policy_callable_and_dual_quant():
+    """정책 함수 백테스트: 매 기간 동일 비중 + 비용 0 = 자산 수익률 평균"""
+    symbols, prices, volumes = _market(n_assets=4, seed=5)
+    bt = qc.Backtester(symbols, prices, volumes, lookback=10, rebalance_every=1, transaction_cost=0.0)
+    result = bt.run(lambda t, p, v: np.full(4, 0.25))
+    asset_returns = prices[:, bt.start + 1:] / prices[:, bt.start:-1] - 1
+    np.testing.assert_allclose(result.returns, asset_returns.mean(axis=0))
+    assert result.equity_curve[0] == bt.initial_capital
+
+    assets = [qc.Asset(s, s, qc.MarketType.USA, "Tech", 100.0, v) for s, v in zip(symbols, [0.1, 0.2, 0.35, 0.5])]
+    dual = qc.Backtester(symbols, prices, volumes, lookback=30, rebalance_every=20).run(
+        qc.Backtester.dual_quant_policy(assets)
+    )
+    assert dual.turnover > 0 and dual.transaction_costs > 0
+    assert 0 <= dual.risk_metrics.max_drawdown < 1
+
+
+def _store_cartridge(tmp_path):
+    """로컬 저장소 이력 200일 + 자산 3개가 등록된 QuantCartridge"""
+    symbols, prices, volumes = _market(n_assets=3, n_periods=200, seed=6)
+    store = MarketDataStore(tmp_path)
+    start = date(2024, 1, 1)
+    for symbol, p, v in zip(symbols, prices, volumes):
+        store.append(symbol, {"date": [start + timedelta(days=i) for i in range(200)],
+                              "open": p, "high": p, "low": p, "close": p, "volume": v})
+    cartridge = qc.QuantCartridge(market_store=store)
+    for symbol in symbols:
+        cartridge.register_asset(qc.Asset(symbol, symbol, qc.MarketType.USA, "Tech", 100.0, 0.2))
+    return cartridge
+
+
+def test_cartridge_tunes_weights_from_store(tmp_path):
+    """QuantCartridge: 로컬 저장소 이력으로 indicator_weights 튜닝 후 적용"""
+    cartridge = _store_cartridge(tmp_path)
+    results = cartridge.tune_indicator_weights(step=0.5, rebalance_every=10)
+    sharpes = [r.risk_metrics.sharpe_ratio for r in results]
+    assert sharpes == sorted(sharpes, reverse=True)
+    assert cartridge.signal_processor.indicator_weights == results[0].parameters
+
+
+@pytest.mark.parametrize("metric", ["max_drawdown", "conditional_var"])
+def test_tuning_on_loss_metric_picks_lowest(tmp_path, metric):
+    """손실형 지표 (낙폭/CVaR) 는 낮을수록 좋음 - 오름차순 정렬, 최소값 가중치 적용"""
+    cartridge = _store_cartridge(tmp_path)
+    results = cartridge.tune_indicator_weights(step=0.5, metric=metric, rebalance_every=10)
+    losses = [getattr(r.risk_metrics, metric) for r in results]
+    assert losses == sorted(losses) and losses[0] < losses[-1]
+    assert cartridge.signal_processor.indicator_weights == results[0].parameters
@@ -0,0 +1,103 @@
+"""
+Bio-Cartridge CV Batch Unit Tests
+검증 대상: bio_cartridge_v2_1.CVAnalyzer (프로세스 풀 배치 / 공유 메모리 / 비동기)
+         + HybridAnalyzer CV-Vision 동시 실행, 배치 스트리밍
+"""
+import asyncio
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from projects.ddc.cartridges.bio import bio_cartridge_v2_1 as bio
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _shutdown_pool():
+    yield
+    bio.CVAnalyzer.shutdown()
+
+
+def _image(seed, size=256):
+    rng = np.random.default_rng(seed)
+    img = cv2.GaussianBlur(rng.integers(0, 256, (size, size), dtype=np.uint8), (9, 9), 0)
+    return cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX)
+
+
+def _plate(tmp_path, n):
+    paths = []
+    for i in range(n):
+        path = str(tmp_path / f"well_{i:02d}.png")
+        cv2.imwrite(path, _image(i))
+        paths.append(path)
+    return paths
+
+
+class SlowVision(bio.GeminiVisionAPI):
+    """Vision API 대신 지연 후 고정 응답"""
+
+    def __init__(self, delay=0.2):
+        self.model = None
+        self.delay = delay
+        self.calls = []
+
+    async def analyze_image(self, image_path, digest=None):
+        self.calls.append(image_path)
+        await asyncio.sleep(self.delay)
+        return {"cell_type": "Organoid", "confidence": 90, "health_score": 80}
+
+
+def test_batch_matches_serial_for_paths_and_arrays(tmp_path):
+    """배치(경로 + 공유 메모리 배열) 결과 = 단일 이미지 동기 분석"""
+    paths = _plate(tmp_path, 6)
+    arrays = [_image(100 + i) for i in range(3)] + [cv2.cvtColor(_image(200), cv2.COLOR_GRAY2BGR)]
+    images = paths + arrays
+
+    results = dict(bio.CVAnalyzer.analyze_batch(images, max_workers=2))
+    assert sorted(results) == list(range(len(images)))
+    for i, path in enumerate(paths):
+        assert results[i] == bio.CVAnalyzer.analyze(path)
+    for i, array in enumerate(arrays, start=len(paths)):
+        assert results[i] == bio.CVAnalyzer.analyze_array(array)
+
+    missing = dict(bio.CVAnalyzer.analyze_batch([str(tmp_path / "missing.png")]))
+    assert missing[0].cv_confidence == 40.0   # 폴백
+
+
+def test_async_batch_streams_every_image(tmp_path):
+    """비동기 배치: 모든 입력 인덱스가 한 번씩 반환"""
+    paths = _plate(tmp_path, 5)
+
+    async def collect():
+        return [item async for item in bio.CVAnalyzer.analyze_batch_async(paths)]
+
+    streamed = asyncio.run(collect())
+    assert sorted(i for i, _ in streamed) == list(range(5))
+    assert dict(streamed)[3] == bio.CVAnalyzer.analyze(paths[3])
+
+
+def test_hybrid_runs_cv_while_vision_in_flight(tmp_path):
+    """HybridAnalyzer: CV 가 Vision 대기 중 풀에서 실행, 배치는 완료 순서대로 스트리밍"""
+    paths = _plate(tmp_path, 8)
+    vision = SlowVision(delay=0.2)
+    analyzer = bio.HybridAnalyzer(vision)
+    bio.CVAnalyzer.analyze(paths[0])
+    asyncio.run(bio.CVAnalyzer.analyze_async(paths[0]))   # 풀 워밍업
+
+    start = time.perf_counter()
+    result = asyncio.run(analyzer.analyze(paths[0]))
+    assert time.perf_counter() - start < 0.2 + 0.15
+    assert result.cv_analysis == bio.CVAnalyzer.analyze(paths[0])
+    assert result.health_score == pytest.approx(result.cv_analysis.morphology_score * 0.3 + 80 * 0.7)
+
+    async def collect():
+        return [item async for item in analyzer.analyze_batch(paths + paths[:2], max_concurrency=4)]
+
+    vision.calls.clear()
+    start = time.perf_counter()
+    streamed = asyncio.run(collect())
+    assert time.perf_counter() - start < 2 * 0.2 + 0.3     # 8장 / 동시 4 = 2 라운드
+    assert sorted(path for path, _ in streamed) == sorted(paths)
+    assert sorted(vision.calls) == sorted(paths)          # 중복 경로는 1회만
@@ -0,0 +1,87 @@
+"""
+Bio-Cartridge Tiled Analysis Unit Tests
+검증 대상: bio_cartridge_v2_1.CVAnalyzer.analyze_tiled (타일 통계 병합 = 전체 이미지 분석, 히트맵)
+"""
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from projects.ddc.cartridges.bio import bio_cartridge_v2_1 as bio
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _shutdown_pool():
+    yield
+    bio.CVAnalyzer.shutdown()
+
+
+def _organoid(h, w, blur=15, seed=0):
+    """구멍 안에 작은 성분이 있는 (RETR_EXTERNAL 과 연결 성분 수가 다른) 합성 이미지"""
+    rng = np.random.default_rng(seed)
+    img = cv2.GaussianBlur(rng.integers(0, 256, (h, w), dtype=np.uint8), (blur, blur), 0)
+    return cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX)
+
+
+def _assert_same(tiled, full):
+    assert tiled.density == pytest.approx(full.density, rel=1e-12)
+    assert tiled.aggregation == full.aggregation
+    assert tiled.texture_variance == pytest.approx(full.texture_variance, rel=1e-9)
+    assert tiled.morphology_score == pytest.approx(full.morphology_score, rel=1e-9)
+
+
+def test_tiled_metrics_match_whole_image():
+    """타일 크기와 무관하게 밀도/응집도(외곽 윤곽선 수)/라플라시안 분산 동일"""
+    img = _organoid(700, 900)
+    full = bio.CVAnalyzer.analyze_array(img)
+    _, thresh = cv2.threshold(img, 127, 255, cv2.THRESH_BINARY)
+    assert cv2.connectedComponents(thresh, connectivity=8)[0] - 1 > full.aggregation * 100
+
+    for tile_size in (64, 250, 1000):
+        _assert_same(bio.CVAnalyzer.analyze_tiled(img, tile_size=tile_size).analysis, full)
+
+    rng = np.random.default_rng(1)
+    for _ in range(10):   # 작은 타일 + 잡음 (대각선/모서리 병합)
+        h, w = rng.integers(5, 60, 2)
+        noise = rng.integers(0, 256, (h, w)).astype(np.uint8)
+        tiled = bio.CVAnalyzer.analyze_tiled(noise, tile_size=int(rng.integers(2, 12)))
+        _assert_same(tiled.analysis, bio.CVAnalyzer.analyze_array(noise))
+
+
+def test_memory_mapped_and_decoded_sources(tmp_path):
+    """.npy 메모리 맵 / 일반 포맷 디코딩 폴백, 히트맵 형태, 임시 파일 정리"""
+    img = _organoid(520, 610, seed=2)
+    full = bio.CVAnalyzer.analyze_array(img)
+    np.save(tmp_path / "slide.npy", img)
+    cv2.imwrite(str(tmp_path / "slide.png"), img)
+
+    tiled = bio.CVAnalyzer.analyze_tiled(str(tmp_path / "slide.npy"), tile_size=200, max_workers=2)
+    _assert_same(tiled.analysis, full)
+    assert tiled.image_shape == (520, 610)
+    assert tiled.density_map.shape == tiled.texture_map.shape == (3, 4)
+    assert tiled.density_map[0, 0] == pytest.approx(np.count_nonzero(img[:200, :200] > 127) / 200 ** 2 * 100)
+
+    before = set(Path(tempfile.gettempdir()).glob("*.npy"))
+    _assert_same(bio.CVAnalyzer.analyze_tiled(str(tmp_path / "slide.png"), tile_size=256).analysis, full)
+    assert set(Path(tempfile.gettempdir()).glob("*.npy")) == before
+
+
+def test_large_images_switch_to_tiled_mode(tmp_path, monkeypatch):
+    """헤더 크기가 기준 이상이면 analyze_async 가 타일 모드 사용"""
+    img = _organoid(300, 300, seed=3)
+    path = str(tmp_path / "large.npy")
+    np.save(path, img)
+    assert bio.CVAnalyzer.image_shape(path) == (300, 300)
+    assert not bio.CVAnalyzer.is_large(path)
+
+    monkeypatch.setattr(bio.Config, "TILED_MIN_PIXELS", 300 * 300)
+    calls = []
+    original = bio.CVAnalyzer.analyze_tiled
+    monkeypatch.setattr(bio.CVAnalyzer, "analyze_tiled", staticmethod(lambda *a, **k: calls.append(a) or original(*a, **k)))
+    assert bio.CVAnalyzer.is_large(path)
+    result = asyncio.run(bio.CVAnalyzer.analyze_async(path))
+    assert calls and result.aggregation == bio.CVAnalyzer.analyze_array(img).aggregation
@@ -0,0 +1,103 @@
+"""
+Bio-Cartridge Video Pipeline Unit Tests
+검증 대상: bio_cartridge_v2_1.VideoFramePipeline (적응형 프레임 샘플링, CV 시계열, 발달 단계, 진행 보고)
+"""
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from projects.ddc.cartridges.bio import bio_cartridge_v2_1 as bio
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _shutdown_pool():
+    yield
+    bio.CVAnalyzer.shutdown()
+
+
+@pytest.fixture(scope="module")
+def timelapse(tmp_path_factory):
+    """오가노이드 성장(0-40초) 후 정체(40-60초) 타임랩스, 8fps"""
+    path = str(tmp_path_factory.mktemp("video") / "organoid.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 8, (160, 160))
+    if not writer.isOpened():
+        pytest.skip("MJPG 인코더 없음")
+    centers = np.random.default_rng(0).integers(20, 140, (12, 2))
+    for i in range(480):
+        frame = np.zeros((160, 160), np.uint8)
+        radius = int(2 + min(i // 8, 40) * 0.35)
+        for c in centers:
+            cv2.circle(frame, (int(c[0]), int(c[1])), radius, 255, -1)
+        writer.write(cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR))
+    writer.release()
+    return path
+
+
+def _frames(path):
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            return frames
+        frames.append(frame)
+
+
+def test_adaptive_sampling_matches_frame_analysis(timelapse):
+    """검사 간격 + 유사 프레임 건너뜀, 샘플 CV 결과 = 해당 프레임 단일 분석"""
+    progress = []
+    result = bio.VideoFramePipeline(inspect_fps=4, max_in_flight=1).analyze(timelapse, progress.append)
+
+    assert result.total_frames == 480 and result.fps == pytest.approx(8)
+    assert result.inspected_frames == 240
+    assert 0 < result.sampled_frames < result.inspected_frames / 4
+    assert progress[-1]["percent"] == 100.0 and progress[-1]["frames_sampled"] == result.sampled_frames
+
+    frames = _frames(timelapse)
+    indices = [s.frame_index for s in result.samples]
+    assert indices == sorted(indices) and all(i % 2 == 0 for i in indices)
+    for sample in result.samples[::5]:
+        assert sample.analysis == bio.CVAnalyzer.analyze_array(frames[sample.frame_index])
+        assert sample.time_seconds == pytest.approx(sample.frame_index / 8)
+
+    # 강제 샘플 간격: 길이 / VIDEO_MIN_SAMPLES
+    gaps = np.diff([s.time_seconds for s in result.samples])
+    assert gaps.max() <= 60 / bio.Config.VIDEO_MIN_SAMPLES + 0.25
+
+    unbounded = bio.VideoFramePipeline(inspect_fps=4).analyze(timelapse)
+    assert [s.analysis for s in unbounded.samples] == [s.analysis for s in result.samples]
+
+
+def test_growth_then_plateau_stages(timelapse):
+    """성장 구간 = proliferation, 마지막 정체 구간 = stable"""
+    result = bio.VideoFramePipeline().analyze(timelapse)
+    stages = [s["stage"] for s in result.stages]
+    assert "proliferation" in stages and stages[-1] == "stable"
+    growth = result.stages[stages.index("proliferation")]
+    assert growth["mean_density"] < result.stages[-1]["mean_density"]
+    assert result.stages[-1]["end_seconds"] == result.samples[-1].time_seconds
+
+    series = result.to_dict()["series"]
+    assert len(series["density"]) == result.sampled_frames
+    assert series["density"][-1] > series["density"][0]
+
+
+def test_async_progress_callback(timelapse):
+    """비동기 실행: 코루틴 콜백도 이벤트 루프에서 호출"""
+    seen = []
+
+    async def on_progress(info):
+        seen.append(info["frames_processed"])
+
+    async def run():
+        result = await bio.CVAnalyzer.analyze_async(np.zeros((8, 8), np.uint8))   # 루프 양보 확인용
+        video = await bio.VideoFramePipeline().analyze_async(timelapse, on_progress)
+        await asyncio.sleep(0.05)
+        return result, video
+
+    _, video = asyncio.run(run())
+    assert seen == sorted(seen) and seen[-1] == video.total_frames
+    assert bio.VideoFramePipeline.detect_stages([]) == []
@@ -0,0 +1,224 @@
+"""
+Content-Addressed Cache Unit Tests
+검증 대상: projects.ddc.utilities.cache_system.ContentAddressedCache / APIResponseCache.cache_bio_analysis
+         + bio_cartridge_v2_1.BioCartridgeV21 결과 캐시, Gemini 업로드 핸들 재사용
+"""
+import asyncio
+import shutil
+
+import pytest
+
+from projects.ddc.utilities.cache_system import APIResponseCache, CacheManager, ContentAddressedCache
+
+
+def _write(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_keys_follow_content_and_survive_restart(tmp_path):
+    """같은 내용 = 같은 해시 (경로 무관), 재시작 후에도 유지, TTL"""
+    cache = ContentAddressedCache(tmp_path / "cache.sqlite3")
+    a = _write(tmp_path / "a.png", b"plate-001")
+    b = _write(tmp_path / "renamed.png", b"plate-001")
+    c = _write(tmp_path / "c.png", b"plate-002")
+    assert cache.content_hash(a) == cache.content_hash(b) == cache.content_hash(b"plate-001")
+    assert cache.content_hash(a) != cache.content_hash(c)
+
+    key = cache.make_key("bio", "v1", cache.content_hash(a))
+    cache.set(key, {"health_score": 88.5})
+    cache.close()
+
+    reopened = ContentAddressedCache(tmp_path / "cache.sqlite3")
+    assert reopened.get(key) == {"health_score": 88.5}
+    assert reopened.get(cache.make_key("bio", "v2", cache.content_hash(a))) is None   # 버전 변경 = 미스
+    assert reopened.get(key, ttl=-1) is None
+    assert reopened.get_stats()["cached_items"] == 1
+
+
+def test_lru_eviction_by_size(tmp_path):
+    """용량 초과 시 가장 오래 사용하지 않은 항목부터 제거 (조회 시 갱신)"""
+    cache = ContentAddressedCache(tmp_path / "cache.sqlite3", max_bytes=300)
+    for name in "abc":
+        cache.set(name, "x" * 90)
+    assert cache.get("a") is not None          # a 사용 -> b 가 가장 오래됨
+    cache.set("d", "x" * 90)
+    assert cache.get("b") is None
+    assert all(cache.get(k) is not None for k in "acd")
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_bio_decorator_sync_and_async(tmp_path):
+    """cache_bio_analysis: 내용 기반 키, 동기/비동기 함수 모두 1회 실행"""
+    api_cache = APIResponseCache(CacheManager(), ContentAddressedCache(tmp_path / "cache.sqlite3"))
+    first = _write(tmp_path / "first.png", b"organoid")
+    second = _write(tmp_path / "second.png", b"organoid")
+    calls = []
+
+    @api_cache.cache_bio_analysis(version="test")
+    def analyze(image_path):
+        calls.append(image_path)
+        return {"path": image_path}
+
+    @api_cache.cache_bio_analysis(version="test-async")
+    async def analyze_async(image_path):
+        calls.append(image_path)
+        return {"path": image_path}
+
+    assert analyze(first) == analyze(second) == {"path": first}
+    assert asyncio.run(analyze_async(image_path=second)) == asyncio.run(analyze_async(first))
+    assert calls == [first, second]
+
+
+# ----------------------------------------------------------------------------
+# Bio-Cartridge 연동
+# ----------------------------------------------------------------------------
+
+def _bio():
+    pytest.importorskip("cv2")
+    from projects.ddc.cartridges.bio import bio_cartridge_v2_1
+    return bio_cartridge_v2_1
+
+
+class _FakeGenai:
+    def __init__(self):
+        self.uploads = []
+
+    def upload_file(self, path):
+        self.uploads.append(path)
+        return f"files/{len(self.uploads)}"
+
+
+class _FlakyModel:
+    """처음 failures 번은 실패, 이후 JSON 응답"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = []
+
+    def generate_content(self, parts):
+        self.calls.append(parts[1])
+        if len(self.calls) <= self.failures:
+            raise RuntimeError("503")
+        return type("Response", (), {"text": '{"cell_type": "Organoid", "confidence": 90, "health_score": 82}'})()
+
+
+def _cartridge(bio, tmp_path, failures=0):
+    cartridge = bio.BioCartridgeV21(cache=ContentAddressedCache(tmp_path / "bio.sqlite3"))
+    cartridge.gemini_api.genai = _FakeGenai()
+    cartridge.gemini_api.model = _FlakyModel(failures)
+    return cartridge
+
+
+def test_cartridge_reuses_results_and_upload_handles(tmp_path, monkeypatch):
+    """같은 내용 재업로드: CV/Gemini 재실행 없음, 재시도 간 업로드 1회"""
+    bio = _bio()
+    np = pytest.importorskip("numpy")
+    cv2 = pytest.importorskip("cv2")
+    image = str(tmp_path / "well_A1.png")
+    cv2.imwrite(image, np.random.default_rng(0).integers(0, 256, (64, 64), dtype=np.uint8))
+    shutil.copy(image, tmp_path / "well_A1_copy.png")
+
+    cv_calls = []
+    original = bio.CVAnalyzer.analyze_async
+    monkeypatch.setattr(bio.CVAnalyzer, "analyze_async", staticmethod(lambda img: cv_calls.append(img) or original(img)))
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(bio.asyncio, "sleep", lambda *_: real_sleep(0))   # 재시도 대기 생략
+
+    cartridge = _cartridge(bio, tmp_path, failures=2)
+    first = asyncio.run(cartridge.analyze(image))
+    assert cartridge.gemini_api.genai.uploads == [image]
+    assert cartridge.gemini_api.model.calls == ["files/1"] * 3
+
+    again = asyncio.run(cartridge.analyze(str(tmp_path / "well_A1_copy.png")))
+    assert again == first and len(cv_calls) == 1 and len(cartridge.gemini_api.model.calls) == 3
+
+    # 새 프로세스 (디스크 캐시만 공유)
+    restarted = _cartridge(bio, tmp_path)
+    assert asyncio.run(restarted.analyze(image)) == first
+    assert restarted.gemini_api.model.calls == [] and len(cv_calls) == 1
+    bio.CVAnalyzer.shutdown()
+
+
+def test_fallback_results_keep_only_cv_features(tmp_path):
+    """Vision 폴백 결과는 저장하지 않고 CV 특징만 재사용"""
+    bio = _bio()
+    np = pytest.importorskip("numpy")
+    cv2 = pytest.importorskip("cv2")
+    image = str(tmp_path / "scan.png")
+    cv2.imwrite(image, np.random.default_rng(1).integers(0, 256, (64, 64), dtype=np.uint8))
+
+    cartridge = _cartridge(bio, tmp_path)
+    cartridge.gemini_api.model = None                       # Vision API 사용 불가
+    degraded = asyncio.run(cartridge.analyze(image))
+    assert degraded.ai_fallback
+
+    cartridge.gemini_api.model = _FlakyModel(0)             # 복구 후 재분석
+    recovered = asyncio.run(cartridge.analyze(image))
+    assert not recovered.ai_fallback and recovered.cell_type == "Organoid"
+    assert recovered.cv_analysis == degraded.cv_analysis
+    assert len(cartridge.gemini_api.model.calls) == 1
+    bio.CVAnalyzer.shutdown()
+
+
+def test_batch_keys_uploads_by_content_and_reuses_cv_features(tmp_path, monkeypatch):
+    """배치: 같은 파일명으로 재촬영하면 새 업로드/새 결과, 캐시된 CV 특징은 배치에서도 재사용"""
+    bio = _bio()
+    np = pytest.importorskip("numpy")
+    cv2 = pytest.importorskip("cv2")
+    image = str(tmp_path / "plate_B2.png")
+    cv2.imwrite(image, np.random.default_rng(2).integers(0, 256, (64, 64), dtype=np.uint8))
+
+    async def collect(cartridge, paths):
+        return dict([item async for item in cartridge.analyze_batch(paths)])
+
+    cartridge = _cartridge(bio, tmp_path)
+    first = asyncio.run(collect(cartridge, [image]))[image]
+    assert list(cartridge.gemini_api._uploads) == [cartridge._cache_keys(image)[0]]
+
+    cv2.imwrite(image, np.random.default_rng(3).integers(0, 200, (80, 80), dtype=np.uint8))   # 재촬영
+    rescanned = asyncio.run(collect(cartridge, [image]))[image]
+    assert cartridge.gemini_api.genai.uploads == [image, image]
+    assert cartridge.gemini_api.model.calls == ["files/1", "files/2"]
+    assert rescanned.cv_analysis != first.cv_analysis
+    assert cartridge.cache.get(cartridge._cache_keys(image)[1])["cv_analysis"] == bio.asdict(rescanned.cv_analysis)
+
+    key = bio.GeminiVisionAPI._upload_key(image, None)                  # 해시 없을 때: 경로 + mtime + 크기
+    cv2.imwrite(image, np.zeros((96, 96), dtype=np.uint8))
+    assert bio.GeminiVisionAPI._upload_key(image, None) != key
+
+    cartridge.gemini_api.model = None                                    # CV 특징만 캐시됨
+    degraded = asyncio.run(cartridge.analyze(image))
+    batches = []
+    original = bio.CVAnalyzer.analyze_batch_async
+    monkeypatch.setattr(bio.CVAnalyzer, "analyze_batch_async",
+                        staticmethod(lambda paths: batches.append(list(paths)) or original(paths)))
+    cartridge.gemini_api.model = _FlakyModel(0)
+    recovered = asyncio.run(collect(cartridge, [image]))[image]
+    assert batches == [] and recovered.cv_analysis == degraded.cv_analysis and not recovered.ai_fallback
+    bio.CVAnalyzer.shutdown()
+
+
+def test_hashing_and_lookup_run_off_the_event_loop(tmp_path, monkeypatch):
+    """파일 해시/sqlite 조회는 이벤트 루프 스레드를 막지 않음 (단일/배치 모두)"""
+    import threading
+
+    bio = _bio()
+    np = pytest.importorskip("numpy")
+    cv2 = pytest.importorskip("cv2")
+    image = str(tmp_path / "plate_C3.png")
+    cv2.imwrite(image, np.random.default_rng(4).integers(0, 256, (64, 64), dtype=np.uint8))
+
+    cartridge = _cartridge(bio, tmp_path)
+    hash_threads = []
+    original = cartridge.cache.content_hash
+    monkeypatch.setattr(cartridge.cache, "content_hash",
+                        lambda source: hash_threads.append(threading.current_thread()) or original(source))
+
+    async def scenario():
+        await cartridge.analyze(image)
+        return [item async for item in cartridge.analyze_batch([image])]
+
+    assert len(asyncio.run(scenario())) == 1
+    assert len(hash_threads) == 2 and threading.main_thread() not in hash_threads
+    bio.CVAnalyzer.shutdown()
@@ -0,0 +1,94 @@
+"""
+CovarianceEngine Unit Tests
+검증 대상: quant_cartridge.CovarianceEngine (표본/EWMA 공분산, Ledoit-Wolf 축소, 랭크-1 증분 갱신)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+
+
+def _returns(t=300, n=12, seed=0):
+    rng = np.random.default_rng(seed)
+    factor = rng.normal(0, 0.01, size=(t, 1))
+    return 0.0004 + factor * rng.uniform(0.5, 1.5, size=n) + rng.normal(0, 0.01, size=(t, n))
+
+
+def _ledoit_wolf_reference(x):
+    """배치 Ledoit-Wolf (scaled identity target) 참조 구현"""
+    t, n = x.shape
+    y = x - x.mean(axis=0)
+    s = y.T @ y / t
+    mu = np.trace(s) / n
+    delta = np.sum((s - mu * np.eye(n)) ** 2) / n
+    beta = sum(np.sum((np.outer(row, row) - s) ** 2) for row in y) / (t * t) / n
+    intensity = min(beta, delta) / delta
+    return intensity, (1 - intensity) * s + intensity * mu * np.eye(n)
+
+
+def test_sample_covariance_matches_numpy():
+    """축소 없는 표본 공분산 = np.cov"""
+    x = _returns()
+    engine = qc.CovarianceEngine([f"S{i}" for i in range(x.shape[1])], shrinkage=False).fit(x)
+    np.testing.assert_allclose(engine.covariance(), np.cov(x, rowvar=False), rtol=1e-9)
+    np.testing.assert_allclose(engine.correlation(), np.corrcoef(x, rowvar=False), rtol=1e-9, atol=1e-12)
+
+
+def test_ledoit_wolf_matches_batch_reference():
+    """증분 모멘트 기반 축소 강도/행렬이 배치 참조 구현과 동일"""
+    x = _returns(t=60, n=20)
+    engine = qc.CovarianceEngine([f"S{i}" for i in range(x.shape[1])]).fit(x)
+    intensity, shrunk = _ledoit_wolf_reference(x)
+    assert 0 < engine.shrinkage_intensity() < 1
+    assert engine.shrinkage_intensity() == pytest.approx(intensity, rel=1e-7)
+    np.testing.assert_allclose(engine.covariance(), shrunk, rtol=1e-7)
+
+
+@pytest.mark.parametrize("halflife", [None, 30.0])
+def test_rank_one_updates_match_full_fit(halflife):
+    """하루씩 update() 한 결과 = 전체 이력 fit() 결과"""
+    x = _returns(t=120)
+    symbols = [f"S{i}" for i in range(x.shape[1])]
+    incremental = qc.CovarianceEngine(symbols, halflife=halflife).fit(x[:100])
+    for row in x[100:]:
+        incremental.update(row)
+    full = qc.CovarianceEngine(symbols, halflife=halflife).fit(x)
+
+    assert incremental.n_obs == full.n_obs == 120
+    assert incremental.shrinkage_intensity() == pytest.approx(full.shrinkage_intensity(), rel=1e-8)
+    np.testing.assert_allclose(incremental.covariance(), full.covariance(), rtol=1e-8)
+
+
+def test_ewma_matches_weighted_covariance():
+    """EWMA 공분산 = 지수 가중 최신 관측 중심 공분산 (np.cov aweights)"""
+    x = _returns(t=200)
+    engine = qc.CovarianceEngine([f"S{i}" for i in range(x.shape[1])], halflife=20, shrinkage=False).fit(x)
+    weights = engine.decay ** np.arange(len(x) - 1, -1, -1)
+    np.testing.assert_allclose(engine.covariance(), np.cov(x, rowvar=False, aweights=weights), rtol=1e-9)
+
+
+def test_risk_metrics_use_empirical_covariance():
+    """calculate_risk_metrics 가 수익률 기반 공분산으로 변동성/상관계수 계산, 증분 갱신 반영"""
+    x = _returns(t=250, n=4)
+    cartridge = qc.QuantCartridge(initial_capital=1e7)
+    symbols = ["A", "B", "C", "D"]
+    for symbol in symbols:
+        asset = qc.Asset(symbol, symbol, qc.MarketType.USA, "Tech", 100.0, 0.3)
+        cartridge.register_asset(asset)
+        cartridge.portfolio_manager.add_position(qc.PortfolioPosition(asset, 100, 100.0))
+
+    engine = cartridge.load_returns_history({s: x[:, i].tolist() for i, s in enumerate(symbols)})
+    metrics = cartridge.calculate_risk_metrics()
+
+    weights = cartridge.portfolio_manager.get_allocation()
+    w = np.array([weights[s] for s in symbols])
+    expected_vol = np.sqrt(w @ engine.covariance(annualize=True) @ w)
+    assert metrics.beta == pytest.approx(expected_vol, rel=1e-9)
+    corr = engine.correlation()
+    assert metrics.correlation_avg == pytest.approx(corr[np.triu_indices(4, k=1)].mean(), rel=1e-9)
+
+    cartridge.update_returns({"A": 0.08, "B": -0.07, "C": 0.05, "D": -0.06})
+    assert engine.n_obs == 251
+    assert cartridge.calculate_risk_metrics().beta != metrics.beta
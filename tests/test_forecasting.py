@@ -0,0 +1,133 @@
+"""
+Time-Series Forecasting Unit Tests
+검증 대상: projects.ddc.utilities.prediction_engine (AR/Yule-Walker, Holt-Winters, 적합 모형 캐시)
+"""
+import asyncio
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.utilities.prediction_engine import (
+    ARModel,
+    DecisionSupportSystem,
+    HoltWintersModel,
+    TimeSeriesForecastingEngine,
+)
+
+
+def _ar2(n, phi=(0.6, -0.3), seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.zeros(n)
+    for t in range(2, n):
+        x[t] = phi[0] * x[t - 1] + phi[1] * x[t - 2] + rng.normal()
+    return x.tolist()
+
+
+def test_levinson_matches_direct_yule_walker():
+    """Levinson-Durbin 해 = Toeplitz 연립방정식 직접 해"""
+    gammas = ARModel(order=6).fit(_ar2(500)).autocovariances()
+    solutions, variances = ARModel.levinson_durbin(gammas[:7])
+    toeplitz = np.array([[gammas[abs(i - j)] for j in range(6)] for i in range(6)])
+    direct = np.linalg.solve(toeplitz, gammas[1:7])
+    np.testing.assert_allclose(solutions[6], direct, atol=1e-10)
+    assert variances[6] == pytest.approx(gammas[0] - direct @ gammas[1:7])
+
+
+def test_ar_recovers_coefficients_and_order():
+    """모의 AR(2): 계수 복원, AIC 차수 선택"""
+    data = _ar2(5000, seed=1)
+    model = ARModel(order=2).fit(data)
+    np.testing.assert_allclose(model.coefficients, [0.6, -0.3], atol=0.05)
+    assert model.sigma2 == pytest.approx(1.0, rel=0.1)
+    assert ARModel(max_order=8).fit(data).p in (2, 3)
+
+
+def test_incremental_append_equals_full_fit():
+    """뒤에 관측치 추가 후 증분 갱신 = 전체 재적합 (AR / 차분 포함)"""
+    data = np.cumsum(_ar2(400, seed=2)).tolist()
+    for order, d in [(3, 0), (2, 1)]:
+        incremental = ARModel(order, d).fit(data[:300])
+        incremental.append(data[300:])
+        full = ARModel(order, d).fit(data)
+        np.testing.assert_allclose(incremental.coefficients, full.coefficients, rtol=1e-9)
+        np.testing.assert_allclose(incremental.forecast(5)[0], full.forecast(5)[0], rtol=1e-9)
+
+
+def test_holt_winters_tracks_seasonal_trend():
+    """계절 + 추세 계열: 계절 모형이 홀드아웃 오차에서 비계절 모형보다 우수"""
+    t = np.arange(120)
+    rng = np.random.default_rng(3)
+    data = (50 + 0.5 * t + 10 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 0.5, 120)).tolist()
+    engine = TimeSeriesForecastingEngine()
+    seasonal = engine.forecast_exponential_smoothing(data, 12, season_length=12)
+    holt = engine.forecast_exponential_smoothing(data, 12)
+
+    future = 50 + 0.5 * np.arange(120, 132) + 10 * np.sin(2 * np.pi * np.arange(120, 132) / 12)
+    np.testing.assert_allclose(seasonal.predictions, future, atol=3.0)
+    assert seasonal.rmse < holt.rmse / 3
+    lower, upper = seasonal.confidence_interval
+    assert all(lo < p < hi for lo, p, hi in zip(lower, seasonal.predictions, upper))
+    assert upper[-1] - lower[-1] > upper[0] - lower[0]
+
+    # 증분 갱신 상태 = 같은 평활 계수로 전체 계열을 처음부터 재귀한 상태
+    model = HoltWintersModel(12).fit(data[:100])
+    model.append(data[100:])
+    sse, count, (level, trend, seasonal) = model._run(data, model.alpha, model.beta, model.gamma)
+    assert (model.level, model.trend) == pytest.approx((level, trend))
+    np.testing.assert_allclose(model.seasonal, seasonal)
+    assert model.sse == pytest.approx(sse) and model.residual_count == count
+
+
+def test_engine_cache_reuse_and_incremental_refit():
+    """같은 키: 동일 계열은 재사용, 뒤에 추가되면 증분 갱신, 앞부분이 바뀌면 재적합"""
+    data = np.cumsum(_ar2(300, seed=4)).tolist()
+    engine = TimeSeriesForecastingEngine()
+    first = engine.forecast_arima(data, 10, order=(2, 1, 0), key="KOSPI")
+    entry = engine._fits[("arima", 2, 1, None, "KOSPI")]
+    again = engine.forecast_arima(data, 10, order=(2, 1, 0), key="KOSPI")
+    assert again.predictions == first.predictions and again.rmse == first.rmse
+
+    extended = data + [data[-1] + 1.0, data[-1] + 2.0]
+    engine.forecast_arima(extended, 10, order=(2, 1, 0), key="KOSPI")
+    assert engine._fits[("arima", 2, 1, None, "KOSPI")] is entry and entry.length == 302
+
+    engine.forecast_arima([v + 1 for v in extended], 10, order=(2, 1, 0), key="KOSPI")
+    assert engine._fits[("arima", 2, 1, None, "KOSPI")] is not entry
+
+    engine.invalidate("KOSPI")
+    assert not engine._fits
+
+
+@pytest.mark.parametrize("method, kwargs", [
+    ("forecast_arima", {"order": (2, 1, 0)}),
+    ("forecast_exponential_smoothing", {}),
+])
+def test_engine_cache_refits_when_interior_values_change(method, kwargs):
+    """양 끝 값이 같아도 중간 값 (수정/분할 조정된 과거) 이 바뀌면 재적합"""
+    data = np.cumsum(_ar2(300, seed=5)).tolist()
+    revised = list(data)
+    revised[150] += 25.0
+    engine = TimeSeriesForecastingEngine()
+    getattr(engine, method)(data, 10, key="KOSPI", **kwargs)
+    cached = getattr(engine, method)(revised, 10, key="KOSPI", **kwargs)
+    fresh = getattr(TimeSeriesForecastingEngine(), method)(revised, 10, key="KOSPI", **kwargs)
+    assert cached.predictions == fresh.predictions and cached.rmse == fresh.rmse
+
+    getattr(engine, method)(data, 10, key="KOSPI", **kwargs)
+    grown = getattr(engine, method)(revised + [revised[-1] + 1.0], 10, key="KOSPI", **kwargs)
+    fresh = getattr(TimeSeriesForecastingEngine(), method)(revised + [revised[-1] + 1.0], 10, **kwargs)
+    assert grown.predictions == fresh.predictions
+
+
+def test_comprehensive_analysis_uses_fitted_models():
+    """DecisionSupportSystem: 짧은 계열에서도 예측 + 유한한 오차 지표"""
+    historical = [100, 102, 101, 105, 108, 110, 109, 112, 115, 118]
+    scenarios = {'revenue': 1000000, 'cost': 500000, 'profit': 500000}
+    dss = DecisionSupportSystem()
+    result = asyncio.run(dss.comprehensive_analysis(historical, scenarios, series_key="demo"))
+    for name in ('arima', 'exponential_smoothing'):
+        forecast = result['forecasts'][name]
+        assert len(forecast['predictions']) == 6
+        assert math.isfinite(forecast['rmse'])
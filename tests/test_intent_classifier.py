@@ -0,0 +1,72 @@
+"""
+IntentClassifier Unit Tests
+검증 대상: projects.ddc.brain.brain_core.intent_classifier (Aho-Corasick 통합 어휘 분석)
+"""
+import pytest
+from projects.ddc.brain.brain_core.intent_classifier import (
+    IntentClassifier,
+    IntentType,
+    PhraseMatcher,
+)
+
+SAMPLES = [
+    "🧬 바이오 분석", "📈", "2번", "3.", "10", "안녕!", "hello", "반갑습니다",
+    "나는 누구야", "너는 누구야?", "나를 알아?", "Dr. SHawn 알지", "근거는?", "왜요?",
+    "어떻게 하지", "더 자세히", "자세히", "계속해줘", "예를 들어줘", "예시 보여줘",
+    "메모리 상태 알려줘", "CPU 사용량", "config 바꿔", "내가 숀이야", "그냥 잡담이야",
+    "def foo(): 코드 설명해줘", "  응  ", "", "안녕 오늘 날씨 어때",
+]
+
+
+def _legacy_classify(c: IntentClassifier, text: str, history=None):
+    """기존 순차 정규식 분류 로직 (비교 기준)"""
+    text = text.strip()
+    if not text:
+        return (IntentType.GENERAL, None)
+    for check in (
+        lambda: c._check_cartridge_switch(text),
+        lambda: c._check_numeric_choice(text, history),
+        lambda: c._check_greeting(text),
+        lambda: c._check_identity_query(text),
+        lambda: c._check_context_follow_up(text),
+        lambda: c._check_system_query(text),
+    ):
+        result = check()
+        if result:
+            return (result.intent_type, result.target)
+    return (IntentType.GENERAL, None)
+
+
+@pytest.fixture
+def classifier():
+    return IntentClassifier()
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_matches_sequential_regex_classification(classifier, text):
+    """단일 스캔 분류 결과가 기존 순차 정규식 결과와 동일"""
+    history = [{"options": ["옵션A", "옵션B", "옵션C"]}]
+    result = classifier.classify(text, intent_history=history)
+    assert (result.intent_type, result.target) == _legacy_classify(classifier, text, history)
+
+
+def test_routing_flags(classifier):
+    """연속/질문/코드/정체성 플래그가 한 번의 분석으로 산출"""
+    a = classifier.analyze("def foo(): 코드 설명해줘")
+    assert a.is_code and a.is_question and not a.is_continuation
+
+    a = classifier.analyze("  응 ")
+    assert a.is_continuation
+
+    a = classifier.analyze("너 정체가 뭐야")
+    assert a.is_identity_question
+
+    assert classifier.analyze("내가 숀이야").identity_update == "숀"
+    assert classifier.analyze("나는 누구야").identity_update is None
+
+
+def test_phrase_matcher_overlapping_phrases():
+    """겹치는 구문(접두/접미) 모두 검출"""
+    matcher = PhraseMatcher([("he", "a"), ("she", "b"), ("hers", "c"), ("his", "d")])
+    hits = sorted(matcher.scan("ushers"))
+    assert hits == [("a", 2), ("b", 1), ("c", 2)]
@@ -0,0 +1,193 @@
+"""
+InvestmentCartridgeV2 Multi-Symbol Analysis Unit Tests
+검증 대상: YahooFinanceAPI 스냅샷 (조회 합치기 + TTL), InvestmentCartridgeV2.analyze_many,
+         InvCartridgeInterface *_async 연동
+"""
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio import investment_cartridge_v2 as inv
+from projects.ddc.cartridges.inv import inv_interface
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+
+
+class FakeYahoo(inv.YahooFinanceAPI):
+    """원격 조회 대신 합성 스냅샷 반환 (호출 수/동시 실행 수 기록)"""
+
+    def __init__(self, delay=0.02, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _fetch_snapshot(self, symbol, days):
+        with self._lock:
+            self.calls.append(symbol)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        closes = 100 * np.exp(np.cumsum(np.random.default_rng(len(symbol)).normal(0, 0.01, 260)))
+        start = date(2025, 1, 1)
+        history = inv.OHLCVFrame.from_columns(symbol, {
+            "date": [start + timedelta(days=i) for i in range(260)],
+            "open": closes, "high": closes, "low": closes, "close": closes, "volume": np.ones(260),
+        })
+        with self._lock:
+            self.active -= 1
+        info = {"currentPrice": float(closes[-1]), "previousClose": float(closes[-2]), "trailingPE": 12.0}
+        return {"info": info, "history": history, "days": days}
+
+
+def _cartridge(api):
+    cartridge = inv.InvestmentCartridgeV2()
+    cartridge.yahoo_api = api
+    cartridge.tech_analyzer = inv.TechnicalAnalyzer(api)
+    return cartridge
+
+
+def test_same_symbol_requests_are_coalesced():
+    """실시간/펀더멘털/기술적 분석이 동시에 요청해도 다운로드 1회"""
+    api = FakeYahoo()
+
+    async def scenario():
+        return await asyncio.gather(
+            api.get_realtime_data("TSLA"), api.get_fundamentals("TSLA"),
+            inv.TechnicalAnalyzer(api).analyze("TSLA"),
+        )
+
+    realtime, fundamentals, technical = asyncio.run(scenario())
+    assert api.calls == ["TSLA"]
+    assert fundamentals.pe_ratio == 12.0
+    assert technical.ma20 > 0 and realtime.current_price > 0
+
+
+def test_snapshot_ttl():
+    """TTL 내 재요청은 캐시, 만료/무효화 후에는 재조회"""
+    api = FakeYahoo(delay=0)
+
+    async def twice():
+        await api.get_realtime_data("AAPL")
+        await api.get_fundamentals("AAPL")
+
+    asyncio.run(twice())
+    assert api.calls == ["AAPL"]
+    api.invalidate("AAPL")
+    asyncio.run(twice())
+    assert api.calls == ["AAPL", "AAPL"]
+
+    expiring = FakeYahoo(delay=0, cache_duration=0)
+    asyncio.run(expiring.get_history("AAPL"))
+    asyncio.run(expiring.get_history("AAPL"))
+    assert len(expiring.calls) == 2
+
+
+def test_analyze_many_bounded_and_deduplicated():
+    """동시 분석 수 제한, 중복 종목 1회 분석, 종목당 다운로드 1회"""
+    api = FakeYahoo(delay=0.05)
+    cartridge = _cartridge(api)
+    symbols = ["AAPL", "MSFT", "TSLA", "NVDA", "AMZN", "AAPL"]
+
+    results = asyncio.run(cartridge.analyze_many(symbols, max_concurrency=2))
+    assert list(results) == ["AAPL", "MSFT", "TSLA", "NVDA", "AMZN"]
+    assert sorted(api.calls) == sorted(set(symbols))
+    assert api.peak <= 2
+    assert results["TSLA"].technical_signals.ma200 > 0
+
+
+def test_interface_collects_missing_analyses():
+    """InvCartridgeInterface: 주어진 데이터는 그대로, 누락 종목만 analyze_many 로 수집"""
+    api = FakeYahoo(delay=0)
+    interface = inv_interface.InvCartridgeInterface(cartridge=_cartridge(api))
+    given = {"NIO": {"technical_analysis": {"rsi": 40}}}
+
+    result = asyncio.run(interface.compare_multiple_stocks_async(["TSLA", "NIO", "AAPL"], given))
+    analyses = {a["ticker"]: a["basic_analysis"] for a in result["individual_analyses"]}
+    assert analyses["NIO"] == given["NIO"]
+    assert analyses["TSLA"]["technical_analysis"]["trend"] in {t.value for t in inv.TrendType}
+    assert sorted(api.calls) == ["AAPL", "TSLA"]
+
+    portfolio = asyncio.run(interface.portfolio_optimization_async({"TSLA": 0.5, "AAPL": 0.5}))
+    assert set(portfolio["individual_analyses"]) == {"TSLA", "AAPL"}
+    assert sorted(api.calls) == ["AAPL", "TSLA"]   # 새 이벤트 루프여도 TTL 캐시 재사용
+
+
+def test_sync_compare_and_portfolio_use_analyze_many():
+    """동기 비교/포트폴리오 메서드도 누락 종목을 analyze_many 로 수집, 이벤트 루프 안에서는 명확한 오류"""
+    api = FakeYahoo(delay=0.05)
+    cartridge = _cartridge(api)
+    batched = []
+    analyze_many = cartridge.analyze_many
+
+    async def recording(symbols, **kwargs):
+        batched.append(list(symbols))
+        return await analyze_many(symbols, **kwargs)
+
+    cartridge.analyze_many = recording
+    interface = inv_interface.InvCartridgeInterface(cartridge=cartridge, optimizer=qc.PortfolioOptimizer())
+
+    result = interface.compare_multiple_stocks(["TSLA", "NIO", "AAPL"], {"NIO": {}})
+    assert batched == [["TSLA", "AAPL"]] and api.peak == 2
+    assert {a["ticker"] for a in result["individual_analyses"]} == {"TSLA", "NIO", "AAPL"}
+
+    portfolio = interface.portfolio_optimization({"TSLA": 0.5, "MSFT": 0.5})
+    assert batched[-1] == ["TSLA", "MSFT"]
+    assert set(portfolio["optimized_portfolio"]["weights"]) == {"TSLA", "MSFT"}   # 수익률도 스냅샷 재사용
+    assert sorted(api.calls) == ["AAPL", "MSFT", "TSLA"]
+
+    async def inside_loop():
+        return interface.compare_multiple_stocks(["NVDA"])
+
+    with pytest.raises(RuntimeError, match="_async"):
+        asyncio.run(inside_loop())
+
+
+def test_failed_snapshot_is_not_cached_for_full_ttl():
+    """info 조회 실패 스냅샷은 짧은 TTL 후 재조회 (정상 스냅샷은 전체 TTL 유지)"""
+
+    class Flaky(FakeYahoo):
+        def _fetch_snapshot(self, symbol, days):
+            snapshot = super()._fetch_snapshot(symbol, days)
+            if len(self.calls) == 1:
+                snapshot["info"] = None
+            return snapshot
+
+    api = Flaky(delay=0, failure_cache_duration=0)
+    assert asyncio.run(api.get_realtime_data("AAPL")).current_price == 0
+    assert asyncio.run(api.get_realtime_data("AAPL")).current_price > 0
+    asyncio.run(api.get_realtime_data("AAPL"))
+    assert api.calls == ["AAPL", "AAPL"]
+
+
+def test_collected_returns_align_on_common_dates():
+    """KRX/미국 휴장일이 달라도 수익률은 모든 종목이 거래된 날짜 기준 (꼬리 길이 정렬 아님)"""
+
+    class MixedCalendar(FakeYahoo):
+        def _fetch_snapshot(self, symbol, days):
+            snapshot = super()._fetch_snapshot(symbol, days)
+            if symbol.endswith(".KS"):
+                history = snapshot["history"]
+                keep = np.arange(len(history)) % 7 != 3               # KRX 휴장일 모사
+                snapshot["history"] = inv.OHLCVFrame(
+                    symbol, history.dates[keep], history.open[keep], history.high[keep],
+                    history.low[keep], history.close[keep], history.volume[keep]
+                )
+            return snapshot
+
+    api = MixedCalendar(delay=0)
+    interface = inv_interface.InvCartridgeInterface(cartridge=_cartridge(api))
+    returns = asyncio.run(interface.collect_returns(["AAPL", "005930.KS"]))
+
+    us = asyncio.run(api.get_history("AAPL"))
+    kr = asyncio.run(api.get_history("005930.KS"))
+    common = np.intersect1d(us.dates, kr.dates)
+    for ticker, history in (("AAPL", us), ("005930.KS", kr)):
+        closes = np.asarray(history.close)[np.searchsorted(history.dates, common)]
+        np.testing.assert_allclose(returns[ticker], closes[1:] / closes[:-1] - 1.0)
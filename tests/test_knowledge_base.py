@@ -0,0 +1,205 @@
+"""
+Biology KnowledgeBase Unit Tests
+검증 대상: bio_cartridge/biology_cartridge.KnowledgeBase (IVF/HNSW 인덱스, 배치 인코딩, 중복 제거,
+         메모리 맵 문서 저장소, 증분 저장)
+"""
+import json
+import zlib
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("faiss")
+
+from projects.ddc.cartridges.bio.bio_cartridge import biology_cartridge as bc
+
+
+class WordEncoder:
+    """단어별 고정 난수 벡터 합 (공유 단어가 많을수록 가까움)"""
+
+    def __init__(self, dimension=32):
+        self.dimension = dimension
+        self.batches = []
+
+    def encode(self, docs, batch_size=32, convert_to_numpy=True):
+        self.batches.append(len(docs))
+        out = np.zeros((len(docs), self.dimension), np.float32)
+        for i, doc in enumerate(docs):
+            for word in doc.lower().split():
+                out[i] += np.random.default_rng(zlib.crc32(word.encode())).normal(size=self.dimension)
+        return out
+
+
+def _corpus(n, seed=0):
+    rng = np.random.default_rng(seed)
+    vocab = [f"w{i}" for i in range(400)]
+    return [" ".join(rng.choice(vocab, 8)) + f" doc{i}" for i in range(n)]
+
+
+def _kb(**kwargs):
+    return bc.KnowledgeBase(dimension=32, model=WordEncoder(), **kwargs)
+
+
+def test_batched_encoding_and_dedupe():
+    """배치 크기 단위 인코딩, 내용 해시 중복 (기존/입력 내부) 건너뜀"""
+    kb = _kb(batch_size=4)
+    docs = _corpus(10)
+    assert kb.add_documents(docs + [docs[0], "  " + docs[1] + " "]) == 10
+    assert kb.model.batches == [4, 4, 2]
+    assert kb.add_documents(docs[:3] + ["Uterine organoids mimic the endometrium."], batch_size=8) == 1
+    assert kb.model.batches[-1] == 1
+    assert kb.index.ntotal == len(kb.documents) == 11
+    assert kb.search(docs[6], k=1)[0] == (docs[6], pytest.approx(0.0, abs=1e-3))
+
+
+@pytest.mark.parametrize("index_type", ["ivf", "hnsw"])
+def test_approximate_indexes_train_and_rebuild(index_type):
+    """IVF: 임계치 전 정확 검색, 임계치에서 학습, 코퍼스 성장 시 재학습 / HNSW: 바로 추가"""
+    kb = _kb(index_type=index_type, train_threshold=400, rebuild_threshold=2.0, nprobe=16, batch_size=100)
+    docs = _corpus(1000, seed=1)
+    kb.add_documents(docs[:300])
+    assert isinstance(kb.index, bc.faiss.IndexHNSW if index_type == "hnsw" else bc.faiss.IndexFlatL2)
+
+    kb.add_documents(docs[300:500])
+    if index_type == "ivf":
+        assert isinstance(kb.index, bc.faiss.IndexIVF) and kb._trained_size == 400
+        assert kb.index.nlist == 10 and kb.index.nprobe == 16
+    kb.add_documents(docs[500:])
+    if index_type == "ivf":
+        assert kb._trained_size == 800 and kb.index.nlist == 20
+    assert kb.index.ntotal == 1000
+
+    hits = sum(kb.search(doc, k=1)[0][0] == doc for doc in docs[::25])
+    assert hits >= 36
+
+
+def test_incremental_save_appends_to_store_and_index(tmp_path):
+    """재저장: 문서/벡터 추가분만 덧붙임, 델타 임계치 초과 시 전체 재작성, 로드 결과 동일"""
+    index_path, docs_path = str(tmp_path / "kb.index"), str(tmp_path / "kb.docs")
+    kb = _kb()
+    docs = _corpus(130, seed=2) + ["자궁내막 오가노이드 배양 프로토콜"]
+    kb.add_documents(docs[:100])
+    kb.save(index_path, docs_path)
+    index_bytes = Path(index_path).read_bytes()
+
+    kb.add_documents(docs[100:])
+    kb.save(index_path, docs_path)
+    assert Path(index_path).read_bytes() == index_bytes           # 기존 인덱스 파일 유지
+    assert Path(index_path + ".delta").stat().st_size == 31 * 32 * 4
+    assert json.loads(Path(index_path + ".meta.json").read_text())["delta"] == 31
+
+    loaded = _kb()
+    loaded.load(index_path, docs_path)
+    assert isinstance(loaded.documents, bc.DocumentStore) and loaded.documents._data is not None
+    assert list(loaded.documents) == docs and loaded.index.ntotal == 131
+    assert loaded.add_documents(docs[:5]) == 0                     # 저장된 해시로 중복 제거
+    assert loaded.search(docs[-1], k=1)[0][0] == docs[-1]
+
+    loaded.add_documents(_corpus(40, seed=3))                      # 델타 > 50% -> 전체 재작성
+    loaded.save(index_path, docs_path)
+    assert Path(index_path).read_bytes() != index_bytes
+    assert json.loads(Path(index_path + ".meta.json").read_text())["delta"] == 0
+    again = _kb()
+    again.load(index_path, docs_path)
+    assert again.index.ntotal == len(again.documents) == 171
+
+
+def test_uncommitted_tail_is_ignored_and_json_docs_load(tmp_path):
+    """매니페스트 이후 쓰인 꼬리 무시 / 기존 JSON 문서 목록 로드 후 저장소 형식으로 변환"""
+    index_path, docs_path = str(tmp_path / "kb.index"), str(tmp_path / "kb.docs")
+    kb = _kb()
+    docs = _corpus(20, seed=4)
+    kb.add_documents(docs)
+    kb.save(index_path, docs_path)
+    with open(docs_path, "ab") as f:                               # 중단된 저장 흉내
+        f.write(b"partial")
+    with open(docs_path + ".offsets", "ab") as f:
+        f.write(np.array([10 ** 6], "<i8").tobytes())
+
+    loaded = _kb()
+    loaded.load(index_path, docs_path)
+    assert len(loaded.documents) == 20
+    loaded.add_documents(["new protocol"])
+    loaded.save(index_path, docs_path)
+    reloaded = _kb()
+    reloaded.load(index_path, docs_path)
+    assert list(reloaded.documents) == docs + ["new protocol"]
+
+    legacy_index, legacy_docs = str(tmp_path / "legacy.index"), str(tmp_path / "legacy.json")
+    bc.faiss.write_index(kb.index, legacy_index)
+    Path(legacy_docs).write_text(json.dumps(docs), encoding="utf-8")
+    legacy = _kb()
+    legacy.load(legacy_index, legacy_docs)
+    assert list(legacy.documents) == docs
+    legacy.save(legacy_index, legacy_docs)
+    assert Path(legacy_docs + ".offsets").exists()
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_index_rewritten_before_manifest_is_truncated(tmp_path, monkeypatch, index_type):
+    """인덱스 전체 재작성 후 매니페스트 쓰기 실패: 로드 시 커밋된 벡터 수로 잘라 문서 id 와 일치"""
+    index_path, docs_path = str(tmp_path / "kb.index"), str(tmp_path / "kb.docs")
+    kb = _kb(index_type=index_type)
+    docs = _corpus(160, seed=6)
+    kb.add_documents(docs[:100])
+    kb.save(index_path, docs_path)
+    kb.add_documents(docs[100:110])
+    kb.save(index_path, docs_path)                                 # 델타 10
+
+    kb.add_documents(docs[110:])                                   # 델타 > 50% -> 전체 재작성
+    with monkeypatch.context() as m:
+        m.setattr(bc.json, "dump", lambda *a, **k: (_ for _ in ()).throw(OSError("disk full")))
+        with pytest.raises(OSError):
+            kb.save(index_path, docs_path)
+    assert bc.faiss.read_index(index_path).ntotal == 160
+
+    loaded = _kb(index_type=index_type)
+    loaded.load(index_path, docs_path)
+    assert loaded.index.ntotal == len(loaded.documents) == 110
+    assert all(loaded.search(doc, k=1)[0][0] == doc for doc in docs[95:110])
+
+    loaded.add_documents(docs[110:])                               # 이어서 추가해도 id 일치
+    loaded.save(index_path, docs_path)
+    again = _kb(index_type=index_type)
+    again.load(index_path, docs_path)
+    assert again.index.ntotal == len(again.documents) == 160
+    assert again.search(docs[-1], k=1)[0][0] == docs[-1]
+
+
+def test_search_batch_and_query_cache():
+    """배치 검색 = 단건 검색, 캐시 적중 시 재인코딩 없음, LRU 용량 유지"""
+    kb = _kb(query_cache_size=3)
+    docs = _corpus(50, seed=5)
+    kb.add_documents(docs)
+    encoded = len(kb.model.batches)
+
+    queries = [docs[3], docs[7], docs[3], docs[11]]
+    batch = kb.search_batch(queries, k=3)
+    assert kb.model.batches[encoded:] == [3]                       # 한 번의 호출, 중복 1회
+    assert batch == [kb.search(q, k=3) for q in queries]
+    assert len(kb.model.batches) == encoded + 1                    # 단건 검색은 모두 캐시 적중
+    assert batch[1][0][0] == docs[7]
+
+    kb.search(docs[20])                                            # docs[7] 이 가장 오래됨 -> 제거
+    assert list(kb._query_cache) == [docs[3], docs[11], docs[20]]
+    assert (kb.query_cache_hits, kb.query_cache_misses) == (4, 4)
+    assert kb.search_batch([]) == [] and _kb().search_batch(["a", "b"]) == [[], []]
+
+
+def test_model_loads_lazily(monkeypatch):
+    """모델 미지정 시 생성자에서 로드하지 않고 첫 인코딩 때 한 번 로드"""
+    loads = []
+
+    def fake_model(name):
+        loads.append(name)
+        return WordEncoder()
+
+    monkeypatch.setattr(bc, "KNOWLEDGE_BASE_AVAILABLE", True)
+    monkeypatch.setattr(bc, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(bc, "SentenceTransformer", fake_model, raising=False)
+    kb = bc.KnowledgeBase(model_name="tiny", dimension=32)
+    assert loads == [] and kb.search("organoid") == []             # 빈 인덱스 검색도 로드 없음
+    kb.add_documents(["organoid culture", "stromal decidualization"])
+    assert loads == ["tiny"] and kb.search("organoid culture", k=1)[0][0] == "organoid culture"
+    assert loads == ["tiny"]
@@ -0,0 +1,103 @@
+"""
+L2 Limbic Async Facade Tests
+검증 대상: projects.ddc.brain.brain_core.limbic_system.limbic_async.AsyncLimbicSystem
+"""
+import asyncio
+import time
+import pytest
+from projects.ddc.brain.brain_core.limbic_system.limbic_integrated import LimbicIntegratedSystem
+from projects.ddc.brain.brain_core.limbic_system.limbic_async import AsyncLimbicSystem
+
+
+class SlowLimbic(LimbicIntegratedSystem):
+    """감정 판별(잠금 밖 계산 단계)에 지연을 주입한 테스트용 Limbic System"""
+
+    def __init__(self, delay: float, slow_texts=None):
+        super().__init__()
+        self.delay = delay
+        self.slow_texts = slow_texts
+
+    def detect_emotion(self, text):
+        if self.slow_texts is None or text in self.slow_texts:
+            time.sleep(self.delay)
+        return super().detect_emotion(text)
+
+
+@pytest.mark.asyncio
+async def test_process_input_matches_sync_schema():
+    """비동기 결과가 동기 process_input과 같은 스키마인지 확인"""
+    facade = AsyncLimbicSystem(system=LimbicIntegratedSystem(), timeout=5.0)
+    result = await facade.process_input("오늘 너무 힘들어요", "u1")
+    assert result["emotion"]["primary"] == "sad"
+    assert set(result) >= {"emotion", "priority", "empathy_proposal", "routing", "context"}
+    facade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_falls_back_to_neutral():
+    """타임아웃 시 중립 결과 반환, 타임아웃된 작업이 계속 실행 중이어도 이후 요청은 막히지 않음"""
+    facade = AsyncLimbicSystem(system=SlowLimbic(delay=0.5, slow_texts={"정말 화가 나요"}), timeout=0.1)
+    result = await facade.process_input("정말 화가 나요", "u1")
+    assert result["emotion"]["primary"] == "neutral"
+    assert result["context"]["fallback"] == "timeout"
+    assert facade.get_stats()["timeouts"] == 1
+
+    later = await facade.process_input("오늘 너무 힘들어요", "u2")
+    assert later["context"].get("fallback") is None
+    assert later["emotion"]["primary"] == "sad"
+    assert facade.get_stats()["timeouts"] == 1
+    facade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_analyses_run_in_parallel_outside_state_lock():
+    """감정 판별은 잠금 밖에서 워커 수만큼 병렬 실행, 학습 상태는 모든 요청을 반영"""
+    system = SlowLimbic(delay=0.2)
+    facade = AsyncLimbicSystem(system=system, max_workers=4, timeout=2.0)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(facade.process_input("기뻐요!", f"u{i}") for i in range(4)))
+    assert time.perf_counter() - start < 0.6
+    assert all(r["context"].get("fallback") is None for r in results)
+    assert system.emotion_analyzer.detector.total_detections == 4
+    facade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_rejects_when_saturated():
+    """대기 한도를 넘으면 즉시 중립 결과 반환"""
+    facade = AsyncLimbicSystem(system=SlowLimbic(delay=0.2), max_pending=1, timeout=1.0)
+    first, second = await asyncio.gather(
+        facade.process_input("기뻐요!", "u1"),
+        facade.process_input("기뻐요!", "u2"),
+    )
+    assert first["context"].get("fallback") is None
+    assert second["context"]["fallback"] == "backpressure"
+    facade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked():
+    """분석 중에도 이벤트 루프가 다른 작업을 처리하는지 확인"""
+    facade = AsyncLimbicSystem(system=SlowLimbic(delay=0.2), timeout=1.0)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    await asyncio.gather(facade.process_input("안녕", "u1"), ticker())
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.2
+    facade.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_batch_preserves_order():
+    """배치 결과 순서 보존"""
+    facade = AsyncLimbicSystem(system=LimbicIntegratedSystem(), timeout=5.0)
+    items = [("기뻐요!", "u1"), ("너무 슬퍼요", "u2"), ("그냥 그래요", "u3")] * 5
+    results = await facade.process_batch(items, chunk_size=4)
+    assert len(results) == len(items)
+    assert [r["context"]["user_id"] for r in results] == [u for _, u in items]
+    facade.shutdown()
@@ -0,0 +1,195 @@
+"""
+MarketDataStore Unit Tests
+검증 대상: projects.ddc.utilities.market_data_store (컬럼형 OHLCV 저장소)
+         + investment_cartridge_v2 / quant_cartridge 데이터 소스 연동
+"""
+import asyncio
+import math
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.utilities.market_data_store import MarketDataStore
+from projects.ddc.cartridges.bio import investment_cartridge_v2 as inv
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+
+
+def _bars(start, n, base=100.0, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = base * np.exp(np.cumsum(rng.normal(0.0005, 0.01, n)))
+    return {
+        "date": [start + timedelta(days=i) for i in range(n)],
+        "open": closes * 0.99, "high": closes * 1.01, "low": closes * 0.98,
+        "close": closes, "volume": rng.uniform(1e5, 1e6, n),
+    }
+
+
+def _write_csv(path, bars):
+    lines = ["Date,Open,High,Low,Close,Adj Close,Volume"]
+    for i, d in enumerate(bars["date"]):
+        lines.append(f"{d.isoformat()},{bars['open'][i]},{bars['high'][i]},{bars['low'][i]},"
+                     f"{bars['close'][i]},{bars['close'][i]},{bars['volume'][i]}")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def test_append_only_and_range_read(tmp_path):
+    """append-only (중복/과거 봉 무시), 구간 조회, 재시작 후 영속성"""
+    store = MarketDataStore(tmp_path)
+    bars = _bars(date(2025, 1, 1), 30)
+    assert store.append("AAPL", bars) == 30
+    assert store.append("AAPL", bars) == 0                  # 재실행 안전
+    assert store.append("AAPL", _bars(date(2025, 1, 25), 10)) == 4
+
+    reopened = MarketDataStore(tmp_path)
+    assert reopened.row_count("AAPL") == 34
+    frame = reopened.read("AAPL", start="2025-01-10", end=date(2025, 1, 12))
+    assert [str(d) for d in frame.dates] == ["2025-01-10", "2025-01-11", "2025-01-12"]
+    np.testing.assert_allclose(frame.close, bars["close"][9:12])
+    assert len(reopened.read("AAPL", last_n=5)) == 5
+    assert reopened.symbols() == ["AAPL"]
+
+
+def test_symbols_with_special_characters_do_not_collide(tmp_path):
+    """BRK/B 와 BRK_B 는 서로 다른 디렉터리, symbols() 는 원래 종목 코드 반환"""
+    store = MarketDataStore(tmp_path)
+    store.append("BRK/B", _bars(date(2025, 1, 1), 10, base=400.0))
+    store.append("BRK_B", _bars(date(2025, 1, 1), 5, base=10.0, seed=1))
+    store.append("..", _bars(date(2025, 1, 1), 3))
+
+    reopened = MarketDataStore(tmp_path)
+    assert reopened.symbols() == ["..", "BRK/B", "BRK_B"]
+    assert reopened.row_count("BRK/B") == 10 and reopened.row_count("BRK_B") == 5
+    assert reopened.read("BRK/B").close[0] > 300 > reopened.read("BRK_B").close[0]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["%2E.", "BRK%2FB", "BRK_B"]    # 루트 밖으로 쓰지 않음
+
+
+def test_sync_fetches_only_new_bars(tmp_path):
+    """최초 1년치 조회, 같은 날 재분석은 조회 없음, 다음 날엔 신규 봉만 조회"""
+    store = MarketDataStore(tmp_path)
+    today = date.today()
+    calls = []
+
+    def fetcher(symbol, start):
+        calls.append(start)
+        n = (today - start).days
+        return _bars(start, n)
+
+    store.sync("MSFT", fetcher, lookback_days=365)
+    assert calls == [today - timedelta(days=365)]
+    assert store.row_count("MSFT") == 365
+
+    assert store.sync("MSFT", fetcher) == 0
+    assert len(calls) == 1
+
+    store.mark_synced("MSFT", today - timedelta(days=1))     # 하루 지난 상태 재현
+    store.sync("MSFT", fetcher)
+    assert calls[-1] == today                                 # 마지막 저장일 다음 날부터
+
+
+def test_fixture_dir_loader(tmp_path):
+    """오프라인 픽스처 (yfinance CSV) 디렉터리 로드"""
+    fixtures = tmp_path / "fixtures"
+    fixtures.mkdir()
+    _write_csv(fixtures / "TSLA.csv", _bars(date(2024, 1, 1), 50))
+    _write_csv(fixtures / "NVDA.csv", _bars(date(2024, 1, 1), 20, seed=1))
+
+    store = MarketDataStore(tmp_path / "store")
+    assert store.load_fixture_dir(fixtures) == {"NVDA": 20, "TSLA": 50}
+    assert str(store.last_date("TSLA")) == "2024-02-19"
+
+
+def test_technical_analyzer_reads_from_store(tmp_path):
+    """TechnicalAnalyzer: 저장소 이력으로 분석 (원격 조회 불가해도 동작)"""
+    store = MarketDataStore(tmp_path)
+    bars = _bars(date(2024, 1, 1), 300)
+    store.append("TSLA", bars)
+
+    cartridge = inv.InvestmentCartridgeV2(history_store=store)
+    signals = asyncio.run(cartridge.tech_analyzer.analyze("TSLA"))
+
+    history = store.read("TSLA", start=store.last_date("TSLA") - np.timedelta64(365, "D"))
+    assert signals.ma20 == pytest.approx(float(np.mean(history.close[-20:])))
+    assert signals.ma200 == pytest.approx(float(np.mean(history.close[-200:])))
+    assert 0 <= signals.rsi <= 100
+
+
+def test_ewm_matches_adjusted_definition():
+    """_ewm_mean = 정규화된 지수 가중 평균 (pandas adjust=True)"""
+    values = np.random.default_rng(2).normal(100, 5, 60)
+    decay = 1 - 2 / (12 + 1)
+    weights = decay ** np.arange(len(values) - 1, -1, -1)
+    expected = float(np.dot(weights, values) / weights.sum())
+    assert inv.TechnicalAnalyzer._ewm_mean(values, 12)[-1] == pytest.approx(expected)
+
+
+def test_quant_cartridge_uses_store_history(tmp_path):
+    """QuantCartridge: 저장된 이력이 있으면 합성 경로 대신 실제 종가로 신호 계산"""
+    store = MarketDataStore(tmp_path)
+    bars = _bars(date(2025, 1, 1), 100)
+    store.append("AAPL", bars)
+
+    cartridge = qc.QuantCartridge(market_store=store)
+    cartridge.register_asset(qc.Asset("AAPL", "Apple", qc.MarketType.USA, "Tech", 150.0, 0.25))
+    signal = cartridge.analyze_market()["AAPL"]
+
+    closes = bars["close"][-60:]
+    assert signal.indicators["momentum"] == pytest.approx(math.tanh(2 * (closes[-1] - closes[0]) / closes[0]))
+
+    store.append("AAPL", _bars(date(2025, 4, 11), 1, base=500.0))   # 새 봉 -> 스냅샷 변경
+    assert cartridge.analyze_market()["AAPL"] is not signal
+
+
+def test_quant_cartridge_aligns_store_history_on_dates(tmp_path):
+    """휴장일이 다른 종목: 꼬리 길이가 아니라 공통 날짜 기준으로 정렬해 공분산/신호 계산"""
+    store = MarketDataStore(tmp_path)
+    us = _bars(date(2025, 1, 1), 120, seed=3)
+    kr = _bars(date(2025, 1, 1), 120, base=50.0, seed=4)
+    kr_days = [i for i in range(120) if i % 5 != 2]                 # 한국 휴장일 모사
+    store.append("AAPL", us)
+    store.append("005930", {k: [v[i] for i in kr_days] for k, v in kr.items()})
+
+    cartridge = qc.QuantCartridge(market_store=store)
+    for symbol in ("AAPL", "005930"):
+        cartridge.register_asset(qc.Asset(symbol, symbol, qc.MarketType.HYBRID, "Tech", 100.0, 0.3))
+
+    common = kr_days[-61:]
+    aligned = np.array([np.asarray(us["close"])[common], np.asarray(kr["close"])[common]])
+    returns = np.diff(aligned, axis=1) / aligned[:, :-1]
+    engine = cartridge.load_returns_from_store(days=60, shrinkage=False)
+    np.testing.assert_allclose(engine.covariance(), np.cov(returns), rtol=1e-9)
+
+    prices, _ = cartridge._stored_market_matrices(list(cartridge.assets.values()), days=60)
+    np.testing.assert_allclose(prices, aligned[:, 1:])
+
+
+def test_risk_metrics_fit_covariance_from_store(tmp_path):
+    """market_store 가 있으면 calculate_risk_metrics 가 공분산 엔진을 자동 적합, 새 봉 추가 시 재적합"""
+    store = MarketDataStore(tmp_path)
+    symbols = ["AAPL", "MSFT", "NVDA"]
+    cartridge = qc.QuantCartridge(initial_capital=1e7, market_store=store)
+    for i, symbol in enumerate(symbols):
+        store.append(symbol, _bars(date(2025, 1, 1), 120, seed=10 + i))
+        asset = qc.Asset(symbol, symbol, qc.MarketType.USA, "Tech", 100.0, 0.3)
+        cartridge.register_asset(asset)
+        cartridge.portfolio_manager.add_position(qc.PortfolioPosition(asset, 100, 100.0))
+
+    metrics = cartridge.calculate_risk_metrics()
+    engine = cartridge.covariance_engine
+    assert engine is not None and engine.n_obs == 119
+
+    reference = qc.QuantCartridge(market_store=store)
+    for symbol in symbols:
+        reference.register_asset(cartridge.assets[symbol])
+    expected = reference.load_returns_from_store()
+    weights = cartridge.portfolio_manager.get_allocation()
+    w = np.array([weights[s] for s in symbols])
+    assert metrics.beta == pytest.approx(np.sqrt(w @ expected.covariance(annualize=True) @ w), rel=1e-9)
+
+    cartridge.calculate_risk_metrics()
+    assert cartridge.covariance_engine is engine                    # 저장소 변경 없음 -> 재사용
+    for i, symbol in enumerate(symbols):
+        store.append(symbol, _bars(date(2025, 5, 1), 1, seed=20 + i))
+    cartridge.calculate_risk_metrics()
+    assert cartridge.covariance_engine is not engine and cartridge.covariance_engine.n_obs == 120
@@ -0,0 +1,68 @@
+"""
+VectorizedMonteCarlo Unit Tests
+검증 대상: projects.ddc.utilities.prediction_engine (벡터화 몬테카를로 엔진)
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.utilities.prediction_engine import (
+    MonteCarloSimulation,
+    VectorizedMonteCarlo,
+)
+
+PARAMS = dict(initial_value=100.0, mean_return=0.01, volatility=0.05, periods=12)
+
+
+def test_same_schema_as_python_path():
+    """벡터화 결과 스키마 = 기존 순수 Python 결과 스키마"""
+    vectorized = MonteCarloSimulation(seed=1).run_simulation(**PARAMS, iterations=500)
+    fallback = MonteCarloSimulation()
+    fallback.engine = None
+    legacy = fallback.run_simulation(**PARAMS, iterations=500)
+
+    assert vectorized.keys() == legacy.keys()
+    assert vectorized['statistics'].keys() == legacy['statistics'].keys()
+    assert len(vectorized['simulations']) == 10
+    assert len(vectorized['simulations'][0]) == PARAMS['periods'] + 1
+    assert vectorized['simulations'][0][0] == PARAMS['initial_value']
+
+
+def test_seeded_and_chunking_invariant():
+    """동일 시드 재현 + 청크 크기와 무관한 동일 결과"""
+    a = VectorizedMonteCarlo(seed=7).run(**PARAMS, iterations=20_000)
+    b = VectorizedMonteCarlo(seed=7, chunk_elements=12 * 1000).run(**PARAMS, iterations=20_000)
+    assert a['statistics'] == pytest.approx(b['statistics'], rel=1e-12)
+    assert a['statistics']['percentile_5'] == b['statistics']['percentile_5']
+    assert a['simulations'] == b['simulations']
+
+
+def test_statistics_match_theory():
+    """최종값 평균 = initial * (1 + μ)^periods (대조 변량으로 오차 감소)"""
+    result = VectorizedMonteCarlo(seed=3).run(**PARAMS, iterations=200_000)
+    expected_mean = PARAMS['initial_value'] * (1 + PARAMS['mean_return']) ** PARAMS['periods']
+    assert result['statistics']['mean_final_value'] == pytest.approx(expected_mean, rel=2e-3)
+    stats = result['statistics']
+    assert stats['min_final_value'] <= stats['percentile_5'] <= stats['median_final_value'] <= stats['percentile_95']
+
+
+def test_streaming_percentiles_close_to_exact():
+    """최종값 미보관(스트리밍 히스토그램) 백분위수 ≈ 정확값, 평균/최소/최대는 동일"""
+    exact = VectorizedMonteCarlo(seed=5, shard_size=50_000).run(**PARAMS, iterations=200_000)
+    streaming = VectorizedMonteCarlo(seed=5, shard_size=50_000, exact_limit=0).run(**PARAMS, iterations=200_000)
+
+    for key in ('median_final_value', 'percentile_5', 'percentile_95'):
+        assert streaming['statistics'][key] == pytest.approx(exact['statistics'][key], rel=1e-3)
+    for key in ('mean_final_value', 'std_final_value'):
+        assert streaming['statistics'][key] == pytest.approx(exact['statistics'][key], rel=1e-9)
+    assert streaming['statistics']['min_final_value'] == exact['statistics']['min_final_value']
+    assert streaming['probability_of_profit'] == exact['probability_of_profit']
+
+
+def test_process_pool_matches_serial():
+    """프로세스 풀 샤딩 결과 = 단일 프로세스 결과 (샤드별 SeedSequence)"""
+    serial = VectorizedMonteCarlo(seed=11, shard_size=10_000, max_workers=1).run(**PARAMS, iterations=40_000)
+    parallel = VectorizedMonteCarlo(
+        seed=11, shard_size=10_000, max_workers=2, process_threshold=0
+    ).run(**PARAMS, iterations=40_000)
+    assert parallel['statistics'] == serial['statistics']
@@ -0,0 +1,126 @@
+"""
+PortfolioOptimizer Unit Tests
+검증 대상: quant_cartridge.PortfolioOptimizer (최소분산 / 최대 샤프 / 리스크 패리티 / 효율적 투자선)
+         + QuantCartridge.generate_allocation, InvCartridgeInterface.portfolio_optimization 연동
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+from projects.ddc.cartridges.inv import inv_interface
+
+
+def _covariance(n, seed=0):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, 0.01, size=(400, n)) + rng.normal(0, 0.006, size=(400, 1))
+    return np.cov(returns.T) * 252
+
+
+def test_projection_onto_capped_simplex():
+    """투영 결과: Σw = 1, 상하한 준수, 이미 가능한 점은 그대로"""
+    v = np.random.default_rng(1).normal(size=40)
+    for lo, hi in [(0.0, 1.0), (0.01, 0.05), (0.0, 0.1)]:
+        w = qc.PortfolioOptimizer.project(v, lo, hi)
+        assert w.sum() == pytest.approx(1.0)
+        assert w.min() >= lo - 1e-15 and w.max() <= hi + 1e-15
+    feasible = np.full(40, 1 / 40)
+    np.testing.assert_allclose(qc.PortfolioOptimizer.project(feasible, 0.0, 0.1), feasible)
+
+
+def test_min_variance_and_max_sharpe_closed_form():
+    """내부해일 때 해석해와 일치: 최소분산 Σ⁻¹1 / 1ᵀΣ⁻¹1, 접점 Σ⁻¹(μ - r_f)"""
+    cov = _covariance(6)
+    symbols = list("ABCDEF")
+    optimizer = qc.PortfolioOptimizer(risk_free_rate=0.02)
+
+    inv_ones = np.linalg.solve(cov, np.ones(6))
+    min_var = optimizer.min_variance(symbols, cov)
+    np.testing.assert_allclose(list(min_var.weights.values()), inv_ones / inv_ones.sum(), atol=1e-7)
+
+    target = np.array([0.1, 0.2, 0.15, 0.25, 0.1, 0.2])
+    mu = 0.02 + cov @ target * 3
+    tangency = optimizer.max_sharpe(symbols, cov, mu)
+    np.testing.assert_allclose(list(tangency.weights.values()), target, atol=1e-6)
+    assert tangency.converged
+
+
+def test_box_constraints_and_frontier():
+    """상하한 제약 준수, 효율적 투자선은 위험-수익 단조 증가"""
+    n = 30
+    cov = _covariance(n, seed=2)
+    mu = np.random.default_rng(3).normal(0.08, 0.05, n)
+    symbols = [f"S{i}" for i in range(n)]
+    optimizer = qc.PortfolioOptimizer(min_weight=0.01, max_weight=0.08)
+
+    result = optimizer.max_sharpe(symbols, cov, mu)
+    weights = np.array(list(result.weights.values()))
+    assert weights.sum() == pytest.approx(1.0)
+    assert weights.min() >= 0.01 - 1e-12 and weights.max() <= 0.08 + 1e-12
+
+    # 무작위 가능 포트폴리오보다 샤프가 낮지 않음
+    rng = np.random.default_rng(4)
+    for _ in range(200):
+        w = optimizer.project(rng.dirichlet(np.ones(n)), 0.01, 0.08)
+        assert (mu @ w - 0.02) / np.sqrt(w @ cov @ w) <= result.sharpe_ratio + 1e-6
+
+    frontier = optimizer.efficient_frontier(symbols, cov, mu, points=12)
+    vols = [p.volatility for p in frontier]
+    rets = [p.expected_return for p in frontier]
+    assert vols == sorted(vols) and rets == sorted(rets)
+
+    with pytest.raises(ValueError):
+        qc.PortfolioOptimizer(max_weight=0.02).min_variance(symbols, cov)
+
+
+def test_risk_parity_equal_contributions():
+    """리스크 패리티: 위험 기여도 w_i(Σw)_i 동일, 예산 지정 시 비례"""
+    cov = _covariance(8, seed=5)
+    symbols = [f"S{i}" for i in range(8)]
+    optimizer = qc.PortfolioOptimizer()
+
+    w = np.array(list(optimizer.risk_parity(symbols, cov).weights.values()))
+    contributions = w * (cov @ w)
+    np.testing.assert_allclose(contributions / contributions.sum(), np.full(8, 1 / 8), atol=1e-8)
+
+    budgets = {s: (2.0 if s == "S0" else 1.0) for s in symbols}
+    w = np.array(list(optimizer.risk_parity(symbols, cov, budgets=budgets).weights.values()))
+    contributions = w * (cov @ w)
+    assert contributions[0] / contributions[1] == pytest.approx(2.0, rel=1e-6)
+
+
+def test_warm_start_after_small_move():
+    """가격 소폭 변동 후 재최적화는 이전 해에서 시작해 반복 수 감소"""
+    n = 60
+    cov = _covariance(n, seed=6)
+    mu = np.random.default_rng(7).normal(0.08, 0.05, n)
+    symbols = [f"S{i}" for i in range(n)]
+    optimizer = qc.PortfolioOptimizer(max_weight=0.1)
+
+    cold = optimizer.max_sharpe(symbols, cov, mu)
+    warm = optimizer.max_sharpe(symbols, cov * 1.001, mu * 1.002)
+    fresh = qc.PortfolioOptimizer(max_weight=0.1).max_sharpe(symbols, cov * 1.001, mu * 1.002)
+    assert warm.iterations < cold.iterations / 2
+    assert warm.sharpe_ratio == pytest.approx(fresh.sharpe_ratio, rel=1e-6)
+
+
+def test_cartridge_and_interface_wiring():
+    """QuantCartridge.generate_allocation(strategy), InvCartridgeInterface 공분산 기반 비중"""
+    cartridge = qc.QuantCartridge()
+    for i, vol in enumerate([0.1, 0.2, 0.3, 0.25]):
+        cartridge.register_asset(qc.Asset(f"A{i}", f"Asset {i}", qc.MarketType.USA, "Tech", 100.0, vol))
+    assert sum(cartridge.generate_allocation().values()) == pytest.approx(1.0)      # Dual Quant 기본값
+    allocation = cartridge.generate_allocation("min_variance")
+    assert allocation["A0"] == max(allocation.values())
+    assert cartridge.last_optimization.strategy == "min_variance"
+
+    rng = np.random.default_rng(8)
+    returns = {t: rng.normal(0.0005, s, 250).tolist() for t, s in [("TSLA", 0.03), ("AAPL", 0.015), ("NIO", 0.04)]}
+    interface = inv_interface.InvCartridgeInterface(optimizer=qc.PortfolioOptimizer())
+    result = interface.portfolio_optimization(
+        {"TSLA": 0.3, "AAPL": 0.3, "NIO": 0.4}, {}, returns, strategy="risk_parity"
+    )
+    weights = result["optimized_portfolio"]["weights"]
+    assert sum(weights.values()) == pytest.approx(1.0)
+    assert weights["AAPL"] > weights["TSLA"] > weights["NIO"]
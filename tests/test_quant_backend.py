@@ -0,0 +1,127 @@
+"""
+QuantCartridge Array Backend Unit Tests
+검증 대상: projects/ddc/cartridges/bio/quant_cartridge/quant_cartridge.py
+(numpy 배열 경로와 순수 Python 경로의 결과 동일성)
+"""
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+
+
+@pytest.fixture
+def backend():
+    """테스트마다 백엔드 선택을 원래 값으로 복구"""
+    original = qc.QUANT_BACKEND
+    yield qc.set_backend
+    qc.QUANT_BACKEND = original
+
+
+def _both(backend, func, *args):
+    backend("python")
+    expected = func(*args)
+    backend("numpy")
+    actual = func(*args)
+    return expected, actual
+
+
+def _assets(n, seed=3):
+    rng = random.Random(seed)
+    markets = [qc.MarketType.KOREA, qc.MarketType.USA]
+    return [
+        qc.Asset(f"S{i}", f"Stock {i}", rng.choice(markets), "Tech", 100.0, rng.uniform(0.05, 0.8))
+        for i in range(n)
+    ]
+
+
+def test_math_utils_match(backend):
+    """표준편차/분산/공분산/회귀/백분위수 동일"""
+    rng = random.Random(1)
+    x = [rng.gauss(0, 1) for _ in range(500)]
+    y = [2 * v + rng.gauss(0, 0.1) for v in x]
+
+    for func, args in [
+        (qc.MathUtils.std_dev, (x,)),
+        (qc.MathUtils.variance, (x,)),
+        (qc.MathUtils.covariance, (x, y)),
+        (qc.MathUtils.correlation, (x, y)),
+        (qc.MathUtils.percentile, (x, 37.5)),
+    ]:
+        expected, actual = _both(backend, func, *args)
+        assert actual == pytest.approx(expected, rel=1e-9)
+
+    expected, actual = _both(backend, qc.MathUtils.linear_regression, x, y)
+    assert actual == pytest.approx(expected, rel=1e-9)
+
+
+def test_risk_measures_match(backend):
+    """VaR/CVaR(np.partition)와 최대낙폭(누적 최대값) 동일"""
+    rng = random.Random(2)
+    returns = [rng.gauss(0.0005, 0.02) for _ in range(1000)]
+    prices = qc.QuantCartridge._generate_cumulative_returns(returns)
+
+    for func, args in [
+        (qc.QuantitativeAnalysis.calculate_var_95, (returns,)),
+        (qc.QuantitativeAnalysis.calculate_cvar, (returns,)),
+        (qc.QuantitativeAnalysis.calculate_max_drawdown, (prices,)),
+    ]:
+        expected, actual = _both(backend, func, *args)
+        assert actual == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("returns", [[], [-0.03], [0.02], [0.0]])
+def test_cvar_short_series_match(backend, returns):
+    """수익률 0~1개: 두 경로 모두 VaR=0 기준 꼬리 손실 평균 (단일 손실 r 이면 |r|)"""
+    expected, actual = _both(backend, qc.QuantitativeAnalysis.calculate_cvar, returns)
+    assert actual == expected
+    if returns and returns[0] < 0:
+        assert actual == abs(returns[0])
+
+
+def test_correlation_and_portfolio_volatility_match(backend):
+    """상관행렬 dict 및 sqrt(wᵀΣw) 포트폴리오 변동성 동일"""
+    assets = _assets(120)
+    weights = {a.symbol: 1.0 / len(assets) for a in assets}
+
+    expected, actual = _both(backend, qc.QuantitativeAnalysis.calculate_correlation_matrix, assets)
+    assert list(actual) == list(expected)
+    assert list(actual.values()) == pytest.approx(list(expected.values()), rel=1e-12)
+
+    # 일부 쌍이 빠진 dict: 기본 상관계수 0.3 적용도 동일해야 함
+    partial = dict(list(expected.items())[::3])
+    expected_vol, actual_vol = _both(
+        backend, qc.QuantitativeAnalysis.calculate_portfolio_volatility, weights, assets, partial
+    )
+    assert actual_vol == pytest.approx(expected_vol, rel=1e-9)
+
+
+def test_risk_metrics_array_path(backend):
+    """calculate_risk_metrics 배열 경로: 평균 상관계수/포트폴리오 변동성 동일"""
+    cartridge = qc.QuantCartridge(initial_capital=1e9)
+    cartridge.register_assets_batch(_assets(80))
+    for asset in list(cartridge.assets.values())[:10]:
+        cartridge.portfolio_manager.add_position(qc.PortfolioPosition(asset, 1000, asset.current_price))
+    cartridge.daily_returns = [random.Random(4).gauss(0, 0.01) for _ in range(252)]
+
+    backend("python")
+    expected = cartridge.calculate_risk_metrics()
+    backend("numpy")
+    actual = cartridge.calculate_risk_metrics()
+
+    assert actual.correlation_avg == pytest.approx(expected.correlation_avg, rel=1e-9)
+    assert actual.beta == pytest.approx(expected.beta, rel=1e-9)
+    assert actual.value_at_risk == pytest.approx(expected.value_at_risk)
+
+
+def test_auto_backend_threshold(backend):
+    """auto 모드: 작은 입력은 순수 Python, 큰 입력은 배열 경로"""
+    backend("auto")
+    assert not qc.use_vectorized(qc.VECTORIZE_MIN_SIZE - 1)
+    assert qc.use_vectorized(qc.VECTORIZE_MIN_SIZE)
+    backend("python")
+    assert not qc.use_vectorized(10_000)
+    with pytest.raises(ValueError):
+        backend("gpu")
@@ -0,0 +1,62 @@
+"""
+MarketSignalProcessor Batch Signal Unit Tests
+검증 대상: quant_cartridge.MarketSignalProcessor.generate_signals_batch, QuantCartridge.analyze_market 메모이제이션
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.cartridges.bio.quant_cartridge import quant_cartridge as qc
+
+
+def _assets(n):
+    rng = random.Random(9)
+    return [
+        qc.Asset(f"S{i}", f"Stock {i}", qc.MarketType.KOREA, "Tech", rng.uniform(10, 1000), rng.uniform(0.05, 0.9))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("periods", [1, 4, 5, 6, 60])
+def test_batch_matches_per_asset(periods):
+    """배치 신호 = 자산별 generate_signal 신호 (모든 지표/신호 유형 동일)"""
+    assets = _assets(40)
+    rng = np.random.default_rng(periods)
+    prices = np.array([a.current_price for a in assets])[:, None] * np.exp(
+        np.cumsum(rng.normal(0, 0.03, size=(len(assets), periods)), axis=1)
+    )
+    volumes = rng.uniform(5e5, 2e6, size=(len(assets), periods))
+
+    processor = qc.MarketSignalProcessor()
+    batch = processor.generate_signals_batch(assets, prices, volumes)
+
+    for asset, price_row, volume_row in zip(assets, prices, volumes):
+        expected = processor.generate_signal(asset, price_row.tolist(), volume_row.tolist())
+        actual = batch[asset.symbol]
+        assert actual.signal_type == expected.signal_type
+        assert actual.confidence == expected.confidence
+        assert actual.strength == pytest.approx(expected.strength, abs=1e-12)
+        for key, value in expected.indicators.items():
+            assert actual.indicators[key] == pytest.approx(value, abs=1e-12)
+
+
+def test_analyze_market_memoized_per_snapshot():
+    """같은 스냅샷에서는 신호 재사용, 자산 변경/refresh 시 재생성"""
+    cartridge = qc.QuantCartridge()
+    cartridge.register_assets_batch(_assets(5))
+
+    first = cartridge.analyze_market()
+    assert cartridge.analyze_market() == first
+    history_len = len(cartridge.signal_processor.signal_history)
+
+    report = cartridge.get_performance_report()
+    assert len(cartridge.signal_processor.signal_history) == history_len
+    assert report["signals"]["S0"]["indicators"] == first["S0"].indicators
+
+    cartridge.register_asset(qc.Asset("NEW", "New", qc.MarketType.USA, "Tech", 50.0, 0.2))
+    refreshed = cartridge.analyze_market()
+    assert "NEW" in refreshed
+    assert refreshed["S0"] is not first["S0"]
+    assert cartridge.analyze_market(refresh=True)["S0"] is not refreshed["S0"]
@@ -0,0 +1,134 @@
+"""
+Response Filter Unit Tests
+검증 대상: projects.ddc.brain.brain_core.response_filter
+"""
+import random
+import re
+import pytest
+from projects.ddc.brain.brain_core.response_filter import (
+    IDENTITY_OVERRIDE_RESPONSE,
+    StreamingResponseFilter,
+    filter_response,
+    strip_metadata,
+)
+
+LEAKY_RESPONSE = (
+    "[Emotional Status]: neutral (Intensity: 0.5)\n"
+    "[Empathy Directive]: 공감하세요\n"
+    "[Session Info]\n- 사용자: User_1234\n- 권한: guest\n- 세션 ID: abc\n\n"
+    "[Response]: 안녕하세요! 바이오지능모드를 설명드릴게요.\n\n\n\n"
+    "1. **병렬 처리**\n2. **적응 학습**\n\n"
+    "```python\nprint('hello')\n```\n\n"
+    "[User]: 응\n"
+)
+
+
+def _stream(text, query="", chunk_size=7):
+    f = StreamingResponseFilter(query)
+    parts = [f.feed(text[i:i + chunk_size]) for i in range(0, len(text), chunk_size)]
+    parts.append(f.flush())
+    return "".join(parts)
+
+
+def test_metadata_removed():
+    """내부 메타데이터 제거 및 빈 줄 정리"""
+    cleaned = filter_response(LEAKY_RESPONSE, "바이오지능모드가 뭐야")
+    assert cleaned.startswith("안녕하세요!")
+    for leaked in ["[Emotional Status]", "[Empathy Directive]", "[Session Info]", "User_1234", "[User]", "[Response]"]:
+        assert leaked not in cleaned
+    assert "\n\n\n" not in cleaned
+    assert "print('hello')" in cleaned
+
+
+def test_identity_override_only_for_identity_questions():
+    """정체성 질문일 때만 모델명 노출 응답 치환"""
+    leak = "저는 Meta AI가 만든 Llama입니다."
+    assert filter_response(leak, "너는 누구야?") == IDENTITY_OVERRIDE_RESPONSE
+    assert filter_response(leak, "Llama 모델 설명해줘") == leak
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 10_000])
+def test_streaming_matches_batch(chunk_size):
+    """청크 크기와 무관하게 스트리밍 결과가 일괄 필터 결과와 동일"""
+    assert _stream(LEAKY_RESPONSE, chunk_size=chunk_size) == filter_response(LEAKY_RESPONSE, "")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100])
+def test_streaming_holds_break_consumed_by_response_marker(chunk_size):
+    """[Response]: 바로 뒤 문단 경계는 마커와 함께 지워지므로 그 위치에서 자르지 않음"""
+    text = "a [Response]:\n\nb"
+    assert _stream(text, query="hi", chunk_size=chunk_size) == filter_response(text, "hi") == "a b"
+
+
+def test_streaming_emits_before_end():
+    """문단 경계가 완성되면 스트림 종료 전에 출력"""
+    f = StreamingResponseFilter("설명해줘")
+    assert f.feed("첫 문단입니다.") == ""
+    assert f.feed("\n\n두 번째") == "첫 문단입니다."
+    assert f.flush() == "\n\n두 번째"
+
+
+def test_streaming_identity_question_held_until_flush():
+    """정체성 질문은 전체 응답으로 판단하므로 flush까지 보류"""
+    f = StreamingResponseFilter("너 누구야")
+    assert f.feed("저는 Claude입니다.\n\n") == ""
+    assert f.feed("도와드릴까요?") == ""
+    assert f.flush() == IDENTITY_OVERRIDE_RESPONSE
+
+
+def _legacy_strip_metadata(text):
+    """기존 ChatEngine 필터의 순차 re.sub 메타데이터 제거 (비교 기준)"""
+    for pattern in [
+        r'\[Emotional Status\]:.*?(?=\n|$)',
+        r'\[Empathy Directive\]:.*?(?=\n|$)',
+        r'\[Session Info\].*?(?=\n\n|\[User\]|$)',
+        r'- 사용자: User_\d+.*?(?=\n|$)',
+        r'- 권한:.*?(?=\n|$)',
+        r'- 세션 ID:.*?(?=\n|$)',
+        r'\[User\]:.*?(?=\n|$)',
+        r'\[Response\]:?\s*',
+    ]:
+        text = re.sub(pattern, '', text, flags=re.DOTALL)
+    return re.sub(r'\n{3,}', '\n\n', text)
+
+
+@pytest.mark.parametrize("text", [
+    "답변\n\n[Session Info]\n[Emotional Status]: sad",
+    "[User]: 응[Session Info]\n본문",
+])
+def test_pass_order_matches_legacy(text):
+    """[Session Info] 범위는 앞 패스([Emotional Status] 등) 제거 후, 뒤 패스([User]) 제거 전 텍스트 기준"""
+    assert strip_metadata(text) == _legacy_strip_metadata(text)
+
+
+def test_marker_scan_equals_legacy_sequential_sub():
+    """마커 기반 스캔 결과가 기존 순차 re.sub 결과와 동일 (두 블록이 섞인 입력 포함)"""
+    rng = random.Random(7)
+    pieces = [
+        "[User]: 응", "[Session Info]\n- 권한: guest", "[Session Info]", "[Emotional Status]: sad",
+        "[Empathy Directive]: 공감", "- 사용자: User_12", "본문", "\n", "\n\n", "\n\n\n",
+        "[Response]: ", "- 세션 ID: x", "[", "- ",
+    ]
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(12))
+        assert strip_metadata(text) == _legacy_strip_metadata(text)
+
+
+def test_streaming_random_chunking_matches_batch():
+    """무작위 메타데이터 조합 x 무작위 청크 분할: 스트리밍 결과 = filter_response"""
+    rng = random.Random(11)
+    pieces = [
+        "[Response]:", "[Response]", "[User]: 응", "[Session Info]", "[Emotional Status]: sad",
+        "- 권한: guest", "- 사용자: User_7", "[Resp", "onse]", "본문", "a ", " ", "\n", "\n\n", "\n\n\n", "b",
+    ]
+    for _ in range(3000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+        max_step = rng.choice([1, 8])
+        f = StreamingResponseFilter("hi")
+        out, i = [], 0
+        while i < len(text):
+            step = rng.randint(1, max_step)
+            out.append(f.feed(text[i:i + step]))
+            i += step
+        out.append(f.flush())
+        assert "".join(out) == filter_response(text, "hi"), repr(text)
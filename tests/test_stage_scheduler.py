@@ -0,0 +1,59 @@
+"""
+StageScheduler Unit Tests
+검증 대상: projects.ddc.brain.brain_core.stage_scheduler.StageScheduler
+"""
+import asyncio
+import time
+import pytest
+from projects.ddc.brain.brain_core.stage_scheduler import StageScheduler
+
+
+async def _sleep_value(value, delay):
+    await asyncio.sleep(delay)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_in_parallel():
+    """독립 단계 병렬 실행 및 절약 시간 기록"""
+    scheduler = StageScheduler("test")
+    scheduler.add_stage("a", lambda r: _sleep_value(1, 0.1))
+    scheduler.add_stage("b", lambda r: _sleep_value(2, 0.1))
+    scheduler.add_stage("c", lambda r: r["a"] + r["b"], depends_on=["a", "b"])
+
+    results = await scheduler.run()
+    report = scheduler.timing_report()
+
+    assert results["c"] == 3
+    assert report["wall_ms"] < 180
+    assert report["sequential_ms"] >= 190
+    assert report["saved_ms"] > 50
+    assert report["critical_path"][-1] == "c"
+
+
+@pytest.mark.asyncio
+async def test_dependent_stage_waits_and_thread_stage():
+    """의존 단계는 선행 단계 완료 후 시작, 동기 블로킹 단계는 스레드에서 실행"""
+    scheduler = StageScheduler("test")
+    scheduler.add_stage("load", lambda r: time.sleep(0.05) or "loaded", run_in_thread=True)
+    scheduler.add_stage("use", lambda r: r["load"].upper(), depends_on=["load"])
+
+    results = await scheduler.run()
+
+    assert results["use"] == "LOADED"
+    assert scheduler.stages["use"].start_ms >= scheduler.stages["load"].end_ms
+    assert scheduler.critical_path() == ["load", "use"]
+
+
+def test_invalid_graph_rejected():
+    """알 수 없는 의존성과 순환 의존성 거부"""
+    scheduler = StageScheduler("test")
+    scheduler.add_stage("a", lambda r: 1, depends_on=["missing"])
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run())
+
+    scheduler = StageScheduler("test")
+    scheduler.add_stage("a", lambda r: 1, depends_on=["b"])
+    scheduler.add_stage("b", lambda r: 1, depends_on=["a"])
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run())
@@ -0,0 +1,127 @@
+"""
+Streaming Indicators Unit Tests
+검증 대상: projects.ddc.utilities.streaming_indicators (봉 단위 O(1) 증분 지표)
+         + investment_cartridge_v2.TechnicalAnalyzer 스트리밍 경로
+"""
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projects.ddc.utilities.streaming_indicators import (
+    RollingWindow, RollingExtrema, RSI, IndicatorWatchlist, SymbolIndicators
+)
+
+from projects.ddc.cartridges.bio import investment_cartridge_v2 as inv
+
+
+def _closes(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n)))
+
+
+def test_rolling_window_and_extrema_match_batch():
+    """링 버퍼 평균/분산(ddof=1), 단조 덱 최저/최고 = 구간 재계산"""
+    values = _closes(1000)
+    window = RollingWindow(20)
+    extrema = RollingExtrema(50)
+    for i, value in enumerate(values):
+        window.update(value)
+        extrema.update(value)
+        if i >= 19:
+            recent = values[i - 19:i + 1]
+            assert window.mean == pytest.approx(recent.mean(), rel=1e-10)
+            assert window.std == pytest.approx(recent.std(ddof=1), rel=1e-6)
+        recent = values[max(0, i - 49):i + 1]
+        assert (extrema.min, extrema.max) == (recent.min(), recent.max())
+
+
+def test_wilder_rsi_matches_reference():
+    """Wilder RSI: 첫 period개 단순 평균 후 (avg*(n-1)+x)/n 평활"""
+    values = _closes(300, seed=1)
+    deltas = np.diff(values)
+    gains, losses = np.clip(deltas, 0, None), np.clip(-deltas, 0, None)
+    avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+    for g, l in zip(gains[14:], losses[14:]):
+        avg_gain = (avg_gain * 13 + g) / 14
+        avg_loss = (avg_loss * 13 + l) / 14
+
+    rsi = RSI(14, "wilder")
+    for value in values:
+        rsi.update(value)
+    assert rsi.value == pytest.approx(100 - 100 / (1 + avg_gain / avg_loss))
+
+
+def test_streaming_signals_match_batch_analyzer():
+    """단순 평균 RSI 모드에서 스트리밍 신호 = analyze_closes (최근 252봉)"""
+    values = _closes(600, seed=2)
+    indicators = SymbolIndicators(rsi_method="simple")
+    indicators.warm_up(values)
+
+    streamed = inv.TechnicalAnalyzer.from_indicators(indicators)
+    batch = inv.TechnicalAnalyzer.analyze_closes(values[-252:])
+    assert streamed.trend == batch.trend
+    assert streamed.buy_signal_count == batch.buy_signal_count
+    assert streamed.sell_signal_count == batch.sell_signal_count
+    for field in ("ma20", "ma50", "ma200", "rsi", "bollinger_upper", "bollinger_lower",
+                  "support_level", "resistance_level"):
+        assert getattr(streamed, field) == pytest.approx(getattr(batch, field), rel=1e-8), field
+    # EMA 는 전체 이력 기준 (analyze_closes 는 잘린 구간에서 재시작)
+    full = inv.TechnicalAnalyzer.analyze_closes(values)
+    assert streamed.macd == pytest.approx(full.macd, rel=1e-9)
+    assert streamed.macd_signal == pytest.approx(full.macd_signal, rel=1e-9)
+
+    assert inv.TechnicalAnalyzer.from_indicators(SymbolIndicators()).signal_strength == 50  # 워밍업 전 폴백
+
+
+def test_checkpoint_roundtrip_continues_identically(tmp_path):
+    """체크포인트 저장/복원 후 이어서 갱신해도 끊김 없이 동일한 값"""
+    values = {sym: _closes(400, seed=i) for i, sym in enumerate(["AAPL", "MSFT", "005930.KS"])}
+    live = IndicatorWatchlist()
+    for sym, closes in values.items():
+        live.warm_up(sym, closes[:300])
+    live.save(tmp_path / "indicators.json")
+
+    restored = IndicatorWatchlist.load(tmp_path / "indicators.json")
+    assert len(restored) == 3
+    for t in range(300, 400):
+        bar = {sym: closes[t] for sym, closes in values.items()}
+        live.update_many(bar)
+        restored.update_many(bar)
+    for sym in values:
+        assert restored.get(sym).values() == live.get(sym).values()
+
+
+def test_technical_analyzer_update_bar():
+    """TechnicalAnalyzer.update_bar: 워치리스트 상태 갱신 후 신호 반환"""
+    analyzer = inv.TechnicalAnalyzer()
+    values = _closes(260, seed=4)
+    analyzer.watchlist.warm_up("TSLA", values[:-1])
+    signals = analyzer.update_bar("TSLA", values[-1])
+    assert signals.ma20 == pytest.approx(values[-20:].mean())
+    assert 0 <= signals.rsi <= 100
+
+
+def test_default_analyzer_creates_watchlist_lazily(monkeypatch):
+    """기본 생성 -> watch/update_bar 첫 호출 때 워치리스트 생성, 모듈이 없으면 명확한 ImportError"""
+    values = _closes(260, seed=5)
+
+    class History:
+        async def get_history(self, symbol, days):
+            return type("Frame", (), {"close": values[:-1]})()
+
+    monkeypatch.setattr(inv, "STREAMING_INDICATORS_AVAILABLE", False)
+    offline = inv.TechnicalAnalyzer(History())
+    with pytest.raises(ImportError, match="streaming_indicators"):
+        offline.update_bar("NVDA", values[-1])
+
+    monkeypatch.setattr(inv, "STREAMING_INDICATORS_AVAILABLE", True)
+    analyzer = inv.TechnicalAnalyzer(History())
+    assert analyzer._watchlist is None
+    warmed = asyncio.run(analyzer.watch("NVDA"))
+    assert warmed.ma20 == pytest.approx(values[-21:-1].mean())
+    updated = analyzer.update_bar("NVDA", values[-1])
+    assert updated.ma20 == pytest.approx(values[-20:].mean())
+    assert analyzer.watchlist.rsi_method == "simple"                     # analyze_closes 와 같은 RSI
+    assert updated.rsi == pytest.approx(inv.TechnicalAnalyzer.analyze_closes(values).rsi, rel=1e-9)
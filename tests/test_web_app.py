@@ -0,0 +1,47 @@
+"""
+Web API Optional Cartridge Tests
+검증 대상: projects.ddc.web.app 선택 카트리지 (투자 최적화 / Bio 비디오) 가 실제로 로드되어
+         임시 응답이 아닌 카트리지 경로로 응답하는지
+"""
+import importlib.util
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from projects.ddc.web import app as web_app
+from projects.ddc.cartridges.inv import inv_interface
+
+
+@pytest.fixture
+def client():
+    return TestClient(web_app.app)
+
+
+def test_optional_cartridges_are_available():
+    """카트리지 패키지 import 가 성공해 가용 플래그가 켜져 있음"""
+    assert web_app.INV_CARTRIDGE_AVAILABLE
+    assert isinstance(web_app.get_inv_interface(), inv_interface.InvCartridgeInterface)
+    if importlib.util.find_spec("cv2") is not None:
+        assert web_app.BIO_VIDEO_AVAILABLE
+
+
+def test_portfolio_optimization_uses_interface(client, monkeypatch):
+    """/api/inv/portfolio_optimization 이 InvCartridgeInterface 최적화 결과를 반환 (임시 응답 아님)"""
+    async def optimize(holdings):
+        return {"optimized_portfolio": {
+            "strategy": "max_sharpe", "weights": {"TSLA": 0.4, "005930": 0.6},
+            "expected_return": 0.1, "volatility": 0.2, "sharpe_ratio": 0.4,
+        }}
+
+    monkeypatch.setattr(web_app.get_inv_interface(), "portfolio_optimization_async", optimize)
+    response = client.post("/api/inv/portfolio_optimization", json={"TSLA": 0.5, "005930": 0.5})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["strategy"] == "max_sharpe"
+    assert body["optimized_portfolio"] == {"TSLA": 0.4, "005930": 0.6}
+    assert "improvement" not in body